@@ -24,6 +24,7 @@ def main(
     prices_dir: Path = typer.Option(Path("./data/prices"), help="Local price cache folder."),
     download_prices: bool = typer.Option(False, help="Fetch missing prices via yfinance (requires internet + yfinance)."),
     include_fees_as_flow: bool = typer.Option(False, help="Treat fees as external flows (gross-of-fees returns)."),
+    fifo_workers: int = typer.Option(1, help="Processes for per-symbol FIFO (large accounts)."),
 ):
     """
     Generate monthly performance report(s), analytics marts, and position guidance.
@@ -57,4 +58,5 @@ def main(
         benchmark_symbol=benchmark,
         download_prices=download_prices,
         include_fees_as_flow=include_fees_as_flow,
+        fifo_workers=fifo_workers,
     )
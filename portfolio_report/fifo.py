@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import datetime as dt
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 from portfolio_report.transactions import NormalizedTransaction
@@ -24,27 +26,49 @@ class RealizedMatch:
     carry_in_basis_unknown: bool
 
 
-def fifo_realized_pnl(
-    txs: list[NormalizedTransaction],
-    *,
-    symbol: str,
-) -> tuple[list[RealizedMatch], list[str]]:
+@dataclass(frozen=True)
+class SymbolFifo:
+    """
+    Result of one FIFO pass over a symbol: realized matches, lots still open at the end, and carry-in diagnostics
+    (SELLs that exceeded the available lots).
+    """
+
+    symbol: str
+    matches: list[RealizedMatch]
+    open_lots: list[Lot]
+    carry_in_sells: int = 0
+    carry_in_shares: float = 0.0
+    carry_in_first: dt.date | None = None
+    carry_in_last: dt.date | None = None
+
+    @property
+    def warnings(self) -> list[str]:
+        if self.carry_in_sells <= 0:
+            return []
+        span = ""
+        if self.carry_in_first and self.carry_in_last:
+            span = f" ({self.carry_in_first.isoformat()} → {self.carry_in_last.isoformat()})"
+        return [
+            f"{self.symbol}: {self.carry_in_sells} SELL(s) exceed available lots by total {self.carry_in_shares:.6g} shares (carry-in basis unknown){span}."
+        ]
+
+
+def fifo_symbol(sym_txs: list[NormalizedTransaction], *, symbol: str) -> SymbolFifo:
     """
-    FIFO realized P&L for a single symbol.
+    FIFO pass over one symbol's transactions, already filtered and date-sorted (see `transactions_by_symbol`).
 
     Notes:
     - If a SELL has no available lots (carry-in holdings), we flag basis unknown and set cost/pnl to None.
     - Fees handling is best-effort and depends on whether the input provides them.
     """
-    warnings: list[str] = []
-    lots: list[Lot] = []
+    lots: deque[Lot] = deque()
     matches: list[RealizedMatch] = []
     carry_in_sells = 0
     carry_in_shares = 0.0
     carry_in_first: dt.date | None = None
     carry_in_last: dt.date | None = None
 
-    for t in sorted([x for x in txs if x.symbol == symbol], key=lambda x: x.date):
+    for t in sym_txs:
         if t.tx_type not in {"BUY", "SELL"}:
             continue
         qty = float(t.qty or 0.0)
@@ -74,7 +98,7 @@ def fifo_realized_pnl(
                 lot.qty -= take
                 remaining -= take
                 if lot.qty <= 1e-12:
-                    lots.pop(0)
+                    lots.popleft()
             if remaining > 1e-12:
                 # Sold more than we can match: carry-in basis unknown.
                 carry_in = True
@@ -107,11 +131,52 @@ def fifo_realized_pnl(
                     carry_in_basis_unknown=carry_in,
                 )
             )
-    if carry_in_sells > 0:
-        span = ""
-        if carry_in_first and carry_in_last:
-            span = f" ({carry_in_first.isoformat()} → {carry_in_last.isoformat()})"
-        warnings.append(
-            f"{symbol}: {carry_in_sells} SELL(s) exceed available lots by total {carry_in_shares:.6g} shares (carry-in basis unknown){span}."
-        )
-    return matches, warnings
+    return SymbolFifo(
+        symbol=symbol,
+        matches=matches,
+        open_lots=list(lots),
+        carry_in_sells=carry_in_sells,
+        carry_in_shares=carry_in_shares,
+        carry_in_first=carry_in_first,
+        carry_in_last=carry_in_last,
+    )
+
+
+def fifo_by_symbol(
+    tx_by_sym: dict[str, list[NormalizedTransaction]],
+    *,
+    symbols: list[str] | None = None,
+    max_workers: int | None = None,
+) -> dict[str, SymbolFifo]:
+    """
+    FIFO for many symbols from one `transactions_by_symbol` grouping (one pass over each symbol's rows).
+
+    Symbols are independent, so `max_workers > 1` spreads them over a process pool for large accounts.
+    """
+    syms = sorted(tx_by_sym) if symbols is None else list(symbols)
+    groups = [tx_by_sym.get(sym, []) for sym in syms]
+    workers = int(max_workers or 1)
+    if workers > 1 and len(syms) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(syms))) as pool:
+            results = list(pool.map(_fifo_symbol_worker, groups, syms, chunksize=max(1, len(syms) // (workers * 4))))
+    else:
+        results = [fifo_symbol(g, symbol=sym) for g, sym in zip(groups, syms)]
+    return dict(zip(syms, results))
+
+
+def _fifo_symbol_worker(sym_txs: list[NormalizedTransaction], symbol: str) -> SymbolFifo:
+    return fifo_symbol(sym_txs, symbol=symbol)
+
+
+def fifo_realized_pnl(
+    txs: list[NormalizedTransaction],
+    *,
+    symbol: str,
+) -> tuple[list[RealizedMatch], list[str]]:
+    """
+    FIFO realized P&L for a single symbol out of a mixed transaction list.
+
+    Reports over many symbols should group once with `transactions_by_symbol` and use `fifo_by_symbol`.
+    """
+    res = fifo_symbol(sorted([x for x in txs if x.symbol == symbol], key=lambda x: x.date), symbol=symbol)
+    return res.matches, res.warnings
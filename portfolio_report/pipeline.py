@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import csv
 import datetime as dt
 import json
@@ -8,7 +9,7 @@ from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from portfolio_report.fifo import fifo_realized_pnl
+from portfolio_report.fifo import fifo_by_symbol
 from portfolio_report.holdings import load_holdings
 from portfolio_report.monthly_perf import load_monthly_perf
 from portfolio_report.prices import daily_returns, load_prices
@@ -73,6 +74,7 @@ def run_pipeline(
     benchmark_symbol: str,
     download_prices: bool,
     include_fees_as_flow: bool,
+    fifo_workers: int | None = None,
 ) -> None:
     warnings: list[str] = []
 
@@ -191,10 +193,10 @@ def run_pipeline(
     # Realized P&L (FIFO), monthly aggregates.
     realized_rows: list[dict] = []
     realized_warn: list[str] = []
-    for sym in sorted(traded_symbols):
-        matches, w = fifo_realized_pnl(txs, symbol=sym)
-        realized_warn.extend(w)
-        for m in matches:
+    fifo = fifo_by_symbol(tx_by_sym, symbols=sorted(traded_symbols), max_workers=fifo_workers)
+    for sym, res in fifo.items():
+        realized_warn.extend(res.warnings)
+        for m in res.matches:
             realized_rows.append(
                 {
                     "symbol": m.symbol,
@@ -209,7 +211,8 @@ def run_pipeline(
 
     # Holdings reconstruction (qty over time) for contribution approximation.
     # If sells exceed in-period buys, infer a starting (carry-in) position so quantities don't go negative.
-    qty_by_sym_date: dict[tuple[str, dt.date], float] = {}
+    # Per symbol: distinct transaction dates (ascending) and the quantity held after each date's last fill.
+    qty_path_by_sym: dict[str, tuple[list[dt.date], list[float]]] = {}
     seed_qty_by_sym: dict[str, float] = {}
     for sym in sorted(traded_symbols):
         running = 0.0
@@ -227,8 +230,15 @@ def run_pipeline(
         seed = -min_running if min_running < -1e-9 else 0.0
         if seed > 0:
             seed_qty_by_sym[sym] = seed
+        dates: list[dt.date] = []
+        qtys: list[float] = []
         for d, q in by_date:
-            qty_by_sym_date[(sym, d)] = q + seed
+            if dates and dates[-1] == d:
+                qtys[-1] = q + seed
+            else:
+                dates.append(d)
+                qtys.append(q + seed)
+        qty_path_by_sym[sym] = (dates, qtys)
 
     # Month-level position contributions (approx avg weight × return + dividend yield contribution).
     contrib_rows: list[dict] = []
@@ -238,6 +248,7 @@ def run_pipeline(
         if ps is None or not ps.points:
             continue
         seed = float(seed_qty_by_sym.get(sym, 0.0))
+        qty_dates, qty_vals = qty_path_by_sym.get(sym, ([], []))
         if seed > 0:
             contrib_warn.append(f"{sym}: inferred starting position of {seed:.6g} shares (carry-in holdings); contribution is approximate.")
         for me in mes:
@@ -255,11 +266,10 @@ def run_pipeline(
             # Quantity at start/end (approx using last transaction qty before date).
             def qty_on(d: dt.date) -> float:
                 # carry forward last known qty.
-                cand = [dd for (s, dd) in qty_by_sym_date.keys() if s == sym and dd <= d]
-                if not cand:
+                i = bisect.bisect_right(qty_dates, d)
+                if i == 0:
                     return float(seed_qty_by_sym.get(sym, 0.0))
-                last_d = max(cand)
-                return float(qty_by_sym_date[(sym, last_d)])
+                return float(qty_vals[i - 1])
 
             q0 = qty_on(ms)
             q1 = qty_on(me)
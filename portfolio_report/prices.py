@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import datetime as dt
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -44,14 +45,16 @@ class PriceSeries:
         return out
 
 
+@lru_cache(maxsize=1024)
 def _norm_key(s: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "_" for ch in (s or "")).strip("_")
 
 
-def load_price_csv(path: Path, symbol: str) -> PriceSeries:
-    warnings: list[str] = []
-    text = path.read_text(encoding="utf-8-sig", errors="replace")
-    delim = sniff_delimiter(text)
+def parse_price_rows(text: str, *, delimiter: str | None = None) -> list[tuple[dt.date, float]]:
+    """
+    Parse usable (date, close) rows from price CSV text, in file order (unsorted, not deduped).
+    """
+    delim = delimiter or sniff_delimiter(text)
     reader = csv.DictReader(text.splitlines(), delimiter=delim)
     out: list[tuple[dt.date, float]] = []
     for row in reader:
@@ -77,6 +80,13 @@ def load_price_csv(path: Path, symbol: str) -> PriceSeries:
         if px is None or px <= 0:
             continue
         out.append((d, float(px)))
+    return out
+
+
+def load_price_csv(path: Path, symbol: str) -> PriceSeries:
+    warnings: list[str] = []
+    text = path.read_text(encoding="utf-8-sig", errors="replace")
+    out = parse_price_rows(text)
     out.sort(key=lambda x: x[0])
     dedup: dict[dt.date, float] = {}
     for d, px in out:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import csv
 import datetime as dt
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -35,6 +36,7 @@ class NormalizedTransaction:
     external_cashflow_investor: float | None
 
 
+@lru_cache(maxsize=1024)
 def _norm_key(s: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "_" for ch in (s or "")).strip("_")
 
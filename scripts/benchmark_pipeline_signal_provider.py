@@ -0,0 +1,65 @@
+"""Benchmark the windowed vs incremental pipeline-backtest signal providers.
+
+Runs both providers bar-by-bar over the same synthetic regime-switching frame,
+reports wall time per provider and confirms the decoded labels agree.
+
+    python scripts/benchmark_pipeline_signal_provider.py --years 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.regime.pipeline_backtest import (  # noqa: E402
+    PipelineBacktestConfig,
+    _IncrementalSignalProvider,
+    _normalize_market_frame,
+    _ProductionSignalProvider,
+)
+from tests.regime._fixtures import regime_switching_frame  # noqa: E402
+
+
+def _run(provider, frame: pd.DataFrame, config: PipelineBacktestConfig) -> tuple[float, list[str | None]]:
+    labels: list[str | None] = []
+    started = time.perf_counter()
+    for idx in range(int(config.training_window), len(frame)):
+        signal = provider("BENCH", pd.Timestamp(frame.index[idx]), frame.iloc[: idx + 1], config, None)
+        labels.append(signal.regime if signal is not None else None)
+    return time.perf_counter() - started, labels
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=float, default=8.0, help="Synthetic history length in trading years.")
+    parser.add_argument("--refit-step", type=int, default=21)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    frame = _normalize_market_frame(regime_switching_frame(int(args.years * 252), args.seed, start="2005-01-03"))
+    config = PipelineBacktestConfig(refit_step=int(args.refit_step))
+    windowed_seconds, windowed_labels = _run(_ProductionSignalProvider(), frame, config)
+    incremental_seconds, incremental_labels = _run(_IncrementalSignalProvider(frame, config), frame, config)
+    mismatches = sum(1 for left, right in zip(windowed_labels, incremental_labels) if left != right)
+
+    bars = len(windowed_labels)
+    print(f"bars={bars} refit_step={config.refit_step} training_window={config.training_window}")
+    print(f"windowed:    {windowed_seconds:8.2f}s  ({1000 * windowed_seconds / max(1, bars):.2f} ms/bar)")
+    print(f"incremental: {incremental_seconds:8.2f}s  ({1000 * incremental_seconds / max(1, bars):.2f} ms/bar)")
+    print(f"speedup:     {windowed_seconds / max(incremental_seconds, 1e-9):8.2f}x")
+    print(f"label mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
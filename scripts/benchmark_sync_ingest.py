@@ -0,0 +1,144 @@
+"""Benchmark ``run_sync`` ingestion on a synthetic broker transaction history.
+
+Builds a fake adapter that pages through a synthetic history (default 50k rows
+spread over 200 tickers and two accounts), runs a FULL sync into a fresh SQLite
+database, then re-runs it to time the all-duplicates path and confirm the import
+is idempotent.
+
+    python scripts/benchmark_sync_ingest.py --rows 50000 --page-size 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session, sessionmaker
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import src.core.sync_runner as sync_runner  # noqa: E402
+from src.db.models import Base, ExternalConnection, TaxpayerEntity, Transaction  # noqa: E402
+from src.importers.adapters import BrokerAdapter  # noqa: E402
+from src.utils.time import now_utc  # noqa: E402
+
+
+class SyntheticAdapter(BrokerAdapter):
+    def __init__(self, pages: list[list[dict]]):
+        self._pages = pages
+
+    @property
+    def page_size(self) -> int:
+        return len(self._pages[0]) if self._pages else 0
+
+    def fetch_accounts(self, connection):
+        return [
+            {"provider_account_id": "A1", "name": "Bench Taxable", "account_type": "TAXABLE"},
+            {"provider_account_id": "A2", "name": "Bench IRA", "account_type": "IRA"},
+        ]
+
+    def fetch_transactions(self, connection, start_date, end_date, cursor=None):
+        idx = int(cursor) if cursor is not None else 0
+        if idx >= len(self._pages):
+            return [], None
+        next_cursor = str(idx + 1) if (idx + 1) < len(self._pages) else None
+        return self._pages[idx], next_cursor
+
+    def fetch_holdings(self, connection, as_of=None):
+        return {"as_of": (as_of or now_utc()).isoformat(), "items": []}
+
+    def test_connection(self, connection):
+        return {"ok": True, "message": "ok"}
+
+
+def synthetic_pages(rows: int, page_size: int, tickers: int, seed: int) -> list[list[dict]]:
+    rng = np.random.default_rng(seed)
+    start = dt.date(2015, 1, 2)
+    types = np.array(["BUY", "SELL", "DIV", "FEE"])
+    items = []
+    for number in range(rows):
+        kind = str(types[rng.integers(0, len(types))])
+        qty = float(rng.integers(1, 200)) if kind in {"BUY", "SELL"} else None
+        amount = round(float(rng.uniform(10, 5000)), 2) * (-1 if kind in {"BUY", "FEE"} else 1)
+        items.append(
+            {
+                "provider_transaction_id": f"BENCH-{number:07d}",
+                "provider_account_id": "A1" if number % 3 else "A2",
+                "date": (start + dt.timedelta(days=int(number * 3650 / max(rows, 1)))).isoformat(),
+                "type": kind,
+                "symbol": f"T{int(rng.integers(0, tickers)):03d}" if kind != "FEE" else None,
+                "qty": qty,
+                "amount": amount,
+            }
+        )
+    return [items[offset : offset + page_size] for offset in range(0, len(items), page_size)]
+
+
+def _timed_sync(session: Session, connection_id: int, mode: str) -> tuple[float, dict]:
+    started = time.perf_counter()
+    run = sync_runner.run_sync(
+        session,
+        connection_id=connection_id,
+        mode=mode,
+        start_date=dt.date(2015, 1, 1),
+        end_date=dt.date(2025, 12, 31),
+        store_payloads=False,
+        pull_holdings=False,
+        actor="benchmark",
+    )
+    session.commit()
+    return time.perf_counter() - started, dict(run.coverage_json or {})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=1_000)
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    pages = synthetic_pages(int(args.rows), max(1, int(args.page_size)), int(args.tickers), int(args.seed))
+    adapter = SyntheticAdapter(pages)
+    sync_runner._adapter_for = lambda _connection: adapter
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", future=True)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine, class_=Session, autoflush=False, autocommit=False)
+        with factory() as session:
+            taxpayer = TaxpayerEntity(name="Bench", type="TRUST")
+            session.add(taxpayer)
+            session.flush()
+            connection = ExternalConnection(
+                name="Bench",
+                provider="YODLEE",
+                broker="IB",
+                taxpayer_entity_id=taxpayer.id,
+                status="ACTIVE",
+                metadata_json={},
+            )
+            session.add(connection)
+            session.commit()
+
+            print(f"rows={args.rows} pages={len(pages)} page_size={args.page_size} tickers={args.tickers}")
+            first_seconds, first = _timed_sync(session, connection.id, "FULL")
+            print(f"first import: {first_seconds:.2f}s new_inserted={first.get('new_inserted')}")
+            second_seconds, second = _timed_sync(session, connection.id, "FULL")
+            print(f"re-import:    {second_seconds:.2f}s duplicates_skipped={second.get('duplicates_skipped')}")
+            stored = int(session.query(func.count(Transaction.id)).scalar() or 0)
+    idempotent = stored == int(args.rows) and int(second.get("new_inserted") or 0) == 0
+    print(f"stored_transactions={stored} idempotent={idempotent}")
+    return 0 if idempotent else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Benchmark interval-sweep vs row-by-row sample uniqueness weights.
+
+Builds a synthetic multi-ticker labeled frame (default 500 tickers x 20 years of
+daily managed-exit labels), times ``sample_uniqueness_weights`` on the full
+frame, and times the row-by-row reference on a ticker subset to report the
+speedup and confirm parity.
+
+    python scripts/benchmark_uniqueness_weights.py --tickers 500 --years 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.regime.triple_barrier import sample_uniqueness_weights  # noqa: E402
+from tests.regime._triple_barrier_reference import sample_uniqueness_weights_reference  # noqa: E402
+
+
+def synthetic_labeled_frame(tickers: int, years: float, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2005-01-03", periods=int(years * 252))
+    rows = len(dates)
+    frames = []
+    for number in range(tickers):
+        end_offsets = np.minimum(np.arange(rows) + rng.integers(1, 22, rows), rows - 1)
+        outcome = rng.integers(0, 2, rows).astype(float)
+        outcome[rng.random(rows) < 0.4] = np.nan
+        frames.append(
+            pd.DataFrame(
+                {
+                    "ticker": f"T{number:04d}",
+                    "barrier_outcome": outcome,
+                    "label_end_idx": end_offsets,
+                    "label_entry_date": dates,
+                    "label_end_date": dates[end_offsets],
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _timed(func, frame: pd.DataFrame) -> tuple[float, pd.Series]:
+    started = time.perf_counter()
+    weights = func(frame)
+    return time.perf_counter() - started, weights
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--years", type=float, default=20.0)
+    parser.add_argument("--reference-tickers", type=int, default=5, help="Tickers timed with the row-by-row reference.")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    frame = synthetic_labeled_frame(int(args.tickers), float(args.years), int(args.seed))
+    positional = frame.drop(columns=["label_entry_date", "label_end_date"])
+    subset_tickers = frame["ticker"].unique()[: max(1, int(args.reference_tickers))]
+    print(f"rows={len(frame)} tickers={args.tickers} years={args.years} reference_tickers={len(subset_tickers)}")
+
+    failures = 0
+    for name, data in (("date", frame), ("positional", positional)):
+        full_seconds, _weights = _timed(sample_uniqueness_weights, data)
+        subset = data.loc[data["ticker"].isin(subset_tickers)]
+        fast_seconds, fast = _timed(sample_uniqueness_weights, subset)
+        reference_seconds, reference = _timed(sample_uniqueness_weights_reference, subset)
+        max_diff = float(np.max(np.abs(fast.to_numpy() - reference.to_numpy()))) if len(subset) else 0.0
+        failures += int(max_diff > 1e-9)
+        print(f"[{name}] full frame:     {full_seconds:8.2f}s")
+        print(f"[{name}] subset sweep:   {fast_seconds:8.3f}s  reference: {reference_seconds:8.2f}s")
+        print(f"[{name}] subset speedup: {reference_seconds / max(fast_seconds, 1e-9):8.1f}x  max |diff|={max_diff:.2e}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
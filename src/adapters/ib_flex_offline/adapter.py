@@ -405,6 +405,26 @@ def _iter_cash_rows(fp):
         yield d
 
 
+def _iter_flex_xml(source):
+    """
+    Stream a Flex XML document as (tag, attrs) pairs without building the whole DOM.
+
+    `source` is a path or binary file object. Elements are yielded in document order (the same
+    order as `root.iter()`), as soon as their start tag is read. Finished elements are detached
+    from their parent, so memory stays bounded by nesting depth rather than statement size.
+    Tags are returned as written (namespace included).
+    """
+    open_elements: list[ElementTree.Element] = []
+    for event, el in ElementTree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            open_elements.append(el)
+            yield el.tag, el.attrib
+            continue
+        open_elements.pop()
+        if open_elements:
+            open_elements[-1].remove(el)
+
+
 _CCY_RE = re.compile(r"^[A-Z]{3}$")
 
 
@@ -701,13 +721,13 @@ class IBFlexOfflineAdapter(BrokerAdapter):
                     )
             else:
                 # Minimal XML support: look for <Position symbol="..." position="..." marketValue="..."/>
-                root = ElementTree.fromstring(p.read_text(encoding="utf-8"))
-                for idx, pos in enumerate(root.findall(".//Position")):
-                    symbol = pos.attrib.get("symbol") or pos.attrib.get("ticker")
+                positions = (attrs for tag, attrs in _iter_flex_xml(p) if tag == "Position")
+                for idx, pos_attrs in enumerate(positions):
+                    symbol = pos_attrs.get("symbol") or pos_attrs.get("ticker")
                     if not symbol:
                         continue
-                    qty = pos.attrib.get("position") or pos.attrib.get("qty")
-                    mv = pos.attrib.get("marketValue") or pos.attrib.get("value")
+                    qty = pos_attrs.get("position") or pos_attrs.get("qty")
+                    mv = pos_attrs.get("marketValue") or pos_attrs.get("value")
                     items.append(
                         {
                             "provider_account_id": "IBFLEX-1",
@@ -989,63 +1009,67 @@ class IBFlexOfflineAdapter(BrokerAdapter):
                 for _k, rec in cash_balance_last.items():
                     items.append(rec)
             else:
-                # Minimal Flex XML support.
-                root = ElementTree.fromstring(p.read_text(encoding="utf-8"))
-                # Trade-like nodes
-                for row_idx, node in enumerate(root.findall(".//Trade")):
-                    d_s = node.attrib.get("tradeDate") or node.attrib.get("dateTime") or ""
-                    d = _parse_date(d_s)
-                    symbol = node.attrib.get("symbol") or node.attrib.get("ticker")
-                    qty = node.attrib.get("quantity")
-                    amt = node.attrib.get("netCash") or node.attrib.get("proceeds") or node.attrib.get("amount")
-                    side = node.attrib.get("buySell") or node.attrib.get("action") or ""
-                    tx_type = _map_tx_type(side)
-                    desc = node.attrib.get("description") or f"{tx_type} {symbol or ''}".strip()
-                    txid = node.attrib.get("transactionID") or node.attrib.get("tradeID")
-                    if not txid:
-                        key = f"{d.isoformat()}|{tx_type}|{symbol or ''}|{qty or ''}|{amt or ''}|{desc}"
-                        txid = f"FILE:{f.file_hash}:{_sha256_bytes(key.encode('utf-8'))}"
-                    items.append(
-                        {
-                            "provider_transaction_id": txid,
-                            "provider_account_id": "IBFLEX-1",
-                            "date": d.isoformat(),
-                            "type": tx_type,
-                            "symbol": symbol,
-                            "qty": _as_float(qty) if qty is not None else None,
-                            "amount": _as_float(amt) if amt is not None else 0.0,
-                            "description": desc,
-                            "source_file": p.name,
-                            "source_row": row_idx + 1,
-                        }
-                    )
-                # CashTransaction-like nodes
-                for row_idx, node in enumerate(root.findall(".//CashTransaction")):
-                    d_s = node.attrib.get("date") or node.attrib.get("dateTime") or ""
-                    d = _parse_date(d_s)
-                    symbol = node.attrib.get("symbol") or node.attrib.get("ticker")
-                    amt = node.attrib.get("amount") or node.attrib.get("netCash")
-                    raw_type = node.attrib.get("type") or node.attrib.get("description") or "OTHER"
-                    tx_type = _map_tx_type(raw_type)
-                    desc = node.attrib.get("description") or str(raw_type)
-                    txid = node.attrib.get("transactionID")
-                    if not txid:
-                        key = f"{d.isoformat()}|{tx_type}|{symbol or ''}|{amt or ''}|{desc}"
-                        txid = f"FILE:{f.file_hash}:{_sha256_bytes(key.encode('utf-8'))}"
-                    items.append(
-                        {
-                            "provider_transaction_id": txid,
-                            "provider_account_id": "IBFLEX-1",
-                            "date": d.isoformat(),
-                            "type": tx_type,
-                            "symbol": symbol,
-                            "qty": None,
-                            "amount": _as_float(amt) if amt is not None else 0.0,
-                            "description": desc,
-                            "source_file": p.name,
-                            "source_row": row_idx + 1,
-                        }
-                    )
+                # Minimal Flex XML support: one streaming pass; trades are emitted before cash rows.
+                trade_items: list[dict[str, Any]] = []
+                cash_items: list[dict[str, Any]] = []
+                for tag, attrs in _iter_flex_xml(p):
+                    if tag == "Trade":
+                        # Trade-like nodes
+                        d_s = attrs.get("tradeDate") or attrs.get("dateTime") or ""
+                        d = _parse_date(d_s)
+                        symbol = attrs.get("symbol") or attrs.get("ticker")
+                        qty = attrs.get("quantity")
+                        amt = attrs.get("netCash") or attrs.get("proceeds") or attrs.get("amount")
+                        side = attrs.get("buySell") or attrs.get("action") or ""
+                        tx_type = _map_tx_type(side)
+                        desc = attrs.get("description") or f"{tx_type} {symbol or ''}".strip()
+                        txid = attrs.get("transactionID") or attrs.get("tradeID")
+                        if not txid:
+                            key = f"{d.isoformat()}|{tx_type}|{symbol or ''}|{qty or ''}|{amt or ''}|{desc}"
+                            txid = f"FILE:{f.file_hash}:{_sha256_bytes(key.encode('utf-8'))}"
+                        trade_items.append(
+                            {
+                                "provider_transaction_id": txid,
+                                "provider_account_id": "IBFLEX-1",
+                                "date": d.isoformat(),
+                                "type": tx_type,
+                                "symbol": symbol,
+                                "qty": _as_float(qty) if qty is not None else None,
+                                "amount": _as_float(amt) if amt is not None else 0.0,
+                                "description": desc,
+                                "source_file": p.name,
+                                "source_row": len(trade_items) + 1,
+                            }
+                        )
+                    elif tag == "CashTransaction":
+                        # CashTransaction-like nodes
+                        d_s = attrs.get("date") or attrs.get("dateTime") or ""
+                        d = _parse_date(d_s)
+                        symbol = attrs.get("symbol") or attrs.get("ticker")
+                        amt = attrs.get("amount") or attrs.get("netCash")
+                        raw_type = attrs.get("type") or attrs.get("description") or "OTHER"
+                        tx_type = _map_tx_type(raw_type)
+                        desc = attrs.get("description") or str(raw_type)
+                        txid = attrs.get("transactionID")
+                        if not txid:
+                            key = f"{d.isoformat()}|{tx_type}|{symbol or ''}|{amt or ''}|{desc}"
+                            txid = f"FILE:{f.file_hash}:{_sha256_bytes(key.encode('utf-8'))}"
+                        cash_items.append(
+                            {
+                                "provider_transaction_id": txid,
+                                "provider_account_id": "IBFLEX-1",
+                                "date": d.isoformat(),
+                                "type": tx_type,
+                                "symbol": symbol,
+                                "qty": None,
+                                "amount": _as_float(amt) if amt is not None else 0.0,
+                                "description": desc,
+                                "source_file": p.name,
+                                "source_row": len(cash_items) + 1,
+                            }
+                        )
+                items.extend(trade_items)
+                items.extend(cash_items)
         except Exception as e:
             raise ProviderError(f"Failed to parse transactions file {p.name}: {type(e).__name__}: {e}")
 
@@ -12,7 +12,8 @@ import csv
 import io
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from itertools import chain
+from typing import Any, Iterable, Iterator, Optional
 
 from src.core.net import http_get
 from src.importers.adapters import BrokerAdapter, ProviderError, RangeTooLargeError
@@ -26,6 +27,7 @@ from src.adapters.ib_flex_offline.adapter import (  # noqa: E402
     _extract_cash_amount,
     _extract_currency,
     _get_any,
+    _iter_flex_xml,
     _sha256_bytes,
 )
 
@@ -41,6 +43,17 @@ def _strip_ns(tag: str) -> str:
     return tag
 
 
+def _iter_report_elements(payload: bytes):
+    """
+    Stream (tag, attrs) pairs from a Flex report payload in document order, namespace stripped.
+    """
+    try:
+        for tag, attrs in _iter_flex_xml(io.BytesIO(payload)):
+            yield _strip_ns(tag), attrs
+    except ET.ParseError as exc:
+        raise ProviderError("IB Flex report payload was not XML.") from exc
+
+
 def _yyyymmdd(d: dt.date) -> str:
     return d.strftime("%Y%m%d")
 
@@ -323,6 +336,180 @@ class FlexReport:
     payload_path: Optional[str]
 
 
+def _iter_report_trades(rep: FlexReport, metrics: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    Stream normalized Trade rows (executions plus CLOSED_LOT/WASH_SALE detail) from one pass over the payload.
+    """
+    for tag, attrs in _iter_report_elements(rep.payload):
+        if tag != "Trade":
+            continue
+        level = (attrs.get("levelOfDetail") or attrs.get("LevelOfDetail") or "EXECUTION").strip().upper()
+        acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+        provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+        symbol = (attrs.get("symbol") or attrs.get("Symbol") or "").strip().upper()
+        trade_date = _parse_ib_date(str(attrs.get("tradeDate") or attrs.get("TradeDate") or attrs.get("dateTime") or attrs.get("DateTime") or "") or None)
+        if trade_date is None:
+            continue
+        qty = _as_float_or_none(attrs.get("quantity") or attrs.get("Quantity"))
+        # Build a row dict compatible with offline helpers.
+        row: dict[str, Any] = {
+            "ClientAccountID": acct,
+            "DateTime": attrs.get("dateTime") or attrs.get("DateTime") or "",
+            "TradeDate": attrs.get("tradeDate") or attrs.get("TradeDate") or "",
+            "Symbol": symbol,
+            "Quantity": qty,
+            "Buy/Sell": attrs.get("buySell") or attrs.get("BuySell") or attrs.get("side") or attrs.get("Side") or "",
+            "NetCash": attrs.get("netCash") or attrs.get("NetCash") or attrs.get("proceeds") or attrs.get("Proceeds") or attrs.get("tradeMoney") or attrs.get("TradeMoney") or "",
+            "Description": attrs.get("description") or attrs.get("Description") or "",
+            "Type": attrs.get("transactionType") or attrs.get("type") or attrs.get("Type") or "",
+            "LevelOfDetail": level,
+            "TransactionID": attrs.get("transactionID") or attrs.get("TransactionID") or attrs.get("transactionId") or "",
+            "TradeID": attrs.get("tradeID") or attrs.get("TradeID") or attrs.get("tradeId") or "",
+            "CostBasis": attrs.get("costBasis") or attrs.get("CostBasis") or "",
+            "FifoPnlRealized": attrs.get("fifoPnlRealized") or attrs.get("FifoPnlRealized") or "",
+            "OpenDateTime": attrs.get("openDateTime") or attrs.get("OpenDateTime") or "",
+            "HoldingPeriodDateTime": attrs.get("holdingPeriodDateTime") or attrs.get("HoldingPeriodDateTime") or "",
+            "WhenRealized": attrs.get("whenRealized") or attrs.get("WhenRealized") or "",
+            "WhenReopened": attrs.get("whenReopened") or attrs.get("WhenReopened") or "",
+            "CurrencyPrimary": attrs.get("currency") or attrs.get("currencyPrimary") or attrs.get("CurrencyPrimary") or "USD",
+            "FXRateToBase": attrs.get("fxRateToBase") or attrs.get("FXRateToBase") or "",
+            "Conid": attrs.get("conid") or attrs.get("Conid") or "",
+        }
+        desc = str(row.get("Description") or "")
+        is_trade = True
+        cash = _extract_cash_amount(row, is_trade=is_trade)
+        tx_type = _classify_activity_row(row, qty=qty, cash=cash, description=desc)
+        metrics["trades_seen"] += 1
+
+        txid = str(row.get("TransactionID") or row.get("TradeID") or "").strip()
+        if not txid:
+            key = f"{provider_account_id}|{trade_date.isoformat()}|{level}|{symbol}|{qty or ''}|{cash or ''}|{desc}"
+            txid = f"WEB:{rep.payload_hash}:{_sha256_bytes(key.encode('utf-8'))}"
+
+        if level in {"CLOSED_LOT", "WASH_SALE"}:
+            cost_basis = _as_float_or_none(row.get("CostBasis"))
+            fifo_realized = _as_float_or_none(row.get("FifoPnlRealized"))
+            proceeds = (cost_basis + fifo_realized) if (cost_basis is not None and fifo_realized is not None) else None
+            yield {
+                "record_kind": "BROKER_CLOSED_LOT" if level == "CLOSED_LOT" else "BROKER_WASH_SALE",
+                "provider_account_id": provider_account_id,
+                "symbol": symbol,
+                "date": trade_date.isoformat(),
+                "qty": abs(float(qty or 0.0)),
+                "cost_basis": cost_basis,
+                "realized_pl_fifo": fifo_realized,
+                "proceeds_derived": proceeds,
+                "currency": str(row.get("CurrencyPrimary") or "USD").strip().upper(),
+                "fx_rate_to_base": _as_float_or_none(row.get("FXRateToBase")),
+                "conid": row.get("Conid") or None,
+                "ib_transaction_id": row.get("TransactionID") or None,
+                "ib_trade_id": row.get("TradeID") or None,
+                "datetime_raw": row.get("DateTime") or None,
+                "open_datetime_raw": row.get("OpenDateTime") or None,
+                "holding_period_datetime_raw": row.get("HoldingPeriodDateTime") or None,
+                "when_realized_raw": row.get("WhenRealized") or None,
+                "when_reopened_raw": row.get("WhenReopened") or None,
+                "source_file": f"IB_FLEX_WEB:{rep.query_id}",
+                "source_row": None,
+                "source_file_hash": rep.payload_hash,
+                "raw_row": attrs,
+                "provider_transaction_id": txid,
+            }
+            if level == "CLOSED_LOT":
+                metrics["closed_lot_rows_seen"] += 1
+            else:
+                metrics["wash_sale_rows_seen"] += 1
+            continue
+
+        # Executions -> main Transaction import path.
+        amount = float(cash or 0.0) if cash is not None else 0.0
+        qty_out: float | None = abs(float(qty)) if qty not in (None, "") else None
+        if tx_type == "BUY":
+            amount = -abs(amount)
+            if qty_out is not None:
+                qty_out = abs(qty_out)
+        elif tx_type == "SELL":
+            amount = abs(amount)
+            if qty_out is not None:
+                qty_out = abs(qty_out)
+        yield {
+            "date": trade_date.isoformat(),
+            "type": tx_type,
+            "ticker": symbol or None,
+            "qty": qty_out,
+            "amount": float(amount),
+            "description": desc,
+            "provider_transaction_id": txid,
+            "provider_account_id": provider_account_id,
+            "source_file_hash": rep.payload_hash,
+            "currency": (_extract_currency(row) or "USD").strip().upper(),
+        }
+
+
+def _iter_report_cash_transactions(rep: FlexReport, metrics: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """
+    Stream normalized CashTransaction rows from one pass over the payload.
+    """
+    for tag, attrs in _iter_report_elements(rep.payload):
+        if tag not in {"CashTransaction", "CashTransactions"}:
+            continue
+        # Leaf records must have an Amount.
+        amt_s = attrs.get("amount") or attrs.get("Amount")
+        if amt_s in (None, ""):
+            continue
+        level = (attrs.get("levelOfDetail") or attrs.get("LevelOfDetail") or "").strip().upper()
+        if level == "SUMMARY":
+            continue
+        acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+        provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+        dt_raw = str(attrs.get("dateTime") or attrs.get("DateTime") or attrs.get("date") or attrs.get("Date") or "")
+        d = _parse_ib_date(dt_raw) or _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
+        if d is None:
+            continue
+        symbol = (attrs.get("symbol") or attrs.get("Symbol") or "").strip().upper() or None
+        raw_type = (attrs.get("type") or attrs.get("Type") or attrs.get("transactionType") or "").strip()
+        desc = (attrs.get("description") or attrs.get("Description") or "").strip()
+        ccy = str(attrs.get("currency") or attrs.get("CurrencyPrimary") or attrs.get("currencyPrimary") or "USD").strip().upper() or "USD"
+        row = {
+            "ClientAccountID": acct,
+            "Date/Time": dt_raw,
+            "Amount": amt_s,
+            "Type": raw_type,
+            "Description": desc or raw_type,
+            "Symbol": symbol or "",
+            "CurrencyPrimary": ccy,
+            "LevelOfDetail": level or "DETAIL",
+        }
+        amt = _as_float_or_none(amt_s)
+        if amt is None:
+            continue
+        tx_type = _classify_activity_row(row, qty=None, cash=float(amt), description=str(desc or raw_type))
+        # App conventions for cashflows
+        if tx_type == "WITHHOLDING":
+            amt = abs(float(amt))
+        elif tx_type == "FEE":
+            amt = -abs(float(amt))
+        txid = (
+            str(attrs.get("transactionID") or attrs.get("TransactionID") or attrs.get("tradeID") or attrs.get("TradeID") or "").strip()
+        )
+        if not txid:
+            key = f"{provider_account_id}|{d.isoformat()}|{tx_type}|{symbol or ''}|{amt}|{desc or raw_type}"
+            txid = f"WEB:{rep.payload_hash}:{_sha256_bytes(key.encode('utf-8'))}"
+        metrics["cash_rows_seen"] += 1
+        yield {
+            "date": d.isoformat(),
+            "type": tx_type,
+            "ticker": symbol,
+            "qty": None,
+            "amount": float(amt),
+            "description": desc or raw_type,
+            "provider_transaction_id": txid,
+            "provider_account_id": provider_account_id,
+            "source_file_hash": rep.payload_hash,
+            "currency": (_extract_currency(row) or "USD").strip().upper(),
+        }
+
+
 class IBFlexWebAdapter(BrokerAdapter):
     """
     Live IB Flex Web Service adapter (manual refresh; no broker sync automation).
@@ -761,17 +948,15 @@ class IBFlexWebAdapter(BrokerAdapter):
     def _accounts_from_report_xml(self, payload: bytes) -> set[str]:
         out: set[str] = set()
         try:
-            root = ET.fromstring(payload)
+            for _tag, attrs in _iter_report_elements(payload):
+                for k in ("accountId", "accountID", "clientAccountID", "ClientAccountID"):
+                    v = attrs.get(k)
+                    if v:
+                        s = str(v).strip()
+                        if s and s != "-":
+                            out.add(s)
         except Exception:
-            return out
-        for el in root.iter():
-            attrs = getattr(el, "attrib", {}) or {}
-            for k in ("accountId", "accountID", "clientAccountID", "ClientAccountID"):
-                v = attrs.get(k)
-                if v:
-                    s = str(v).strip()
-                    if s and s != "-":
-                        out.add(s)
+            return set()
         return out
 
     def fetch_accounts(self, connection: Any) -> list[dict[str, Any]]:
@@ -838,7 +1023,8 @@ class IBFlexWebAdapter(BrokerAdapter):
             qid = self._resolve_query_id(token=token, query=query_ids[0], connection=connection)
             rep = self._download_report(connection, token=token, query_id=qid, start=today, end=today)
             try:
-                ET.fromstring(rep.payload)
+                for _ in _iter_report_elements(rep.payload):
+                    pass
             except Exception:
                 return {"ok": False, "message": "Fetched report but it was not valid XML."}
             return {"ok": True, "message": "OK (IB Flex Web Service)", "payload_hash_prefix": rep.payload_hash[:12]}
@@ -854,12 +1040,13 @@ class IBFlexWebAdapter(BrokerAdapter):
         *,
         start_date: dt.date,
         end_date: dt.date,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
+    ) -> tuple[Iterator[dict[str, Any]], dict[str, Any], dict[str, Any]]:
         """
         Returns:
-          - items: normalized transaction-like records for sync runner
+          - items: lazy iterator of normalized transaction-like records for sync runner (payload marker,
+            trades, cash rows, CASH_BALANCE rows); trades and cash rows are parsed as they are consumed
           - holdings: dict(as_of, items, payload_hashes)
-          - metrics: coverage-ish counters for this report
+          - metrics: coverage-ish counters for this report (trade/cash counts fill in as items are consumed)
         """
         metrics: dict[str, Any] = {
             "payload_hash": rep.payload_hash,
@@ -870,25 +1057,16 @@ class IBFlexWebAdapter(BrokerAdapter):
             "closed_lot_rows_seen": 0,
             "wash_sale_rows_seen": 0,
         }
-        items: list[dict[str, Any]] = []
-
-        # Report payload marker for sync_runner idempotency.
-        items.append(
-            {
-                "record_kind": "REPORT_PAYLOAD",
-                "payload_hash": rep.payload_hash,
-                "source": "IB_FLEX_WEB",
-                "query_id": rep.query_id,
-                "reference_code": rep.reference_code,
-                "payload_path": rep.payload_path,
-                "bytes": len(rep.payload),
-            }
-        )
-
-        try:
-            root = ET.fromstring(rep.payload)
-        except Exception:
-            raise ProviderError("IB Flex report payload was not XML.")
+        # Report payload marker for sync_runner idempotency; it leads the page so duplicates are skipped early.
+        marker: dict[str, Any] = {
+            "record_kind": "REPORT_PAYLOAD",
+            "payload_hash": rep.payload_hash,
+            "source": "IB_FLEX_WEB",
+            "query_id": rep.query_id,
+            "reference_code": rep.reference_code,
+            "payload_path": rep.payload_path,
+            "bytes": len(rep.payload),
+        }
 
         # Holdings snapshot (Open Positions).
         #
@@ -898,145 +1076,128 @@ class IBFlexWebAdapter(BrokerAdapter):
         # from another, which breaks portfolio valuations and performance reporting.
         holdings_items_by_date: dict[dt.date, list[dict[str, Any]]] = {}
         equity_by_acct_date: dict[tuple[str, dt.date], dict[str, float]] = {}
-        cash_report_by_acct_date: dict[tuple[str, dt.date], float] = {}
+        # CashReport rows take precedence over CashReportCurrency rows for the same account/date.
+        cash_report_currency_by_acct_date: dict[tuple[str, dt.date], float] = {}
+        cash_report_plain_by_acct_date: dict[tuple[str, dt.date], float] = {}
         flex_meta: dict[str, Any] = {}
 
-        # FlexStatement meta (useful for debugging "range ignored" issues).
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag != "FlexStatement":
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            flex_meta = {
-                "accountId": (attrs.get("accountId") or attrs.get("AccountId") or "").strip() or None,
-                "fromDate": attrs.get("fromDate") or attrs.get("FromDate"),
-                "toDate": attrs.get("toDate") or attrs.get("ToDate"),
-                "period": attrs.get("period") or attrs.get("Period"),
-                "whenGenerated": attrs.get("whenGenerated") or attrs.get("WhenGenerated"),
-            }
-            break
-
-        # Equity summary (base-currency cash/stock/total by reportDate).
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag != "EquitySummaryByReportDateInBase":
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            d = _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
-            if d is None:
-                continue
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            cash = _as_float_or_none(attrs.get("cash") or attrs.get("Cash") or attrs.get("cashLong") or attrs.get("CashLong"))
-            stock = _as_float_or_none(attrs.get("stock") or attrs.get("Stock") or attrs.get("stockLong") or attrs.get("StockLong"))
-            total = _as_float_or_none(attrs.get("total") or attrs.get("Total") or attrs.get("totalLong") or attrs.get("TotalLong"))
-            rec: dict[str, float] = {}
-            if cash is not None:
-                rec["cash"] = float(cash)
-            if stock is not None:
-                rec["stock"] = float(stock)
-            if total is not None:
-                rec["total"] = float(total)
-            if rec:
-                equity_by_acct_date[(provider_account_id, d)] = rec
-
-        # Cash report (base-currency ending cash by toDate).
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag != "CashReportCurrency":
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            d = _parse_ib_date(str(attrs.get("toDate") or attrs.get("ToDate") or "") or None)
-            if d is None:
-                continue
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            ccy = str(attrs.get("currency") or attrs.get("CurrencyPrimary") or attrs.get("currencyPrimary") or "").strip().upper()
-            if ccy and ccy not in {"USD", "BASE_SUMMARY", "BASE"}:
-                continue
-            bal = _as_float_or_none(
-                attrs.get("endingCashSec")
-                or attrs.get("EndingCashSec")
-                or attrs.get("endingCash")
-                or attrs.get("EndingCash")
-            )
-            if bal is None:
+        # One streaming pass for statement meta, holdings and cash balances. Trade and cash rows are
+        # streamed by their own passes when the returned items are consumed, so they are never all held.
+        for tag, attrs in _iter_report_elements(rep.payload):
+            if tag == "FlexStatement":
+                # FlexStatement meta (useful for debugging "range ignored" issues).
+                if flex_meta:
+                    continue
+                flex_meta = {
+                    "accountId": (attrs.get("accountId") or attrs.get("AccountId") or "").strip() or None,
+                    "fromDate": attrs.get("fromDate") or attrs.get("FromDate"),
+                    "toDate": attrs.get("toDate") or attrs.get("ToDate"),
+                    "period": attrs.get("period") or attrs.get("Period"),
+                    "whenGenerated": attrs.get("whenGenerated") or attrs.get("WhenGenerated"),
+                }
+            elif tag == "EquitySummaryByReportDateInBase":
+                # Equity summary (base-currency cash/stock/total by reportDate).
+                d = _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
+                if d is None:
+                    continue
+                acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+                provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+                cash = _as_float_or_none(attrs.get("cash") or attrs.get("Cash") or attrs.get("cashLong") or attrs.get("CashLong"))
+                stock = _as_float_or_none(attrs.get("stock") or attrs.get("Stock") or attrs.get("stockLong") or attrs.get("StockLong"))
+                total = _as_float_or_none(attrs.get("total") or attrs.get("Total") or attrs.get("totalLong") or attrs.get("TotalLong"))
+                rec: dict[str, float] = {}
+                if cash is not None:
+                    rec["cash"] = float(cash)
+                if stock is not None:
+                    rec["stock"] = float(stock)
+                if total is not None:
+                    rec["total"] = float(total)
+                if rec:
+                    equity_by_acct_date[(provider_account_id, d)] = rec
+            elif tag == "CashReportCurrency":
+                # Cash report (base-currency ending cash by toDate).
+                d = _parse_ib_date(str(attrs.get("toDate") or attrs.get("ToDate") or "") or None)
+                if d is None:
+                    continue
+                acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+                provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+                ccy = str(attrs.get("currency") or attrs.get("CurrencyPrimary") or attrs.get("currencyPrimary") or "").strip().upper()
+                if ccy and ccy not in {"USD", "BASE_SUMMARY", "BASE"}:
+                    continue
+                bal = _as_float_or_none(
+                    attrs.get("endingCashSec")
+                    or attrs.get("EndingCashSec")
+                    or attrs.get("endingCash")
+                    or attrs.get("EndingCash")
+                )
+                if bal is None:
+                    bal = _extract_balance_from_attrs(attrs)
+                if bal is None:
+                    continue
+                cash_report_currency_by_acct_date[(provider_account_id, d)] = float(bal)
+            elif tag == "CashReport":
+                # Some Flex queries expose cash balances as <CashReport ... endingCash="..."> without CashReportCurrency rows.
+                # Anchor those to the report's toDate when present; otherwise use the requested end date.
+                acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+                provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+                d = (
+                    _parse_ib_date(str(attrs.get("toDate") or attrs.get("ToDate") or "") or None)
+                    or _parse_ib_date(str(flex_meta.get("toDate") or "") or None)
+                    or end_date
+                )
                 bal = _extract_balance_from_attrs(attrs)
-            if bal is None:
-                continue
-            cash_report_by_acct_date[(provider_account_id, d)] = float(bal)
-
-        # Some Flex queries expose cash balances as <CashReport ... endingCash="..."> without CashReportCurrency rows.
-        # Anchor those to the report's toDate when present; otherwise use the requested end date.
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag != "CashReport":
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            d = (
-                _parse_ib_date(str(attrs.get("toDate") or attrs.get("ToDate") or "") or None)
-                or _parse_ib_date(str(flex_meta.get("toDate") or "") or None)
-                or end_date
-            )
-            bal = _extract_balance_from_attrs(attrs)
-            if bal is None:
-                continue
-            cash_report_by_acct_date[(provider_account_id, d)] = float(bal)
+                if bal is None:
+                    continue
+                cash_report_plain_by_acct_date[(provider_account_id, d)] = float(bal)
+            elif tag in {"OpenPosition", "OpenPositions", "Position", "OpenPositionsSummary"}:
+                # Only leaf records with symbol/qty fields.
+                sym = (attrs.get("symbol") or attrs.get("Symbol") or attrs.get("underlyingSymbol") or "").strip()
+                qty_s = attrs.get("position") or attrs.get("quantity") or attrs.get("qty") or attrs.get("Position") or attrs.get("Quantity")
+                mv_s = attrs.get("marketValue") or attrs.get("positionValue") or attrs.get("value") or attrs.get("MarketValue")
+                if not sym or qty_s in (None, ""):
+                    continue
+                qty = _as_float_or_none(qty_s)
+                if qty is None:
+                    continue
+                mv = _as_float_or_none(mv_s) if mv_s not in (None, "") else None
+                basis = _as_float_or_none(attrs.get("costBasis") or attrs.get("costBasisMoney") or attrs.get("CostBasis"))
+                acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
+                provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
+                report_date = _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
+                if report_date is None:
+                    report_date = _parse_ib_date(str(flex_meta.get("toDate") or "") or None) or end_date
+                sym_u = sym.strip().upper()
+                # Cash positions often show symbol="USD" or similar; normalize to CASH:USD for internal cash fallback.
+                asset_class = (attrs.get("assetClass") or attrs.get("AssetClass") or attrs.get("assetCategory") or attrs.get("AssetCategory") or "").strip().upper()
+                if asset_class == "CASH" or sym_u in {"USD", "CASH", "CASHUSD"}:
+                    sym_u = "CASH:USD"
+                else:
+                    conid = (attrs.get("conid") or attrs.get("Conid") or "").strip()
+                    expiry = (attrs.get("expiry") or attrs.get("Expiry") or "").strip()
+                    strike = (attrs.get("strike") or attrs.get("Strike") or "").strip()
+                    put_call = (attrs.get("putCall") or attrs.get("PutCall") or "").strip().upper()
+                    # IB Flex can emit multiple positions with the same symbol (options/futures/etc.).
+                    # Add a stable suffix to keep those distinct in holdings snapshots.
+                    if conid and asset_class and asset_class not in {"STK", "ETF", "ADR"}:
+                        sym_u = f"{sym_u}#{conid}"
+                    elif (expiry or strike or put_call) and conid:
+                        sym_u = f"{sym_u}#{conid}"
+                    elif expiry or strike or put_call:
+                        suffix_bits = [expiry, put_call, strike]
+                        suffix = "-".join([b for b in suffix_bits if b])
+                        if suffix:
+                            sym_u = f"{sym_u}#{suffix}"
+                holdings_items_by_date.setdefault(report_date, []).append(
+                    {
+                        "provider_account_id": provider_account_id,
+                        "symbol": sym_u,
+                        "qty": float(qty),
+                        "market_value": float(mv) if mv is not None else None,
+                        "cost_basis_total": float(basis) if basis is not None else None,
+                        "source": "IB Flex (Web)",
+                    }
+                )
 
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag not in {"OpenPosition", "OpenPositions", "Position", "OpenPositionsSummary"}:
-                continue
-            # Only leaf records with symbol/qty fields.
-            attrs = getattr(el, "attrib", {}) or {}
-            sym = (attrs.get("symbol") or attrs.get("Symbol") or attrs.get("underlyingSymbol") or "").strip()
-            qty_s = attrs.get("position") or attrs.get("quantity") or attrs.get("qty") or attrs.get("Position") or attrs.get("Quantity")
-            mv_s = attrs.get("marketValue") or attrs.get("positionValue") or attrs.get("value") or attrs.get("MarketValue")
-            if not sym or qty_s in (None, ""):
-                continue
-            qty = _as_float_or_none(qty_s)
-            if qty is None:
-                continue
-            mv = _as_float_or_none(mv_s) if mv_s not in (None, "") else None
-            basis = _as_float_or_none(attrs.get("costBasis") or attrs.get("costBasisMoney") or attrs.get("CostBasis"))
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            report_date = _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
-            if report_date is None:
-                report_date = _parse_ib_date(str(flex_meta.get("toDate") or "") or None) or end_date
-            sym_u = sym.strip().upper()
-            # Cash positions often show symbol="USD" or similar; normalize to CASH:USD for internal cash fallback.
-            asset_class = (attrs.get("assetClass") or attrs.get("AssetClass") or attrs.get("assetCategory") or attrs.get("AssetCategory") or "").strip().upper()
-            if asset_class == "CASH" or sym_u in {"USD", "CASH", "CASHUSD"}:
-                sym_u = "CASH:USD"
-            else:
-                conid = (attrs.get("conid") or attrs.get("Conid") or "").strip()
-                expiry = (attrs.get("expiry") or attrs.get("Expiry") or "").strip()
-                strike = (attrs.get("strike") or attrs.get("Strike") or "").strip()
-                put_call = (attrs.get("putCall") or attrs.get("PutCall") or "").strip().upper()
-                # IB Flex can emit multiple positions with the same symbol (options/futures/etc.).
-                # Add a stable suffix to keep those distinct in holdings snapshots.
-                if conid and asset_class and asset_class not in {"STK", "ETF", "ADR"}:
-                    sym_u = f"{sym_u}#{conid}"
-                elif (expiry or strike or put_call) and conid:
-                    sym_u = f"{sym_u}#{conid}"
-                elif expiry or strike or put_call:
-                    suffix_bits = [expiry, put_call, strike]
-                    suffix = "-".join([b for b in suffix_bits if b])
-                    if suffix:
-                        sym_u = f"{sym_u}#{suffix}"
-            holdings_items_by_date.setdefault(report_date, []).append(
-                {
-                    "provider_account_id": provider_account_id,
-                    "symbol": sym_u,
-                    "qty": float(qty),
-                    "market_value": float(mv) if mv is not None else None,
-                    "cost_basis_total": float(basis) if basis is not None else None,
-                    "source": "IB Flex (Web)",
-                }
-            )
         metrics["holdings_items_seen"] = sum(
             1
             for items_d in holdings_items_by_date.values()
@@ -1044,181 +1205,9 @@ class IBFlexWebAdapter(BrokerAdapter):
             if not str(h.get("symbol") or "").startswith("CASH:")
         )
 
-        # Trades + multi-detail trade rows (CLOSED_LOT/WASH_SALE).
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag != "Trade":
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            level = (attrs.get("levelOfDetail") or attrs.get("LevelOfDetail") or "EXECUTION").strip().upper()
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            symbol = (attrs.get("symbol") or attrs.get("Symbol") or "").strip().upper()
-            trade_date = _parse_ib_date(str(attrs.get("tradeDate") or attrs.get("TradeDate") or attrs.get("dateTime") or attrs.get("DateTime") or "") or None)
-            if trade_date is None:
-                continue
-            qty = _as_float_or_none(attrs.get("quantity") or attrs.get("Quantity"))
-            # Build a row dict compatible with offline helpers.
-            row: dict[str, Any] = {
-                "ClientAccountID": acct,
-                "DateTime": attrs.get("dateTime") or attrs.get("DateTime") or "",
-                "TradeDate": attrs.get("tradeDate") or attrs.get("TradeDate") or "",
-                "Symbol": symbol,
-                "Quantity": qty,
-                "Buy/Sell": attrs.get("buySell") or attrs.get("BuySell") or attrs.get("side") or attrs.get("Side") or "",
-                "NetCash": attrs.get("netCash") or attrs.get("NetCash") or attrs.get("proceeds") or attrs.get("Proceeds") or attrs.get("tradeMoney") or attrs.get("TradeMoney") or "",
-                "Description": attrs.get("description") or attrs.get("Description") or "",
-                "Type": attrs.get("transactionType") or attrs.get("type") or attrs.get("Type") or "",
-                "LevelOfDetail": level,
-                "TransactionID": attrs.get("transactionID") or attrs.get("TransactionID") or attrs.get("transactionId") or "",
-                "TradeID": attrs.get("tradeID") or attrs.get("TradeID") or attrs.get("tradeId") or "",
-                "CostBasis": attrs.get("costBasis") or attrs.get("CostBasis") or "",
-                "FifoPnlRealized": attrs.get("fifoPnlRealized") or attrs.get("FifoPnlRealized") or "",
-                "OpenDateTime": attrs.get("openDateTime") or attrs.get("OpenDateTime") or "",
-                "HoldingPeriodDateTime": attrs.get("holdingPeriodDateTime") or attrs.get("HoldingPeriodDateTime") or "",
-                "WhenRealized": attrs.get("whenRealized") or attrs.get("WhenRealized") or "",
-                "WhenReopened": attrs.get("whenReopened") or attrs.get("WhenReopened") or "",
-                "CurrencyPrimary": attrs.get("currency") or attrs.get("currencyPrimary") or attrs.get("CurrencyPrimary") or "USD",
-                "FXRateToBase": attrs.get("fxRateToBase") or attrs.get("FXRateToBase") or "",
-                "Conid": attrs.get("conid") or attrs.get("Conid") or "",
-            }
-            desc = str(row.get("Description") or "")
-            is_trade = True
-            cash = _extract_cash_amount(row, is_trade=is_trade)
-            tx_type = _classify_activity_row(row, qty=qty, cash=cash, description=desc)
-            metrics["trades_seen"] += 1
-
-            txid = str(row.get("TransactionID") or row.get("TradeID") or "").strip()
-            if not txid:
-                key = f"{provider_account_id}|{trade_date.isoformat()}|{level}|{symbol}|{qty or ''}|{cash or ''}|{desc}"
-                txid = f"WEB:{rep.payload_hash}:{_sha256_bytes(key.encode('utf-8'))}"
-
-            if level in {"CLOSED_LOT", "WASH_SALE"}:
-                cost_basis = _as_float_or_none(row.get("CostBasis"))
-                fifo_realized = _as_float_or_none(row.get("FifoPnlRealized"))
-                proceeds = (cost_basis + fifo_realized) if (cost_basis is not None and fifo_realized is not None) else None
-                items.append(
-                    {
-                        "record_kind": "BROKER_CLOSED_LOT" if level == "CLOSED_LOT" else "BROKER_WASH_SALE",
-                        "provider_account_id": provider_account_id,
-                        "symbol": symbol,
-                        "date": trade_date.isoformat(),
-                        "qty": abs(float(qty or 0.0)),
-                        "cost_basis": cost_basis,
-                        "realized_pl_fifo": fifo_realized,
-                        "proceeds_derived": proceeds,
-                        "currency": str(row.get("CurrencyPrimary") or "USD").strip().upper(),
-                        "fx_rate_to_base": _as_float_or_none(row.get("FXRateToBase")),
-                        "conid": row.get("Conid") or None,
-                        "ib_transaction_id": row.get("TransactionID") or None,
-                        "ib_trade_id": row.get("TradeID") or None,
-                        "datetime_raw": row.get("DateTime") or None,
-                        "open_datetime_raw": row.get("OpenDateTime") or None,
-                        "holding_period_datetime_raw": row.get("HoldingPeriodDateTime") or None,
-                        "when_realized_raw": row.get("WhenRealized") or None,
-                        "when_reopened_raw": row.get("WhenReopened") or None,
-                        "source_file": f"IB_FLEX_WEB:{rep.query_id}",
-                        "source_row": None,
-                        "source_file_hash": rep.payload_hash,
-                        "raw_row": attrs,
-                        "provider_transaction_id": txid,
-                    }
-                )
-                if level == "CLOSED_LOT":
-                    metrics["closed_lot_rows_seen"] += 1
-                else:
-                    metrics["wash_sale_rows_seen"] += 1
-                continue
-
-            # Executions -> main Transaction import path.
-            amount = float(cash or 0.0) if cash is not None else 0.0
-            qty_out: float | None = abs(float(qty)) if qty not in (None, "") else None
-            if tx_type == "BUY":
-                amount = -abs(amount)
-                if qty_out is not None:
-                    qty_out = abs(qty_out)
-            elif tx_type == "SELL":
-                amount = abs(amount)
-                if qty_out is not None:
-                    qty_out = abs(qty_out)
-            items.append(
-                {
-                    "date": trade_date.isoformat(),
-                    "type": tx_type,
-                    "ticker": symbol or None,
-                    "qty": qty_out,
-                    "amount": float(amount),
-                    "description": desc,
-                    "provider_transaction_id": txid,
-                    "provider_account_id": provider_account_id,
-                    "source_file_hash": rep.payload_hash,
-                    "currency": (_extract_currency(row) or "USD").strip().upper(),
-                }
-            )
-
-        # Cash transactions.
-        for el in root.iter():
-            tag = _strip_ns(el.tag)
-            if tag not in {"CashTransaction", "CashTransactions"}:
-                continue
-            attrs = getattr(el, "attrib", {}) or {}
-            # Leaf records must have an Amount.
-            amt_s = attrs.get("amount") or attrs.get("Amount")
-            if amt_s in (None, ""):
-                continue
-            level = (attrs.get("levelOfDetail") or attrs.get("LevelOfDetail") or "").strip().upper()
-            if level == "SUMMARY":
-                continue
-            acct = (attrs.get("accountId") or attrs.get("clientAccountID") or attrs.get("ClientAccountID") or "").strip()
-            provider_account_id = f"IBFLEX:{acct}" if acct else "IBFLEX-1"
-            dt_raw = str(attrs.get("dateTime") or attrs.get("DateTime") or attrs.get("date") or attrs.get("Date") or "")
-            d = _parse_ib_date(dt_raw) or _parse_ib_date(str(attrs.get("reportDate") or attrs.get("ReportDate") or "") or None)
-            if d is None:
-                continue
-            symbol = (attrs.get("symbol") or attrs.get("Symbol") or "").strip().upper() or None
-            raw_type = (attrs.get("type") or attrs.get("Type") or attrs.get("transactionType") or "").strip()
-            desc = (attrs.get("description") or attrs.get("Description") or "").strip()
-            ccy = str(attrs.get("currency") or attrs.get("CurrencyPrimary") or attrs.get("currencyPrimary") or "USD").strip().upper() or "USD"
-            row = {
-                "ClientAccountID": acct,
-                "Date/Time": dt_raw,
-                "Amount": amt_s,
-                "Type": raw_type,
-                "Description": desc or raw_type,
-                "Symbol": symbol or "",
-                "CurrencyPrimary": ccy,
-                "LevelOfDetail": level or "DETAIL",
-            }
-            amt = _as_float_or_none(amt_s)
-            if amt is None:
-                continue
-            tx_type = _classify_activity_row(row, qty=None, cash=float(amt), description=str(desc or raw_type))
-            # App conventions for cashflows
-            if tx_type == "WITHHOLDING":
-                amt = abs(float(amt))
-            elif tx_type == "FEE":
-                amt = -abs(float(amt))
-            txid = (
-                str(attrs.get("transactionID") or attrs.get("TransactionID") or attrs.get("tradeID") or attrs.get("TradeID") or "").strip()
-            )
-            if not txid:
-                key = f"{provider_account_id}|{d.isoformat()}|{tx_type}|{symbol or ''}|{amt}|{desc or raw_type}"
-                txid = f"WEB:{rep.payload_hash}:{_sha256_bytes(key.encode('utf-8'))}"
-            metrics["cash_rows_seen"] += 1
-            items.append(
-                {
-                    "date": d.isoformat(),
-                    "type": tx_type,
-                    "ticker": symbol,
-                    "qty": None,
-                    "amount": float(amt),
-                    "description": desc or raw_type,
-                    "provider_transaction_id": txid,
-                    "provider_account_id": provider_account_id,
-                    "source_file_hash": rep.payload_hash,
-                    "currency": (_extract_currency(row) or "USD").strip().upper(),
-                }
-            )
+        cash_report_by_acct_date = {**cash_report_currency_by_acct_date, **cash_report_plain_by_acct_date}
+        items = chain([marker], _iter_report_trades(rep, metrics), _iter_report_cash_transactions(rep, metrics))
+        balance_items: list[dict[str, Any]] = []
 
         # Build one or more holdings snapshots, keyed by reportDate values present in the payload.
         all_dates: set[dt.date] = set(holdings_items_by_date.keys())
@@ -1355,7 +1344,7 @@ class IBFlexWebAdapter(BrokerAdapter):
                 snap["cash_balances"] = cash_balances
                 # Emit CASH_BALANCE records too (allows importing cash even if holdings snapshots are skipped later).
                 for c in cash_balances:
-                    items.append(
+                    balance_items.append(
                         {
                             "record_kind": "CASH_BALANCE",
                             "provider_account_id": c.get("provider_account_id"),
@@ -1377,7 +1366,7 @@ class IBFlexWebAdapter(BrokerAdapter):
         }
         if isinstance((latest_snap or {}).get("cash_balances"), list):
             holdings["cash_balances"] = (latest_snap or {}).get("cash_balances")
-        return items, holdings, metrics
+        return chain(items, balance_items), holdings, metrics
 
     def fetch_transactions(
         self,
@@ -1385,7 +1374,7 @@ class IBFlexWebAdapter(BrokerAdapter):
         start_date: dt.date,
         end_date: dt.date,
         cursor: str | None = None,
-    ) -> tuple[list[dict[str, Any]], str | None]:
+    ) -> tuple[Iterable[dict[str, Any]], str | None]:
         # Pagination: cursor is the raw query index. We download/parse at most ONE report per call, so
         # multiple query ids don't all submit at once.
         idx = int(cursor) if cursor is not None else 0
@@ -7,13 +7,16 @@ import datetime as dt
 import json
 import logging
 import os
+import pickle
 from pathlib import Path
 import re
 import sqlite3
+import sys
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import AbstractContextManager, nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, is_dataclass
 from typing import Any
 from urllib.parse import parse_qs
@@ -49,6 +52,14 @@ _JOB_TTL_SECONDS = 600
 _MIN_REGIME_DAYS = 5
 _MIN_SIGNAL_PROBABILITY = 0.70
 _DEFAULT_FRONTIER_BATCH_SIZE = 5
+_DEFAULT_DASHBOARD_FIT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+_MAX_DASHBOARD_FIT_WORKERS = 16
+_DASHBOARD_FIT_FUNCTIONS = (
+    "download_market_frame",
+    "fit_regime_model",
+    "fit_regime_model_weekly",
+    "get_next_earnings_date",
+)
 _ADAPTER_TIMEOUT = 15
 _MODEL_CACHE_TTL_SECONDS = 300
 _JOBS: dict[str, "RegimeJob"] = {}
@@ -81,6 +92,7 @@ class RegimeJob:
     cache_hits: int = 0
     cache_misses: int = 0
     partial_results: dict[str, Any] | None = None
+    regime_cache: dict[str, int] | None = None
 
 
 @dataclass
@@ -146,7 +158,7 @@ def _load_hmm_runtime() -> tuple[dict[str, Any] | None, str | None]:
         from src.regime.charts import build_confidence_timeline, build_regime_price_chart, build_transition_heatmap
         from src.regime.data import download_market_frame, get_next_earnings_date
         from src.regime.digest import generate_weekly_digest
-        from src.regime.hmm_engine import fit_regime_model, fit_regime_model_weekly
+        from src.regime.hmm_engine import fit_regime_model_cached, fit_regime_model_weekly
         from src.regime.investor_adapter import (
             get_investor_db_path,
             get_latest_prices,
@@ -254,6 +266,7 @@ def _load_hmm_runtime() -> tuple[dict[str, Any] | None, str | None]:
             update_training_status,
             update_ticker_in_theme,
             update_watchlist_status,
+            transaction,
             update_transition_outcome,
             update_signal_outcome,
             upsert_watchlist_candidate,
@@ -427,7 +440,7 @@ def _load_hmm_runtime() -> tuple[dict[str, Any] | None, str | None]:
         "build_confidence_timeline": build_confidence_timeline,
         "get_next_earnings_date": get_next_earnings_date,
         "generate_weekly_digest": generate_weekly_digest,
-        "fit_regime_model": fit_regime_model,
+        "fit_regime_model": fit_regime_model_cached,
         "fit_regime_model_weekly": fit_regime_model_weekly,
         "build_qualitative_assessment": build_qualitative_assessment,
         "configured_frontier_model": configured_frontier_model,
@@ -624,6 +637,7 @@ def _load_hmm_runtime() -> tuple[dict[str, Any] | None, str | None]:
         "save_signal_snapshot": save_signal_snapshot,
         "run_backtest": run_backtest,
         "get_tax_assumptions": get_tax_assumptions,
+        "persistence_transaction": transaction,
         "update_transition_outcome": update_transition_outcome,
         "update_signal_outcome": update_signal_outcome,
         "update_training_status": update_training_status,
@@ -1619,6 +1633,7 @@ def _serialize_job(job: RegimeJob) -> dict[str, Any]:
         "cache_hits": job.cache_hits,
         "cache_misses": job.cache_misses,
         "partial_results": _json_ready(job.partial_results or {}),
+        "regime_cache": dict(getattr(job, "regime_cache", None) or {}),
     }
 
 
@@ -1826,8 +1841,15 @@ def _sector_by_ticker(db_path: str | None, tickers: list[str]) -> dict[str, str]
     return {str(row["ticker"]).upper(): str(row["sector"] or "Unknown") for row in rows if row["ticker"]}
 
 
-def _fit_regime_with_adaptive_window(runtime: dict[str, Any], *, ticker: str, market_frame: Any) -> Any:
-    fit_kwargs = _hmm_fit_kwargs_from_runtime(runtime)
+def _fit_regime_with_adaptive_window(
+    runtime: dict[str, Any],
+    *,
+    ticker: str,
+    market_frame: Any,
+    fit_kwargs: dict[str, Any] | None = None,
+) -> Any:
+    if fit_kwargs is None:
+        fit_kwargs = _hmm_fit_kwargs_from_runtime(runtime)
     try:
         try:
             return runtime["fit_regime_model"](ticker=ticker, market_frame=market_frame, **fit_kwargs)
@@ -1856,6 +1878,107 @@ def _fit_regime_with_adaptive_window(runtime: dict[str, Any], *, ticker: str, ma
             )
 
 
+def _fit_dashboard_ticker(
+    fit_functions: dict[str, Any],
+    ticker: str,
+    period: str,
+    fit_kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """Download, daily fit, weekly overlay and earnings lookup for one dashboard ticker.
+
+    Module-level and driven only by ``fit_functions`` so it can run in a worker process.
+    """
+
+    market_frame = fit_functions["download_market_frame"](ticker=ticker, period=period, interval="1d").frame
+    regime = _fit_regime_with_adaptive_window(fit_functions, ticker=ticker, market_frame=market_frame, fit_kwargs=fit_kwargs)
+    regime_cache_outcome = None
+    engine = sys.modules.get("src.regime.hmm_engine")
+    if engine is not None and fit_functions["fit_regime_model"] is getattr(engine, "fit_regime_model_cached", None):
+        regime_cache_outcome = engine.get_regime_result_cache().last_outcome()
+    weekly_regime = regime
+    fit_regime_model_weekly_fn = fit_functions.get("fit_regime_model_weekly")
+    if callable(fit_regime_model_weekly_fn):
+        try:
+            weekly_regime = fit_regime_model_weekly_fn(ticker=ticker, market_frame=market_frame)
+        except Exception as exc:
+            logger.warning("Unable to build weekly regime overlay for %s; falling back to daily regime.", ticker)
+            logger.debug("Weekly regime overlay failed for %s.", ticker, exc_info=exc)
+    get_next_earnings_date_fn = fit_functions.get("get_next_earnings_date")
+    return {
+        "market_frame": market_frame,
+        "regime": regime,
+        "weekly_regime": weekly_regime,
+        "earnings_date": get_next_earnings_date_fn(ticker) if callable(get_next_earnings_date_fn) else None,
+        "regime_cache_outcome": regime_cache_outcome,
+    }
+
+
+def _dashboard_fit_workers(runtime: dict[str, Any], total: int) -> int:
+    workers = _DEFAULT_DASHBOARD_FIT_WORKERS
+    get_setting_fn = runtime.get("get_setting")
+    if callable(get_setting_fn):
+        try:
+            workers = int(get_setting_fn("regime_dashboard_fit_workers") or workers)
+        except Exception:
+            workers = _DEFAULT_DASHBOARD_FIT_WORKERS
+    return max(1, min(workers, _MAX_DASHBOARD_FIT_WORKERS, total))
+
+
+def _dashboard_fit_executor(fit_functions: dict[str, Any], workers: int) -> tuple[AbstractContextManager[Executor], int, str]:
+    """Executor for the CPU-bound fits, with how many fits the job runs at once and on what.
+
+    Picklable runtimes go to the long-lived ``get_fit_executor`` process pool, whose forkserver
+    workers are shared across jobs and never forked from the threaded server; the context does
+    not shut it down, and the job keeps at most ``workers`` fits in flight on it (fewer if the
+    pool itself is smaller).  Otherwise a job-scoped thread pool of ``workers`` runs the fits.
+    """
+
+    if workers > 1:
+        try:
+            pickle.dumps(fit_functions)
+            from src.regime.hmm_engine import fit_pool_size, get_fit_executor
+        except Exception:
+            logger.debug("Dashboard fit runtime is not picklable; fitting on threads.")
+        else:
+            return nullcontext(get_fit_executor()), min(workers, fit_pool_size()), "process"
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="regime-fit"), workers, "thread"
+
+
+def _preliminary_dashboard_row(item: dict[str, Any]) -> dict[str, Any]:
+    """Fit-stage row streamed to the page before ensemble, frontier and tax enrichment land."""
+
+    regime = item["regime_obj"]
+    composite_signal = item["composite_signal"]
+    weekly_label = getattr(composite_signal, "weekly_regime", None) or regime.latest_label
+    return _json_ready(
+        {
+            "ticker": item["ticker"],
+            "regime": regime.latest_label,
+            "state_id": int(regime.latest_state_id),
+            "regime_class": _regime_class(regime.latest_label),
+            "probability": float(regime.latest_probability),
+            "probability_pct": float(regime.latest_probability * 100.0),
+            "composite_signal": composite_signal.composite_action,
+            "composite_signal_class": _signal_class(composite_signal.composite_action),
+            "weekly_regime": weekly_label,
+            "multi_timeframe_note": getattr(composite_signal, "multi_timeframe_note", None),
+            "multi_timeframe_aligned": weekly_label == regime.latest_label,
+            "forward_signal": item["forward_signal"].action,
+            "forward_signal_class": _signal_class(item["forward_signal"].action),
+            "technical_signal": item["technical_signal"],
+            "price_targets": item["price_targets"],
+            "current_price": float(getattr(regime, "latest_price", 0.0) or 0.0),
+            "days_in_regime": int(regime.regime_days),
+            "market_value": item["market_value"],
+            "transition_risk_pct": float(regime.transition_risk * 100.0),
+            "expected_duration": float(regime.expected_regime_duration),
+            "earnings_date": item["earnings_date"],
+            "tax_status": item["tax_status"],
+            "analysis_stage": "fit",
+        }
+    )
+
+
 def _hmm_fit_kwargs_from_runtime(runtime: dict[str, Any]) -> dict[str, Any]:
     get_setting_fn = runtime.get("get_setting")
     if not callable(get_setting_fn):
@@ -2022,22 +2145,23 @@ def _refresh_transition_outcomes(runtime: dict[str, Any], investor_db_path: str)
             }
         )
         latest_prices = get_latest_prices_fn(investor_db_path, pending_tickers) if pending_tickers else {}
-        for row in pending_rows:
-            base_price = row.get("price_at_change")
-            current_price = latest_prices.get(str(row.get("ticker") or "").upper())
-            if base_price in (None, 0, 0.0) or current_price is None:
-                continue
-            try:
-                realized = (float(current_price) - float(base_price)) / float(base_price)
-            except Exception as exc:
-                logger.debug("Unable to compute transition outcome return for %s.", row.get("ticker"), exc_info=exc)
-                continue
-            update_transition_outcome_fn(
-                int(row["id"]),
-                return_5d=realized,
-                return_10d=realized,
-                return_21d=realized,
-            )
+        with runtime.get("persistence_transaction", nullcontext)():
+            for row in pending_rows:
+                base_price = row.get("price_at_change")
+                current_price = latest_prices.get(str(row.get("ticker") or "").upper())
+                if base_price in (None, 0, 0.0) or current_price is None:
+                    continue
+                try:
+                    realized = (float(current_price) - float(base_price)) / float(base_price)
+                except Exception as exc:
+                    logger.debug("Unable to compute transition outcome return for %s.", row.get("ticker"), exc_info=exc)
+                    continue
+                update_transition_outcome_fn(
+                    int(row["id"]),
+                    return_5d=realized,
+                    return_10d=realized,
+                    return_21d=realized,
+                )
     except Exception as exc:
         logger.warning("Unable to refresh transition journal outcomes.", exc_info=exc)
 
@@ -2054,8 +2178,10 @@ def _progress_event(
     cache_hits: int = 0,
     cache_misses: int = 0,
     partial_result: dict[str, Any] | None = None,
+    regime_cache: dict[str, int] | None = None,
 ) -> None:
     if callable(progress_callback):
+        extra = {"regime_cache": regime_cache} if regime_cache is not None else {}
         progress_callback(
             progress,
             total,
@@ -2066,6 +2192,7 @@ def _progress_event(
             cache_hits=cache_hits,
             cache_misses=cache_misses,
             partial_result=partial_result,
+            **extra,
         )
 
 
@@ -2143,11 +2270,12 @@ def _build_regime_dashboard_payload(
             pending_rows = pending_outcomes_fn()
             pending_tickers = sorted({str(row.get("ticker") or "").upper() for row in pending_rows if str(row.get("ticker") or "").strip()})
             latest_prices = get_latest_prices_fn(investor_db_path, pending_tickers) if pending_tickers else {}
-            for row in pending_rows:
-                ticker_key = str(row.get("ticker") or "").upper()
-                current_price = latest_prices.get(ticker_key)
-                if current_price is not None:
-                    update_signal_outcome_fn(int(row["id"]), str(row["interval"]), float(current_price))
+            with runtime.get("persistence_transaction", nullcontext)():
+                for row in pending_rows:
+                    ticker_key = str(row.get("ticker") or "").upper()
+                    current_price = latest_prices.get(ticker_key)
+                    if current_price is not None:
+                        update_signal_outcome_fn(int(row["id"]), str(row["interval"]), float(current_price))
         except Exception as exc:
             logger.warning("Unable to refresh historical signal outcomes.", exc_info=exc)
     calibrator = None
@@ -2231,54 +2359,23 @@ def _build_regime_dashboard_payload(
             f"Analyzing {total} tickers with Frontier may take several minutes. Cached results will be reused where available."
         )
 
-    fitted_rows: list[dict[str, Any]] = []
     fit_started = time.monotonic()
     snapshots_saved_count = 0
-    for index, ticker in enumerate(selected_tickers, start=1):
-        elapsed = time.monotonic() - fit_started
-        eta_seconds = (elapsed / max(1, index - 1)) * (total - (index - 1)) if index > 1 else None
-        _progress_event(
-            progress_callback,
-            progress=index - 1,
-            total=total,
-            ticker=ticker,
-            stage="fit",
-            text=f"Analyzing ticker {index} of {total}: {ticker}",
-            eta_seconds=eta_seconds,
-        )
-        try:
-            market_frame = runtime["download_market_frame"](ticker=ticker, period=period, interval="1d").frame
-            regime = _fit_regime_with_adaptive_window(runtime, ticker=ticker, market_frame=market_frame)
-            fit_regime_model_weekly_fn = runtime.get("fit_regime_model_weekly")
-            if callable(fit_regime_model_weekly_fn):
-                try:
-                    weekly_regime = fit_regime_model_weekly_fn(ticker=ticker, market_frame=market_frame)
-                except Exception as exc:
-                    logger.warning("Unable to build weekly regime overlay for %s; falling back to daily regime.", ticker)
-                    logger.debug("Weekly regime overlay failed for %s.", ticker, exc_info=exc)
-                    weekly_regime = regime
-            else:
-                weekly_regime = regime
-        except Exception as exc:
-            logger.warning("Unable to analyze regime for %s.", ticker, exc_info=exc)
-            payload["warnings"].append(f"{ticker}: unable to analyze holding ({exc})")
-            _progress_event(
-                progress_callback,
-                progress=index,
-                total=total,
-                ticker=ticker,
-                stage="fit",
-                text=f"Skipped {ticker}: analysis failed",
-                eta_seconds=eta_seconds,
-            )
-            continue
+    pending_snapshots: list[dict[str, Any]] = []
 
+    def build_fitted_row(
+        ticker: str,
+        *,
+        market_frame: Any,
+        regime: Any,
+        weekly_regime: Any,
+        earnings_date: Any,
+    ) -> dict[str, Any]:
         forward_curve = runtime["forward_regime_curve"](
             regime.transition_matrix,
             regime.latest_state_vector,
             horizon=21,
         )
-        earnings_date = runtime["get_next_earnings_date"](ticker) if callable(runtime.get("get_next_earnings_date")) else None
         try:
             forward_signal = runtime["signal_from_forward_curve"](
                 forward_curve,
@@ -2420,62 +2517,60 @@ def _build_regime_dashboard_payload(
             {"day": idx + 1, "probability": float(val)}
             for idx, val in enumerate(regime.price_frame["state_probability"].tail(21).tolist())
         ]
-        fitted_rows.append(
-            {
-                "ticker": ticker,
-                "regime_obj": regime,
-                "market_frame": market_frame,
-                "forward_curve": forward_curve,
-                "forward_signal": forward_signal,
-                "technicals": technicals,
-                "technical_signal": technical_signal,
-                "composite_signal": composite_signal,
-                "price_targets": price_targets,
-                "price_targets_error": price_targets_error,
-                "earnings_date": earnings_date.isoformat() if earnings_date else None,
-                "earnings_warning": earnings_note,
-                "confidence": confidence,
-                "sentiment_info": sentiment_info,
-                "sentiment_history": sentiment_history,
-                "account_positions": account_positions,
-                "market_value": float(market_value) if market_value > 0 else None,
-                "material_tax_signals": material_tax_signals,
-                "primary_tax_signal": primary_tax_signal,
-                "display_tax_signal": display_tax_signal,
-                "lot_details": lot_details,
-                "open_lot_count": len(lot_details),
-                "tax_status": tax_status if tax_status != "—" else (getattr(display_tax_signal, "tax_status", None) or "—"),
-                "lot_count_st": lot_count_st,
-                "lot_count_lt": lot_count_lt,
-                "confidence_points": confidence_points,
-                "duration_accuracy": duration_context,
-                "unified_confidence": _json_ready(unified_confidence),
-                "unified_confidence_raw": unified_confidence,
-                "theme_membership": theme_membership,
-                "theme_target_price": theme_target_price,
-                "theme_stop_price": theme_stop_price,
-            }
-        )
-        save_signal_snapshot_fn = runtime.get("save_signal_snapshot")
-        if callable(save_signal_snapshot_fn) and price_targets is not None:
+        fitted_row = {
+            "ticker": ticker,
+            "regime_obj": regime,
+            "market_frame": market_frame,
+            "forward_curve": forward_curve,
+            "forward_signal": forward_signal,
+            "technicals": technicals,
+            "technical_signal": technical_signal,
+            "composite_signal": composite_signal,
+            "price_targets": price_targets,
+            "price_targets_error": price_targets_error,
+            "earnings_date": earnings_date.isoformat() if earnings_date else None,
+            "earnings_warning": earnings_note,
+            "confidence": confidence,
+            "sentiment_info": sentiment_info,
+            "sentiment_history": sentiment_history,
+            "account_positions": account_positions,
+            "market_value": float(market_value) if market_value > 0 else None,
+            "material_tax_signals": material_tax_signals,
+            "primary_tax_signal": primary_tax_signal,
+            "display_tax_signal": display_tax_signal,
+            "lot_details": lot_details,
+            "open_lot_count": len(lot_details),
+            "tax_status": tax_status if tax_status != "—" else (getattr(display_tax_signal, "tax_status", None) or "—"),
+            "lot_count_st": lot_count_st,
+            "lot_count_lt": lot_count_lt,
+            "confidence_points": confidence_points,
+            "duration_accuracy": duration_context,
+            "unified_confidence": _json_ready(unified_confidence),
+            "unified_confidence_raw": unified_confidence,
+            "theme_membership": theme_membership,
+            "theme_target_price": theme_target_price,
+            "theme_stop_price": theme_stop_price,
+        }
+        if callable(runtime.get("save_signal_snapshot")) and price_targets is not None:
             try:
-                save_signal_snapshot_fn(
-                    ticker=ticker,
-                    snapshot_date=dt.date.today().isoformat(),
-                    action=str(composite_signal.composite_action),
-                    regime_label=str(regime.latest_label),
-                    regime_probability=float(regime.latest_probability),
-                    composite_strength=float(composite_signal.composite_strength),
-                    benchmark=benchmark,
-                    current_price=float(getattr(regime, "latest_price", 0.0) or 0.0),
-                    entry_price=getattr(price_targets, "entry_price", None),
-                    exit_price=getattr(price_targets, "exit_price", None),
-                    stop_price=getattr(price_targets, "stop_price", None),
-                    risk_reward_ratio=getattr(price_targets, "risk_reward_ratio", None),
-                    timeframe_days=int(getattr(price_targets, "timeframe_days", 0) or 0),
-                    expected_regime_duration=float(getattr(regime, "expected_regime_duration", 0.0) or 0.0),
+                pending_snapshots.append(
+                    {
+                        "ticker": ticker,
+                        "snapshot_date": dt.date.today().isoformat(),
+                        "action": str(composite_signal.composite_action),
+                        "regime_label": str(regime.latest_label),
+                        "regime_probability": float(regime.latest_probability),
+                        "composite_strength": float(composite_signal.composite_strength),
+                        "benchmark": benchmark,
+                        "current_price": float(getattr(regime, "latest_price", 0.0) or 0.0),
+                        "entry_price": getattr(price_targets, "entry_price", None),
+                        "exit_price": getattr(price_targets, "exit_price", None),
+                        "stop_price": getattr(price_targets, "stop_price", None),
+                        "risk_reward_ratio": getattr(price_targets, "risk_reward_ratio", None),
+                        "timeframe_days": int(getattr(price_targets, "timeframe_days", 0) or 0),
+                        "expected_regime_duration": float(getattr(regime, "expected_regime_duration", 0.0) or 0.0),
+                    }
                 )
-                snapshots_saved_count += 1
             except Exception as exc:
                 logger.warning("Unable to persist signal snapshot for %s.", ticker, exc_info=exc)
         try:
@@ -2505,6 +2600,80 @@ def _build_regime_dashboard_payload(
                 get_event_bus().publish_sync(event)
         except Exception:
             logger.debug("Event bus publish failed for enriched_signal %s — non-fatal", ticker, exc_info=True)
+        return fitted_row
+
+    fit_functions = {name: runtime.get(name) for name in _DASHBOARD_FIT_FUNCTIONS}
+    fit_kwargs = _hmm_fit_kwargs_from_runtime(runtime)
+    fit_workers = _dashboard_fit_workers(runtime, total)
+    rows_by_index: dict[int, dict[str, Any]] = {}
+    regime_cache_counts = {"hits": 0, "incremental": 0, "misses": 0}
+    from src.regime.hmm_engine import bounded_completions
+
+    executor_context, fit_concurrency, fit_kind = _dashboard_fit_executor(fit_functions, fit_workers)
+    _progress_event(
+        progress_callback,
+        progress=0,
+        total=total,
+        ticker=selected_tickers[0],
+        stage="fit",
+        text=(
+            f"Analyzing {total} tickers, up to {fit_concurrency} at a time on "
+            f"{fit_kind} worker{'s' if fit_concurrency != 1 else ''}"
+        ),
+    )
+    with executor_context as fit_executor:
+        completions = bounded_completions(
+            fit_executor,
+            _fit_dashboard_ticker,
+            ((fit_functions, ticker, period, fit_kwargs) for ticker in selected_tickers),
+            limit=fit_concurrency,
+        )
+        for completed, (index, future) in enumerate(completions, start=1):
+            ticker = selected_tickers[index]
+            elapsed = time.monotonic() - fit_started
+            eta_seconds = (elapsed / completed) * (total - completed)
+            try:
+                fitted = future.result()
+            except Exception as exc:
+                logger.warning("Unable to analyze regime for %s.", ticker, exc_info=exc)
+                payload["warnings"].append(f"{ticker}: unable to analyze holding ({exc})")
+                _progress_event(
+                    progress_callback,
+                    progress=completed,
+                    total=total,
+                    ticker=ticker,
+                    stage="fit",
+                    text=f"Skipped {ticker}: analysis failed",
+                    eta_seconds=eta_seconds,
+                )
+                continue
+            outcome = fitted.pop("regime_cache_outcome", None)
+            if outcome is not None:
+                regime_cache_counts["hits" if outcome == "hit" else "misses" if outcome == "miss" else outcome] += 1
+            fitted_row = build_fitted_row(ticker, **fitted)
+            rows_by_index[index] = fitted_row
+            _progress_event(
+                progress_callback,
+                progress=completed,
+                total=total,
+                ticker=ticker,
+                stage="fit",
+                text=f"Analyzed ticker {completed} of {total}: {ticker}",
+                eta_seconds=eta_seconds,
+                partial_result=_preliminary_dashboard_row(fitted_row),
+                regime_cache=dict(regime_cache_counts),
+            )
+    fitted_rows = [rows_by_index[index] for index in sorted(rows_by_index)]
+    payload["regime_cache"] = regime_cache_counts
+    save_signal_snapshot_fn = runtime.get("save_signal_snapshot")
+    if callable(save_signal_snapshot_fn) and pending_snapshots:
+        with runtime.get("persistence_transaction", nullcontext)():
+            for snapshot in pending_snapshots:
+                try:
+                    save_signal_snapshot_fn(**snapshot)
+                    snapshots_saved_count += 1
+                except Exception as exc:
+                    logger.warning("Unable to persist signal snapshot for %s.", snapshot["ticker"], exc_info=exc)
 
     cache_hits = 0
     cache_misses = 0
@@ -3054,6 +3223,7 @@ def _set_job_state(
     cache_hits: int | None = None,
     cache_misses: int | None = None,
     partial_result: dict[str, Any] | None = None,
+    regime_cache: dict[str, int] | None = None,
 ) -> None:
     with _JOBS_LOCK:
         job = _JOBS.get(job_id)
@@ -3083,6 +3253,8 @@ def _set_job_state(
             ticker = str(partial_result.get("ticker") or "").upper()
             if ticker:
                 job.partial_results[ticker] = partial_result
+        if regime_cache is not None:
+            job.regime_cache = dict(regime_cache)
 
 
 def _run_analysis(job_id: str) -> None:
@@ -3115,6 +3287,7 @@ def _run_analysis(job_id: str) -> None:
         cache_hits: int = 0,
         cache_misses: int = 0,
         partial_result: dict[str, Any] | None = None,
+        regime_cache: dict[str, int] | None = None,
     ) -> None:
         del stage
         resolved_eta = eta_seconds
@@ -3130,6 +3303,7 @@ def _run_analysis(job_id: str) -> None:
             cache_hits=cache_hits,
             cache_misses=cache_misses,
             partial_result=partial_result,
+            regime_cache=regime_cache,
         )
 
     session: Session | None = None
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime as dt
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
@@ -18,6 +17,7 @@ from src.db.models import (
     CashBalance,
     ExternalAccountMap,
     ExternalConnection,
+    ExternalHoldingPosition,
     ExternalHoldingSnapshot,
     ExternalTransactionMap,
     PositionLot,
@@ -27,6 +27,7 @@ from src.db.models import (
     Transaction,
 )
 from src.core.portfolio import latest_cash_by_account
+from src.core.price_index import LatestPriceIndex
 
 
 @dataclass(frozen=True)
@@ -100,49 +101,6 @@ def _scope_label(scope: DashboardScope) -> str:
     return "Household"
 
 
-def _latest_price_from_csv(*, path: Path, symbol: str, as_of: dt.date) -> tuple[dt.date, float] | None:
-    try:
-        from portfolio_report.prices import load_price_csv
-    except Exception:
-        return None
-    try:
-        series = load_price_csv(path, symbol)
-    except Exception:
-        return None
-    for d, px in reversed(series.points or []):
-        if d <= as_of and px and float(px) > 0:
-            return d, float(px)
-    return None
-
-
-def _read_price_fetched_at(csv_path: Path) -> dt.datetime | None:
-    """
-    Best-effort 'when was this price file last refreshed' timestamp.
-
-    - Prefers a JSON sidecar `{TICKER}.json` (used by the yfinance cache).
-    - Falls back to file mtime (UTC).
-    """
-    try:
-        meta_p = csv_path.with_suffix(".json")
-        if meta_p.exists():
-            meta = json.loads(meta_p.read_text(encoding="utf-8"))
-            qt = str((meta or {}).get("quote_time") or "").strip()
-            if qt:
-                try:
-                    return dt.datetime.fromisoformat(qt.replace("Z", "+00:00"))
-                except Exception:
-                    pass
-            fetched = str((meta or {}).get("fetched_at") or "").strip()
-            if fetched:
-                return dt.datetime.fromisoformat(fetched.replace("Z", "+00:00"))
-    except Exception:
-        pass
-    try:
-        return dt.datetime.fromtimestamp(csv_path.stat().st_mtime, tz=dt.timezone.utc)
-    except Exception:
-        return None
-
-
 def _latest_prices_for_symbols(
     *,
     prices_dir: Path,
@@ -153,6 +111,7 @@ def _latest_prices_for_symbols(
     out: dict[str, tuple[dt.date, float, dt.datetime | None]] = {}
     prices_dir = Path(prices_dir)
     yfinance_dir = prices_dir / "yfinance"
+    index = LatestPriceIndex(prices_dir)
     try:
         from market_data.symbols import normalize_ticker, sanitize_ticker
     except Exception:
@@ -191,12 +150,12 @@ def _latest_prices_for_symbols(
                     candidates.append(y2)
 
         for cp in candidates:
-            hit = _latest_price_from_csv(path=cp, symbol=sym, as_of=as_of)
+            hit = index.latest_price(cp, symbol=sym, as_of=as_of)
             if hit is not None:
-                d, px = hit
-                out[sym] = (d, px, _read_price_fetched_at(cp))
+                out[sym] = hit
                 break
 
+    index.save()
     return out
 
 
@@ -228,55 +187,61 @@ def accounts_with_snapshot_positions(session: Session, *, scope: str | Dashboard
     # Pick the latest snapshot per connection by (as_of desc, id desc).
     # Using max(id) alone breaks when importing historical statement snapshots after live holdings snapshots:
     # the statement rows would "win" even though their as_of is older.
-    snapshots: list[tuple[ExternalHoldingSnapshot, ExternalConnection]] = []
+    latest = _latest_snapshot_ids(session, conn_ids)
     rows = (
-        session.query(ExternalHoldingSnapshot, ExternalConnection)
-        .join(ExternalConnection, ExternalConnection.id == ExternalHoldingSnapshot.connection_id)
-        .filter(ExternalHoldingSnapshot.connection_id.in_(conn_ids))
-        .order_by(ExternalHoldingSnapshot.as_of.desc(), ExternalHoldingSnapshot.id.desc())
+        session.query(ExternalHoldingSnapshot.connection_id, ExternalHoldingPosition.provider_account_id)
+        .join(ExternalHoldingPosition, ExternalHoldingPosition.snapshot_id == ExternalHoldingSnapshot.id)
+        .filter(
+            ExternalHoldingSnapshot.id.in_(latest),
+            ExternalHoldingPosition.provider_account_id != "",
+            # Some adapters store a synthetic "TOTAL" row (is_total=true) to represent statement/account valuation.
+            # It marks the account as populated but must not be treated as a position row.
+            or_(ExternalHoldingPosition.is_total.is_(True), ExternalHoldingPosition.is_cash.is_(False)),
+        )
+        .distinct()
         .all()
     )
-    seen_conn_ids: set[int] = set()
-    for snap, conn in rows:
-        cid = int(conn.id)
-        if cid in seen_conn_ids:
-            continue
-        seen_conn_ids.add(cid)
-        snapshots.append((snap, conn))
-        if len(seen_conn_ids) >= len(conn_ids):
-            break
 
     maps = session.query(ExternalAccountMap).filter(ExternalAccountMap.connection_id.in_(conn_ids)).all()
     map_by_conn_provider: dict[tuple[int, str], int] = {(m.connection_id, m.provider_account_id): m.account_id for m in maps}
 
     out: set[int] = set()
-    for snap, conn in snapshots:
-        payload = snap.payload_json or {}
-        items = payload.get("items") or []
-        if not isinstance(items, list):
-            continue
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            provider_acct = str(it.get("provider_account_id") or "").strip()
-            symbol = str(it.get("symbol") or it.get("ticker") or "").strip().upper()
-            if not provider_acct or not symbol:
-                continue
-            # Some adapters store a synthetic "TOTAL" row (is_total=true) to represent statement/account valuation.
-            # This is used for performance reporting and must not be treated as a position row.
-            if bool(it.get("is_total")):
-                acct_id = map_by_conn_provider.get((int(conn.id), provider_acct))
-                if acct_id is not None:
-                    out.add(int(acct_id))
-                continue
-            if symbol.startswith("CASH:"):
-                continue
-            acct_id = map_by_conn_provider.get((int(conn.id), provider_acct))
-            if acct_id is not None:
-                out.add(int(acct_id))
+    for cid, provider_acct in rows:
+        acct_id = map_by_conn_provider.get((int(cid), str(provider_acct)))
+        if acct_id is not None:
+            out.add(int(acct_id))
     return out
 
 
+def _latest_snapshot_ids(session: Session, conn_ids: list[int], *, with_positions: bool = False):
+    """
+    Query of the latest holdings snapshot id per connection, by (as_of desc, id desc).
+
+    With `with_positions`, only snapshots holding at least one non-cash, non-TOTAL position row qualify.
+    """
+    q = session.query(
+        ExternalHoldingSnapshot.id.label("snapshot_id"),
+        func.row_number()
+        .over(
+            partition_by=ExternalHoldingSnapshot.connection_id,
+            order_by=(ExternalHoldingSnapshot.as_of.desc(), ExternalHoldingSnapshot.id.desc()),
+        )
+        .label("rn"),
+    ).filter(ExternalHoldingSnapshot.connection_id.in_(conn_ids))
+    if with_positions:
+        q = q.filter(
+            session.query(ExternalHoldingPosition.id)
+            .filter(
+                ExternalHoldingPosition.snapshot_id == ExternalHoldingSnapshot.id,
+                ExternalHoldingPosition.is_total.is_(False),
+                ExternalHoldingPosition.is_cash.is_(False),
+            )
+            .exists()
+        )
+    ranked = q.subquery()
+    return session.query(ranked.c.snapshot_id).filter(ranked.c.rn == 1)
+
+
 def _scoped_accounts(
     session: Session,
     *,
@@ -324,37 +289,23 @@ def _current_snapshot_tickers_by_account(
     if not conn_ids:
         return account_by_id, {account_id: set() for account_id in allowed_account_ids}
 
+    # Latest snapshot per connection that actually holds positions (a newer cash-only/empty snapshot has no tickers).
+    latest = _latest_snapshot_ids(session, conn_ids, with_positions=True)
     rows = (
-        session.query(ExternalHoldingSnapshot, ExternalConnection)
-        .join(ExternalConnection, ExternalConnection.id == ExternalHoldingSnapshot.connection_id)
-        .filter(ExternalHoldingSnapshot.connection_id.in_(conn_ids))
-        .order_by(ExternalHoldingSnapshot.as_of.desc(), ExternalHoldingSnapshot.id.desc())
+        session.query(
+            ExternalHoldingSnapshot.connection_id,
+            ExternalHoldingPosition.provider_account_id,
+            ExternalHoldingPosition.symbol,
+        )
+        .join(ExternalHoldingPosition, ExternalHoldingPosition.snapshot_id == ExternalHoldingSnapshot.id)
+        .filter(
+            ExternalHoldingSnapshot.id.in_(latest),
+            ExternalHoldingPosition.is_total.is_(False),
+            ExternalHoldingPosition.is_cash.is_(False),
+        )
+        .distinct()
         .all()
     )
-    chosen_by_conn: dict[int, tuple[ExternalHoldingSnapshot, ExternalConnection]] = {}
-    fallback_by_conn: dict[int, tuple[ExternalHoldingSnapshot, ExternalConnection]] = {}
-    for snap, conn in rows:
-        cid = int(conn.id)
-        if cid in chosen_by_conn:
-            continue
-        if cid not in fallback_by_conn:
-            fallback_by_conn[cid] = (snap, conn)
-        payload = snap.payload_json or {}
-        items = payload.get("items") or []
-        if not isinstance(items, list):
-            continue
-        if any(
-            isinstance(item, dict)
-            and not bool(item.get("is_total"))
-            and not str(item.get("symbol") or item.get("ticker") or "").strip().upper().startswith("CASH:")
-            and str(item.get("symbol") or item.get("ticker") or "").strip()
-            for item in items
-        ):
-            chosen_by_conn[cid] = (snap, conn)
-        if len(chosen_by_conn) >= len(conn_ids):
-            break
-
-    snapshots = [chosen_by_conn.get(cid) or fallback_by_conn.get(cid) for cid in conn_ids]
     maps = session.query(ExternalAccountMap).filter(ExternalAccountMap.connection_id.in_(conn_ids)).all()
     map_by_conn_provider = {
         (int(m.connection_id), str(m.provider_account_id)): int(m.account_id)
@@ -362,29 +313,10 @@ def _current_snapshot_tickers_by_account(
         if m.connection_id is not None and m.provider_account_id and m.account_id is not None
     }
     ticker_map = {account_id: set() for account_id in allowed_account_ids}
-    for pair in snapshots:
-        if pair is None:
-            continue
-        snap, conn = pair
-        payload = snap.payload_json or {}
-        items = payload.get("items") or []
-        if not isinstance(items, list):
-            continue
-        seen_item_keys: set[tuple[str, str]] = set()
-        for item in items:
-            if not isinstance(item, dict) or bool(item.get("is_total")):
-                continue
-            symbol = str(item.get("symbol") or item.get("ticker") or "").strip().upper()
-            provider_acct = str(item.get("provider_account_id") or "").strip()
-            if not symbol or symbol.startswith("CASH:"):
-                continue
-            key = (provider_acct, symbol)
-            if key in seen_item_keys:
-                continue
-            seen_item_keys.add(key)
-            account_id = map_by_conn_provider.get((int(conn.id), provider_acct))
-            if account_id is not None and account_id in allowed_account_ids:
-                ticker_map.setdefault(account_id, set()).add(symbol)
+    for cid, provider_acct, symbol in rows:
+        account_id = map_by_conn_provider.get((int(cid), str(provider_acct)))
+        if account_id is not None and account_id in allowed_account_ids:
+            ticker_map.setdefault(account_id, set()).add(str(symbol))
     return account_by_id, ticker_map
 
 
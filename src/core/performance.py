@@ -20,6 +20,7 @@ from src.db.models import (
     ExternalAccountMap,
     ExternalConnection,
     ExternalHoldingSnapshot,
+    ExternalHoldingValuation,
     ExternalTransactionMap,
     TaxpayerEntity,
     Transaction,
@@ -704,54 +705,71 @@ def _valuation_points_from_snapshots(
 
     start_dt = dt.datetime.combine(start_date, dt.time.min, tzinfo=dt.timezone.utc)
     end_dt = dt.datetime.combine(end_date, dt.time.max, tzinfo=dt.timezone.utc)
-    snaps = (
-        session.query(ExternalHoldingSnapshot)
+    # Per-(snapshot, provider account) rollups written at ingestion; no payload decoding needed here.
+    val_rows = (
+        session.query(
+            ExternalHoldingSnapshot.id.label("snapshot_id"),
+            ExternalHoldingSnapshot.connection_id,
+            ExternalHoldingSnapshot.as_of,
+            ExternalHoldingValuation.provider_account_id,
+            ExternalHoldingValuation.positions_value,
+            ExternalHoldingValuation.position_rows,
+            ExternalHoldingValuation.cash_value,
+            ExternalHoldingValuation.cash_rows,
+            ExternalHoldingValuation.total_value,
+            ExternalHoldingValuation.total_ordinal,
+        )
+        .join(ExternalHoldingValuation, ExternalHoldingValuation.snapshot_id == ExternalHoldingSnapshot.id)
         .filter(
             ExternalHoldingSnapshot.connection_id.in_(conn_ids),
             ExternalHoldingSnapshot.as_of >= start_dt,
             ExternalHoldingSnapshot.as_of <= end_dt,
         )
-        .order_by(ExternalHoldingSnapshot.as_of.asc(), ExternalHoldingSnapshot.id.asc())
+        .order_by(
+            ExternalHoldingSnapshot.as_of.asc(),
+            ExternalHoldingSnapshot.id.asc(),
+            ExternalHoldingValuation.ordinal.asc(),
+        )
         .all()
     )
+    snaps: list[tuple[dt.datetime, list[Any]]] = []
+    prev_snap_id: int | None = None
+    for r in val_rows:
+        if r.snapshot_id != prev_snap_id:
+            snaps.append((r.as_of, []))
+            prev_snap_id = r.snapshot_id
+        snaps[-1][1].append(r)
 
     # For each (account_id, date), keep the latest snapshot seen that day.
     # Store (as_of_dt, positions_value, cash_value_snapshot)
     latest: dict[tuple[int, dt.date], tuple[dt.datetime, float, float]] = {}
     totals_keys: set[tuple[int, dt.date]] = set()
-    for snap in snaps:
-        payload = snap.payload_json or {}
-        items = payload.get("items") or []
-        if not isinstance(items, list):
-            continue
+    for snap_as_of, vals in snaps:
         positions: dict[int, float] = {}
         cash: dict[int, float] = {}
         totals: dict[int, float] = {}
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            provider_acct = str(it.get("provider_account_id") or "").strip()
-            acct_id = map_by_conn_provider.get((int(snap.connection_id), provider_acct))
+        total_ordinals: dict[int, int] = {}
+        for r in vals:
+            acct_id = map_by_conn_provider.get((int(r.connection_id), str(r.provider_account_id or "")))
             if acct_id is None:
                 continue
-            sym = str(it.get("symbol") or it.get("ticker") or "").strip().upper()
-            mv = _as_float(it.get("market_value") or it.get("value") or it.get("qty") or 0.0) or 0.0
-            if bool(it.get("is_total")) and mv and mv > 0:
-                totals[acct_id] = float(mv)
-                continue
-            if sym.startswith("CASH:"):
-                cash[acct_id] = float(cash.get(acct_id) or 0.0) + float(mv)
-            elif sym:
-                positions[acct_id] = float(positions.get(acct_id) or 0.0) + float(mv)
-        day = snap.as_of.date()
+            if r.total_value is not None and int(r.total_ordinal or 0) >= total_ordinals.get(acct_id, -1):
+                # The last TOTAL row in the payload wins when several provider accounts map to one account.
+                totals[acct_id] = float(r.total_value)
+                total_ordinals[acct_id] = int(r.total_ordinal or 0)
+            if int(r.cash_rows or 0) > 0:
+                cash[acct_id] = float(cash.get(acct_id) or 0.0) + float(r.cash_value or 0.0)
+            if int(r.position_rows or 0) > 0:
+                positions[acct_id] = float(positions.get(acct_id) or 0.0) + float(r.positions_value or 0.0)
+        day = snap_as_of.date()
         totals_accts = set(totals.keys())
         # If a snapshot provides an explicit total (e.g., parsed from a PDF statement), use it and avoid
         # double-counting by summing positions/cash.
         for acct_id, tv in totals.items():
             k = (acct_id, day)
             prev = latest.get(k)
-            if prev is None or snap.as_of >= prev[0]:
-                latest[k] = (snap.as_of, float(tv), 0.0)
+            if prev is None or snap_as_of >= prev[0]:
+                latest[k] = (snap_as_of, float(tv), 0.0)
                 totals_keys.add(k)
         for acct_id, pv in positions.items():
             if acct_id in totals_accts:
@@ -759,8 +777,8 @@ def _valuation_points_from_snapshots(
             cv = float(cash.get(acct_id) or 0.0)
             k = (acct_id, day)
             prev = latest.get(k)
-            if prev is None or snap.as_of >= prev[0]:
-                latest[k] = (snap.as_of, float(pv), cv)
+            if prev is None or snap_as_of >= prev[0]:
+                latest[k] = (snap_as_of, float(pv), cv)
         # Also allow cash-only rows (all-cash account).
         for acct_id, cv in cash.items():
             if acct_id in totals_accts:
@@ -769,8 +787,8 @@ def _valuation_points_from_snapshots(
             if k in latest:
                 continue
             prev = latest.get(k)
-            if prev is None or snap.as_of >= prev[0]:
-                latest[k] = (snap.as_of, 0.0, float(cv))
+            if prev is None or snap_as_of >= prev[0]:
+                latest[k] = (snap_as_of, 0.0, float(cv))
 
     out: dict[int, dict[dt.date, float]] = {}
     for (acct_id, day), (_asof, pos_v, cash_v) in latest.items():
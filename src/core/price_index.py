@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+INDEX_FILENAME = ".latest_price_index.json"
+INDEX_VERSION = 1
+
+# Bytes just before the indexed offset that must be unchanged for an append-only (tail) refresh.
+_TAIL_SIG_BYTES = 256
+
+
+def _latest_price_from_csv(*, path: Path, symbol: str, as_of: dt.date) -> tuple[dt.date, float] | None:
+    try:
+        from portfolio_report.prices import load_price_csv
+    except Exception:
+        return None
+    try:
+        series = load_price_csv(path, symbol)
+    except Exception:
+        return None
+    for d, px in reversed(series.points or []):
+        if d <= as_of and px and float(px) > 0:
+            return d, float(px)
+    return None
+
+
+def _read_price_fetched_at(csv_path: Path) -> dt.datetime | None:
+    """
+    Best-effort 'when was this price file last refreshed' timestamp.
+
+    - Prefers a JSON sidecar `{TICKER}.json` (used by the yfinance cache).
+    - Falls back to file mtime (UTC).
+    """
+    try:
+        meta_p = csv_path.with_suffix(".json")
+        if meta_p.exists():
+            meta = json.loads(meta_p.read_text(encoding="utf-8"))
+            qt = str((meta or {}).get("quote_time") or "").strip()
+            if qt:
+                try:
+                    return dt.datetime.fromisoformat(qt.replace("Z", "+00:00"))
+                except Exception:
+                    pass
+            fetched = str((meta or {}).get("fetched_at") or "").strip()
+            if fetched:
+                return dt.datetime.fromisoformat(fetched.replace("Z", "+00:00"))
+    except Exception:
+        pass
+    try:
+        return dt.datetime.fromtimestamp(csv_path.stat().st_mtime, tz=dt.timezone.utc)
+    except Exception:
+        return None
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return int(path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _last_point(rows: list[tuple[dt.date, float]]) -> tuple[dt.date, float] | None:
+    # Same semantics as load_price_csv: latest date wins, later rows win ties.
+    best: tuple[dt.date, float] | None = None
+    for d, px in rows:
+        if best is None or d >= best[0]:
+            best = (d, float(px))
+    return best
+
+
+class LatestPriceIndex:
+    """
+    Persistent "last close per price CSV" index for one prices directory.
+
+    Holdings, dashboard and report renders only need the last close on or before today for each held symbol.
+    The index keeps one small JSON file (`INDEX_FILENAME`) next to the CSVs recording, per file: its stat signature,
+    the last usable (date, close), the sidecar fetched_at timestamp and the byte offset indexed so far. Unchanged
+    files are answered from the index; files that only grew are refreshed by parsing the appended rows from the
+    stored offset; anything else is re-parsed in full.
+    """
+
+    def __init__(self, prices_dir: Path):
+        self.prices_dir = Path(prices_dir)
+        self.path = self.prices_dir / INDEX_FILENAME
+        self._files: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(raw, dict) and raw.get("version") == INDEX_VERSION and isinstance(raw.get("files"), dict):
+                self._files = dict(raw["files"])
+        except Exception:
+            self._files = {}
+
+    def _key(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.prices_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+    def latest_price(
+        self, path: Path, *, symbol: str, as_of: dt.date
+    ) -> tuple[dt.date, float, dt.datetime | None] | None:
+        """
+        Returns (date, close, fetched_at) for the last usable close on or before `as_of`, or None.
+        """
+        path = Path(path)
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = self._key(path)
+        entry = self._files.get(key)
+        if entry is None or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+            entry = self._refresh(path, st, entry)
+            self._files[key] = entry
+            self._dirty = True
+
+        meta_mtime = _mtime_ns(path.with_suffix(".json"))
+        if "fetched_at" not in entry or entry.get("meta_mtime_ns") != meta_mtime:
+            fetched = _read_price_fetched_at(path)
+            entry["fetched_at"] = fetched.isoformat() if fetched is not None else None
+            entry["meta_mtime_ns"] = meta_mtime
+            self._dirty = True
+        fetched_s = entry.get("fetched_at")
+        fetched_at = dt.datetime.fromisoformat(fetched_s) if fetched_s else None
+
+        last_s = entry.get("last_date")
+        if not last_s:
+            return None
+        last_d = dt.date.fromisoformat(last_s)
+        if last_d <= as_of:
+            return last_d, float(entry["last_close"]), fetched_at
+        # Historical as-of (rare): fall back to a full parse of this file.
+        hit = _latest_price_from_csv(path=path, symbol=symbol, as_of=as_of)
+        if hit is None:
+            return None
+        return hit[0], hit[1], fetched_at
+
+    def _refresh(self, path: Path, st: os.stat_result, entry: dict[str, Any] | None) -> dict[str, Any]:
+        try:
+            from portfolio_report.prices import parse_price_rows
+            from portfolio_report.util import sniff_delimiter
+        except Exception:
+            return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "last_date": None}
+
+        size = int(st.st_size)
+        try:
+            with path.open("rb") as fh:
+                offset = int((entry or {}).get("offset") or 0)
+                if entry and entry.get("header") and 0 < offset < size:
+                    sig_start = max(0, offset - _TAIL_SIG_BYTES)
+                    fh.seek(sig_start)
+                    sig = fh.read(offset - sig_start)
+                    if sig.endswith(b"\n") and hashlib.sha256(sig).hexdigest() == entry.get("tail_sha"):
+                        # Append-only change: parse just the new rows under the stored header.
+                        tail = fh.read(size - offset).decode("utf-8", errors="replace")
+                        rows = parse_price_rows(entry["header"] + "\n" + tail, delimiter=entry.get("delimiter"))
+                        prev = None
+                        if entry.get("last_date"):
+                            prev = (dt.date.fromisoformat(entry["last_date"]), float(entry["last_close"]))
+                        last = _last_point(([prev] if prev else []) + rows)
+                        return self._entry(fh, st, last, header=entry["header"], delimiter=entry.get("delimiter"))
+                fh.seek(0)
+                data = fh.read()
+                text = data.decode("utf-8-sig", errors="replace")
+                delimiter = sniff_delimiter(text)
+                lines = text.splitlines()
+                header = lines[0] if lines else ""
+                last = _last_point(parse_price_rows(text, delimiter=delimiter))
+                return self._entry(fh, st, last, header=header, delimiter=delimiter)
+        except Exception:
+            return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "last_date": None}
+
+    @staticmethod
+    def _entry(fh, st: os.stat_result, last: tuple[dt.date, float] | None, *, header: str, delimiter: str | None) -> dict[str, Any]:
+        size = int(st.st_size)
+        sig_start = max(0, size - _TAIL_SIG_BYTES)
+        fh.seek(sig_start)
+        sig = fh.read(size - sig_start)
+        return {
+            "mtime_ns": st.st_mtime_ns,
+            "size": size,
+            "offset": size,
+            "tail_sha": hashlib.sha256(sig).hexdigest(),
+            "header": header,
+            "delimiter": delimiter,
+            "last_date": last[0].isoformat() if last else None,
+            "last_close": float(last[1]) if last else None,
+        }
+
+    def save(self) -> None:
+        """
+        Persist the index when it changed. Best-effort: a read-only prices directory just means no caching.
+        """
+        if not self._dirty:
+            return
+        tmp = self.path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": self._files}, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
@@ -6,10 +6,11 @@ import json
 import os
 import math
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy import func
@@ -730,6 +731,300 @@ def _ensure_security(session: Session, *, ticker: str, meta: dict[str, Any]) ->
     )
 
 
+# Keep IN (...) lists well under SQLite's bound-parameter limit.
+_PREFETCH_CHUNK = 500
+
+
+def _chunked(values: list[Any], size: int = _PREFETCH_CHUNK) -> list[list[Any]]:
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+# Page items are ingested in batches of this many rows, so streamed pages are never fully materialized.
+_PAGE_ITEM_BATCH = 5000
+
+
+def _iter_batches(items: Iterable[dict[str, Any]], size: int = _PAGE_ITEM_BATCH) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _prefetch_transaction_maps(
+    session: Session,
+    *,
+    connection_id: int,
+    provider_txn_ids: list[str],
+    load_transactions: bool,
+) -> tuple[dict[str, int], dict[int, Transaction]]:
+    """Load the page's already-imported provider ids in a few IN queries instead of one lookup per row.
+
+    Returns provider_txn_id -> transaction_id and, when ``load_transactions`` is set (the page may
+    reclassify existing rows), transaction_id -> Transaction.
+    """
+    txn_ids: dict[str, int] = {}
+    for chunk in _chunked(sorted(set(provider_txn_ids))):
+        rows = (
+            session.query(ExternalTransactionMap.provider_txn_id, ExternalTransactionMap.transaction_id)
+            .filter(
+                ExternalTransactionMap.connection_id == connection_id,
+                ExternalTransactionMap.provider_txn_id.in_(chunk),
+            )
+            .all()
+        )
+        txn_ids.update({str(provider_txn_id): int(transaction_id) for provider_txn_id, transaction_id in rows})
+    transactions: dict[int, Transaction] = {}
+    if load_transactions and txn_ids:
+        for chunk in _chunked(sorted(set(txn_ids.values()))):
+            for txn in session.query(Transaction).filter(Transaction.id.in_(chunk)).all():
+                transactions[int(txn.id)] = txn
+    return txn_ids, transactions
+
+
+@dataclass
+class _PendingTxn:
+    txn: Transaction
+    provider_txn_id: str
+    account_id: int
+    tx_date: dt.date
+    tx_type: str
+    ticker: str
+    qty: float | None
+    amount: float
+    # Churned provider ids (e.g. Plaid pending -> posted) that resolve to this same new transaction.
+    aliases: list[str] = field(default_factory=list)
+
+
+_TRANSACTION_FIELDS = ("account_id", "date", "type", "ticker", "qty", "amount", "lot_links_json")
+
+
+def _insert_pending_transactions(session: Session, *, connection_id: int, pending: list[_PendingTxn]) -> list[_PendingTxn]:
+    """Insert a page of new transactions and their external maps in one savepoint.
+
+    The page was already diffed against the prefetched maps, so a conflict here means another
+    writer raced us; fall back to per-row savepoints so only the conflicting rows are skipped.
+    Returns the entries that were inserted.
+    """
+    if not pending:
+        return []
+    session.flush()
+    try:
+        with session.begin_nested():
+            session.add_all([p.txn for p in pending])
+            session.flush()
+            session.add_all(
+                [
+                    ExternalTransactionMap(connection_id=connection_id, provider_txn_id=provider_txn_id, transaction_id=p.txn.id)
+                    for p in pending
+                    for provider_txn_id in (p.provider_txn_id, *p.aliases)
+                ]
+            )
+            session.flush()
+        return list(pending)
+    except IntegrityError:
+        pass
+    inserted: list[_PendingTxn] = []
+    for p in pending:
+        p.txn = Transaction(**{name: getattr(p.txn, name) for name in _TRANSACTION_FIELDS})
+        try:
+            with session.begin_nested():
+                session.add(p.txn)
+                session.flush()
+                session.add(
+                    ExternalTransactionMap(
+                        connection_id=connection_id, provider_txn_id=p.provider_txn_id, transaction_id=p.txn.id
+                    )
+                )
+                session.flush()
+        except IntegrityError:
+            continue
+        _insert_transaction_links(session, connection_id=connection_id, links=[(alias, int(p.txn.id)) for alias in p.aliases])
+        inserted.append(p)
+    return inserted
+
+
+def _insert_transaction_links(session: Session, *, connection_id: int, links: list[tuple[str, int]]) -> int:
+    """Map extra provider ids onto already-imported transactions in one savepoint (per-row on conflict)."""
+    if not links:
+        return 0
+    try:
+        with session.begin_nested():
+            session.add_all(
+                [
+                    ExternalTransactionMap(connection_id=connection_id, provider_txn_id=provider_txn_id, transaction_id=transaction_id)
+                    for provider_txn_id, transaction_id in links
+                ]
+            )
+            session.flush()
+        return len(links)
+    except IntegrityError:
+        pass
+    linked = 0
+    for provider_txn_id, transaction_id in links:
+        try:
+            with session.begin_nested():
+                session.add(
+                    ExternalTransactionMap(connection_id=connection_id, provider_txn_id=provider_txn_id, transaction_id=transaction_id)
+                )
+                session.flush()
+        except IntegrityError:
+            continue
+        linked += 1
+    return linked
+
+
+_TxnSignature = tuple[int, dt.date, str, Optional[str], float, Optional[float]]
+
+
+def _txn_signature(
+    account_id: int, tx_date: dt.date, tx_type: str, ticker: str | None, amount: float, qty: float | None
+) -> _TxnSignature:
+    # Rounded to the Transaction column scales so stored Numeric values and parsed floats compare equal.
+    return (
+        int(account_id),
+        tx_date,
+        str(tx_type),
+        ticker,
+        round(float(amount), 2),
+        None if qty is None else round(float(qty), 6),
+    )
+
+
+def _signature_of(txn: Transaction) -> _TxnSignature:
+    return _txn_signature(txn.account_id, txn.date, txn.type, txn.ticker, txn.amount, txn.qty)
+
+
+def _page_dates(items: list[dict[str, Any]]) -> list[dt.date]:
+    dates: list[dt.date] = []
+    for it in items:
+        if str(it.get("record_kind") or "TRANSACTION").strip().upper() != "TRANSACTION":
+            continue
+        try:
+            dates.append(dt.date.fromisoformat(str(it.get("date"))))
+        except ValueError:
+            continue
+    return dates
+
+
+def _prefetch_transaction_signatures(
+    session: Session, *, connection_id: int, dates: list[dt.date]
+) -> dict[_TxnSignature, list[Transaction]]:
+    """Index the connection's imported transactions on the page's dates by their Plaid churn signature.
+
+    Each signature lists its transactions in id order; the first one is what a churned provider id links to.
+    """
+    index: dict[_TxnSignature, list[Transaction]] = {}
+    for chunk in _chunked(sorted(set(dates))):
+        rows = (
+            session.query(Transaction)
+            .join(ExternalTransactionMap, ExternalTransactionMap.transaction_id == Transaction.id)
+            .filter(ExternalTransactionMap.connection_id == connection_id, Transaction.date.in_(chunk))
+            .order_by(Transaction.id.asc())
+            .all()
+        )
+        for txn in rows:
+            matches = index.setdefault(_signature_of(txn), [])
+            if txn not in matches:
+                matches.append(txn)
+    return index
+
+
+def _reindex_signature(index: dict[_TxnSignature, list[Transaction]], txn: Transaction, old: _TxnSignature) -> None:
+    """Move a reclassified transaction to its new signature, keeping each list in id order."""
+    matches = index.get(old) or []
+    if txn in matches:
+        matches.remove(txn)
+    if not matches:
+        index.pop(old, None)
+    moved = index.setdefault(_signature_of(txn), [])
+    moved.append(txn)
+    moved.sort(key=lambda t: int(t.id))
+
+
+def _plaid_expense_txn_id(provider_txn_id: str) -> str:
+    return hashlib.sha256(f"PLAID:{provider_txn_id}".encode("utf-8")).hexdigest()
+
+
+def _prefetch_expense_transactions(session: Session, *, txn_ids: list[str]) -> dict[str, ExpenseTransaction]:
+    existing: dict[str, ExpenseTransaction] = {}
+    for chunk in _chunked(sorted(set(txn_ids))):
+        for row in session.query(ExpenseTransaction).filter(ExpenseTransaction.txn_id.in_(chunk)).all():
+            existing[str(row.txn_id)] = row
+    return existing
+
+
+_EXPENSE_FIELDS = (
+    "txn_id",
+    "expense_account_id",
+    "institution",
+    "account_name",
+    "posted_date",
+    "transaction_date",
+    "description_raw",
+    "description_norm",
+    "merchant_norm",
+    "amount",
+    "currency",
+    "account_last4_masked",
+    "cardholder_name",
+    "category_hint",
+    "category_user",
+    "category_system",
+    "tags_json",
+    "notes",
+    "import_batch_id",
+    "original_row_json",
+)
+
+
+def _merge_expense_update(existing: ExpenseTransaction, incoming: ExpenseTransaction) -> None:
+    """Apply a re-reported (e.g. Plaid-modified) expense row onto the stored one."""
+    existing.posted_date = incoming.posted_date
+    existing.description_raw = incoming.description_raw
+    existing.description_norm = incoming.description_norm
+    existing.merchant_norm = incoming.merchant_norm
+    existing.amount = incoming.amount
+    existing.currency = incoming.currency
+    if incoming.category_hint and not (existing.category_hint or "").strip():
+        existing.category_hint = incoming.category_hint
+    if incoming.cardholder_name and not (existing.cardholder_name or "").strip():
+        existing.cardholder_name = incoming.cardholder_name
+    if incoming.original_row_json and not (existing.original_row_json or {}):
+        existing.original_row_json = incoming.original_row_json
+
+
+def _insert_pending_expenses(
+    session: Session, pending: list[ExpenseTransaction]
+) -> tuple[list[ExpenseTransaction], list[ExpenseTransaction]]:
+    """Insert a page of new expense rows in one savepoint; returns (inserted, conflicting).
+
+    Rows were diffed against the prefetched txn_ids, so conflicts only come from a concurrent
+    writer; those rows are retried one savepoint each and handed back for the upsert path.
+    """
+    if not pending:
+        return [], []
+    session.flush()
+    try:
+        with session.begin_nested():
+            session.add_all(pending)
+            session.flush()
+        return list(pending), []
+    except IntegrityError:
+        pass
+    inserted: list[ExpenseTransaction] = []
+    conflicting: list[ExpenseTransaction] = []
+    for row in pending:
+        row = ExpenseTransaction(**{name: getattr(row, name) for name in _EXPENSE_FIELDS})
+        try:
+            with session.begin_nested():
+                session.add(row)
+                session.flush()
+        except IntegrityError:
+            conflicting.append(row)
+            continue
+        inserted.append(row)
+    return inserted, conflicting
+
+
 def _upsert_account_map(
     session: Session,
     *,
@@ -1485,6 +1780,140 @@ def run_sync(
         latest: dt.date | None = None
         is_offline_flex = (conn.provider or "").upper() == "IB" and (conn.connector or "").upper() == "IB_FLEX_OFFLINE"
         expense_batch_id: int | None = None
+        expense_batch: ExpenseImportBatch | None = None
+        # Per-run lookup caches and the per-batch ingestion index: existing provider ids are prefetched
+        # once per batch of page items and new rows are queued, then inserted together when the batch ends.
+        reclassify_existing = connector_u == "CHASE_PLAID" or (is_offline_flex and bool(reprocess_files))
+        known_tickers: set[str] = set()
+        account_types: dict[int, str] = {}
+        expense_accounts: dict[int, ExpenseAccount] = {}
+        page_txn_ids: dict[str, int] = {}
+        page_txns: dict[int, Transaction] = {}
+        pending_txns: list[_PendingTxn] = []
+        pending_by_provider: dict[str, Transaction] = {}
+        # CHASE_PLAID churn detection: the page's imported rows indexed by signature, the new rows queued
+        # on this page by signature, and churned provider ids to map onto already-imported rows.
+        page_signatures: dict[_TxnSignature, list[Transaction]] = {}
+        pending_by_signature: dict[_TxnSignature, _PendingTxn] = {}
+        pending_links: list[tuple[str, int]] = []
+        # Expense rows: existing rows prefetched by txn_id, plus the page's new rows awaiting one bulk insert.
+        page_expenses: dict[str, ExpenseTransaction] = {}
+        pending_expenses: list[ExpenseTransaction] = []
+
+        def _drain_pending_expenses() -> None:
+            nonlocal earliest, latest
+            if not pending_expenses:
+                return
+            inserted, conflicting = _insert_pending_expenses(session, pending_expenses)
+            pending_expenses.clear()
+            if expense_batch is not None:
+                expense_batch.row_count = int(expense_batch.row_count or 0) + len(inserted)
+            processed: list[ExpenseTransaction] = list(inserted)
+            coverage["new_inserted"] += len(inserted)
+            coverage["txn_count"] += len(inserted)
+            coverage["expenses_txns_imported"] = int(coverage.get("expenses_txns_imported") or 0) + len(inserted)
+            for row in conflicting:
+                # Inserted by another writer after the page was prefetched; fall back to the upsert.
+                existing = session.query(ExpenseTransaction).filter(ExpenseTransaction.txn_id == row.txn_id).one_or_none()
+                if existing is None:
+                    coverage["duplicates_skipped"] += 1
+                    if expense_batch is not None:
+                        expense_batch.duplicates_skipped = int(expense_batch.duplicates_skipped or 0) + 1
+                    continue
+                _merge_expense_update(existing, row)
+                coverage["updated_existing"] = int(coverage.get("updated_existing") or 0) + 1
+                processed.append(row)
+            coverage["expenses_txns_processed"] = int(coverage.get("expenses_txns_processed") or 0) + len(processed)
+            for row in processed:
+                if earliest is None or row.posted_date < earliest:
+                    earliest = row.posted_date
+                if latest is None or row.posted_date > latest:
+                    latest = row.posted_date
+
+        def _drain_pending_txns() -> None:
+            nonlocal earliest, latest
+            if pending_links:
+                linked = _insert_transaction_links(session, connection_id=conn.id, links=pending_links)
+                coverage["linked_existing"] = int(coverage.get("linked_existing") or 0) + linked
+                pending_links.clear()
+            pending_by_signature.clear()
+            if not pending_txns:
+                return
+            inserted = _insert_pending_transactions(session, connection_id=conn.id, pending=pending_txns)
+            coverage["duplicates_skipped"] += len(pending_txns) - len(inserted)
+            pending_txns.clear()
+            pending_by_provider.clear()
+            for p in inserted:
+                page_txn_ids[p.provider_txn_id] = int(p.txn.id)
+                page_txns[int(p.txn.id)] = p.txn
+                coverage["new_inserted"] += 1
+
+                if earliest is None or p.tx_date < earliest:
+                    earliest = p.tx_date
+                if latest is None or p.tx_date > latest:
+                    latest = p.tx_date
+
+                # Minimal BUY-lot creation (MVP): create lot if qty and amount exist and account is taxable.
+                if p.account_id not in account_types:
+                    account_types[p.account_id] = session.query(Account).filter(Account.id == p.account_id).one().account_type
+                if account_types[p.account_id] == "TAXABLE" and p.tx_type == "BUY" and p.qty and p.qty > 0:
+                    try:
+                        basis_total = abs(p.amount)
+                        # Idempotency: PositionLot has no natural unique key, so do a best-effort match to
+                        # avoid duplicating lots when the same BUY appears across re-runs/imports.
+                        existing_lots = (
+                            session.query(PositionLot)
+                            .filter(
+                                PositionLot.account_id == p.account_id,
+                                PositionLot.ticker == p.ticker,
+                                PositionLot.acquisition_date == p.tx_date,
+                            )
+                            .all()
+                        )
+                        lot_exists = False
+                        for l in existing_lots:
+                            try:
+                                if abs(float(l.qty) - float(p.qty)) <= 1e-6 and abs(float(l.basis_total) - float(basis_total)) <= 0.01:
+                                    lot_exists = True
+                                    break
+                            except Exception:
+                                continue
+                        if not lot_exists:
+                            with session.begin_nested():
+                                session.add(
+                                    PositionLot(
+                                        account_id=p.account_id,
+                                        ticker=p.ticker,
+                                        acquisition_date=p.tx_date,
+                                        qty=p.qty,
+                                        basis_total=basis_total,
+                                        adjusted_basis_total=None,
+                                    )
+                                )
+                                session.flush()
+                    except Exception as e:
+                        warnings.append(f"Best-effort lot creation failed for BUY txn_id={p.txn.id}: {type(e).__name__}")
+
+        def _drain_page_batch() -> None:
+            # Same contract as the per-item handler: a batch whose bulk insert fails is rolled back to its
+            # savepoint, counted as parse failures and reported, and the sync moves on to the next batch.
+            for record_kind, drain, queued in (
+                ("EXPENSE_TXN", _drain_pending_expenses, len(pending_expenses)),
+                ("TRANSACTION", _drain_pending_txns, len(pending_txns) + len(pending_links)),
+            ):
+                try:
+                    with session.begin_nested():
+                        drain()
+                except Exception as e:
+                    coverage["parse_fail_count"] += max(1, queued)
+                    warnings.append(f"Parse fail kind={record_kind} batch_rows={queued} err={type(e).__name__}")
+                    if record_kind == "EXPENSE_TXN":
+                        pending_expenses.clear()
+                    else:
+                        pending_links.clear()
+                        pending_by_signature.clear()
+                        pending_txns.clear()
+                        pending_by_provider.clear()
 
         if is_offline_files and not ((ctx.run_settings or {}).get("selected_files") or []):
             exhausted = True
@@ -1500,11 +1929,15 @@ def run_sync(
                 break
 
             coverage["pages_fetched"] += 1
+            # Pages may be lazy iterables (IB Flex Web streams its report rows), so they are consumed in
+            # batches: lookups are prefetched and new rows inserted one batch at a time.
+            page_batches = _iter_batches(items, _PAGE_ITEM_BATCH)
+            first_batch = next(page_batches, [])
             # Live connectors can emit a report-level payload marker for idempotency. If we've already imported
             # this exact payload hash for this connection, skip processing this page to avoid duplicating
-            # holdings snapshots/cash balances/etc.
+            # holdings snapshots/cash balances/etc. Adapters emit the marker first, so it is in the first batch.
             skip_page = False
-            for it in items:
+            for it in first_batch:
                 if str(it.get("record_kind") or "").strip().upper() != "REPORT_PAYLOAD":
                     continue
                 payload_hash = str(it.get("payload_hash") or "").strip()
@@ -1612,424 +2045,441 @@ def run_sync(
                     pass
                 except Exception:
                     pass
-            if store_payloads:
-                session.add(
-                    ExternalPayloadSnapshot(
-                        sync_run_id=run.id,
-                        kind="transactions_page",
-                        cursor=cursor,
-                        payload_json={"items": items, "next_cursor": next_cursor},
+            page_items: list[dict[str, Any]] = []
+            page_item_count = 0
+            for batch in chain([first_batch], page_batches):
+                page_item_count += len(batch)
+                if store_payloads:
+                    page_items.extend(batch)
+                page_txn_ids, page_txns = _prefetch_transaction_maps(
+                    session,
+                    connection_id=conn.id,
+                    provider_txn_ids=[_stable_provider_txn_id(it) for it in batch],
+                    load_transactions=reclassify_existing,
+                )
+                if connector_u == "CHASE_PLAID":
+                    page_signatures = _prefetch_transaction_signatures(
+                        session, connection_id=conn.id, dates=_page_dates(batch)
                     )
+                page_expenses = _prefetch_expense_transactions(
+                    session,
+                    txn_ids=[
+                        _plaid_expense_txn_id(str(it.get("provider_transaction_id") or "").strip())
+                        for it in batch
+                        if str(it.get("record_kind") or "").strip().upper() == "EXPENSE_TXN"
+                        and str(it.get("provider_transaction_id") or "").strip()
+                    ],
                 )
-
-            for it in items:
-                record_kind = str(it.get("record_kind") or "TRANSACTION").strip().upper()
-                try:
-                    if record_kind == "REPORT_PAYLOAD":
-                        continue
-                    if record_kind == "SYNC_CURSOR":
-                        # Adapter-supplied cursor updates (persisted after SUCCESS).
-                        kind = str(it.get("cursor_kind") or "").strip().upper()
-                        cur = str(it.get("cursor") or "").strip()
-                        if kind == "PLAID_TRANSACTIONS" and cur:
-                            ctx.run_settings["plaid_transactions_cursor"] = cur
-                            coverage["plaid_transactions_cursor_updated"] = True
-                            st = str(it.get("transactions_update_status") or "").strip()
-                            if st:
-                                ctx.run_settings["plaid_transactions_update_status"] = st
-                                coverage["plaid_transactions_update_status"] = st
-                            if "historical_complete" in it:
-                                try:
-                                    hc = bool(it.get("historical_complete"))
-                                    ctx.run_settings["plaid_transactions_historical_complete"] = hc
-                                    coverage["plaid_transactions_historical_complete"] = hc
-                                except Exception:
-                                    pass
-                        continue
-                    if record_kind == "ADAPTER_WARNING":
-                        msg = str(it.get("message") or "").strip()
-                        if msg:
-                            warnings.append(msg)
-                        continue
-                    if record_kind == "EXPENSE_TXN":
-                        # Expense transactions are stored in `expense_transactions` (not the investment `transactions` table).
-                        provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "").strip()
-                        exp_acct_id = expense_account_id_by_provider.get(provider_account_id)
-                        if exp_acct_id is None:
-                            if expense_account_id_by_provider:
-                                exp_acct_id = next(iter(expense_account_id_by_provider.values()))
-                                warnings.append(
-                                    f"Missing expense account mapping for provider_account_id={provider_account_id}; used expense_account_id={exp_acct_id}."
-                                )
+                for it in batch:
+                    record_kind = str(it.get("record_kind") or "TRANSACTION").strip().upper()
+                    try:
+                        if record_kind == "REPORT_PAYLOAD":
+                            continue
+                        if record_kind == "SYNC_CURSOR":
+                            # Adapter-supplied cursor updates (persisted after SUCCESS).
+                            kind = str(it.get("cursor_kind") or "").strip().upper()
+                            cur = str(it.get("cursor") or "").strip()
+                            if kind == "PLAID_TRANSACTIONS" and cur:
+                                ctx.run_settings["plaid_transactions_cursor"] = cur
+                                coverage["plaid_transactions_cursor_updated"] = True
+                                st = str(it.get("transactions_update_status") or "").strip()
+                                if st:
+                                    ctx.run_settings["plaid_transactions_update_status"] = st
+                                    coverage["plaid_transactions_update_status"] = st
+                                if "historical_complete" in it:
+                                    try:
+                                        hc = bool(it.get("historical_complete"))
+                                        ctx.run_settings["plaid_transactions_historical_complete"] = hc
+                                        coverage["plaid_transactions_historical_complete"] = hc
+                                    except Exception:
+                                        pass
+                            continue
+                        if record_kind == "ADAPTER_WARNING":
+                            msg = str(it.get("message") or "").strip()
+                            if msg:
+                                warnings.append(msg)
+                            continue
+                        if record_kind == "EXPENSE_TXN":
+                            # Expense transactions are stored in `expense_transactions` (not the investment `transactions` table).
+                            provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "").strip()
+                            exp_acct_id = expense_account_id_by_provider.get(provider_account_id)
+                            if exp_acct_id is None:
+                                if expense_account_id_by_provider:
+                                    exp_acct_id = next(iter(expense_account_id_by_provider.values()))
+                                    warnings.append(
+                                        f"Missing expense account mapping for provider_account_id={provider_account_id}; used expense_account_id={exp_acct_id}."
+                                    )
+                                else:
+                                    raise ValueError("No expense accounts available for this connection.")
+
+                            d_s = str(it.get("date") or "").strip()
+                            posted = dt.date.fromisoformat(d_s[:10])
+                            amount = Decimal(str(it.get("amount") or "0")).quantize(Decimal("0.01"))
+                            currency = str(it.get("currency") or "USD").strip().upper() or "USD"
+                            desc_raw = str(it.get("description") or "").strip() or "Unknown"
+
+                            # Use bank vs card merchant normalization based on ExpenseAccount.type.
+                            exp_acct = expense_accounts.get(exp_acct_id)
+                            if exp_acct is None:
+                                exp_acct = session.query(ExpenseAccount).filter(ExpenseAccount.id == exp_acct_id).one()
+                                expense_accounts[exp_acct_id] = exp_acct
+                            desc_norm = normalize_description(desc_raw)
+                            if (exp_acct.type or "").upper() == "CREDIT":
+                                merchant_norm = normalize_merchant(desc_raw)
                             else:
-                                raise ValueError("No expense accounts available for this connection.")
-
-                        d_s = str(it.get("date") or "").strip()
-                        posted = dt.date.fromisoformat(d_s[:10])
-                        amount = Decimal(str(it.get("amount") or "0")).quantize(Decimal("0.01"))
-                        currency = str(it.get("currency") or "USD").strip().upper() or "USD"
-                        desc_raw = str(it.get("description") or "").strip() or "Unknown"
-
-                        # Use bank vs card merchant normalization based on ExpenseAccount.type.
-                        exp_acct = session.query(ExpenseAccount).filter(ExpenseAccount.id == exp_acct_id).one()
-                        desc_norm = normalize_description(desc_raw)
-                        if (exp_acct.type or "").upper() == "CREDIT":
-                            merchant_norm = normalize_merchant(desc_raw)
-                        else:
-                            merchant_norm = normalize_bank_merchant(desc_raw)
+                                merchant_norm = normalize_bank_merchant(desc_raw)
 
-                        provider_txn_id = str(it.get("provider_transaction_id") or "").strip() or None
-                        # Plaid provides a stable transaction_id; use it as the authoritative idempotency key
-                        # to avoid duplicating when Plaid modifies a transaction (pending→posted, date tweaks, etc.).
-                        if provider_txn_id:
-                            txn_id = hashlib.sha256(f"PLAID:{provider_txn_id}".encode("utf-8")).hexdigest()
-                        else:
-                            txn_id = stable_txn_id(
+                            provider_txn_id = str(it.get("provider_transaction_id") or "").strip() or None
+                            # Plaid provides a stable transaction_id; use it as the authoritative idempotency key
+                            # to avoid duplicating when Plaid modifies a transaction (pending→posted, date tweaks, etc.).
+                            if provider_txn_id:
+                                txn_id = _plaid_expense_txn_id(provider_txn_id)
+                            else:
+                                txn_id = stable_txn_id(
+                                    institution=str(exp_acct.institution),
+                                    account_name=str(exp_acct.name),
+                                    posted_date=posted,
+                                    amount=amount,
+                                    description_norm=desc_norm,
+                                    currency=currency,
+                                    external_id=None,
+                                )
+                                # Only provider ids are prefetched per page; hashed rows are looked up on first sight.
+                                if txn_id not in page_expenses:
+                                    found = session.query(ExpenseTransaction).filter(ExpenseTransaction.txn_id == txn_id).one_or_none()
+                                    if found is not None:
+                                        page_expenses[txn_id] = found
+
+                            if expense_batch_id is None:
+                                h = hashlib.sha256(f"PLAID:{conn.id}:{run.id}".encode("utf-8")).hexdigest()
+                                batch = ExpenseImportBatch(
+                                    source="PLAID",
+                                    file_name=f"plaid:sync_run:{run.id}",
+                                    file_hash=h,
+                                    row_count=0,
+                                    duplicates_skipped=0,
+                                    metadata_json={"connection_id": int(conn.id), "connector": str(conn.connector or "")},
+                                )
+                                session.add(batch)
+                                session.flush()
+                                expense_batch_id = int(batch.id)
+                                expense_batch = batch
+
+                            category_hint = str(it.get("category_hint") or "").strip() or None
+                            raw_payload = it.get("raw") if isinstance(it.get("raw"), dict) else None
+                            raw_cardholder = None
+                            if raw_payload:
+                                raw_cardholder = (
+                                    str(
+                                        raw_payload.get("authorized_user")
+                                        or raw_payload.get("authorized_user_name")
+                                        or raw_payload.get("account_owner")
+                                        or ""
+                                    )
+                                    .strip()
+                                    or None
+                                )
+                            row = ExpenseTransaction(
+                                txn_id=txn_id,
+                                expense_account_id=exp_acct_id,
                                 institution=str(exp_acct.institution),
                                 account_name=str(exp_acct.name),
                                 posted_date=posted,
-                                amount=amount,
+                                transaction_date=None,
+                                description_raw=desc_raw,
                                 description_norm=desc_norm,
+                                merchant_norm=merchant_norm,
+                                amount=float(amount),
                                 currency=currency,
-                                external_id=None,
-                            )
-
-                        if expense_batch_id is None:
-                            h = hashlib.sha256(f"PLAID:{conn.id}:{run.id}".encode("utf-8")).hexdigest()
-                            batch = ExpenseImportBatch(
-                                source="PLAID",
-                                file_name=f"plaid:sync_run:{run.id}",
-                                file_hash=h,
-                                row_count=0,
-                                duplicates_skipped=0,
-                                metadata_json={"connection_id": int(conn.id), "connector": str(conn.connector or "")},
-                            )
-                            session.add(batch)
-                            session.flush()
-                            expense_batch_id = int(batch.id)
-
-                        category_hint = str(it.get("category_hint") or "").strip() or None
-                        raw_payload = it.get("raw") if isinstance(it.get("raw"), dict) else None
-                        raw_cardholder = None
-                        if raw_payload:
-                            raw_cardholder = (
-                                str(
-                                    raw_payload.get("authorized_user")
-                                    or raw_payload.get("authorized_user_name")
-                                    or raw_payload.get("account_owner")
-                                    or ""
-                                )
-                                .strip()
-                                or None
+                                account_last4_masked=str(exp_acct.last4_masked or "")[:8] or None,
+                                cardholder_name=raw_cardholder,
+                                category_hint=category_hint,
+                                category_user=None,
+                                category_system=None,
+                                tags_json=[],
+                                notes=None,
+                                import_batch_id=expense_batch_id,
+                                original_row_json=raw_payload,
                             )
-                        inserted = False
-                        try:
-                            with session.begin_nested():
-                                session.add(
-                                    ExpenseTransaction(
-                                        txn_id=txn_id,
-                                        expense_account_id=exp_acct_id,
-                                        institution=str(exp_acct.institution),
-                                        account_name=str(exp_acct.name),
-                                        posted_date=posted,
-                                        transaction_date=None,
-                                        description_raw=desc_raw,
-                                        description_norm=desc_norm,
-                                        merchant_norm=merchant_norm,
-                                        amount=float(amount),
-                                        currency=currency,
-                                        account_last4_masked=str(exp_acct.last4_masked or "")[:8] or None,
-                                        cardholder_name=raw_cardholder,
-                                        category_hint=category_hint,
-                                        category_user=None,
-                                        category_system=None,
-                                        tags_json=[],
-                                        notes=None,
-                                        import_batch_id=expense_batch_id,
-                                        original_row_json=raw_payload,
-                                    )
-                                )
-                                inserted = True
-                        except IntegrityError:
-                            inserted = False
-
-                        if inserted:
-                            if expense_batch_id is not None:
-                                try:
-                                    batch = session.query(ExpenseImportBatch).filter(ExpenseImportBatch.id == expense_batch_id).one()
-                                    batch.row_count = int(batch.row_count or 0) + 1
-                                    session.flush()
-                                except Exception:
-                                    pass
-                        else:
-                            # Upsert: update key fields when Plaid reports the txn as modified.
-                            existing = session.query(ExpenseTransaction).filter(ExpenseTransaction.txn_id == txn_id).one_or_none()
-                            if existing is not None:
-                                existing.posted_date = posted
-                                existing.description_raw = desc_raw
-                                existing.description_norm = desc_norm
-                                existing.merchant_norm = merchant_norm
-                                existing.amount = float(amount)
-                                existing.currency = currency
-                                if category_hint and not (existing.category_hint or "").strip():
-                                    existing.category_hint = category_hint
-                                if raw_cardholder and not (existing.cardholder_name or "").strip():
-                                    existing.cardholder_name = raw_cardholder
-                                if raw_payload and not (existing.original_row_json or {}):
-                                    existing.original_row_json = raw_payload
-                                session.flush()
-                                coverage["updated_existing"] = int(coverage.get("updated_existing") or 0) + 1
-                            else:
-                                coverage["duplicates_skipped"] += 1
-                                if expense_batch_id is not None:
-                                    try:
-                                        batch = session.query(ExpenseImportBatch).filter(ExpenseImportBatch.id == expense_batch_id).one()
-                                        batch.duplicates_skipped = int(batch.duplicates_skipped or 0) + 1
-                                        session.flush()
-                                    except Exception:
-                                        pass
+                            existing = page_expenses.get(txn_id)
+                            if existing is None:
+                                # New rows are inserted together when the page ends (and counted there).
+                                pending_expenses.append(row)
+                                page_expenses[txn_id] = row
                                 continue
-
-                        if inserted:
-                            coverage["new_inserted"] += 1
-                            coverage["txn_count"] += 1
-                            coverage["expenses_txns_imported"] = int(coverage.get("expenses_txns_imported") or 0) + 1
-                        coverage["expenses_txns_processed"] = int(coverage.get("expenses_txns_processed") or 0) + 1
-                        if earliest is None or posted < earliest:
-                            earliest = posted
-                        if latest is None or posted > latest:
-                            latest = posted
-                        continue
-                    if record_kind == "CASH_BALANCE":
-                        provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "")
-                        account_id = account_map.get(provider_account_id)
-                        if account_id is None:
-                            account_id = next(iter(account_map.values()))
-                            warnings.append(f"Missing provider_account_id mapping for cash balance; used account_id={account_id}.")
-                        ccy = str(it.get("currency") or "USD").strip().upper()
-                        if ccy != "USD":
-                            warnings.append(f"Ignored non-USD cash balance for {provider_account_id}: {ccy}")
-                            continue
-                        as_of_date_s = str(it.get("as_of_date") or it.get("date") or "")
-                        try:
-                            as_of_date = dt.date.fromisoformat(as_of_date_s[:10])
-                        except Exception:
-                            as_of_date = today
-                        amount = float(it.get("amount") or 0.0)
-                        existing_cb = (
-                            session.query(CashBalance)
-                            .filter(CashBalance.account_id == account_id, CashBalance.as_of_date == as_of_date)
-                            .order_by(CashBalance.id.desc())
-                            .first()
-                        )
-                        with session.begin_nested():
-                            if existing_cb is not None:
-                                existing_cb.amount = amount
-                                coverage["cash_balances_updated"] = int(coverage.get("cash_balances_updated") or 0) + 1
-                            else:
-                                session.add(CashBalance(account_id=account_id, as_of_date=as_of_date, amount=amount))
-                                coverage["cash_balances_imported"] = int(coverage.get("cash_balances_imported") or 0) + 1
-                        continue
-                    if record_kind == "BROKER_SYMBOL_SUMMARY":
-                        symbol = str(it.get("symbol") or "").strip().upper()
-                        provider_account_id = str(it.get("provider_account_id") or "")
-                        if not symbol or not provider_account_id:
-                            coverage["parse_fail_count"] += 1
-                            continue
-                        try:
-                            as_of_date = dt.date.fromisoformat(str(it.get("date")))
-                        except Exception:
-                            coverage["parse_fail_count"] += 1
+                            # Upsert: update key fields when Plaid reports the txn as modified.
+                            _merge_expense_update(existing, row)
+                            coverage["updated_existing"] = int(coverage.get("updated_existing") or 0) + 1
+                            coverage["expenses_txns_processed"] = int(coverage.get("expenses_txns_processed") or 0) + 1
+                            if earliest is None or posted < earliest:
+                                earliest = posted
+                            if latest is None or posted > latest:
+                                latest = posted
                             continue
-                        qty = _float_or_none(it.get("qty"))
-                        cost_basis = _float_or_none(it.get("cost_basis"))
-                        realized = _float_or_none(it.get("realized_pl"))
-                        proceeds = _float_or_none(it.get("proceeds"))
-                        source_file_hash = str(it.get("source_file_hash") or "") or "UNKNOWN"
-                        source_row = int(it.get("source_row") or 0)
-
-                        row = BrokerSymbolSummary(
-                            connection_id=conn.id,
-                            provider_account_id=provider_account_id,
-                            symbol=symbol,
-                            as_of_date=as_of_date,
-                            quantity=qty,
-                            cost_basis=cost_basis,
-                            proceeds=proceeds,
-                            realized_pl=realized,
-                            currency=str(it.get("currency")) if it.get("currency") not in (None, "") else None,
-                            source_file_hash=source_file_hash,
-                            source_row=source_row,
-                            raw_json={"row": it.get("raw_row") or {}, "source_file": it.get("source_file"), "source_row": it.get("source_row")},
-                        )
-                        try:
+                        if record_kind == "CASH_BALANCE":
+                            provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "")
+                            account_id = account_map.get(provider_account_id)
+                            if account_id is None:
+                                account_id = next(iter(account_map.values()))
+                                warnings.append(f"Missing provider_account_id mapping for cash balance; used account_id={account_id}.")
+                            ccy = str(it.get("currency") or "USD").strip().upper()
+                            if ccy != "USD":
+                                warnings.append(f"Ignored non-USD cash balance for {provider_account_id}: {ccy}")
+                                continue
+                            as_of_date_s = str(it.get("as_of_date") or it.get("date") or "")
+                            try:
+                                as_of_date = dt.date.fromisoformat(as_of_date_s[:10])
+                            except Exception:
+                                as_of_date = today
+                            amount = float(it.get("amount") or 0.0)
+                            existing_cb = (
+                                session.query(CashBalance)
+                                .filter(CashBalance.account_id == account_id, CashBalance.as_of_date == as_of_date)
+                                .order_by(CashBalance.id.desc())
+                                .first()
+                            )
                             with session.begin_nested():
-                                session.add(row)
-                                session.flush()
-                            coverage["symbol_summary_rows_imported"] = int(coverage.get("symbol_summary_rows_imported") or 0) + 1
-                        except IntegrityError:
-                            coverage["symbol_summary_rows_dupes"] = int(coverage.get("symbol_summary_rows_dupes") or 0) + 1
-                        continue
-                    if record_kind in {"BROKER_CLOSED_LOT", "BROKER_WASH_SALE"}:
-                        symbol = str(it.get("symbol") or it.get("ticker") or "").strip().upper()
-                        if not symbol:
-                            coverage["parse_fail_count"] += 1
-                            continue
-                        provider_account_id = str(it.get("provider_account_id") or "")
-                        trade_date = dt.date.fromisoformat(str(it.get("date")))
-                        qty = _float_or_none(it.get("qty"))
-                        if qty is None:
-                            coverage["parse_fail_count"] += 1
+                                if existing_cb is not None:
+                                    existing_cb.amount = amount
+                                    coverage["cash_balances_updated"] = int(coverage.get("cash_balances_updated") or 0) + 1
+                                else:
+                                    session.add(CashBalance(account_id=account_id, as_of_date=as_of_date, amount=amount))
+                                    coverage["cash_balances_imported"] = int(coverage.get("cash_balances_imported") or 0) + 1
                             continue
-                        qty = abs(qty)
-                        cost_basis = _float_or_none(it.get("cost_basis"))
-                        realized = _float_or_none(it.get("realized_pl_fifo"))
-                        proceeds = _float_or_none(it.get("proceeds_derived"))
-                        if proceeds is None and cost_basis is not None and realized is not None:
-                            proceeds = cost_basis + realized
-                        if proceeds is None:
-                            warns = coverage.get("warnings") or []
-                            warns.append(f"Broker {record_kind} missing proceeds derivation for {symbol} on {trade_date}.")
-                            coverage["warnings"] = warns
-
-                        source_file_hash = str(it.get("source_file_hash") or "")
-                        if not source_file_hash:
-                            source_file_hash = "UNKNOWN"
-
-                        if record_kind == "BROKER_CLOSED_LOT":
-                            row = BrokerLotClosure(
-                                connection_id=conn.id,
-                                taxpayer_entity_id=conn.taxpayer_entity_id,
-                                provider_account_id=provider_account_id or "IBFLEX-1",
-                                symbol=symbol,
-                                conid=str(it.get("conid")) if it.get("conid") not in (None, "") else None,
-                                trade_date=trade_date,
-                                datetime_raw=str(it.get("datetime_raw")) if it.get("datetime_raw") not in (None, "") else None,
-                                open_datetime_raw=str(it.get("open_datetime_raw")) if it.get("open_datetime_raw") not in (None, "") else None,
-                                quantity_closed=qty,
-                                cost_basis=cost_basis,
-                                realized_pl_fifo=realized,
-                                proceeds_derived=proceeds,
-                                currency=str(it.get("currency")) if it.get("currency") not in (None, "") else None,
-                                fx_rate_to_base=_float_or_none(it.get("fx_rate_to_base")),
-                                ib_transaction_id=str(it.get("ib_transaction_id")) if it.get("ib_transaction_id") not in (None, "") else None,
-                                ib_trade_id=str(it.get("ib_trade_id")) if it.get("ib_trade_id") not in (None, "") else None,
-                                source_file_hash=source_file_hash,
-                                raw_json={"row": it.get("raw_row") or {}, "source_file": it.get("source_file"), "source_row": it.get("source_row")},
-                            )
+                        if record_kind == "BROKER_SYMBOL_SUMMARY":
+                            symbol = str(it.get("symbol") or "").strip().upper()
+                            provider_account_id = str(it.get("provider_account_id") or "")
+                            if not symbol or not provider_account_id:
+                                coverage["parse_fail_count"] += 1
+                                continue
                             try:
-                                with session.begin_nested():
-                                    session.add(row)
-                                    session.flush()
-                                coverage["closed_lot_rows_imported"] = int(coverage.get("closed_lot_rows_imported") or 0) + 1
-                            except IntegrityError:
-                                coverage["closed_lot_rows_dupes"] = int(coverage.get("closed_lot_rows_dupes") or 0) + 1
-
-                            # YTD gain summary (planning-grade) for the connection detail view.
-                            if trade_date.year == today.year and realized is not None:
-                                open_d = _parse_ib_date(it.get("open_datetime_raw"))
-                                if open_d is None:
-                                    coverage["broker_gains_ytd_unknown"] = float(coverage.get("broker_gains_ytd_unknown") or 0.0) + float(realized)
-                                else:
-                                    term = "LT" if (trade_date - open_d).days >= 365 else "ST"
-                                    k = "broker_gains_ytd_lt" if term == "LT" else "broker_gains_ytd_st"
-                                    coverage[k] = float(coverage.get(k) or 0.0) + float(realized)
-                        else:
-                            row = BrokerWashSaleEvent(
+                                as_of_date = dt.date.fromisoformat(str(it.get("date")))
+                            except Exception:
+                                coverage["parse_fail_count"] += 1
+                                continue
+                            qty = _float_or_none(it.get("qty"))
+                            cost_basis = _float_or_none(it.get("cost_basis"))
+                            realized = _float_or_none(it.get("realized_pl"))
+                            proceeds = _float_or_none(it.get("proceeds"))
+                            source_file_hash = str(it.get("source_file_hash") or "") or "UNKNOWN"
+                            source_row = int(it.get("source_row") or 0)
+
+                            row = BrokerSymbolSummary(
                                 connection_id=conn.id,
-                                provider_account_id=provider_account_id or "IBFLEX-1",
+                                provider_account_id=provider_account_id,
                                 symbol=symbol,
-                                trade_date=trade_date,
-                                holding_period_datetime_raw=str(it.get("holding_period_datetime_raw")) if it.get("holding_period_datetime_raw") not in (None, "") else None,
-                                when_realized_raw=str(it.get("when_realized_raw")) if it.get("when_realized_raw") not in (None, "") else None,
-                                when_reopened_raw=str(it.get("when_reopened_raw")) if it.get("when_reopened_raw") not in (None, "") else None,
+                                as_of_date=as_of_date,
                                 quantity=qty,
-                                realized_pl_fifo=realized,
                                 cost_basis=cost_basis,
-                                proceeds_derived=proceeds,
-                                ib_transaction_id=str(it.get("ib_transaction_id")) if it.get("ib_transaction_id") not in (None, "") else None,
-                                ib_trade_id=str(it.get("ib_trade_id")) if it.get("ib_trade_id") not in (None, "") else None,
+                                proceeds=proceeds,
+                                realized_pl=realized,
+                                currency=str(it.get("currency")) if it.get("currency") not in (None, "") else None,
                                 source_file_hash=source_file_hash,
+                                source_row=source_row,
                                 raw_json={"row": it.get("raw_row") or {}, "source_file": it.get("source_file"), "source_row": it.get("source_row")},
                             )
                             try:
                                 with session.begin_nested():
                                     session.add(row)
                                     session.flush()
-                                coverage["wash_sale_rows_imported"] = int(coverage.get("wash_sale_rows_imported") or 0) + 1
+                                coverage["symbol_summary_rows_imported"] = int(coverage.get("symbol_summary_rows_imported") or 0) + 1
                             except IntegrityError:
-                                coverage["wash_sale_rows_dupes"] = int(coverage.get("wash_sale_rows_dupes") or 0) + 1
-                        continue
-
-                    coverage["txn_count"] += 1
-                    tx_date = dt.date.fromisoformat(str(it.get("date")))
-                    amount = float(it.get("amount"))
-                    tx_type = _map_txn_type(str(it.get("type") or "OTHER"))
-                    # Normalize sign conventions for cashflows:
-                    # - WITHHOLDING stored as positive credit
-                    # - FEE stored as negative cash outflow
-                    if tx_type == "WITHHOLDING":
-                        amount = abs(amount)
-                    elif tx_type == "FEE":
-                        amount = -abs(amount)
-                    # Per-run type counts (count provider items processed).
-                    tcounts = coverage.get("txn_type_counts") or {}
-                    tcounts[tx_type] = int(tcounts.get(tx_type) or 0) + 1
-                    coverage["txn_type_counts"] = tcounts
-                    description = str(it.get("description") or "")
-                    qty = it.get("qty")
-                    qty_f = float(qty) if qty not in (None, "") else None
-                    # Some providers encode SELL quantities as negative numbers (e.g., RJ offline exports).
-                    # Normalize BUY/SELL quantities to positive values for downstream lot reconstruction.
-                    if tx_type in {"BUY", "SELL"} and qty_f is not None:
-                        qty_f = abs(float(qty_f))
-                    symbol = it.get("ticker") or it.get("symbol")
-                    provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "")
-
-                    account_id = account_map.get(provider_account_id)
-                    if account_id is None:
-                        if (conn.connector or "").upper() == "CHASE_PLAID":
-                            warnings.append(
-                                f"Missing provider_account_id mapping for Plaid investment txn; skipped provider_account_id={provider_account_id}."
-                            )
+                                coverage["symbol_summary_rows_dupes"] = int(coverage.get("symbol_summary_rows_dupes") or 0) + 1
+                            continue
+                        if record_kind in {"BROKER_CLOSED_LOT", "BROKER_WASH_SALE"}:
+                            symbol = str(it.get("symbol") or it.get("ticker") or "").strip().upper()
+                            if not symbol:
+                                coverage["parse_fail_count"] += 1
+                                continue
+                            provider_account_id = str(it.get("provider_account_id") or "")
+                            trade_date = dt.date.fromisoformat(str(it.get("date")))
+                            qty = _float_or_none(it.get("qty"))
+                            if qty is None:
+                                coverage["parse_fail_count"] += 1
+                                continue
+                            qty = abs(qty)
+                            cost_basis = _float_or_none(it.get("cost_basis"))
+                            realized = _float_or_none(it.get("realized_pl_fifo"))
+                            proceeds = _float_or_none(it.get("proceeds_derived"))
+                            if proceeds is None and cost_basis is not None and realized is not None:
+                                proceeds = cost_basis + realized
+                            if proceeds is None:
+                                warns = coverage.get("warnings") or []
+                                warns.append(f"Broker {record_kind} missing proceeds derivation for {symbol} on {trade_date}.")
+                                coverage["warnings"] = warns
+
+                            source_file_hash = str(it.get("source_file_hash") or "")
+                            if not source_file_hash:
+                                source_file_hash = "UNKNOWN"
+
+                            if record_kind == "BROKER_CLOSED_LOT":
+                                row = BrokerLotClosure(
+                                    connection_id=conn.id,
+                                    taxpayer_entity_id=conn.taxpayer_entity_id,
+                                    provider_account_id=provider_account_id or "IBFLEX-1",
+                                    symbol=symbol,
+                                    conid=str(it.get("conid")) if it.get("conid") not in (None, "") else None,
+                                    trade_date=trade_date,
+                                    datetime_raw=str(it.get("datetime_raw")) if it.get("datetime_raw") not in (None, "") else None,
+                                    open_datetime_raw=str(it.get("open_datetime_raw")) if it.get("open_datetime_raw") not in (None, "") else None,
+                                    quantity_closed=qty,
+                                    cost_basis=cost_basis,
+                                    realized_pl_fifo=realized,
+                                    proceeds_derived=proceeds,
+                                    currency=str(it.get("currency")) if it.get("currency") not in (None, "") else None,
+                                    fx_rate_to_base=_float_or_none(it.get("fx_rate_to_base")),
+                                    ib_transaction_id=str(it.get("ib_transaction_id")) if it.get("ib_transaction_id") not in (None, "") else None,
+                                    ib_trade_id=str(it.get("ib_trade_id")) if it.get("ib_trade_id") not in (None, "") else None,
+                                    source_file_hash=source_file_hash,
+                                    raw_json={"row": it.get("raw_row") or {}, "source_file": it.get("source_file"), "source_row": it.get("source_row")},
+                                )
+                                try:
+                                    with session.begin_nested():
+                                        session.add(row)
+                                        session.flush()
+                                    coverage["closed_lot_rows_imported"] = int(coverage.get("closed_lot_rows_imported") or 0) + 1
+                                except IntegrityError:
+                                    coverage["closed_lot_rows_dupes"] = int(coverage.get("closed_lot_rows_dupes") or 0) + 1
+
+                                # YTD gain summary (planning-grade) for the connection detail view.
+                                if trade_date.year == today.year and realized is not None:
+                                    open_d = _parse_ib_date(it.get("open_datetime_raw"))
+                                    if open_d is None:
+                                        coverage["broker_gains_ytd_unknown"] = float(coverage.get("broker_gains_ytd_unknown") or 0.0) + float(realized)
+                                    else:
+                                        term = "LT" if (trade_date - open_d).days >= 365 else "ST"
+                                        k = "broker_gains_ytd_lt" if term == "LT" else "broker_gains_ytd_st"
+                                        coverage[k] = float(coverage.get(k) or 0.0) + float(realized)
+                            else:
+                                row = BrokerWashSaleEvent(
+                                    connection_id=conn.id,
+                                    provider_account_id=provider_account_id or "IBFLEX-1",
+                                    symbol=symbol,
+                                    trade_date=trade_date,
+                                    holding_period_datetime_raw=str(it.get("holding_period_datetime_raw")) if it.get("holding_period_datetime_raw") not in (None, "") else None,
+                                    when_realized_raw=str(it.get("when_realized_raw")) if it.get("when_realized_raw") not in (None, "") else None,
+                                    when_reopened_raw=str(it.get("when_reopened_raw")) if it.get("when_reopened_raw") not in (None, "") else None,
+                                    quantity=qty,
+                                    realized_pl_fifo=realized,
+                                    cost_basis=cost_basis,
+                                    proceeds_derived=proceeds,
+                                    ib_transaction_id=str(it.get("ib_transaction_id")) if it.get("ib_transaction_id") not in (None, "") else None,
+                                    ib_trade_id=str(it.get("ib_trade_id")) if it.get("ib_trade_id") not in (None, "") else None,
+                                    source_file_hash=source_file_hash,
+                                    raw_json={"row": it.get("raw_row") or {}, "source_file": it.get("source_file"), "source_row": it.get("source_row")},
+                                )
+                                try:
+                                    with session.begin_nested():
+                                        session.add(row)
+                                        session.flush()
+                                    coverage["wash_sale_rows_imported"] = int(coverage.get("wash_sale_rows_imported") or 0) + 1
+                                except IntegrityError:
+                                    coverage["wash_sale_rows_dupes"] = int(coverage.get("wash_sale_rows_dupes") or 0) + 1
                             continue
-                        # fallback to first mapped account
-                        account_id = next(iter(account_map.values()))
-                        warnings.append(f"Missing provider_account_id mapping for txn; used account_id={account_id}.")
-
-                    ticker = None
-                    if symbol and str(symbol).strip():
-                        ticker = str(symbol).strip().upper()
-                        _ensure_security(session, ticker=ticker, meta={"source": "sync", "provider_symbol": ticker})
-                    else:
-                        coverage["missing_symbol_count"] += 1
-                        ticker = "UNKNOWN"
-                        _ensure_security(
-                            session,
-                            ticker="UNKNOWN",
-                            meta={"source": "sync", "note": "Placeholder for missing symbols"},
-                        )
 
-                    provider_txn_id = _stable_provider_txn_id(it)
-                    exists = (
-                        session.query(ExternalTransactionMap)
-                        .filter(
-                            ExternalTransactionMap.connection_id == conn.id,
-                            ExternalTransactionMap.provider_txn_id == provider_txn_id,
-                        )
-                        .one_or_none()
-                    )
-                    if exists is not None:
-                        # Allow safe reclassification for Plaid investment txns when upstream mapping improves.
-                        # This avoids cashflow/report distortion from earlier misclassification (e.g., cash dividends as fees).
-                        try:
-                            if (conn.connector or "").upper() == "CHASE_PLAID" and str(provider_txn_id).startswith("PLAID_INV:"):
-                                existing_txn = session.query(Transaction).filter(Transaction.id == exists.transaction_id).one_or_none()
+                        coverage["txn_count"] += 1
+                        tx_date = dt.date.fromisoformat(str(it.get("date")))
+                        amount = float(it.get("amount"))
+                        tx_type = _map_txn_type(str(it.get("type") or "OTHER"))
+                        # Normalize sign conventions for cashflows:
+                        # - WITHHOLDING stored as positive credit
+                        # - FEE stored as negative cash outflow
+                        if tx_type == "WITHHOLDING":
+                            amount = abs(amount)
+                        elif tx_type == "FEE":
+                            amount = -abs(amount)
+                        # Per-run type counts (count provider items processed).
+                        tcounts = coverage.get("txn_type_counts") or {}
+                        tcounts[tx_type] = int(tcounts.get(tx_type) or 0) + 1
+                        coverage["txn_type_counts"] = tcounts
+                        description = str(it.get("description") or "")
+                        qty = it.get("qty")
+                        qty_f = float(qty) if qty not in (None, "") else None
+                        # Some providers encode SELL quantities as negative numbers (e.g., RJ offline exports).
+                        # Normalize BUY/SELL quantities to positive values for downstream lot reconstruction.
+                        if tx_type in {"BUY", "SELL"} and qty_f is not None:
+                            qty_f = abs(float(qty_f))
+                        symbol = it.get("ticker") or it.get("symbol")
+                        provider_account_id = str(it.get("provider_account_id") or it.get("account_id") or "")
+
+                        account_id = account_map.get(provider_account_id)
+                        if account_id is None:
+                            if (conn.connector or "").upper() == "CHASE_PLAID":
+                                warnings.append(
+                                    f"Missing provider_account_id mapping for Plaid investment txn; skipped provider_account_id={provider_account_id}."
+                                )
+                                continue
+                            # fallback to first mapped account
+                            account_id = next(iter(account_map.values()))
+                            warnings.append(f"Missing provider_account_id mapping for txn; used account_id={account_id}.")
+
+                        ticker = None
+                        if symbol and str(symbol).strip():
+                            ticker = str(symbol).strip().upper()
+                            if ticker not in known_tickers:
+                                _ensure_security(session, ticker=ticker, meta={"source": "sync", "provider_symbol": ticker})
+                                known_tickers.add(ticker)
+                        else:
+                            coverage["missing_symbol_count"] += 1
+                            ticker = "UNKNOWN"
+                            if ticker not in known_tickers:
+                                _ensure_security(
+                                    session,
+                                    ticker="UNKNOWN",
+                                    meta={"source": "sync", "note": "Placeholder for missing symbols"},
+                                )
+                                known_tickers.add(ticker)
+
+                        provider_txn_id = _stable_provider_txn_id(it)
+                        pending_txn = pending_by_provider.get(provider_txn_id)
+                        existing_txn_id = page_txn_ids.get(provider_txn_id)
+                        if pending_txn is not None or existing_txn_id is not None:
+                            # Allow safe reclassification for Plaid investment txns when upstream mapping improves.
+                            # This avoids cashflow/report distortion from earlier misclassification (e.g., cash dividends as fees).
+                            try:
+                                if (conn.connector or "").upper() == "CHASE_PLAID" and str(provider_txn_id).startswith("PLAID_INV:"):
+                                    existing_txn = pending_txn if pending_txn is not None else page_txns.get(existing_txn_id)
+                                    if existing_txn is not None:
+                                        old_signature = _signature_of(existing_txn)
+                                        changed = False
+                                        if existing_txn.type != tx_type:
+                                            existing_txn.type = tx_type
+                                            changed = True
+                                        if existing_txn.ticker != ticker:
+                                            existing_txn.ticker = ticker
+                                            changed = True
+                                        if qty_f is not None and existing_txn.qty != qty_f:
+                                            existing_txn.qty = qty_f
+                                            changed = True
+                                        if existing_txn.amount != amount:
+                                            existing_txn.amount = amount
+                                            changed = True
+                                        if changed:
+                                            links = existing_txn.lot_links_json or {}
+                                            links["reclassified_by_sync"] = True
+                                            links["reclassified_at"] = now_utc().isoformat()
+                                            links["raw_type"] = tx_type
+                                            existing_txn.lot_links_json = links
+                                            coverage["updated_existing"] = int(coverage.get("updated_existing") or 0) + 1
+                                            if existing_txn.id is not None:
+                                                _reindex_signature(page_signatures, existing_txn, old_signature)
+                                            elif (queued := pending_by_signature.get(old_signature)) is not None and queued.txn is existing_txn:
+                                                del pending_by_signature[old_signature]
+                                                holder = pending_by_signature.get(_signature_of(existing_txn))
+                                                if holder is None or pending_txns.index(queued) < pending_txns.index(holder):
+                                                    pending_by_signature[_signature_of(existing_txn)] = queued
+                            except Exception:
+                                pass
+                            # Idempotency: skip duplicates; if reprocessing offline files, allow upgrading previously imported
+                            # rows (e.g., backfilling better classification) without changing transaction IDs.
+                            if is_offline_flex and reprocess_files:
+                                existing_txn = pending_txn if pending_txn is not None else page_txns.get(existing_txn_id)
                                 if existing_txn is not None:
                                     changed = False
                                     if existing_txn.type != tx_type:
                                         existing_txn.type = tx_type
                                         changed = True
+                                    # Keep ticker/qty/amount consistent with the latest normalization.
                                     if existing_txn.ticker != ticker:
                                         existing_txn.ticker = ticker
                                         changed = True
@@ -2043,169 +2493,85 @@ def run_sync(
                                         links = existing_txn.lot_links_json or {}
                                         links["reclassified_by_sync"] = True
                                         links["reclassified_at"] = now_utc().isoformat()
-                                        links["raw_type"] = tx_type
                                         existing_txn.lot_links_json = links
-                                        coverage["updated_existing"] = int(coverage.get("updated_existing") or 0) + 1
-                        except Exception:
-                            pass
-                        # Idempotency: skip duplicates; if reprocessing offline files, allow upgrading previously imported
-                        # rows (e.g., backfilling better classification) without changing transaction IDs.
-                        if is_offline_flex and reprocess_files:
-                            existing_txn = session.query(Transaction).filter(Transaction.id == exists.transaction_id).one_or_none()
-                            if existing_txn is not None:
-                                changed = False
-                                if existing_txn.type != tx_type:
-                                    existing_txn.type = tx_type
-                                    changed = True
-                                # Keep ticker/qty/amount consistent with the latest normalization.
-                                if existing_txn.ticker != ticker:
-                                    existing_txn.ticker = ticker
-                                    changed = True
-                                if qty_f is not None and existing_txn.qty != qty_f:
-                                    existing_txn.qty = qty_f
-                                    changed = True
-                                if existing_txn.amount != amount:
-                                    existing_txn.amount = amount
-                                    changed = True
-                                if changed:
-                                    links = existing_txn.lot_links_json or {}
-                                    links["reclassified_by_sync"] = True
-                                    links["reclassified_at"] = now_utc().isoformat()
-                                    existing_txn.lot_links_json = links
-                                    coverage["updated_existing"] += 1
-                        coverage["duplicates_skipped"] += 1
-                        continue
+                                        coverage["updated_existing"] += 1
+                            coverage["duplicates_skipped"] += 1
+                            continue
 
-                    # Plaid Chase transactions can "churn" IDs (pending vs posted/corrected). Prevent duplicates by
-                    # linking a new provider_txn_id to an existing imported transaction with the same signature.
-                    if (conn.connector or "").upper() == "CHASE_PLAID" and str(provider_txn_id).startswith(
-                        ("PLAID_INV:", "PLAID_TXN:")
-                    ):
-                        try:
-                            qsig = (
-                                session.query(Transaction, ExternalTransactionMap)
-                                .join(ExternalTransactionMap, ExternalTransactionMap.transaction_id == Transaction.id)
-                                .filter(
-                                    ExternalTransactionMap.connection_id == conn.id,
-                                    Transaction.account_id == account_id,
-                                    Transaction.date == tx_date,
-                                    Transaction.type == tx_type,
-                                    Transaction.ticker == ticker,
-                                    Transaction.amount == amount,
-                                )
-                            )
-                            if qty_f is None:
-                                qsig = qsig.filter(Transaction.qty.is_(None))
-                            else:
-                                qsig = qsig.filter(Transaction.qty == qty_f)
-                            hit = qsig.order_by(Transaction.id.asc()).first()
-                            if hit is not None:
-                                existing_txn = hit[0]
-                                with session.begin_nested():
-                                    session.add(
-                                        ExternalTransactionMap(
-                                            connection_id=conn.id,
-                                            provider_txn_id=provider_txn_id,
-                                            transaction_id=existing_txn.id,
-                                        )
-                                    )
-                                    session.flush()
+                        # Plaid Chase transactions can "churn" IDs (pending vs posted/corrected). Prevent duplicates by
+                        # linking a new provider_txn_id to an existing imported transaction with the same signature.
+                        # Matched against the page's prefetched signature index and the rows queued on this page.
+                        signature: _TxnSignature | None = None
+                        if (conn.connector or "").upper() == "CHASE_PLAID" and str(provider_txn_id).startswith(
+                            ("PLAID_INV:", "PLAID_TXN:")
+                        ):
+                            signature = _txn_signature(account_id, tx_date, tx_type, ticker, amount, qty_f)
+                            queued = pending_by_signature.get(signature)
+                            if queued is not None:
+                                queued.aliases.append(provider_txn_id)
+                                pending_by_provider[provider_txn_id] = queued.txn
                                 coverage["duplicates_skipped"] += 1
                                 coverage["linked_existing"] = int(coverage.get("linked_existing") or 0) + 1
                                 continue
-                        except IntegrityError:
-                            coverage["duplicates_skipped"] += 1
-                            continue
-                        except Exception:
-                            pass
+                            matched = next(iter(page_signatures.get(signature) or []), None)
+                            if matched is not None:
+                                pending_links.append((provider_txn_id, int(matched.id)))
+                                page_txn_ids[provider_txn_id] = int(matched.id)
+                                page_txns[int(matched.id)] = matched
+                                coverage["duplicates_skipped"] += 1
+                                continue
 
-                    # Insert txn + external map atomically (savepoint). Never rollback the whole run on one dup/error.
-                    try:
-                        with session.begin_nested():
-                            txn = Transaction(
-                                account_id=account_id,
-                                date=tx_date,
-                                type=tx_type,
-                                ticker=ticker,
-                                qty=qty_f,
-                                amount=amount,
-                                lot_links_json={
-                                    "provider_txn_id": provider_txn_id,
-                                    "provider_account_id": provider_account_id,
-                                    "raw_type": it.get("type"),
-                                    "description": description,
-                                    "additional_detail": it.get("additional_detail"),
-                                    "currency": it.get("currency"),
-                                    "cashflow_kind": it.get("cashflow_kind"),
-                                    "source_file": it.get("source_file"),
-                                    "source_row": it.get("source_row"),
-                                },
-                            )
-                            session.add(txn)
-                            session.flush()
-                            session.add(
-                                ExternalTransactionMap(
-                                    connection_id=conn.id, provider_txn_id=provider_txn_id, transaction_id=txn.id
-                                )
-                            )
-                            session.flush()
-                    except IntegrityError:
-                        coverage["duplicates_skipped"] += 1
+                        # Queue txn + external map; the page's new rows are inserted together in one savepoint.
+                        txn = Transaction(
+                            account_id=account_id,
+                            date=tx_date,
+                            type=tx_type,
+                            ticker=ticker,
+                            qty=qty_f,
+                            amount=amount,
+                            lot_links_json={
+                                "provider_txn_id": provider_txn_id,
+                                "provider_account_id": provider_account_id,
+                                "raw_type": it.get("type"),
+                                "description": description,
+                                "additional_detail": it.get("additional_detail"),
+                                "currency": it.get("currency"),
+                                "cashflow_kind": it.get("cashflow_kind"),
+                                "source_file": it.get("source_file"),
+                                "source_row": it.get("source_row"),
+                            },
+                        )
+                        pending = _PendingTxn(
+                            txn=txn,
+                            provider_txn_id=provider_txn_id,
+                            account_id=account_id,
+                            tx_date=tx_date,
+                            tx_type=tx_type,
+                            ticker=ticker,
+                            qty=qty_f,
+                            amount=amount,
+                        )
+                        pending_txns.append(pending)
+                        pending_by_provider[provider_txn_id] = txn
+                        if signature is not None:
+                            pending_by_signature[signature] = pending
+                    except Exception as e:
+                        coverage["parse_fail_count"] += 1
+                        # Include a small, redacted hint to aid debugging; never include secrets.
+                        warnings.append(
+                            f"Parse fail kind={record_kind} file={it.get('source_file') or ''} row={it.get('source_row') or ''} err={type(e).__name__}"
+                        )
                         continue
-
-                    coverage["new_inserted"] += 1
-
-                    if earliest is None or tx_date < earliest:
-                        earliest = tx_date
-                    if latest is None or tx_date > latest:
-                        latest = tx_date
-
-                    # Minimal BUY-lot creation (MVP): create lot if qty and amount exist and account is taxable.
-                    acct = session.query(Account).filter(Account.id == account_id).one()
-                    if acct.account_type == "TAXABLE" and tx_type == "BUY" and qty_f and qty_f > 0:
-                        try:
-                            basis_total = abs(amount)
-                            # Idempotency: PositionLot has no natural unique key, so do a best-effort match to
-                            # avoid duplicating lots when the same BUY appears across re-runs/imports.
-                            existing_lots = (
-                                session.query(PositionLot)
-                                .filter(
-                                    PositionLot.account_id == account_id,
-                                    PositionLot.ticker == ticker,
-                                    PositionLot.acquisition_date == tx_date,
-                                )
-                                .all()
-                            )
-                            lot_exists = False
-                            for l in existing_lots:
-                                try:
-                                    if abs(float(l.qty) - float(qty_f)) <= 1e-6 and abs(float(l.basis_total) - float(basis_total)) <= 0.01:
-                                        lot_exists = True
-                                        break
-                                except Exception:
-                                    continue
-                            if not lot_exists:
-                                with session.begin_nested():
-                                    session.add(
-                                        PositionLot(
-                                            account_id=account_id,
-                                            ticker=ticker,
-                                            acquisition_date=tx_date,
-                                            qty=qty_f,
-                                            basis_total=basis_total,
-                                            adjusted_basis_total=None,
-                                        )
-                                    )
-                                    session.flush()
-                        except Exception as e:
-                            warnings.append(f"Best-effort lot creation failed for BUY txn_id={tx.id}: {type(e).__name__}")
-                except Exception as e:
-                    coverage["parse_fail_count"] += 1
-                    # Include a small, redacted hint to aid debugging; never include secrets.
-                    warnings.append(
-                        f"Parse fail kind={record_kind} file={it.get('source_file') or ''} row={it.get('source_row') or ''} err={type(e).__name__}"
+                _drain_page_batch()
+            if store_payloads:
+                session.add(
+                    ExternalPayloadSnapshot(
+                        sync_run_id=run.id,
+                        kind="transactions_page",
+                        cursor=cursor,
+                        payload_json={"items": page_items, "next_cursor": next_cursor},
                     )
-                    continue
+                )
 
             cursor = next_cursor
             if not next_cursor:
@@ -2216,7 +2582,7 @@ def run_sync(
             #
             # Offline file connectors can legitimately produce empty pages (e.g., a holdings-only file in the
             # transactions iterator). Do not treat that as exhaustion when a next_cursor exists.
-            if len(items) == 0 and not is_offline_files:
+            if page_item_count == 0 and not is_offline_files:
                 exhausted = True
                 break
 
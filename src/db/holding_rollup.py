@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from src.db.models import ExternalHoldingPosition, ExternalHoldingSnapshot, ExternalHoldingValuation
+
+# Bump when the derivation below changes; init_db re-derives snapshots stamped with an older version.
+ROLLUP_VERSION = 1
+
+
+def _as_float(v: Any) -> float | None:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        try:
+            return float(v)
+        except Exception:
+            return None
+    s = str(v).strip()
+    if not s:
+        return None
+    neg = False
+    if s.startswith("(") and s.endswith(")"):
+        neg = True
+        s = s[1:-1]
+    s = s.replace("$", "").replace(",", "").replace("*", "").strip()
+    try:
+        out = float(s)
+    except Exception:
+        return None
+    return -out if neg else out
+
+
+def _add(prev: float | None, v: float | None) -> float | None:
+    if v is None:
+        return prev
+    return float(prev or 0.0) + float(v)
+
+
+def snapshot_rollup(payload: Any) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Derive normalized rows from a holdings snapshot payload.
+
+    Returns (positions, valuations):
+      - positions: one row per (provider_account_id, symbol, is_total), summed across duplicate items
+      - valuations: one row per provider_account_id with position/cash sums and the explicit TOTAL (if any),
+        using the same item rules as performance reporting
+    """
+    items = (payload or {}).get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        return [], []
+    positions: dict[tuple[str, str, bool], dict[str, Any]] = {}
+    valuations: dict[str, dict[str, Any]] = {}
+
+    def _valuation(provider_acct: str) -> dict[str, Any]:
+        rec = valuations.get(provider_acct)
+        if rec is None:
+            rec = {
+                "provider_account_id": provider_acct,
+                "ordinal": len(valuations),
+                "positions_value": 0.0,
+                "position_rows": 0,
+                "cash_value": 0.0,
+                "cash_rows": 0,
+                "total_value": None,
+                "total_ordinal": None,
+            }
+            valuations[provider_acct] = rec
+        return rec
+
+    for idx, it in enumerate(items):
+        if not isinstance(it, dict):
+            continue
+        provider_acct = str(it.get("provider_account_id") or "").strip()
+        sym = str(it.get("symbol") or it.get("ticker") or "").strip().upper()
+        is_total = bool(it.get("is_total"))
+
+        if sym:
+            key = (provider_acct, sym, is_total)
+            row = positions.get(key)
+            if row is None:
+                row = {
+                    "provider_account_id": provider_acct,
+                    "symbol": sym,
+                    "is_total": is_total,
+                    "is_cash": sym.startswith("CASH:"),
+                    "qty": None,
+                    "market_value": None,
+                    "cost_basis_total": None,
+                }
+                positions[key] = row
+            row["qty"] = _add(row["qty"], _as_float(it.get("qty")))
+            row["market_value"] = _add(row["market_value"], _as_float(it.get("market_value") or it.get("value")))
+            row["cost_basis_total"] = _add(
+                row["cost_basis_total"], _as_float(it.get("cost_basis_total") or it.get("cost_basis"))
+            )
+
+        mv = _as_float(it.get("market_value") or it.get("value") or it.get("qty") or 0.0) or 0.0
+        if is_total and mv and mv > 0:
+            rec = _valuation(provider_acct)
+            rec["total_value"] = float(mv)
+            rec["total_ordinal"] = idx
+            continue
+        if sym.startswith("CASH:"):
+            rec = _valuation(provider_acct)
+            rec["cash_value"] = float(rec["cash_value"]) + float(mv)
+            rec["cash_rows"] = int(rec["cash_rows"]) + 1
+        elif sym:
+            rec = _valuation(provider_acct)
+            rec["positions_value"] = float(rec["positions_value"]) + float(mv)
+            rec["position_rows"] = int(rec["position_rows"]) + 1
+    return list(positions.values()), list(valuations.values())
+
+
+def _sync_rows(existing: list[Any], wanted: list[dict[str, Any]], *, key_fields: tuple[str, ...], factory: type) -> list[Any]:
+    # Update rows in place by key so a re-import never inserts a duplicate key ahead of the orphan delete.
+    by_key = {tuple(getattr(r, f) for f in key_fields): r for r in existing}
+    out: list[Any] = []
+    for values in wanted:
+        row = by_key.pop(tuple(values[f] for f in key_fields), None)
+        if row is None:
+            row = factory(**values)
+        else:
+            for k, v in values.items():
+                setattr(row, k, v)
+        out.append(row)
+    return out
+
+
+def apply_snapshot_rollup(snap: ExternalHoldingSnapshot, payload: Any) -> None:
+    positions, valuations = snapshot_rollup(payload)
+    snap.positions = _sync_rows(
+        list(snap.positions or []),
+        positions,
+        key_fields=("provider_account_id", "symbol", "is_total"),
+        factory=ExternalHoldingPosition,
+    )
+    snap.valuations = _sync_rows(
+        list(snap.valuations or []),
+        valuations,
+        key_fields=("provider_account_id",),
+        factory=ExternalHoldingValuation,
+    )
+    snap.rollup_version = ROLLUP_VERSION
+
+
+def backfill_holding_rollups(session: Session, *, batch_size: int = 200) -> int:
+    """
+    Derive position/valuation rows for snapshots written before the rollup existed (or by an older version).
+    """
+    done = 0
+    while True:
+        snaps = (
+            session.query(ExternalHoldingSnapshot)
+            .filter(
+                or_(
+                    ExternalHoldingSnapshot.rollup_version.is_(None),
+                    ExternalHoldingSnapshot.rollup_version < ROLLUP_VERSION,
+                )
+            )
+            .order_by(ExternalHoldingSnapshot.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not snaps:
+            return done
+        for snap in snaps:
+            apply_snapshot_rollup(snap, snap.payload_json)
+        session.commit()
+        done += len(snaps)
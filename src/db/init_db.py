@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime as dt
 
+from src.db.holding_rollup import backfill_holding_rollups
 from src.db.models import Base
 from src.db.session import get_engine
 from src.db.session import get_session
@@ -15,6 +16,9 @@ def init_db() -> None:
     ensure_sqlite_schema(engine)
     # Post-create bootstrapping (keeps read-only pages from needing to write).
     with get_session() as session:
+        # Normalized holdings rows for snapshots imported before the rollup tables existed.
+        backfill_holding_rollups(session)
+
         existing = session.query(TaxAssumptionsSet).filter(TaxAssumptionsSet.name == "Default").one_or_none()
         if existing is None:
             session.add(
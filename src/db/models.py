@@ -18,7 +18,7 @@ try:
         Text,
         UniqueConstraint,
     )
-    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+    from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
 except Exception as e:  # pragma: no cover
     raise RuntimeError(
         "Failed to import SQLAlchemy.\n\n"
@@ -840,13 +840,83 @@ class ExternalPayloadSnapshot(Base):
 
 class ExternalHoldingSnapshot(Base):
     __tablename__ = "external_holding_snapshots"
+    __table_args__ = (Index("ix_external_holding_snapshots_conn_asof", "connection_id", "as_of"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     connection_id: Mapped[int] = mapped_column(ForeignKey("external_connections.id"), nullable=False)
     as_of: Mapped[dt.datetime] = mapped_column(UTCDateTime(), nullable=False)
     payload_json: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    # Version of the normalized position/valuation rows derived from payload_json (NULL = not built yet).
+    rollup_version: Mapped[Optional[int]] = mapped_column(Integer)
     created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime(), default=now_utc, nullable=False)
 
+    positions: Mapped[list["ExternalHoldingPosition"]] = relationship(
+        back_populates="snapshot", cascade="all, delete-orphan", passive_deletes=True
+    )
+    valuations: Mapped[list["ExternalHoldingValuation"]] = relationship(
+        back_populates="snapshot", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    @validates("payload_json")
+    def _rebuild_rollup(self, _key: str, payload: dict[str, Any]) -> dict[str, Any]:
+        # Keep the normalized child rows in step with every payload write (ingestion, re-import, tests).
+        from src.db.holding_rollup import apply_snapshot_rollup
+
+        apply_snapshot_rollup(self, payload)
+        return payload
+
+
+class ExternalHoldingPosition(Base):
+    """
+    One (provider account, symbol) row of a holdings snapshot payload, aggregated across duplicate items.
+    """
+
+    __tablename__ = "external_holding_positions"
+    __table_args__ = (
+        UniqueConstraint("snapshot_id", "provider_account_id", "symbol", "is_total", name="uq_external_holding_position"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    snapshot_id: Mapped[int] = mapped_column(
+        ForeignKey("external_holding_snapshots.id", ondelete="CASCADE"), nullable=False
+    )
+    provider_account_id: Mapped[str] = mapped_column(String(200), nullable=False, default="")
+    symbol: Mapped[str] = mapped_column(String(64), nullable=False)
+    is_total: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    is_cash: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    qty: Mapped[Optional[float]] = mapped_column(Float)
+    market_value: Mapped[Optional[float]] = mapped_column(Float)
+    cost_basis_total: Mapped[Optional[float]] = mapped_column(Float)
+
+    snapshot: Mapped["ExternalHoldingSnapshot"] = relationship(back_populates="positions")
+
+
+class ExternalHoldingValuation(Base):
+    """
+    Per-(snapshot, provider account) valuation rollup used by performance reporting.
+
+    `ordinal` is the account's first-appearance order in the payload; `total_ordinal` is the item index of the
+    explicit TOTAL row that supplied `total_value` (later rows win).
+    """
+
+    __tablename__ = "external_holding_valuations"
+    __table_args__ = (UniqueConstraint("snapshot_id", "provider_account_id", name="uq_external_holding_valuation"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    snapshot_id: Mapped[int] = mapped_column(
+        ForeignKey("external_holding_snapshots.id", ondelete="CASCADE"), nullable=False
+    )
+    provider_account_id: Mapped[str] = mapped_column(String(200), nullable=False, default="")
+    ordinal: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    positions_value: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    position_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    cash_value: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
+    cash_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_value: Mapped[Optional[float]] = mapped_column(Float)
+    total_ordinal: Mapped[Optional[int]] = mapped_column(Integer)
+
+    snapshot: Mapped["ExternalHoldingSnapshot"] = relationship(back_populates="valuations")
+
 
 class ExternalLiabilitySnapshot(Base):
     __tablename__ = "external_liability_snapshots"
@@ -73,6 +73,21 @@ def ensure_sqlite_schema(engine: Engine) -> None:
         if "last_error_json" not in cols:
             _add_column(engine, "external_connections", "last_error_json TEXT")
 
+    if "external_holding_snapshots" in existing_tables:
+        cols = _table_columns(engine, "external_holding_snapshots")
+        if "rollup_version" not in cols:
+            _add_column(engine, "external_holding_snapshots", "rollup_version INTEGER")
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS ix_external_holding_snapshots_conn_asof "
+                        "ON external_holding_snapshots(connection_id, as_of)"
+                    )
+                )
+        except Exception:
+            pass
+
     if "sync_runs" in existing_tables:
         cols = _table_columns(engine, "sync_runs")
         for name, ddl in [
@@ -4,7 +4,7 @@ import datetime as dt
 import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 class ProviderError(Exception):
@@ -27,7 +27,7 @@ class BrokerAdapter(ABC):
         start_date: dt.date,
         end_date: dt.date,
         cursor: str | None = None,
-    ) -> tuple[list[dict[str, Any]], str | None]:
+    ) -> tuple[Iterable[dict[str, Any]], str | None]:
         raise NotImplementedError
 
     @abstractmethod
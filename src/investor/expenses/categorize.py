@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import re
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -53,6 +55,188 @@ class CompiledRules:
     income_keywords: list[str]
     rules: list[CompiledRule]
 
+    @cached_property
+    def matcher(self) -> "RuleMatcher":
+        return RuleMatcher(self)
+
+
+def _keyword_pattern(keywords: list[str]) -> Optional[re.Pattern[str]]:
+    # One alternation instead of `any(k in s for k in keywords)`; same truth value for lowercase input.
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(k) for k in sorted(set(keywords))))
+
+
+_BOUNDED_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+_ESCAPE_ARG_LENGTH = {"x": 2, "u": 4, "U": 8}
+
+
+def _required_literal(pattern: re.Pattern[str]) -> Optional[str]:
+    """
+    Longest run of ASCII literal characters every match of `pattern` must contain (lowercased), or None.
+
+    Scans the pattern source: only literals outside groups and character classes count, a character followed by
+    `?`, `*` or `{m,n}` is dropped, and a top-level alternation (or verbose mode) gives up. The run is therefore a
+    necessary condition for a match; on ASCII text a substring check against the lowercased text is then an exact,
+    much cheaper prefilter than the regex itself.
+    """
+    src = pattern.pattern
+    if pattern.flags & re.VERBOSE or "(?#" in src:
+        return None
+    runs: list[str] = []
+    run: list[str] = []
+    depth = 0
+    i, n = 0, len(src)
+    while i < n:
+        ch = src[i]
+        literal: Optional[str] = None
+        if ch == "\\":
+            nxt = src[i + 1 : i + 2]
+            i += 2
+            if nxt and nxt.isascii() and not nxt.isalnum():
+                literal = nxt
+            elif nxt == "N":
+                i = src.find("}", i) + 1 or n
+            elif nxt.isdigit():
+                while i < n and src[i].isdigit():
+                    i += 1
+            else:
+                i += _ESCAPE_ARG_LENGTH.get(nxt, 0)
+        elif ch == "[":
+            i += 1
+            if src[i : i + 1] == "^":
+                i += 1
+            if src[i : i + 1] == "]":
+                i += 1
+            while i < n and src[i] != "]":
+                i += 2 if src[i] == "\\" else 1
+            i += 1
+        elif ch in "()":
+            depth += 1 if ch == "(" else -1
+            i += 1
+        elif ch == "|":
+            if depth == 0:
+                return None
+            i += 1
+        elif ch in "*+?" or (ch == "{" and _BOUNDED_QUANTIFIER.match(src, i)):
+            if ch != "+" and run:
+                run.pop()
+            i = _BOUNDED_QUANTIFIER.match(src, i).end() if ch == "{" else i + 1  # type: ignore[union-attr]
+        elif ch in ".^$" or not ch.isascii():
+            i += 1
+        else:
+            literal = ch
+            i += 1
+        if literal is not None and depth == 0:
+            run.append(literal)
+        else:
+            runs.append("".join(run))
+            run = []
+    runs.append("".join(run))
+    return max(runs, key=len).lower() or None
+
+
+class RuleMatcher:
+    """
+    Indexed form of `CompiledRules` for bulk categorization.
+
+    Rules stay in priority order; the index only narrows which ones are evaluated:
+      - merchant_exact rules are bucketed by lowercased merchant, and merchant_regex / category_hint_exact are
+        resolved once per distinct (merchant_norm, hint), leaving only description regexes per transaction
+      - each description regex is gated by a required literal substring (`_required_literal`)
+      - transfer/income keywords are single compiled alternations
+    Results are memoized by (merchant_norm, description_norm, sign(amount), category_hint), which are the only
+    inputs `categorize_one` depends on.
+    """
+
+    MEMO_MAX = 200_000
+
+    def __init__(self, rules: CompiledRules):
+        self.compiled = rules
+        self.rules = list(rules.rules)
+        self.transfer_re = _keyword_pattern(rules.transfer_keywords)
+        self.income_re = _keyword_pattern(rules.income_keywords)
+        self.categories_by_lower: dict[str, str] = {}
+        for c in rules.categories:
+            if c:
+                self.categories_by_lower.setdefault(c.lower(), c)
+        self._by_merchant: dict[str, list[int]] = {}
+        self._open: list[int] = []
+        self._hint_exact: list[Optional[str]] = []
+        for i, r in enumerate(self.rules):
+            if r.merchant_exact:
+                self._by_merchant.setdefault(r.merchant_exact.strip().lower(), []).append(i)
+            else:
+                self._open.append(i)
+            self._hint_exact.append(r.category_hint_exact.strip().lower() if r.category_hint_exact else None)
+        self._description_literal = [
+            _required_literal(r.description_regex) if r.description_regex else None for r in self.rules
+        ]
+        self._merchant_candidates: dict[str, tuple[int, ...]] = {}
+        self._candidates: dict[tuple[str, str], tuple[int, ...]] = {}
+        self._memo: dict[tuple[str, str, int, Optional[str]], tuple[str, Optional[str]]] = {}
+
+    def _candidates_for(self, merchant_norm: str, hint: str) -> tuple[int, ...]:
+        hit = self._candidates.get((merchant_norm, hint))
+        if hit is not None:
+            return hit
+        by_merchant = self._merchant_candidates.get(merchant_norm)
+        if by_merchant is None:
+            bucket = self._by_merchant.get(merchant_norm.strip().lower(), [])
+            by_merchant = tuple(
+                i
+                for i in heapq.merge(bucket, self._open)
+                if not (self.rules[i].merchant_regex and not self.rules[i].merchant_regex.search(merchant_norm))
+            )
+            self._merchant_candidates[merchant_norm] = by_merchant
+        hit = tuple(i for i in by_merchant if self._hint_exact[i] is None or self._hint_exact[i] == hint)
+        self._candidates[(merchant_norm, hint)] = hit
+        return hit
+
+    def match_rule(self, *, merchant_norm: str, description_norm: str, category_hint: Optional[str]) -> Optional[CompiledRule]:
+        """
+        First rule in priority order whose conditions all hold (same result as scanning `rules` linearly).
+        """
+        folded: Optional[str] = None
+        for i in self._candidates_for(merchant_norm, (category_hint or "").strip().lower()):
+            r = self.rules[i]
+            if r.description_regex:
+                literal = self._description_literal[i]
+                if literal is not None:
+                    if folded is None:
+                        # IGNORECASE equals lower() only for ASCII; other text always goes to the regex.
+                        folded = description_norm.lower() if description_norm.isascii() else ""
+                    if folded and literal not in folded:
+                        continue
+                if not r.description_regex.search(description_norm):
+                    continue
+            return r
+        return None
+
+    def categorize(
+        self,
+        *,
+        merchant_norm: str,
+        description_norm: str,
+        amount: float,
+        category_hint: Optional[str],
+    ) -> tuple[str, Optional[str]]:
+        key = (merchant_norm, description_norm, (amount > 0) - (amount < 0), category_hint)
+        out = self._memo.get(key)
+        if out is None:
+            out = _categorize_uncached(
+                merchant_norm=merchant_norm,
+                description_norm=description_norm,
+                amount=amount,
+                category_hint=category_hint,
+                rules=self.compiled,
+                matcher=self,
+            )
+            if len(self._memo) >= self.MEMO_MAX:
+                self._memo.clear()
+            self._memo[key] = out
+        return out
+
 
 def _compile_rule(r: CategoryRule) -> CompiledRule:
     return CompiledRule(
@@ -135,7 +319,8 @@ def compile_rules(
     )
 
 
-def _keyword_category(desc: str, *, rules: CompiledRules, amount: float) -> Optional[str]:
+def _keyword_category(desc: str, *, rules: CompiledRules, amount: float, matcher: Optional[RuleMatcher] = None) -> Optional[str]:
+    matcher = matcher or rules.matcher
     s = (desc or "").lower()
     if amount < 0 and "monthly installment" in s:
         return "Apple Installment Payment"
@@ -159,9 +344,9 @@ def _keyword_category(desc: str, *, rules: CompiledRules, amount: float) -> Opti
         cc_markers = ["credit card", "card payment", "cc payment", "amex", "american express", "visa", "mastercard", "discover"]
         if any(m in s for m in cc_markers):
             return "Payments"
-    if any(k in s for k in rules.transfer_keywords):
+    if matcher.transfer_re is not None and matcher.transfer_re.search(s):
         return "Transfers"
-    if amount > 0 and any(k in s for k in rules.income_keywords):
+    if amount > 0 and matcher.income_re is not None and matcher.income_re.search(s):
         return "Income"
     return None
 
@@ -174,25 +359,35 @@ def categorize_one(
     category_hint: Optional[str],
     rules: CompiledRules,
 ) -> tuple[str, Optional[str]]:
-    kw = _keyword_category(description_norm, rules=rules, amount=amount)
+    return rules.matcher.categorize(
+        merchant_norm=merchant_norm,
+        description_norm=description_norm,
+        amount=amount,
+        category_hint=category_hint,
+    )
+
+
+def _categorize_uncached(
+    *,
+    merchant_norm: str,
+    description_norm: str,
+    amount: float,
+    category_hint: Optional[str],
+    rules: CompiledRules,
+    matcher: RuleMatcher,
+) -> tuple[str, Optional[str]]:
+    kw = _keyword_category(description_norm, rules=rules, amount=amount, matcher=matcher)
     if kw:
         return kw, "keyword"
-    for r in rules.rules:
-        if r.merchant_exact and merchant_norm.strip().lower() != r.merchant_exact.strip().lower():
-            continue
-        if r.merchant_regex and not r.merchant_regex.search(merchant_norm):
-            continue
-        if r.description_regex and not r.description_regex.search(description_norm):
-            continue
-        if r.category_hint_exact and (category_hint or "").strip().lower() != r.category_hint_exact.strip().lower():
-            continue
+    r = matcher.match_rule(merchant_norm=merchant_norm, description_norm=description_norm, category_hint=category_hint)
+    if r is not None:
         return r.category, r.name
     if category_hint:
         h = category_hint.lower()
         # If hint matches a known category name, trust it (deterministic).
-        for c in rules.categories:
-            if c and h.strip() == c.lower():
-                return c, "hint"
+        c = matcher.categories_by_lower.get(h.strip())
+        if c:
+            return c, "hint"
         if "payment" in h:
             return "Payments", "hint"
         if "credit" in h or "refund" in h or "return" in h:
@@ -226,6 +421,10 @@ def categorize_one(
     return "Unknown", None
 
 
+# Ids per UPDATE ... WHERE id IN (...) statement; stays under SQLite's bound-parameter limit.
+_UPDATE_CHUNK = 900
+
+
 def apply_rules_to_db(
     *,
     session: Session,
@@ -236,22 +435,42 @@ def apply_rules_to_db(
     rules = compile_rules(session=session, rules_path=rules_path, defaults=config)
     updated = 0
     skipped_user = 0
-    q = session.query(ExpenseTransaction).order_by(ExpenseTransaction.posted_date.asc(), ExpenseTransaction.id.asc())
-    for t in q:
-        if t.category_user:
+    # Read just the inputs and write back only changed categories, one UPDATE per category; loading full ORM rows
+    # dominated rebuilds of large tables. Flush first so pending in-session edits are what gets read.
+    session.flush()
+    q = session.query(
+        ExpenseTransaction.id,
+        ExpenseTransaction.category_user,
+        ExpenseTransaction.category_system,
+        ExpenseTransaction.merchant_norm,
+        ExpenseTransaction.description_norm,
+        ExpenseTransaction.amount,
+        ExpenseTransaction.category_hint,
+    ).order_by(ExpenseTransaction.posted_date.asc(), ExpenseTransaction.id.asc())
+    changed_ids: dict[str, list[int]] = {}
+    for row_id, category_user, category_system, merchant_norm, description_norm, amount, category_hint in q.all():
+        if category_user:
             skipped_user += 1
             continue
-        if (t.category_system or "").strip() and not rebuild:
+        if (category_system or "").strip() and not rebuild:
             continue
         category, _rule = categorize_one(
-            merchant_norm=t.merchant_norm or "Unknown",
-            description_norm=t.description_norm or "",
-            amount=float(t.amount),
-            category_hint=t.category_hint,
+            merchant_norm=merchant_norm or "Unknown",
+            description_norm=description_norm or "",
+            amount=float(amount),
+            category_hint=category_hint,
             rules=rules,
         )
-        t.category_system = category
+        if category != category_system:
+            changed_ids.setdefault(category, []).append(int(row_id))
         updated += 1
+    for category, ids in changed_ids.items():
+        for start in range(0, len(ids), _UPDATE_CHUNK):
+            (
+                session.query(ExpenseTransaction)
+                .filter(ExpenseTransaction.id.in_(ids[start : start + _UPDATE_CHUNK]))
+                .update({ExpenseTransaction.category_system: category}, synchronize_session=False)
+            )
     session.commit()
     return updated, skipped_user
 
@@ -8,7 +8,7 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Float, select, type_coerce
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -140,6 +140,37 @@ def _backfill_duplicate_fields(
     return changed
 
 
+_DEDUPE_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_DEDUPE_DIGITS_RE = re.compile(r"\d+")
+# Candidates checked per row; matches the LIMIT of the per-row query.
+_FUZZY_MAX_CANDIDATES = 50
+
+
+def _dedupe_sig(s: str) -> str:
+    # Normalize for dedupe matching across minor importer/normalization changes.
+    # Keep only letters/numbers to ignore punctuation like apostrophes/dashes.
+    x = (s or "").strip().lower()
+    x = _DEDUPE_NON_ALNUM_RE.sub("", x)
+    # Drop digits to be resilient to store IDs and order suffixes.
+    x = _DEDUPE_DIGITS_RE.sub("", x)
+    return x[:120]
+
+
+def _dedupe_sigs_match(m0: str, d0: str, m1: str, d1: str) -> bool:
+    if not m1 and not d1:
+        return False
+    if m0 and m1 and m0 == m1:
+        return True
+    if d0 and d1 and d0 == d1:
+        return True
+    # Containment fallback helps when one normalization is "shorter".
+    if m0 and m1 and (m0 in m1 or m1 in m0):
+        return True
+    if d0 and d1 and (d0 in d1 or d1 in d0):
+        return True
+    return False
+
+
 def _fuzzy_duplicate_exists(
     session: Session,
     *,
@@ -149,6 +180,10 @@ def _fuzzy_duplicate_exists(
     merchant_norm: str,
     description_norm: str,
 ) -> bool:
+    """
+    Per-row fuzzy duplicate check (one query per call). Imports use `_FuzzyDedupeIndex`; this stays as the
+    reference implementation.
+    """
     start = posted_date - dt.timedelta(days=1)
     end = posted_date + dt.timedelta(days=1)
     amt = float(money_2dp(amount_2dp))
@@ -165,38 +200,73 @@ def _fuzzy_duplicate_exists(
             ExpenseTransaction.posted_date <= end,
             ExpenseTransaction.amount.in_([amt, alt]),
         )
-        .limit(50)
+        .limit(_FUZZY_MAX_CANDIDATES)
         .all()
     )
 
-    def _sig(s: str) -> str:
-        # Normalize for dedupe matching across minor importer/normalization changes.
-        # Keep only letters/numbers to ignore punctuation like apostrophes/dashes.
-        x = (s or "").strip().lower()
-        x = re.sub(r"[^a-z0-9]+", "", x)
-        # Drop digits to be resilient to store IDs and order suffixes.
-        x = re.sub(r"\d+", "", x)
-        return x[:120]
-
-    m0 = _sig(merchant_norm)
-    d0 = _sig(description_norm)
+    m0 = _dedupe_sig(merchant_norm)
+    d0 = _dedupe_sig(description_norm)
     for m1_raw, d1_raw, _amt1 in candidates:
-        m1 = _sig(str(m1_raw or ""))
-        d1 = _sig(str(d1_raw or ""))
-        if not m1 and not d1:
-            continue
-        if m0 and m1 and m0 == m1:
-            return True
-        if d0 and d1 and d0 == d1:
-            return True
-        # Containment fallback helps when one normalization is "shorter".
-        if m0 and m1 and (m0 in m1 or m1 in m0):
-            return True
-        if d0 and d1 and (d0 in d1 or d1 in d0):
+        if _dedupe_sigs_match(m0, d0, _dedupe_sig(str(m1_raw or "")), _dedupe_sig(str(d1_raw or ""))):
             return True
     return False
 
 
+class _FuzzyDedupeIndex:
+    """
+    In-memory equivalent of `_fuzzy_duplicate_exists` for one account over one import file.
+
+    The account's rows in the file's date range (±1 day) are loaded with a single query and bucketed by
+    (posted_date, |amount|) with pre-computed signatures, so each check is at most three dict lookups. Rows the
+    import inserts are `add`ed as it goes, so later rows of the same file see them like the per-row query would.
+    """
+
+    def __init__(self, session: Session, *, expense_account_id: int, dates: list[dt.date]):
+        self._buckets: dict[tuple[dt.date, float], list[tuple[str, str]]] = {}
+        if not dates:
+            return
+        rows = (
+            session.query(
+                ExpenseTransaction.posted_date,
+                # Raw stored value: the per-row query compares it exactly, not at the column's 2dp scale.
+                type_coerce(ExpenseTransaction.amount, Float),
+                ExpenseTransaction.merchant_norm,
+                ExpenseTransaction.description_norm,
+            )
+            .filter(
+                ExpenseTransaction.expense_account_id == expense_account_id,
+                ExpenseTransaction.posted_date >= min(dates) - dt.timedelta(days=1),
+                ExpenseTransaction.posted_date <= max(dates) + dt.timedelta(days=1),
+            )
+            .order_by(ExpenseTransaction.posted_date.asc(), ExpenseTransaction.id.asc())
+            .all()
+        )
+        for posted_date, amount, merchant_norm, description_norm in rows:
+            self.add(posted_date=posted_date, amount=amount, merchant_norm=merchant_norm, description_norm=description_norm)
+
+    def add(self, *, posted_date: dt.date, amount: Any, merchant_norm: Optional[str], description_norm: Optional[str]) -> None:
+        if amount is None:
+            return
+        key = (posted_date, abs(float(amount)))
+        self._buckets.setdefault(key, []).append(
+            (_dedupe_sig(str(merchant_norm or "")), _dedupe_sig(str(description_norm or "")))
+        )
+
+    def exists(self, *, posted_date: dt.date, amount_2dp: Decimal, merchant_norm: str, description_norm: str) -> bool:
+        amt = abs(float(money_2dp(amount_2dp)))
+        m0 = _dedupe_sig(merchant_norm)
+        d0 = _dedupe_sig(description_norm)
+        seen = 0
+        for offset in (-1, 0, 1):
+            for m1, d1 in self._buckets.get((posted_date + dt.timedelta(days=offset), amt), ()):
+                if seen >= _FUZZY_MAX_CANDIDATES:
+                    return False
+                seen += 1
+                if _dedupe_sigs_match(m0, d0, m1, d1):
+                    return True
+        return False
+
+
 def import_csv_statement(
     *,
     session: Session,
@@ -340,6 +410,11 @@ def import_csv_statement_text(
         )
 
     existing = _existing_txn_ids(session, [c["txn_id"] for c in canonical])
+    fuzzy_index = (
+        _FuzzyDedupeIndex(session, expense_account_id=acct.id, dates=[c["posted_date"] for c in canonical])
+        if options.fuzzy_dedupe
+        else None
+    )
     inserted = 0
     dupes = 0
     fuzzy_dupes = 0
@@ -356,9 +431,7 @@ def import_csv_statement_text(
             ):
                 backfilled += 1
             continue
-        if options.fuzzy_dedupe and _fuzzy_duplicate_exists(
-            session,
-            expense_account_id=acct.id,
+        if fuzzy_index is not None and fuzzy_index.exists(
             posted_date=c["posted_date"],
             amount_2dp=c["amount"],
             merchant_norm=c["merchant_norm"],
@@ -401,6 +474,13 @@ def import_csv_statement_text(
         except IntegrityError:
             dupes += 1
             continue
+        if fuzzy_index is not None:
+            fuzzy_index.add(
+                posted_date=tx.posted_date,
+                amount=tx.amount,
+                merchant_norm=tx.merchant_norm,
+                description_norm=tx.description_norm,
+            )
 
     batch.row_count = len(raw_txns)
     batch.duplicates_skipped = dupes + fuzzy_dupes
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import pandas as pd
+
 from .data import download_market_frame
 from .digest import generate_weekly_digest
-from .hmm_engine import fit_regime_model
+from .hmm_engine import HMMModelCache, bounded_completions, fit_regime_model_cached, get_fit_executor
 from .investor_adapter import get_tax_assumptions, get_wash_sale_risk, positions_by_ticker_and_account
 from .persistence import get_alerts, get_recent_regime_changes, get_signal_effectiveness, save_alert, save_regime_event
 from .signals import (
@@ -19,6 +25,8 @@ from .signals import (
     tax_adjusted_signals,
 )
 
+DEFAULT_ALERT_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
 
 @dataclass(frozen=True)
 class RegimeAlert:
@@ -60,50 +68,129 @@ def _now_text() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def check_regime_changes(tickers: list[str], db_path: str) -> list[RegimeAlert]:
+@dataclass(frozen=True)
+class TickerAnalysis:
+    """One download + one fit per ticker, shared by every alert check in a run."""
+
+    ticker: str
+    regime: Any
+    technicals: pd.DataFrame
+    composite: Any
+    price_targets: Any
+    timings: dict[str, float]
+
+
+def analyze_ticker(ticker: str) -> TickerAnalysis:
+    market_frame, load_seconds = _download_ticker_frame(ticker)
+    return analyze_frame(ticker, market_frame, load_seconds=load_seconds)
+
+
+def _download_ticker_frame(ticker: str) -> tuple[pd.DataFrame, float]:
+    started = time.perf_counter()
+    market_frame = download_market_frame(ticker=ticker, period="3y", interval="1d").frame
+    return market_frame, time.perf_counter() - started
+
+
+def analyze_frame(ticker: str, market_frame: pd.DataFrame, load_seconds: float = 0.0) -> TickerAnalysis:
+    """The CPU-bound half of `analyze_ticker`: fit and signals over an already downloaded frame."""
+    loaded = time.perf_counter()
+    regime = fit_regime_model_cached(ticker=ticker, market_frame=market_frame, refit_step=21, model_cache=HMMModelCache())
+    fitted = time.perf_counter()
+    technicals = compute_technicals(
+        market_frame["price"],
+        market_frame["volume"],
+        market_frame["high"] if "high" in market_frame.columns else None,
+        market_frame["low"] if "low" in market_frame.columns else None,
+    )
+    forward_curve = forward_regime_curve(regime.transition_matrix, regime.latest_state_vector, horizon=21)
+    forward_signal = signal_from_forward_curve(
+        forward_curve,
+        regime.latest_label,
+        regime.transition_risk,
+        regime.expected_regime_duration,
+        regime.latest_probability,
+    )
+    technical_signal = intra_regime_signal(technicals, regime.latest_label)
+    composite = build_composite_signal(regime.latest_label, regime.latest_probability, forward_signal, technical_signal)
+    price_targets = compute_price_targets(
+        current_price=float(getattr(regime, "latest_price", 0.0) or 0.0),
+        technicals_df=technicals,
+        composite_signal=composite,
+        expected_duration=float(regime.expected_regime_duration),
+        state_mean_return=float(getattr(regime, "recent_state_mean_return", 0.0) or 0.0),
+    )
+    return TickerAnalysis(
+        ticker=ticker.upper(),
+        regime=regime,
+        technicals=technicals,
+        composite=composite,
+        price_targets=price_targets,
+        timings={
+            "load_seconds": float(load_seconds),
+            "fit_seconds": fitted - loaded,
+            "signal_seconds": time.perf_counter() - fitted,
+        },
+    )
+
+
+def _ticker_key(ticker: Any) -> str:
+    return str(ticker or "").strip().upper()
+
+
+def analyze_tickers(tickers: list[str], *, max_workers: int | None = None) -> dict[str, TickerAnalysis]:
+    """Analyze each distinct ticker once; blank tickers are dropped.
+
+    ``max_workers=1`` keeps the work in-process.  Otherwise up to ``max_workers`` downloads run on
+    threads and, as frames arrive, at most ``max_workers`` fits are in flight on the process-wide
+    pool from ``get_fit_executor``, so network I/O never occupies a fit worker.
+    """
+
+    unique = list(dict.fromkeys(key for key in (_ticker_key(ticker) for ticker in tickers) if key))
+    workers = max(1, min(int(max_workers or DEFAULT_ALERT_WORKERS), len(unique) or 1))
+    if workers == 1:
+        return {ticker: analyze_ticker(ticker) for ticker in unique}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alert-download") as downloads:
+        frames = downloads.map(_download_ticker_frame, unique)
+        calls = ((ticker, frame, load_seconds) for ticker, (frame, load_seconds) in zip(unique, frames))
+        analyses = {
+            unique[position]: future.result()
+            for position, future in bounded_completions(get_fit_executor(), analyze_frame, calls, limit=workers)
+        }
+    return {ticker: analyses[ticker] for ticker in unique}
+
+
+def _analyses_for(tickers: list[str], analyses: Mapping[str, TickerAnalysis] | None) -> list[TickerAnalysis]:
+    if analyses is None:
+        analyses = analyze_tickers(tickers, max_workers=1)
+    return [analyses[key] for key in (_ticker_key(ticker) for ticker in tickers) if key]
+
+
+def check_regime_changes(
+    tickers: list[str],
+    db_path: str,
+    *,
+    analyses: Mapping[str, TickerAnalysis] | None = None,
+) -> list[RegimeAlert]:
     positions = positions_by_ticker_and_account([])
     tax_assumptions = get_tax_assumptions(db_path)
     alerts: list[RegimeAlert] = []
-    for ticker in tickers:
-        market_frame = download_market_frame(ticker=ticker, period="3y", interval="1d").frame
-        regime = fit_regime_model(ticker=ticker, market_frame=market_frame, refit_step=21)
-        persistence = save_regime_event(ticker, regime.latest_label, int(regime.latest_state_id))
+    for analysis in _analyses_for(tickers, analyses):
+        regime = analysis.regime
+        persistence = save_regime_event(analysis.ticker, regime.latest_label, int(regime.latest_state_id))
         if persistence.get("previous_label") == regime.latest_label:
             continue
-        forward_curve = forward_regime_curve(regime.transition_matrix, regime.latest_state_vector, horizon=21)
-        technicals = compute_technicals(
-            market_frame["price"],
-            market_frame["volume"],
-            market_frame["high"] if "high" in market_frame.columns else None,
-            market_frame["low"] if "low" in market_frame.columns else None,
-        )
-        forward_signal = signal_from_forward_curve(
-            forward_curve,
-            regime.latest_label,
-            regime.transition_risk,
-            regime.expected_regime_duration,
-            regime.latest_probability,
-        )
-        technical_signal = intra_regime_signal(technicals, regime.latest_label)
-        composite = build_composite_signal(regime.latest_label, regime.latest_probability, forward_signal, technical_signal)
-        price_targets = compute_price_targets(
-            current_price=float(getattr(regime, "latest_price", 0.0) or 0.0),
-            technicals_df=technicals,
-            composite_signal=composite,
-            expected_duration=float(regime.expected_regime_duration),
-            state_mean_return=float(getattr(regime, "recent_state_mean_return", 0.0) or 0.0),
-        )
-        account_positions = positions.get(ticker.upper(), [])
+        account_positions = positions.get(analysis.ticker, [])
         signals = tax_adjusted_signals(
-            composite,
+            analysis.composite,
             account_positions,
             tax_assumptions,
-            wash_sale_risk=get_wash_sale_risk(db_path, ticker),
+            wash_sale_risk=get_wash_sale_risk(db_path, analysis.ticker),
         ) if account_positions else []
-        composite_action = signals[0].adjusted_action if signals else composite.composite_action
+        composite_action = signals[0].adjusted_action if signals else analysis.composite.composite_action
+        price_targets = analysis.price_targets
         alerts.append(
             RegimeAlert(
-                ticker=ticker.upper(),
+                ticker=analysis.ticker,
                 previous_label=persistence.get("previous_label"),
                 new_label=str(regime.latest_label),
                 transition_risk=float(regime.transition_risk),
@@ -115,17 +202,21 @@ def check_regime_changes(tickers: list[str], db_path: str) -> list[RegimeAlert]:
     return alerts
 
 
-def check_transition_risk_spikes(tickers: list[str], threshold: float = 0.20) -> list[RiskAlert]:
+def check_transition_risk_spikes(
+    tickers: list[str],
+    threshold: float = 0.20,
+    *,
+    analyses: Mapping[str, TickerAnalysis] | None = None,
+) -> list[RiskAlert]:
     alerts: list[RiskAlert] = []
-    for ticker in tickers:
-        market_frame = download_market_frame(ticker=ticker, period="3y", interval="1d").frame
-        regime = fit_regime_model(ticker=ticker, market_frame=market_frame, refit_step=21)
-        if float(regime.transition_risk) <= float(threshold):
+    for analysis in _analyses_for(tickers, analyses):
+        transition_risk = float(analysis.regime.transition_risk)
+        if transition_risk <= float(threshold):
             continue
         alerts.append(
             RiskAlert(
-                ticker=ticker.upper(),
-                transition_risk=float(regime.transition_risk),
+                ticker=analysis.ticker,
+                transition_risk=transition_risk,
                 threshold=float(threshold),
                 timestamp=_now_text(),
             )
@@ -133,73 +224,41 @@ def check_transition_risk_spikes(tickers: list[str], threshold: float = 0.20) ->
     return alerts
 
 
-def check_signal_changes(tickers: list[str]) -> list[SignalAlert]:
+def check_signal_changes(
+    tickers: list[str],
+    *,
+    analyses: Mapping[str, TickerAnalysis] | None = None,
+) -> list[SignalAlert]:
     effectiveness = get_signal_effectiveness()
     prior_rows = effectiveness.get("rows") or []
     prior_by_ticker = {str(row.get("ticker") or "").upper(): row for row in prior_rows if row.get("ticker")}
     alerts: list[SignalAlert] = []
-    for ticker in tickers:
-        market_frame = download_market_frame(ticker=ticker, period="3y", interval="1d").frame
-        regime = fit_regime_model(ticker=ticker, market_frame=market_frame, refit_step=21)
-        technicals = compute_technicals(
-            market_frame["price"],
-            market_frame["volume"],
-            market_frame["high"] if "high" in market_frame.columns else None,
-            market_frame["low"] if "low" in market_frame.columns else None,
-        )
-        forward_curve = forward_regime_curve(regime.transition_matrix, regime.latest_state_vector, horizon=21)
-        forward_signal = signal_from_forward_curve(
-            forward_curve,
-            regime.latest_label,
-            regime.transition_risk,
-            regime.expected_regime_duration,
-            regime.latest_probability,
-        )
-        technical_signal = intra_regime_signal(technicals, regime.latest_label)
-        composite = build_composite_signal(regime.latest_label, regime.latest_probability, forward_signal, technical_signal)
-        previous = prior_by_ticker.get(ticker.upper(), {})
+    for analysis in _analyses_for(tickers, analyses):
+        previous = prior_by_ticker.get(analysis.ticker, {})
         previous_action = previous.get("action")
-        if previous_action == composite.composite_action:
+        if previous_action == analysis.composite.composite_action:
             continue
         alerts.append(
             SignalAlert(
-                ticker=ticker.upper(),
+                ticker=analysis.ticker,
                 previous_action=previous_action,
-                new_action=str(composite.composite_action),
+                new_action=str(analysis.composite.composite_action),
                 timestamp=_now_text(),
             )
         )
     return alerts
 
 
-def check_stop_proximity(tickers: list[str], db_path: str, threshold_pct: float = 0.05) -> list[StopAlert]:
+def check_stop_proximity(
+    tickers: list[str],
+    db_path: str,
+    threshold_pct: float = 0.05,
+    *,
+    analyses: Mapping[str, TickerAnalysis] | None = None,
+) -> list[StopAlert]:
     alerts: list[StopAlert] = []
-    for ticker in tickers:
-        market_frame = download_market_frame(ticker=ticker, period="3y", interval="1d").frame
-        regime = fit_regime_model(ticker=ticker, market_frame=market_frame, refit_step=21)
-        technicals = compute_technicals(
-            market_frame["price"],
-            market_frame["volume"],
-            market_frame["high"] if "high" in market_frame.columns else None,
-            market_frame["low"] if "low" in market_frame.columns else None,
-        )
-        forward_curve = forward_regime_curve(regime.transition_matrix, regime.latest_state_vector, horizon=21)
-        forward_signal = signal_from_forward_curve(
-            forward_curve,
-            regime.latest_label,
-            regime.transition_risk,
-            regime.expected_regime_duration,
-            regime.latest_probability,
-        )
-        technical_signal = intra_regime_signal(technicals, regime.latest_label)
-        composite = build_composite_signal(regime.latest_label, regime.latest_probability, forward_signal, technical_signal)
-        targets = compute_price_targets(
-            current_price=float(getattr(regime, "latest_price", 0.0) or 0.0),
-            technicals_df=technicals,
-            composite_signal=composite,
-            expected_duration=float(regime.expected_regime_duration),
-            state_mean_return=float(getattr(regime, "recent_state_mean_return", 0.0) or 0.0),
-        )
+    for analysis in _analyses_for(tickers, analyses):
+        targets = analysis.price_targets
         stop_price = getattr(targets, "stop_price", None)
         current_price = float(getattr(targets, "current_price", 0.0) or 0.0)
         if stop_price is None or current_price <= 0:
@@ -208,7 +267,7 @@ def check_stop_proximity(tickers: list[str], db_path: str, threshold_pct: float
         if distance_pct <= float(threshold_pct):
             alerts.append(
                 StopAlert(
-                    ticker=ticker.upper(),
+                    ticker=analysis.ticker,
                     current_price=current_price,
                     stop_price=float(stop_price),
                     distance_pct=float(distance_pct),
@@ -218,6 +277,41 @@ def check_stop_proximity(tickers: list[str], db_path: str, threshold_pct: float
     return alerts
 
 
+def run_regime_alert_checks(
+    tickers: list[str],
+    db_path: str,
+    *,
+    max_workers: int | None = None,
+    risk_threshold: float = 0.20,
+    stop_threshold_pct: float = 0.05,
+) -> dict[str, Any]:
+    """Fit every ticker once and derive regime, risk, signal and stop alerts from that shared result.
+
+    ``timings`` carries wall-clock seconds for the analysis and derive stages plus the summed
+    per-ticker load/fit/signal seconds spent inside the worker pool.
+    """
+
+    started = time.perf_counter()
+    analyses = analyze_tickers(tickers, max_workers=max_workers)
+    analyzed = time.perf_counter()
+    selected = list(analyses)
+    regime_alerts = check_regime_changes(selected, db_path, analyses=analyses)
+    risk_alerts = check_transition_risk_spikes(selected, risk_threshold, analyses=analyses)
+    signal_alerts = check_signal_changes(selected, analyses=analyses)
+    stop_alerts = check_stop_proximity(selected, db_path, stop_threshold_pct, analyses=analyses)
+    finished = time.perf_counter()
+    timings = {"ticker_count": len(analyses), "analyze_seconds": analyzed - started, "derive_seconds": finished - analyzed}
+    for stage in ("load_seconds", "fit_seconds", "signal_seconds"):
+        timings[stage] = sum(float(analysis.timings.get(stage, 0.0)) for analysis in analyses.values())
+    return {
+        "regime": regime_alerts,
+        "risk": risk_alerts,
+        "signal": signal_alerts,
+        "stop": stop_alerts,
+        "timings": timings,
+    }
+
+
 def format_alert_summary(alerts: list[Any]) -> str:
     if not alerts:
         return "No new regime, transition-risk, or signal alerts."
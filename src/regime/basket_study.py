@@ -17,6 +17,7 @@ import pandas as pd
 from .alpha_campaign import DEFAULT_BASKET_PATH, DEFAULT_CAMPAIGN_DIR, _git_sha, _json_safe, _read_json, _write_json, load_basket
 from .ccel_campaign import (
     CCELLot,
+    LotBook,
     apply_wash_sales,
     build_after_tax_curve,
     buy_hold_taxable_payload,
@@ -39,6 +40,7 @@ DEFAULT_BASKET_STUDY_OOS_START = "2024-01-01"
 DEFAULT_BASKET_STUDY_DIR = DEFAULT_CAMPAIGN_DIR / "basket_construction_study"
 DEFAULT_BASKET_STUDY_REPORT_DIR = Path("output") / "basket_construction_study_report"
 DEFAULT_BASKET_STUDY_REPORT_PATH = DEFAULT_BASKET_STUDY_REPORT_DIR / "management_report.html"
+DAILY_SNAPSHOT_LOOKBACK_DAYS = 31
 
 SELECTION_ARMS = (
     "C0_static_basket",
@@ -317,7 +319,7 @@ def run_basket_arm(
     dates = _panel_dates_by_permaticker(prices)
     dates = sorted(set(dates) | {event.date for event in terminal_events.values()})
     cash = float(cfg.starting_cash)
-    lots: list[CCELLot] = []
+    lots = LotBook()
     trades: list[dict[str, Any]] = []
     realizations: list[dict[str, Any]] = []
     terminal_realizations: list[dict[str, Any]] = []
@@ -355,7 +357,7 @@ def run_basket_arm(
             executed_selection_dates.add(selection_date)
             ranked = selections[selection_date]
             target_holdings = reconstitute_holdings(
-                current={_security_to_perma(lot.ticker) for lot in lots},
+                current={_security_to_perma(security) for security in lots.tickers()},
                 ranked=[row.permaticker for row in ranked],
                 scores={row.permaticker: row.score for row in ranked},
                 target_size=cfg.basket_size,
@@ -378,7 +380,7 @@ def run_basket_arm(
             total_turnover += turnover
 
         valued_prices, unresolved_marks = _mark_prices_for_lots(lots, last_prices)
-        position_value = float(sum(lot.quantity * float(valued_prices.get(lot.ticker, 0.0)) for lot in lots))
+        position_value = lots.market_value(valued_prices)
         equity = cash + position_value
         equity_curve.append(
             {
@@ -1300,11 +1302,23 @@ def _score_selection_rows(rows: list[SelectionRow], arm: str, cfg: BasketStudyCo
 
 
 def _daily_snapshot(store: SharadarStore, permatickers: Sequence[int], as_of: pd.Timestamp) -> dict[int, dict[str, Any]]:
-    daily = store.read_fact_table(
+    wanted = [int(item) for item in permatickers]
+    columns = ["permaticker", "date", "marketcap", "ev", "evebitda", "pe", "pb"]
+    # Most names have a DAILY row within days of as_of; only the stragglers need the full history scan.
+    recent = store.read_fact_table(
         "DAILY",
-        columns=["permaticker", "date", "marketcap", "ev", "evebitda", "pe", "pb"],
-        filters=[("permaticker", "in", [int(item) for item in permatickers])],
+        columns=columns,
+        filters=[("permaticker", "in", wanted)],
+        start=pd.Timestamp(as_of) - pd.Timedelta(days=DAILY_SNAPSHOT_LOOKBACK_DAYS),
+        end=as_of,
     )
+    found = set(pd.to_numeric(recent["permaticker"], errors="coerce").dropna().astype(int)) if "permaticker" in recent.columns else set()
+    stale = [perma for perma in wanted if perma not in found]
+    frames = [recent]
+    if stale:
+        frames.append(store.read_fact_table("DAILY", columns=columns, filters=[("permaticker", "in", stale)], end=as_of))
+    frames = [frame for frame in frames if not frame.empty]
+    daily = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     if daily.empty:
         return {}
     daily["permaticker"] = pd.to_numeric(daily["permaticker"], errors="coerce").astype("Int64")
@@ -1320,42 +1334,17 @@ def _fundamentals_snapshot(store: SharadarStore, permatickers: Sequence[int], as
     wanted = sorted({int(item) for item in permatickers})
     if not wanted:
         return {}
-    columns = ["permaticker", "datekey", "dimension", *QUALITY_FIELDS]
-    sf1 = store.read_fact_table(
-        "SF1",
-        columns=list(dict.fromkeys(columns)),
-        filters=[
-            ("permaticker", "in", wanted),
-            ("datekey", "<=", pd.Timestamp(as_of).date().isoformat()),
-        ],
-    )
-    if sf1.empty or "permaticker" not in sf1.columns or "datekey" not in sf1.columns:
-        return {}
-    sf1 = sf1.copy()
-    sf1["permaticker"] = pd.to_numeric(sf1["permaticker"], errors="coerce").astype("Int64")
-    sf1["datekey"] = pd.to_datetime(sf1["datekey"], errors="coerce")
-    rows = sf1.loc[sf1["permaticker"].isin(wanted) & (sf1["datekey"] <= pd.Timestamp(as_of))].copy()
-    if rows.empty:
-        return {}
-    if "dimension" in rows.columns:
-        dim_order = {name: idx for idx, name in enumerate(("ARQ", "ART", "ARY"))}
-        rows = rows.loc[rows["dimension"].astype(str).str.upper().isin(dim_order)].copy()
-        rows["_dimension_order"] = rows["dimension"].astype(str).str.upper().map(dim_order).fillna(999)
-    else:
-        rows["_dimension_order"] = 999
-        rows["dimension"] = ""
-    rows = rows.sort_values(["permaticker", "datekey", "_dimension_order"], ascending=[True, False, True])
-    latest = rows.groupby("permaticker", as_index=False).head(1)
+    snapshot = store.get_fundamentals_snapshot(wanted, [pd.Timestamp(as_of)], QUALITY_FIELDS)
     out: dict[int, dict[str, Any]] = {}
-    for _, row in latest.dropna(subset=["permaticker"]).iterrows():
+    for record in snapshot.to_dict("records"):
         payload = {
-            "permaticker": int(row["permaticker"]),
-            "datekey": pd.Timestamp(row["datekey"]).date().isoformat() if pd.notna(row["datekey"]) else None,
-            "dimension": str(row.get("dimension") or ""),
+            "permaticker": int(record["permaticker"]),
+            "datekey": pd.Timestamp(record["datekey"]).date().isoformat(),
+            "dimension": str(record.get("dimension") or ""),
         }
         for field in QUALITY_FIELDS:
-            payload[field] = row.get(field)
-        out[int(row["permaticker"])] = payload
+            payload[field] = record.get(field)
+        out[int(record["permaticker"])] = payload
     return out
 
 
@@ -1427,7 +1416,7 @@ def _valuation_factor(fields: dict[str, Any], market: dict[str, Any]) -> float |
 def _execute_terminal_value_events(
     *,
     date: pd.Timestamp,
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     terminal_events: dict[int, Any],
     processed: set[int],
@@ -1438,7 +1427,7 @@ def _execute_terminal_value_events(
         if perma in processed or pd.Timestamp(event.date).normalize() > pd.Timestamp(date).normalize():
             continue
         sec = _perma_security(int(perma))
-        qty = sum(lot.quantity for lot in lots if lot.ticker == sec)
+        qty = lots.quantity(sec)
         processed.add(int(perma))
         if qty <= 0:
             continue
@@ -1458,7 +1447,7 @@ def _rebalance_to_targets(
     *,
     date: pd.Timestamp,
     target_holdings: set[int],
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     open_prices: dict[int, float],
     cfg: BasketStudyConfig,
@@ -1469,11 +1458,11 @@ def _rebalance_to_targets(
     realized: list[dict[str, Any]] = []
     costs = 0.0
     turnover = 0.0
-    held = {_security_to_perma(lot.ticker) for lot in lots}
+    held = {_security_to_perma(security) for security in lots.tickers()}
     to_sell = held - target_holdings
     for perma in sorted(to_sell):
         sec = _perma_security(perma)
-        qty = sum(lot.quantity for lot in lots if lot.ticker == sec)
+        qty = lots.quantity(sec)
         price = float(open_prices.get(perma, 0.0))
         if qty <= 0 or price <= 0:
             continue
@@ -1487,11 +1476,11 @@ def _rebalance_to_targets(
         trades.append(_trade(date, sec, "Sell", qty, price, notional, cost, "annual_reconstitution_drop"))
 
     current_values = {
-        _security_to_perma(lot.ticker): sum(item.quantity for item in lots if item.ticker == lot.ticker) * float(open_prices.get(_security_to_perma(lot.ticker), 0.0))
-        for lot in lots
+        _security_to_perma(security): quantity * float(open_prices.get(_security_to_perma(security), 0.0))
+        for security, quantity in lots.positions().items()
     }
     equity = cash + sum(current_values.values())
-    new_targets = sorted(target_holdings - {_security_to_perma(lot.ticker) for lot in lots})
+    new_targets = sorted(target_holdings - {_security_to_perma(security) for security in lots.tickers()})
     if rebalance_weights:
         for perma in sorted(target_holdings):
             sec = _perma_security(perma)
@@ -1502,7 +1491,7 @@ def _rebalance_to_targets(
             current_value = current_values.get(perma, 0.0)
             delta = target_value - current_value
             if delta < -price:
-                qty = min(sum(lot.quantity for lot in lots if lot.ticker == sec), abs(delta) / price)
+                qty = min(lots.quantity(sec), abs(delta) / price)
                 cost = qty * price * cfg.exit_cost_bps / 10_000.0
                 realized.extend(_sell_fifo_lots(lots, sec, qty, price - cost / qty, _date_text(date), "equal_weight_rebalance"))
                 notional = qty * price
@@ -1653,11 +1642,11 @@ def _matching_selection_date(selections: dict[str, list[SelectionRow]], date: pd
     return sorted(due)[0] if due else None
 
 
-def _append_new_lot(lots: list[CCELLot], trade: dict[str, Any]) -> None:
+def _append_new_lot(lots: LotBook, trade: dict[str, Any]) -> None:
     payload = trade.pop("_new_lot", None)
     if not isinstance(payload, dict):
         return
-    lots.append(
+    lots.add(
         CCELLot(
             lot_id=int(payload["lot_id"]),
             ticker=str(payload["ticker"]),
@@ -1683,7 +1672,7 @@ def _mark_price_for_security(last_prices: dict[int, float], security: str) -> fl
     return float(value) if value is not None else None
 
 
-def _mark_prices_for_lots(lots: list[CCELLot], last_prices: dict[int, float]) -> tuple[dict[str, float], list[str]]:
+def _mark_prices_for_lots(lots: Iterable[CCELLot], last_prices: dict[int, float]) -> tuple[dict[str, float], list[str]]:
     prices: dict[str, float] = {}
     unresolved: list[str] = []
     for lot in lots:
@@ -1695,7 +1684,7 @@ def _mark_prices_for_lots(lots: list[CCELLot], last_prices: dict[int, float]) ->
     return prices, unresolved
 
 
-def _valuation_diagnostics(lots: list[CCELLot], last_prices: dict[int, float]) -> dict[str, Any]:
+def _valuation_diagnostics(lots: Iterable[CCELLot], last_prices: dict[int, float]) -> dict[str, Any]:
     prices, unresolved = _mark_prices_for_lots(lots, last_prices)
     zero_marked = sorted({lot.ticker for lot in lots if prices.get(lot.ticker, 0.0) <= 0.0})
     return {
@@ -1857,7 +1846,7 @@ def _delta(left: Any, right: Any) -> float | None:
     return left_value - right_value
 
 
-def per_name_distribution(trades: list[dict[str, Any]], lots: list[CCELLot], final_prices: dict[str, float], label_by_perma: dict[int, str]) -> dict[str, Any]:
+def per_name_distribution(trades: list[dict[str, Any]], lots: Iterable[CCELLot], final_prices: dict[str, float], label_by_perma: dict[int, str]) -> dict[str, Any]:
     pnl: dict[str, float] = {}
     for trade in trades:
         ticker = str(trade.get("ticker") or "")
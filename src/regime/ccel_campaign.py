@@ -3,14 +3,16 @@ from __future__ import annotations
 import datetime as dt
 import html
 import math
+from collections import deque
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Iterable, Iterator, Literal, Mapping
 
 import pandas as pd
 
 from .alpha_campaign import DEFAULT_BASKET_PATH, DEFAULT_CAMPAIGN_DIR, _git_sha, _json_safe, _read_json, _write_json, load_basket
 from .data import download_market_frame
+from .factor_panel import FactorPanel
 from .pipeline_backtest import compute_equity_metrics
 from .portfolio_backtest import PortfolioBacktestConfig, run_portfolio_backtest
 from .portfolio_campaign import _campaign_row, _enrich_regime_frames as _campaign2_enrich_regime_frames
@@ -83,6 +85,100 @@ class CCELLot:
         return asdict(self)
 
 
+class LotBook:
+    """
+    Open tax lots keyed by ticker.
+
+    Each ticker keeps a FIFO-ordered queue (acquisition date, then lot id) with running quantity and cost-basis totals,
+    so per-ticker quantity, value and weighted basis are O(1) and FIFO relief pops from the queue front instead of
+    sorting and rebuilding a flat lot list. Iteration yields the open lots ticker by ticker in FIFO order.
+    """
+
+    def __init__(self, lots: Iterable[CCELLot] = ()) -> None:
+        self._queues: dict[str, deque[CCELLot]] = {}
+        self._quantity: dict[str, float] = {}
+        self._basis: dict[str, float] = {}
+        self._count = 0
+        for lot in lots:
+            self.add(lot)
+
+    def __iter__(self) -> Iterator[CCELLot]:
+        for queue in self._queues.values():
+            yield from queue
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, lot: CCELLot) -> None:
+        if lot.quantity <= 1e-9:
+            return
+        queue = self._queues.setdefault(lot.ticker, deque())
+        if queue and _fifo_key(lot) < _fifo_key(queue[-1]):
+            ordered = sorted([*queue, lot], key=_fifo_key)
+            queue.clear()
+            queue.extend(ordered)
+        else:
+            queue.append(lot)
+        self._quantity[lot.ticker] = self._quantity.get(lot.ticker, 0.0) + lot.quantity
+        self._basis[lot.ticker] = self._basis.get(lot.ticker, 0.0) + lot.quantity * lot.basis_per_share
+        self._count += 1
+
+    def tickers(self) -> set[str]:
+        return set(self._queues)
+
+    def lots(self, ticker: str) -> list[CCELLot]:
+        return list(self._queues.get(ticker, ()))
+
+    def positions(self) -> dict[str, float]:
+        return dict(self._quantity)
+
+    def quantity(self, ticker: str) -> float:
+        return self._quantity.get(ticker, 0.0)
+
+    def weighted_basis(self, ticker: str) -> float:
+        quantity = self._quantity.get(ticker, 0.0)
+        return self._basis[ticker] / quantity if quantity > 0 else 0.0
+
+    def market_value(self, prices: Mapping[str, float]) -> float:
+        return float(sum(quantity * float(prices.get(ticker, 0.0)) for ticker, quantity in self._quantity.items()))
+
+    def relieve(self, ticker: str, quantity: float, *, order: Callable[[CCELLot], Any] | None = None) -> list[tuple[CCELLot, float]]:
+        """
+        Take `quantity` shares out of `ticker`'s lots, FIFO unless `order` ranks the lots. Returns (lot, shares taken).
+        """
+        queue = self._queues.get(ticker)
+        if not queue:
+            return []
+        remaining = float(quantity)
+        taken: list[tuple[CCELLot, float]] = []
+        for lot in queue if order is None else sorted(queue, key=order):
+            if remaining <= 1e-9:
+                break
+            take = min(lot.quantity, remaining)
+            lot.quantity -= take
+            remaining -= take
+            self._quantity[ticker] -= take
+            self._basis[ticker] -= take * lot.basis_per_share
+            taken.append((lot, take))
+        if order is None:
+            while queue and queue[0].quantity <= 1e-9:
+                self._discard(queue.popleft())
+        else:
+            for lot in queue:
+                if lot.quantity <= 1e-9:
+                    self._discard(lot)
+            queue = self._queues[ticker] = deque(lot for lot in queue if lot.quantity > 1e-9)
+        if not queue:
+            # Drop the running totals with the last lot so rounding residue never outlives the position.
+            del self._queues[ticker], self._quantity[ticker], self._basis[ticker]
+        return taken
+
+    def _discard(self, lot: CCELLot) -> None:
+        self._quantity[lot.ticker] -= lot.quantity
+        self._basis[lot.ticker] -= lot.quantity * lot.basis_per_share
+        self._count -= 1
+
+
 @dataclass
 class PendingInstruction:
     decision_date: str
@@ -305,9 +401,10 @@ def run_ccel_backtest(
     dates = _panel_dates(frames)
     if len(dates) < 2:
         raise ValueError("CCEL backtest requires at least two trading dates.")
+    factors = FactorPanel(frames)
 
     cash = float(cfg.starting_cash)
-    lots: list[CCELLot] = []
+    lots = LotBook()
     trades: list[dict[str, Any]] = []
     realizations: list[dict[str, Any]] = []
     pending: PendingInstruction | None = PendingInstruction(decision_date=_date_text(dates[0]), buy_candidates=sorted(frames), reason="initial_deployment")
@@ -378,6 +475,7 @@ def run_ccel_backtest(
             first_day=(idx == 0),
             is_month_start=(idx == 0 or pd.Timestamp(dates[idx - 1]).month != pd.Timestamp(date).month),
             strategic_entry_dates=strategic_entry_dates,
+            factors=factors,
         )
 
     taxable = apply_wash_sales(realizations, trades)
@@ -495,7 +593,7 @@ def annual_tax(realizations: list[dict[str, Any]], *, st_tax_rate: float = 0.32,
 def build_after_tax_curve(
     equity_curve: list[dict[str, Any]],
     realizations: list[dict[str, Any]],
-    open_lots: list[CCELLot],
+    open_lots: Iterable[CCELLot],
     final_prices: dict[str, float],
     *,
     st_tax_rate: float = 0.32,
@@ -536,7 +634,7 @@ def build_after_tax_curve(
 
 
 def terminal_liquidation_tax(
-    open_lots: list[CCELLot],
+    open_lots: Iterable[CCELLot],
     final_prices: dict[str, float],
     *,
     as_of: pd.Timestamp,
@@ -877,8 +975,8 @@ def buy_hold_taxable_payload(
     }
 
 
-def reconstruct_lots_from_trades(trades: list[dict[str, Any]]) -> tuple[list[CCELLot], list[dict[str, Any]]]:
-    lots: list[CCELLot] = []
+def reconstruct_lots_from_trades(trades: list[dict[str, Any]]) -> tuple[LotBook, list[dict[str, Any]]]:
+    lots = LotBook()
     realizations: list[dict[str, Any]] = []
     next_id = 1
     for trade in sorted(trades, key=lambda row: (str(row.get("date") or ""), 0 if str(row.get("side")).lower() == "buy" else 1)):
@@ -891,7 +989,7 @@ def reconstruct_lots_from_trades(trades: list[dict[str, Any]]) -> tuple[list[CCE
             continue
         if str(trade.get("side") or "").lower() == "buy":
             basis = price + (cost / qty if qty else 0.0)
-            lots.append(CCELLot(next_id, ticker, qty, basis, date))
+            lots.add(CCELLot(next_id, ticker, qty, basis, date))
             next_id += 1
         elif str(trade.get("side") or "").lower() == "sell":
             proceeds_per_share = price - (cost / qty if qty else 0.0)
@@ -903,7 +1001,7 @@ def _execute_ccel_instruction(
     *,
     date: pd.Timestamp,
     pending: PendingInstruction,
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     open_prices: dict[str, float],
     no_rebuy_until: dict[str, pd.Timestamp],
@@ -933,14 +1031,14 @@ def _execute_ccel_instruction(
         turnover += reentry_turnover
     harvest_replacement_cash = 0.0
     for ticker, reason in sorted(pending.sell_tickers.items()):
-        qty = sum(lot.quantity for lot in lots if lot.ticker == ticker)
+        qty = lots.quantity(ticker)
         price = float(open_prices.get(ticker, 0.0))
         if qty <= 0 or price <= 0:
             continue
         total_before_sale = cash + _position_value(lots, open_prices)
         target_weight = qty * price / total_before_sale if total_before_sale > 0 else 0.0
         bridge_target_weights = {
-            held: sum(lot.quantity for lot in lots if lot.ticker == held) * float(open_prices.get(held, 0.0)) / total_before_sale
+            held: lots.quantity(held) * float(open_prices.get(held, 0.0)) / total_before_sale
             for held in sorted(_held_tickers(lots))
             if held != ticker and total_before_sale > 0 and float(open_prices.get(held, 0.0)) > 0
         }
@@ -1012,7 +1110,7 @@ def _execute_ccel_instruction(
 
 def _update_strategic_entry_dates(
     strategic_entry_dates: dict[str, str],
-    lots: list[CCELLot],
+    lots: LotBook,
     trades: list[dict[str, Any]],
 ) -> None:
     held = _held_tickers(lots)
@@ -1034,7 +1132,7 @@ def _execute_harvest_reentries(
     *,
     date: pd.Timestamp,
     targets: dict[str, float],
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     open_prices: dict[str, float],
     pending_reentry: dict[str, dict[str, Any]],
@@ -1051,7 +1149,7 @@ def _execute_harvest_reentries(
         total_value = cash + _position_value(lots, open_prices)
         if total_value <= 0:
             continue
-        current_value = sum(lot.quantity for lot in lots if lot.ticker == ticker) * float(open_prices[ticker])
+        current_value = lots.quantity(ticker) * float(open_prices[ticker])
         target_value = max(0.0, float(target_weight or 0.0)) * total_value
         buy_budget = max(0.0, target_value - current_value)
         if buy_budget < cfg.min_cash_to_deploy:
@@ -1101,7 +1199,7 @@ def _trim_bridge_for_reentry(
     date: pd.Timestamp,
     ticker: str,
     needed_cash: float,
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     open_prices: dict[str, float],
     entry: dict[str, Any],
@@ -1118,7 +1216,7 @@ def _trim_bridge_for_reentry(
     excess_values: dict[str, float] = {}
     for name in bridge_tickers:
         price = float(open_prices.get(name, 0.0))
-        qty = sum(lot.quantity for lot in lots if lot.ticker == name)
+        qty = lots.quantity(name)
         if price <= 0 or qty <= 0:
             continue
         current_value = qty * price
@@ -1136,7 +1234,7 @@ def _trim_bridge_for_reentry(
     excess_total = sum(excess_values.values())
     for name, excess in sorted(excess_values.items()):
         price = float(open_prices.get(name, 0.0))
-        held_qty = sum(lot.quantity for lot in lots if lot.ticker == name)
+        held_qty = lots.quantity(name)
         if price <= 0 or held_qty <= 0:
             continue
         allocation = sell_notional * excess / excess_total if excess_total > 0 else 0.0
@@ -1162,7 +1260,7 @@ def _deploy_cash_to_tickers(
     *,
     date: pd.Timestamp,
     tickers: list[str],
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     open_prices: dict[str, float],
     cfg: CCELConfig,
@@ -1204,7 +1302,7 @@ def _deploy_cash_to_tickers(
         cash -= qty * price + cost
         costs += cost
         turnover += qty * price
-        lots.append(CCELLot(next_lot_id, ticker, qty, unit_cost, _date_text(date)))
+        lots.add(CCELLot(next_lot_id, ticker, qty, unit_cost, _date_text(date)))
         next_lot_id += 1
         trades.append(_trade_row(date, ticker, "Buy", qty, price, qty * price, cost, -cost, reason))
     return cash, next_lot_id, trades, costs, turnover
@@ -1215,7 +1313,7 @@ def _build_ccel_instruction(
     date: pd.Timestamp,
     frames: dict[str, pd.DataFrame],
     active: set[str],
-    lots: list[CCELLot],
+    lots: LotBook,
     cash: float,
     close_prices: dict[str, float],
     no_rebuy_until: dict[str, pd.Timestamp],
@@ -1223,6 +1321,7 @@ def _build_ccel_instruction(
     cfg: CCELConfig,
     first_day: bool,
     is_month_start: bool,
+    factors: FactorPanel,
     strategic_entry_dates: dict[str, str] | None = None,
 ) -> PendingInstruction | None:
     is_semiannual = pd.Timestamp(date).month in {1, 7} and is_month_start
@@ -1234,7 +1333,7 @@ def _build_ccel_instruction(
             earliest = pd.Timestamp(entry.get("earliest_rebuy_date", pd.Timestamp.max))
             if pd.Timestamp(date) < earliest:
                 continue
-            if ticker not in active or ticker not in frames or _quality_fails(ticker, date, frames):
+            if ticker not in active or ticker not in frames or factors.quality_fails(ticker, date):
                 pending_reentry.pop(ticker, None)
                 if ticker not in _held_tickers(lots):
                     strategic_entry_dates.pop(ticker, None)
@@ -1246,10 +1345,10 @@ def _build_ccel_instruction(
             price = float(close_prices.get(ticker, 0.0))
             if price <= 0:
                 continue
-            position_lots = [lot for lot in lots if lot.ticker == ticker]
+            position_lots = lots.lots(ticker)
             if not position_lots:
                 continue
-            basis = _weighted_basis(position_lots)
+            basis = lots.weighted_basis(ticker)
             tax_lot_age = min((pd.Timestamp(date) - pd.Timestamp(lot.acquisition_date)).days for lot in position_lots)
             strategic_date = strategic_entry_dates.get(ticker)
             age = (pd.Timestamp(date) - pd.Timestamp(strategic_date)).days if strategic_date else max((pd.Timestamp(date) - pd.Timestamp(lot.acquisition_date)).days for lot in position_lots)
@@ -1264,10 +1363,10 @@ def _build_ccel_instruction(
                 if pnl_pct <= -cfg.probation_loss_pct:
                     sell[ticker] = "probation_relegate_loss"
                     continue
-                if cfg.momentum_breakdown_enabled and _bottom_momentum(ticker, date, frames, active, cfg.momentum_bottom_quantile):
+                if cfg.momentum_breakdown_enabled and factors.bottom_momentum(ticker, date, cfg.momentum_bottom_quantile):
                     sell[ticker] = "probation_momentum_breakdown"
                     continue
-            if _quality_fails(ticker, date, frames):
+            if factors.quality_fails(ticker, date):
                 sell[ticker] = "quality_gate_deterioration"
     need_deploy = first_day or is_semiannual or bool(sell) or bool(harvest_reentry_targets) or cash >= cfg.min_cash_to_deploy * 2
     if not need_deploy and not sell:
@@ -1283,7 +1382,7 @@ def _build_ccel_instruction(
     candidates: list[str] = []
     if selection_trigger:
         max_new = max(0, cfg.max_names - len(held_after_sells))
-        candidates = _ranked_buy_candidates(date, frames, active, held_after_sells, set(sell), no_rebuy_until, max_new=max_new)
+        candidates = _ranked_buy_candidates(date, factors, active, held_after_sells, set(sell), no_rebuy_until, max_new=max_new)
     if not sell and cash < cfg.min_cash_to_deploy and not candidates:
         return None
     return PendingInstruction(
@@ -1298,7 +1397,7 @@ def _build_ccel_instruction(
 
 def _ranked_buy_candidates(
     date: pd.Timestamp,
-    frames: dict[str, pd.DataFrame],
+    factors: FactorPanel,
     active: set[str],
     held: set[str],
     just_sold: set[str],
@@ -1312,7 +1411,7 @@ def _ranked_buy_candidates(
             continue
         if pd.Timestamp(date) <= no_rebuy_until.get(ticker, pd.Timestamp.min):
             continue
-        momentum = _momentum_12_1(ticker, date, frames)
+        momentum = factors.momentum_12_1(ticker, date)
         is_new = ticker not in held
         candidates.append((not is_new, -(momentum if momentum is not None else -999.0), ticker))
     candidates.sort()
@@ -1330,13 +1429,9 @@ def _ranked_buy_candidates(
     return selected
 
 
-def _sell_fifo_lots(lots: list[CCELLot], ticker: str, quantity: float, proceeds_per_share: float, date: str, reason: str) -> list[dict[str, Any]]:
-    remaining = float(quantity)
+def _sell_fifo_lots(lots: LotBook, ticker: str, quantity: float, proceeds_per_share: float, date: str, reason: str) -> list[dict[str, Any]]:
     realized: list[dict[str, Any]] = []
-    for lot in sorted([lot for lot in lots if lot.ticker == ticker and lot.quantity > 0], key=lambda item: (item.acquisition_date, item.lot_id)):
-        if remaining <= 1e-9:
-            break
-        take = min(lot.quantity, remaining)
+    for lot, take in lots.relieve(ticker, quantity):
         holding_days = (pd.Timestamp(date) - pd.Timestamp(lot.acquisition_date)).days
         gain = (float(proceeds_per_share) - lot.basis_per_share) * take
         realized.append(
@@ -1353,9 +1448,6 @@ def _sell_fifo_lots(lots: list[CCELLot], ticker: str, quantity: float, proceeds_
                 "exit_reason": reason,
             }
         )
-        lot.quantity -= take
-        remaining -= take
-    lots[:] = [lot for lot in lots if lot.quantity > 1e-9]
     return realized
 
 
@@ -1636,12 +1728,12 @@ def _date_text(value: Any) -> str:
     return str(pd.Timestamp(value).date().isoformat())
 
 
-def _position_value(lots: list[CCELLot], prices: dict[str, float]) -> float:
-    return float(sum(lot.quantity * float(prices.get(lot.ticker, 0.0)) for lot in lots))
+def _position_value(lots: LotBook, prices: dict[str, float]) -> float:
+    return lots.market_value(prices)
 
 
-def _held_tickers(lots: list[CCELLot]) -> set[str]:
-    return {lot.ticker for lot in lots if lot.quantity > 0}
+def _held_tickers(lots: LotBook) -> set[str]:
+    return lots.tickers()
 
 
 def _unique_tickers(tickers: list[str]) -> list[str]:
@@ -1655,10 +1747,10 @@ def _unique_tickers(tickers: list[str]) -> list[str]:
     return out
 
 
-def _held_value_weights(tickers: list[str], lots: list[CCELLot], prices: dict[str, float]) -> dict[str, float]:
+def _held_value_weights(tickers: list[str], lots: LotBook, prices: dict[str, float]) -> dict[str, float]:
     values: dict[str, float] = {}
     for ticker in _unique_tickers(tickers):
-        qty = sum(lot.quantity for lot in lots if lot.ticker == ticker)
+        qty = lots.quantity(ticker)
         price = float(prices.get(ticker, 0.0))
         if qty > 0 and price > 0:
             values[ticker] = qty * price
@@ -1668,53 +1760,8 @@ def _held_value_weights(tickers: list[str], lots: list[CCELLot], prices: dict[st
     return {ticker: value / total for ticker, value in values.items()}
 
 
-def _weighted_basis(lots: list[CCELLot]) -> float:
-    total_qty = sum(lot.quantity for lot in lots)
-    if total_qty <= 0:
-        return 0.0
-    return sum(lot.quantity * lot.basis_per_share for lot in lots) / total_qty
-
-
-def _momentum_12_1(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame]) -> float | None:
-    frame = frames.get(ticker)
-    if frame is None or frame.empty:
-        return None
-    rows = frame.loc[frame.index <= pd.Timestamp(date)]
-    if len(rows) < 253:
-        return None
-    price = pd.to_numeric(rows["price"], errors="coerce")
-    if float(price.iloc[-252]) <= 0:
-        return None
-    return float(price.iloc[-21] / price.iloc[-252] - 1.0)
-
-
-def _bottom_momentum(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame], active: set[str], quantile: float) -> bool:
-    scored: list[tuple[str, float]] = []
-    for name in active:
-        score = _momentum_12_1(name, date, frames)
-        if score is not None:
-            scored.append((name, score))
-    if len(scored) < 4:
-        return False
-    scored.sort(key=lambda item: item[1])
-    cutoff = max(1, math.ceil(len(scored) * max(0.0, min(1.0, quantile))))
-    return ticker in {name for name, _score in scored[:cutoff]}
-
-
-def _quality_fails(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame]) -> bool:
-    frame = frames.get(ticker)
-    if frame is None or frame.empty:
-        return False
-    rows = frame.loc[frame.index <= pd.Timestamp(date)]
-    if rows.empty:
-        return False
-    row = rows.iloc[-1]
-    if "quality_gate_pass" in row:
-        return not bool(row.get("quality_gate_pass"))
-    if "quality_score" in row:
-        value = _float(row.get("quality_score"))
-        return value is not None and value < 0.2
-    return False
+def _fifo_key(lot: CCELLot) -> tuple[str, int]:
+    return (lot.acquisition_date, lot.lot_id)
 
 
 def _is_first_trading_day_month(date: pd.Timestamp, frames: dict[str, pd.DataFrame]) -> bool:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import Executor
 from dataclasses import replace
 from pathlib import Path
 from typing import Any
@@ -9,7 +10,7 @@ from typing import Any
 from .config import DEFAULT_TICKERS
 from .data import download_market_frame
 from .digest import digest_to_dict, digest_to_text, generate_weekly_digest
-from .hmm_engine import fit_regime_model, fit_regime_model_weekly
+from .hmm_engine import fit_regime_model, fit_regime_model_weekly, refit_executor
 from .investor_adapter import (
     get_investor_db_path,
     get_portfolio_positions,
@@ -131,7 +132,14 @@ from .agent_research_loop import (
     run_h002_quality_value_walk_forward,
     run_stage2_go_live,
 )
-from .rl_explore import DEFAULT_RL_EXPLORE_DIR, RLExploreConfig, pause_rl_explore, rl_explore_status, run_rl_explore
+from .rl_explore import (
+    DEFAULT_RL_EXPLORE_DIR,
+    RLExploreConfig,
+    pause_rl_explore,
+    rl_explore_status,
+    run_rl_explore,
+    run_rl_explore_seeds,
+)
 from .rl_explore.agent import RLAgentConfig
 from .rl_explore.env import DEFAULT_SNAPSHOT_HASH, RLMarketEnvConfig
 
@@ -172,6 +180,9 @@ def parse_args() -> argparse.Namespace:
     sweep_parser.add_argument("--hmm-covariance", choices=["diag", "full", "spherical", "tied"], default="diag")
     sweep_parser.add_argument("--hmm-n-seeds", type=int, default=1)
     sweep_parser.add_argument("--seed-agreement-min", type=float, default=0.8)
+    sweep_parser.add_argument("--hmm-model-cache", default=None, help="Directory of cached HMM refits reused across runs.")
+    sweep_parser.add_argument("--workers", type=int, default=1, help="Worker processes for regime decodes and combo replays. Default: 1")
+    sweep_parser.add_argument("--checkpoint-dir", default=None, help="Write one JSON checkpoint per finished combo and skip them on rerun.")
     sharadar_parser = subparsers.add_parser("sharadar", help="Manage the local Sharadar point-in-time data snapshot.")
     sharadar_subparsers = sharadar_parser.add_subparsers(dest="sharadar_command")
     sharadar_ingest_parser = sharadar_subparsers.add_parser("ingest", help="Bulk-download Sharadar tables into the local store.")
@@ -370,6 +381,8 @@ def parse_args() -> argparse.Namespace:
         rl_cmd.add_argument("--output-dir", default=str(DEFAULT_RL_EXPLORE_DIR))
         rl_cmd.add_argument("--snapshot", default=DEFAULT_SNAPSHOT_HASH)
         rl_cmd.add_argument("--seed", type=int, default=17)
+        rl_cmd.add_argument("--seeds", type=int, nargs="+", default=None, help="Run one session per seed under <output-dir>/seed_<seed>.")
+        rl_cmd.add_argument("--workers", type=int, default=1, help="Worker processes for --seeds sessions. Default: 1")
         rl_cmd.add_argument("--max-steps", type=int, default=None)
         rl_cmd.add_argument("--max-episodes", type=int, default=None)
         rl_cmd.add_argument("--max-wall-clock", default=None)
@@ -388,6 +401,7 @@ def parse_args() -> argparse.Namespace:
         rl_cmd.add_argument("--train-end", default="2020-12-31")
         rl_cmd.add_argument("--validation-start", default="2021-01-01")
         rl_cmd.add_argument("--validation-end", default="2023-12-31")
+        rl_cmd.add_argument("--preload-panel", action="store_true", help="Load research-window prices once and step episodes as arrays.")
     rl_run.add_argument("--force-new", action="store_true")
     rl_pause = rl_subparsers.add_parser("pause", help="Request graceful RL exploration pause.")
     rl_pause.add_argument("--output-dir", default=str(DEFAULT_RL_EXPLORE_DIR))
@@ -440,6 +454,7 @@ def _rl_explore_config_from_args(args: argparse.Namespace) -> RLExploreConfig:
         rebalance_every_days=int(getattr(args, "rebalance_every_days", 21)),
         lookback_days=int(getattr(args, "lookback_days", 63)),
         snapshot_hash=getattr(args, "snapshot", DEFAULT_SNAPSHOT_HASH),
+        preload_panel=bool(getattr(args, "preload_panel", False)),
     )
     return RLExploreConfig(
         output_dir=getattr(args, "output_dir", str(DEFAULT_RL_EXPLORE_DIR)),
@@ -498,8 +513,8 @@ def _features_from_pipeline_context(signal: PipelineSignal, history) -> dict[str
 
 
 class _MetaLabelerVetoProvider:
-    def __init__(self, engine: MetaLabelerEngine, veto_mode: str = "gate") -> None:
-        self._base = _ProductionSignalProvider()
+    def __init__(self, engine: MetaLabelerEngine, veto_mode: str = "gate", fit_executor: Executor | None = None) -> None:
+        self._base = _ProductionSignalProvider(fit_executor)
         self._engine = engine
         self._veto_mode = normalize_meta_labeler_veto_mode(veto_mode)
         self._probabilities: list[float] = []
@@ -794,6 +809,7 @@ def _build_report(
         training_window=training_window,
         refit_step=refit_step,
         macro_weighting=macro_weighting,
+        executor=refit_executor(),
     )
     prior_event = save_regime_event(ticker, regime_result.latest_label, regime_result.latest_state_id)
     qualitative = build_qualitative_assessment(
@@ -1108,6 +1124,15 @@ def main() -> None:
         raise SystemExit("agent-research-loop requires one of: go-live, rescore-h001-walkforward, run-h002-quality-value, run, resume, pause, status")
     if getattr(args, "command", None) == "rl-explore":
         rl_command = getattr(args, "rl_explore_command", None)
+        if rl_command in {"run", "resume"} and getattr(args, "seeds", None):
+            payload = run_rl_explore_seeds(
+                _rl_explore_config_from_args(args),
+                list(args.seeds),
+                mode=rl_command,
+                max_workers=max(1, int(getattr(args, "workers", 1) or 1)),
+            )
+            print(json.dumps(payload, indent=2))
+            return
         if rl_command == "run":
             payload = run_rl_explore(_rl_explore_config_from_args(args), mode="run")
             print(json.dumps(payload, indent=2))
@@ -1159,6 +1184,7 @@ def main() -> None:
             hmm_covariance_type=str(getattr(args, "hmm_covariance", "diag") or "diag"),
             hmm_n_seeds=max(1, int(getattr(args, "hmm_n_seeds", 1))),
             seed_agreement_min=max(0.0, min(1.0, float(getattr(args, "seed_agreement_min", 0.8)))),
+            hmm_model_cache_dir=getattr(args, "hmm_model_cache", None),
         )
         rows = run_threshold_sweep(
             tickers=tickers,
@@ -1167,6 +1193,8 @@ def main() -> None:
             grid=load_threshold_grid(getattr(args, "grid_json", None)),
             base_config=config,
             include_stress_windows=bool(getattr(args, "stress_report", False)),
+            max_workers=max(1, int(getattr(args, "workers", 1) or 1)),
+            checkpoint_dir=getattr(args, "checkpoint_dir", None),
         )
         write_sweep_rows(rows, json_path=getattr(args, "output_json", None), csv_path=getattr(args, "output_csv", None))
         if not getattr(args, "output_json", None) and not getattr(args, "output_csv", None):
@@ -1192,6 +1220,7 @@ def main() -> None:
                 cache=bool(getattr(args, "cache", False)),
             ).frame if benchmark_ticker else None
             engine = _load_meta_labeler_for_ab()
+            fit_executor = refit_executor()
             results = []
             for ticker in tickers:
                 market = download_market_frame(
@@ -1202,8 +1231,10 @@ def main() -> None:
                     end=getattr(args, "end", None),
                     cache=bool(getattr(args, "cache", False)),
                 ).frame
-                baseline = run_pipeline_backtest(ticker, market, config=config, benchmark_frame=benchmark)
-                provider = _MetaLabelerVetoProvider(engine, veto_mode=veto_mode)
+                baseline = run_pipeline_backtest(
+                    ticker, market, config=config, benchmark_frame=benchmark, fit_executor=fit_executor
+                )
+                provider = _MetaLabelerVetoProvider(engine, veto_mode=veto_mode, fit_executor=fit_executor)
                 meta_veto = run_pipeline_backtest(
                     ticker,
                     market,
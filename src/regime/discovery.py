@@ -18,7 +18,7 @@ from .cross_sectional import (
     compute_peer_percentiles,
 )
 from .data import download_market_frame
-from .hmm_engine import fit_regime_model
+from .hmm_engine import fit_regime_model_cached, refit_executor
 from .llm_layer import request_frontier_decision
 from .market_data_client import get_ticker_info
 from .universe import check_universe_eligibility, universe_screen_enabled
@@ -343,7 +343,9 @@ Return strict JSON array:
 def _quick_regime_screen(ticker: str) -> tuple[str | None, float | None, float | None, float | None]:
     try:
         market_frame = download_market_frame(ticker=ticker, period="2y", interval="1d").frame
-        regime = fit_regime_model(ticker=ticker, market_frame=market_frame, training_window=252, refit_step=21)
+        regime = fit_regime_model_cached(
+            ticker=ticker, market_frame=market_frame, training_window=252, refit_step=21, executor=refit_executor()
+        )
         price_window = market_frame.tail(126).copy()
         current_price = float(price_window["price"].iloc[-1])
         high = price_window["high"].astype(float)
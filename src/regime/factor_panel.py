@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from .portfolio_campaign import _float
+
+MOMENTUM_LOOKBACK_ROWS = 252
+MOMENTUM_SKIP_ROWS = 21
+MIN_RANKED_NAMES = 4
+QUALITY_SCORE_FLOOR = 0.2
+
+
+class FactorPanel:
+    """
+    Date-aligned factor panel for the CCEL-family simulators, built once per backtest run.
+
+    Rows are the union of frame dates and columns the tickers. Each cell holds the as-of value from the ticker's last
+    row on or before that date: 12-1 momentum over trading rows (price 21 rows back over price 252 rows back) and the
+    quality-gate failure flag (`quality_gate_pass` false, else `quality_score` below the floor). Bottom-momentum sets
+    are ranked once per (date, quantile) over the names trading on that date and memoized, so every query is a dict
+    lookup and an array read instead of a `frame.index <= date` filter.
+    """
+
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self.tickers = sorted(frames)
+        self._columns = {ticker: col for col, ticker in enumerate(self.tickers)}
+        indexes = {ticker: _index_ns(frames[ticker].index) for ticker in self.tickers}
+        stamps = [index for index in indexes.values() if len(index)]
+        self.dates = np.unique(np.concatenate(stamps)) if stamps else np.array([], dtype=np.int64)
+        self._rows = {int(stamp): row for row, stamp in enumerate(self.dates)}
+        shape = (len(self.dates), len(self.tickers))
+        self._momentum = np.full(shape, np.nan)
+        self._quality_fails = np.zeros(shape, dtype=bool)
+        self._observed = np.zeros(shape, dtype=bool)
+        self._bottom_sets: dict[tuple[int, float], frozenset[str]] = {}
+        for ticker, col in self._columns.items():
+            index = indexes[ticker]
+            if not len(index):
+                continue
+            frame = frames[ticker]
+            asof = np.searchsorted(index, self.dates, side="right") - 1
+            seen = asof >= 0
+            asof = np.where(seen, asof, 0)
+            self._momentum[:, col] = np.where(seen, _momentum_rows(frame)[asof], np.nan)
+            self._quality_fails[:, col] = seen & _quality_fail_rows(frame)[asof]
+            self._observed[:, col] = seen & (index[asof] == self.dates)
+
+    def momentum_12_1(self, ticker: str, date: pd.Timestamp) -> float | None:
+        row, col = self._row(date), self._columns.get(ticker)
+        if row < 0 or col is None:
+            return None
+        value = float(self._momentum[row, col])
+        return None if math.isnan(value) else value
+
+    def quality_fails(self, ticker: str, date: pd.Timestamp) -> bool:
+        row, col = self._row(date), self._columns.get(ticker)
+        if row < 0 or col is None:
+            return False
+        return bool(self._quality_fails[row, col])
+
+    def bottom_momentum(self, ticker: str, date: pd.Timestamp, quantile: float) -> bool:
+        row = self._rows.get(pd.Timestamp(date).value)
+        if row is None:
+            return False
+        key = (row, float(quantile))
+        bottom = self._bottom_sets.get(key)
+        if bottom is None:
+            bottom = self._bottom_sets[key] = self._rank_bottom(row, float(quantile))
+        return ticker in bottom
+
+    def _row(self, date: pd.Timestamp) -> int:
+        stamp = pd.Timestamp(date).value
+        row = self._rows.get(stamp)
+        if row is None:
+            row = int(np.searchsorted(self.dates, stamp, side="right")) - 1
+        return row
+
+    def _rank_bottom(self, row: int, quantile: float) -> frozenset[str]:
+        scores = self._momentum[row]
+        cols = np.flatnonzero(self._observed[row] & ~np.isnan(scores))
+        if len(cols) < MIN_RANKED_NAMES:
+            return frozenset()
+        # Columns are in ticker order, so ties rank by ticker name.
+        ranked = cols[np.lexsort((cols, scores[cols]))]
+        cutoff = max(1, math.ceil(len(ranked) * max(0.0, min(1.0, quantile))))
+        return frozenset(self.tickers[col] for col in ranked[:cutoff])
+
+
+def _index_ns(index: pd.Index) -> np.ndarray:
+    return pd.DatetimeIndex(index).as_unit("ns").asi8
+
+
+def _momentum_rows(frame: pd.DataFrame) -> np.ndarray:
+    out = np.full(len(frame), np.nan)
+    if "price" not in frame.columns or len(frame) <= MOMENTUM_LOOKBACK_ROWS:
+        return out
+    price = pd.to_numeric(frame["price"], errors="coerce").to_numpy(dtype=float)
+    # Row i (with at least 253 rows up to it) compares price[i - 20] with price[i - 251].
+    base_lag, recent_lag = MOMENTUM_LOOKBACK_ROWS - 1, MOMENTUM_SKIP_ROWS - 1
+    base = price[MOMENTUM_LOOKBACK_ROWS - base_lag : len(price) - base_lag]
+    recent = price[MOMENTUM_LOOKBACK_ROWS - recent_lag : len(price) - recent_lag]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[MOMENTUM_LOOKBACK_ROWS:] = np.where(base > 0, recent / base - 1.0, np.nan)
+    return out
+
+
+def _quality_fail_rows(frame: pd.DataFrame) -> np.ndarray:
+    if "quality_gate_pass" in frame.columns:
+        return np.array([not bool(value) for value in frame["quality_gate_pass"].tolist()], dtype=bool)
+    if "quality_score" in frame.columns:
+        scores = [_float(value) for value in frame["quality_score"].tolist()]
+        return np.array([value is not None and value < QUALITY_SCORE_FLOOR for value in scores], dtype=bool)
+    return np.zeros(len(frame), dtype=bool)
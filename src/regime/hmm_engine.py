@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
+import hashlib
+import inspect
+import json
 import logging
+import multiprocessing
+import os
+from pathlib import Path
+import pickle
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
 
 import numpy as np
 import pandas as pd
@@ -14,6 +27,13 @@ from .logging_config import setup_regime_logging
 setup_regime_logging()
 logger = logging.getLogger(__name__)
 
+FEATURE_COLUMNS = ("return", "volatility", "trend", "volume_zscore", "vix_change", "yield_10y_change")
+_STATE_COLUMNS = ("hidden_state", "canonical_state", "regime", "state_probability")
+_FORWARD_COLUMNS = ("p_bull_day5", "p_neutral_day5", "p_bear_day5", "transition_risk")
+DEFAULT_REGIME_RESULT_CACHE_ENTRIES = int(os.getenv("REGIME_RESULT_CACHE_ENTRIES", "128"))
+REGIME_RESULT_CACHE_SCHEMA = "regime_result_cache.v1"
+DEFAULT_FIT_POOL_WORKERS = int(os.getenv("REGIME_FIT_POOL_WORKERS", str(max(1, min(8, os.cpu_count() or 1)))))
+
 
 STATE_META = {
     "Bull": {
@@ -260,6 +280,195 @@ def _fit_hmm_candidate(
     }
 
 
+def default_model_cache_dir() -> Path:
+    configured = os.getenv("HMM_DATA_DIR")
+    base = Path(configured).expanduser() if configured else Path(__file__).resolve().parents[2] / "data" / "regime"
+    return base / "models" / "hmm_fit_cache"
+
+
+class HMMModelCache:
+    """On-disk cache of fitted walk-forward HMM candidates.
+
+    Entries are keyed by ticker, refit window bounds, a hash of the scaled feature window and the
+    fit parameters, so re-running a walk-forward over unchanged data skips the refit entirely.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory).expanduser() if directory is not None else default_model_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        *,
+        ticker: str,
+        window: pd.DataFrame,
+        x_scaled: np.ndarray,
+        n_states: int,
+        covariance_type: str,
+        seed: int,
+        iterations: int,
+    ) -> str:
+        payload = {
+            "ticker": str(ticker or "").upper(),
+            "window_start": pd.Timestamp(window.index[0]).isoformat(),
+            "window_end": pd.Timestamp(window.index[-1]).isoformat(),
+            "feature_hash": hashlib.sha256(np.ascontiguousarray(x_scaled, dtype=float).tobytes()).hexdigest(),
+            "n_states": int(n_states),
+            "covariance_type": str(covariance_type or "diag"),
+            "seed": int(seed),
+            "iterations": int(iterations),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def load(self, key: str) -> dict[str, object] | None:
+        path = self._path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        try:
+            with path.open("rb") as handle:
+                candidate = pickle.load(handle)
+        except Exception as exc:
+            logger.warning("Discarding unreadable HMM cache entry %s: %s", path, exc)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return candidate if isinstance(candidate, dict) else None
+
+    def store(self, key: str, candidate: dict[str, object]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with temp_path.open("wb") as handle:
+                pickle.dump(candidate, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("Unable to write HMM cache entry %s: %s", path, exc)
+
+    def prune(self, max_age_days: float = 30.0) -> int:
+        """Delete entries not written within ``max_age_days``; returns the number removed."""
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - float(max_age_days) * 86_400.0
+        removed = 0
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def _refit_end_positions(training_window: int, total_rows: int, refit_step: int) -> list[int]:
+    """End positions at which the walk-forward loop refits; mirrors the serial refit rule."""
+    positions = list(range(int(training_window), int(total_rows) + 1, max(1, int(refit_step or 1))))
+    if positions and positions[-1] != int(total_rows):
+        positions.append(int(total_rows))
+    return positions
+
+
+def _candidate_score(candidate: dict[str, object]) -> float:
+    score = candidate.get("score")
+    return float(score) if isinstance(score, (int, float)) else 0.0
+
+
+def _fit_refit_candidates(
+    *,
+    ticker: str,
+    features: pd.DataFrame,
+    feature_cols: list[str],
+    refit_positions: list[int],
+    training_window: int,
+    macro_weighting: bool,
+    macro_weight: float,
+    n_states: int,
+    iterations: int,
+    random_state: int,
+    n_seeds: int,
+    covariance_type: str,
+    executor: Executor | None,
+    model_cache: HMMModelCache | None,
+) -> dict[int, tuple[StandardScaler, dict[str, object], list[pd.Series]]]:
+    """Fit every (refit window, seed) candidate, using the cache and executor when provided.
+
+    Refit windows are independent of each other, so they can be fitted in any order and the
+    walk-forward decode stitched together afterwards.  Only the best-scoring candidate per window
+    (earliest seed on ties) is kept, alongside every seed's canonical labels for the agreement check.
+    """
+    seeds = [int(random_state) + seed_index for seed_index in range(max(1, int(n_seeds or 1)))]
+    scalers: dict[int, StandardScaler] = {}
+    best: dict[int, tuple[float, int, dict[str, object]]] = {}
+    label_sets: dict[int, list[pd.Series]] = {}
+    pending: list[tuple[int, int, Future, str | None]] = []
+
+    def _keep(end_pos: int, seed_index: int, candidate: dict[str, object]) -> None:
+        labels = candidate.get("canonical_labels")
+        if isinstance(labels, pd.Series):
+            label_sets[end_pos].append(labels)
+        score = _candidate_score(candidate)
+        current = best.get(end_pos)
+        if current is None or (score, -seed_index) > (current[0], -current[1]):
+            best[end_pos] = (score, seed_index, candidate)
+
+    for end_pos in refit_positions:
+        window = features.iloc[end_pos - training_window : end_pos].copy()
+        scaler = StandardScaler()
+        x_scaled = scaler.fit_transform(window[feature_cols].to_numpy())
+        if macro_weighting:
+            x_scaled[:, 4:6] *= float(macro_weight)
+        scalers[end_pos] = scaler
+        label_sets[end_pos] = []
+        for seed_index, seed in enumerate(seeds):
+            key = (
+                HMMModelCache.key(
+                    ticker=ticker,
+                    window=window,
+                    x_scaled=x_scaled,
+                    n_states=n_states,
+                    covariance_type=covariance_type,
+                    seed=seed,
+                    iterations=iterations,
+                )
+                if model_cache is not None
+                else None
+            )
+            cached = model_cache.load(key) if model_cache is not None and key is not None else None
+            if cached is not None:
+                _keep(end_pos, seed_index, cached)
+                continue
+            fit_kwargs = {
+                "x_scaled": x_scaled,
+                "window": window,
+                "n_states": n_states,
+                "iterations": iterations,
+                "random_state": seed,
+                "covariance_type": covariance_type,
+            }
+            if executor is not None:
+                pending.append((end_pos, seed_index, executor.submit(_fit_hmm_candidate, **fit_kwargs), key))
+                continue
+            candidate = _fit_hmm_candidate(**fit_kwargs)
+            if model_cache is not None and key is not None:
+                model_cache.store(key, candidate)
+            _keep(end_pos, seed_index, candidate)
+
+    for end_pos, seed_index, future, key in pending:
+        candidate = future.result()
+        if model_cache is not None and key is not None:
+            model_cache.store(key, candidate)
+        _keep(end_pos, seed_index, candidate)
+    if model_cache is not None:
+        logger.debug("HMM model cache for %s hits=%d misses=%d", ticker, model_cache.hits, model_cache.misses)
+    return {end_pos: (scalers[end_pos], best[end_pos][2], label_sets[end_pos]) for end_pos in refit_positions}
+
+
 def _seed_agreement(canonical_label_sets: list[pd.Series], window: pd.DataFrame, refit_step: int) -> float:
     if len(canonical_label_sets) <= 1:
         return 1.0
@@ -290,7 +499,15 @@ def fit_regime_model(
     n_seeds: int = 1,
     seed_agreement_min: float = 0.8,
     covariance_type: str = "diag",
+    executor: Executor | None = None,
+    model_cache: HMMModelCache | str | Path | None = None,
 ) -> RegimeResult:
+    """Walk-forward fit and decode of the 3-state regime HMM.
+
+    ``executor`` fans the independent refit windows and seed candidates out (typically a
+    ``ProcessPoolExecutor``); ``model_cache`` (an ``HMMModelCache`` or its directory) reuses
+    previously fitted candidates for identical windows.  Both leave the decoded result unchanged.
+    """
     logger.info(
         "Fitting HMM for %s rows=%d lookback=%d training_window=%d refit_step=%d",
         ticker,
@@ -303,14 +520,7 @@ def fit_regime_model(
     if len(features) < training_window:
         raise InsufficientDataError(f"Insufficient history for walk-forward analysis. Need at least {training_window} feature rows.")
 
-    feature_cols = [
-        "return",
-        "volatility",
-        "trend",
-        "volume_zscore",
-        "vix_change",
-        "yield_10y_change",
-    ]
+    feature_cols = list(FEATURE_COLUMNS)
     hidden_states = pd.Series(index=features.index, dtype=float, name="hidden_state")
     canonical_states = pd.Series(index=features.index, dtype=float, name="canonical_state")
     regime_labels = pd.Series(index=features.index, dtype=object, name="regime")
@@ -327,45 +537,32 @@ def fit_regime_model(
     latest_state_statistics: pd.DataFrame | None = None
     latest_posteriors: np.ndarray | None = None
     latest_seed_agreement = 1.0
-    last_refit_end_pos: int | None = None
+
+    cache = HMMModelCache(model_cache) if isinstance(model_cache, (str, Path)) else model_cache
+    refits = _fit_refit_candidates(
+        ticker=ticker,
+        features=features,
+        feature_cols=feature_cols,
+        refit_positions=_refit_end_positions(training_window, len(features), refit_step),
+        training_window=training_window,
+        macro_weighting=macro_weighting,
+        macro_weight=macro_weight,
+        n_states=n_states,
+        iterations=iterations,
+        random_state=random_state,
+        n_seeds=n_seeds,
+        covariance_type=covariance_type,
+        executor=executor,
+        model_cache=cache,
+    )
 
     for end_pos in range(training_window, len(features) + 1):
         window = features.iloc[end_pos - training_window : end_pos].copy()
-        should_refit = (
-            latest_model is None
-            or last_refit_end_pos is None
-            or (end_pos - last_refit_end_pos) >= refit_step
-            or end_pos == len(features)
-        )
         X_window = window[feature_cols].to_numpy()
 
-        if should_refit:
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X_window)
-            if macro_weighting:
-                X_scaled[:, 4:6] *= float(macro_weight)
-
-            candidates = [
-                _fit_hmm_candidate(
-                    x_scaled=X_scaled,
-                    window=window,
-                    n_states=n_states,
-                    iterations=iterations,
-                    random_state=int(random_state) + seed_index,
-                    covariance_type=covariance_type,
-                )
-                for seed_index in range(max(1, int(n_seeds or 1)))
-            ]
-            agreement = _seed_agreement(
-                [candidate["canonical_labels"] for candidate in candidates if isinstance(candidate.get("canonical_labels"), pd.Series)],
-                window,
-                refit_step,
-            )
-            def _candidate_score(item: dict[str, object]) -> float:
-                score = item.get("score")
-                return float(score) if isinstance(score, (int, float)) else 0.0
-
-            best = max(candidates, key=_candidate_score)
+        if end_pos in refits:
+            scaler, best, label_sets = refits[end_pos]
+            agreement = _seed_agreement(label_sets, window, refit_step)
             model = best["model"]
             assert isinstance(model, GaussianHMM)
             decoded_window = best["decoded_window"]
@@ -393,7 +590,6 @@ def fit_regime_model(
             latest_state_statistics = state_statistics
             latest_posteriors = posteriors
             latest_seed_agreement = float(agreement)
-            last_refit_end_pos = end_pos
         else:
             assert latest_model is not None
             assert latest_scaler is not None
@@ -416,15 +612,11 @@ def fit_regime_model(
         state_probabilities.loc[current_index] = float(posteriors[-1, current_hidden_state])
         if record_forward_probabilities:
             active_model = latest_model if latest_model is not None else model
-            transition = _canonical_transition_matrix(active_model, canonical_state_map)
-            vector = _canonical_state_vector(posteriors[-1], canonical_state_map)
-            day5 = vector @ np.linalg.matrix_power(transition, 5)
-            p_bull_day5.loc[current_index] = float(day5[0])
-            p_neutral_day5.loc[current_index] = float(day5[1])
-            p_bear_day5.loc[current_index] = float(day5[2])
-            current_state_id = int(canonical_state_map[current_hidden_state])
-            stay_probability = float(transition[current_state_id, current_state_id])
-            transition_risks.loc[current_index] = max(0.0, min(1.0, 1.0 - stay_probability))
+            bull, neutral, bear, risk = _forward_probabilities(active_model, canonical_state_map, posteriors[-1], current_hidden_state)
+            p_bull_day5.loc[current_index] = bull
+            p_neutral_day5.loc[current_index] = neutral
+            p_bear_day5.loc[current_index] = bear
+            transition_risks.loc[current_index] = risk
 
     if (
         latest_model is None
@@ -446,6 +638,54 @@ def fit_regime_model(
         result_frame["p_neutral_day5"] = p_neutral_day5.loc[result_frame.index].astype(float)
         result_frame["p_bear_day5"] = p_bear_day5.loc[result_frame.index].astype(float)
         result_frame["transition_risk"] = transition_risks.loc[result_frame.index].astype(float)
+    return _assemble_regime_result(
+        ticker=ticker,
+        features=features,
+        result_frame=result_frame,
+        latest_model=latest_model,
+        latest_scaler=latest_scaler,
+        latest_state_map=latest_state_map,
+        latest_canonical_state_map=latest_canonical_state_map,
+        latest_state_statistics=latest_state_statistics,
+        latest_posterior=latest_posteriors[-1],
+        latest_seed_agreement=latest_seed_agreement,
+        seed_agreement_min=seed_agreement_min,
+        record_forward_probabilities=record_forward_probabilities,
+    )
+
+
+def _forward_probabilities(
+    model: GaussianHMM,
+    canonical_state_map: dict[int, int],
+    posterior: np.ndarray,
+    hidden_state: int,
+) -> tuple[float, float, float, float]:
+    """Day-5 canonical (bull, neutral, bear) probabilities and the one-step transition risk."""
+    transition = _canonical_transition_matrix(model, canonical_state_map)
+    vector = _canonical_state_vector(posterior, canonical_state_map)
+    day5 = vector @ np.linalg.matrix_power(transition, 5)
+    current_state_id = int(canonical_state_map[hidden_state])
+    stay_probability = float(transition[current_state_id, current_state_id])
+    return float(day5[0]), float(day5[1]), float(day5[2]), max(0.0, min(1.0, 1.0 - stay_probability))
+
+
+def _assemble_regime_result(
+    *,
+    ticker: str,
+    features: pd.DataFrame,
+    result_frame: pd.DataFrame,
+    latest_model: GaussianHMM,
+    latest_scaler: StandardScaler,
+    latest_state_map: dict[int, str],
+    latest_canonical_state_map: dict[int, int],
+    latest_state_statistics: pd.DataFrame,
+    latest_posterior: np.ndarray,
+    latest_seed_agreement: float,
+    seed_agreement_min: float,
+    record_forward_probabilities: bool,
+) -> RegimeResult:
+    """Derive the latest-state summary fields from a decoded walk-forward ``result_frame``."""
+    if record_forward_probabilities:
         regime_day_values: list[int] = []
         active_label: str | None = None
         active_count = 0
@@ -466,9 +706,8 @@ def fit_regime_model(
     latest_probability = float(result_frame["state_probability"].iloc[-1])
     latest_price = float(features["price"].iloc[-1])
     latest_state_vector = np.zeros(3, dtype=float)
-    last_hidden_posterior = latest_posteriors[-1]
     for hidden_state, canonical_state in latest_canonical_state_map.items():
-        latest_state_vector[canonical_state] = float(last_hidden_posterior[hidden_state])
+        latest_state_vector[canonical_state] = float(latest_posterior[hidden_state])
     transition_matrix = _canonical_transition_matrix(latest_model, latest_canonical_state_map)
     stay_probability = float(transition_matrix[latest_state_id, latest_state_id])
     # Capped at 999 trading days (~4 years); effectively permanent regime.
@@ -584,3 +823,377 @@ def fit_regime_model_weekly(
             seed_agreement_min=seed_agreement_min,
             covariance_type=covariance_type,
         )
+
+
+def extend_regime_result(
+    result: RegimeResult,
+    market_frame: pd.DataFrame,
+    *,
+    lookback_window: int = 20,
+    training_window: int = 504,
+    macro_weighting: bool = False,
+    macro_weight: float = 1.5,
+    seed_agreement_min: float = 0.8,
+    record_forward_probabilities: bool = False,
+) -> RegimeResult | None:
+    """Forward-decode bars appended after ``result`` with its latest model instead of refitting.
+
+    Mirrors the between-refit branch of the walk-forward loop.  Returns ``None`` when the frame
+    does not extend the result or lacks a full training window ahead of the new bars.
+    """
+    features = build_features(market_frame, lookback_window=lookback_window)
+    last_index = result.price_frame.index[-1]
+    if last_index not in features.index:
+        return None
+    start = int(features.index.get_loc(last_index)) + 1
+    if start >= len(features) or start < training_window:
+        return None
+    columns = [*features.columns, *_STATE_COLUMNS, *(_FORWARD_COLUMNS if record_forward_probabilities else ())]
+    if any(column not in result.price_frame.columns for column in columns):
+        return None
+    values = features[list(FEATURE_COLUMNS)].to_numpy()
+    rows: list[dict[str, object]] = []
+    posteriors = np.empty((0, 0))
+    for end_pos in range(start + 1, len(features) + 1):
+        x_scaled = result.scaler.transform(values[end_pos - training_window : end_pos])
+        if macro_weighting:
+            x_scaled[:, 4:6] *= float(macro_weight)
+        hidden_state = int(result.model.predict(x_scaled)[-1])
+        posteriors = result.model.predict_proba(x_scaled)
+        row: dict[str, object] = {
+            "hidden_state": hidden_state,
+            "canonical_state": int(result.canonical_state_map[hidden_state]),
+            "regime": result.state_map[hidden_state],
+            "state_probability": float(posteriors[-1, hidden_state]),
+        }
+        if record_forward_probabilities:
+            row.update(zip(_FORWARD_COLUMNS, _forward_probabilities(result.model, result.canonical_state_map, posteriors[-1], hidden_state)))
+        rows.append(row)
+    appended = features.iloc[start:].join(pd.DataFrame(rows, index=features.index[start:]))
+    history = result.price_frame.loc[result.price_frame.index >= features.index[training_window - 1], columns]
+    return _assemble_regime_result(
+        ticker=result.ticker,
+        features=features,
+        result_frame=pd.concat([history, appended[columns]]),
+        latest_model=result.model,
+        latest_scaler=result.scaler,
+        latest_state_map=result.state_map,
+        latest_canonical_state_map=result.canonical_state_map,
+        latest_state_statistics=result.state_statistics,
+        latest_posterior=posteriors[-1],
+        latest_seed_agreement=result.seed_agreement,
+        seed_agreement_min=seed_agreement_min,
+        record_forward_probabilities=record_forward_probabilities,
+    )
+
+
+_FIT_PARAMETER_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(fit_regime_model).parameters.items()
+    if name not in {"ticker", "market_frame", "executor", "model_cache"}
+}
+_FINGERPRINT_COLUMNS = ("price", "high", "low", "volume", "vix", "yield_10y")
+
+
+def default_result_cache_dir() -> Path:
+    return default_model_cache_dir().parent / "regime_result_cache"
+
+
+class RegimeResultCache:
+    """Shared cache of fitted ``RegimeResult``s: a bounded in-memory LRU over an on-disk tier.
+
+    Entries are keyed by ticker, the fit parameters and a fingerprint of the frame's first bar and
+    last ``fingerprint_bars`` bars, so callers fitting the same (ticker, period) frame share one
+    fit.  When a frame only appends bars to the latest cached fit and fewer than ``refit_step``
+    bars have passed since its last refit, the cached model forward-decodes the new bars.
+    Every call returns its own copy, so callers may mutate the result without touching the cache.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        max_entries: int = DEFAULT_REGIME_RESULT_CACHE_ENTRIES,
+        fingerprint_bars: int = 64,
+    ) -> None:
+        self.directory = Path(directory).expanduser() if directory is not None else default_result_cache_dir()
+        self.max_entries = int(max_entries)
+        self.fingerprint_bars = max(1, int(fingerprint_bars))
+        self.hits = 0
+        self.misses = 0
+        self.incremental = 0
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._latest: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @staticmethod
+    def params_key(ticker: str, fit_params: dict[str, Any]) -> str:
+        unknown = set(fit_params) - set(_FIT_PARAMETER_DEFAULTS)
+        if unknown:
+            raise TypeError(f"Unexpected fit_regime_model arguments: {', '.join(sorted(unknown))}")
+        payload = {"ticker": str(ticker or "").upper(), **_FIT_PARAMETER_DEFAULTS, **fit_params}
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def frame_fingerprint(self, market_frame: pd.DataFrame) -> str:
+        digest = hashlib.sha256()
+        if len(market_frame):
+            digest.update(pd.Timestamp(market_frame.index[0]).isoformat().encode("utf-8"))
+        tail = market_frame.tail(self.fingerprint_bars)
+        digest.update(np.asarray(pd.DatetimeIndex(tail.index).asi8).tobytes())
+        for column in _FINGERPRINT_COLUMNS:
+            if column in tail.columns:
+                digest.update(column.encode("utf-8"))
+                digest.update(np.ascontiguousarray(tail[column].to_numpy(dtype=float)).tobytes())
+        return digest.hexdigest()
+
+    def last_outcome(self) -> str | None:
+        """``"hit"``, ``"incremental"`` or ``"miss"`` for the latest ``fit`` on this thread."""
+        return getattr(self._local, "outcome", None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "incremental": self.incremental,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
+
+    def fit(
+        self,
+        ticker: str,
+        market_frame: pd.DataFrame,
+        *,
+        executor: Executor | None = None,
+        model_cache: HMMModelCache | str | Path | None = None,
+        **fit_params: Any,
+    ) -> RegimeResult:
+        params_key = self.params_key(ticker, fit_params)
+        key = f"{params_key[:32]}{self.frame_fingerprint(market_frame)[:32]}"
+        entry = self._load(key)
+        if entry is not None:
+            self._record("hit")
+            return copy.deepcopy(entry["result"])
+        settings = {**_FIT_PARAMETER_DEFAULTS, **fit_params}
+        result: RegimeResult | None = None
+        bars_since_refit = 0
+        previous = self._load(self._latest.get(params_key) or self._read_latest(params_key))
+        added = self._appended_bars(previous, market_frame) if previous is not None else 0
+        if previous is not None and 0 < added and int(previous["bars_since_refit"]) + added < int(settings["refit_step"]):
+            result = extend_regime_result(
+                previous["result"],
+                market_frame,
+                lookback_window=settings["lookback_window"],
+                training_window=settings["training_window"],
+                macro_weighting=settings["macro_weighting"],
+                macro_weight=settings["macro_weight"],
+                seed_agreement_min=settings["seed_agreement_min"],
+                record_forward_probabilities=settings["record_forward_probabilities"],
+            )
+            bars_since_refit = int(previous["bars_since_refit"]) + added
+        if result is None:
+            result = fit_regime_model(ticker, market_frame, executor=executor, model_cache=model_cache, **fit_params)
+            bars_since_refit = 0
+            self._record("miss")
+        else:
+            self._record("incremental")
+        self._store(
+            key,
+            params_key,
+            {
+                "schema": REGIME_RESULT_CACHE_SCHEMA,
+                "result": result,
+                "bars_since_refit": bars_since_refit,
+                "tail": market_frame.tail(self.fingerprint_bars).copy(),
+            },
+        )
+        return copy.deepcopy(result)
+
+    def prune(self, max_age_days: float = 30.0) -> int:
+        """Delete on-disk entries not written within ``max_age_days``; returns the number removed."""
+        if not self.directory.exists():
+            return 0
+        cutoff = time.time() - float(max_age_days) * 86_400.0
+        removed = 0
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _record(self, outcome: str) -> None:
+        self._local.outcome = outcome
+        with self._lock:
+            if outcome == "hit":
+                self.hits += 1
+            elif outcome == "incremental":
+                self.incremental += 1
+            else:
+                self.misses += 1
+
+    def _appended_bars(self, previous: dict[str, Any], market_frame: pd.DataFrame) -> int:
+        """Bars ``market_frame`` adds after the cached fit, or 0 when the shared history was restated."""
+        tail = previous.get("tail")
+        if not isinstance(tail, pd.DataFrame) or tail.empty or not len(market_frame):
+            return 0
+        last_date = tail.index[-1]
+        if last_date not in market_frame.index or not tail.index.isin(market_frame.index).all():
+            return 0
+        overlap = market_frame.loc[tail.index]
+        for column in _FINGERPRINT_COLUMNS:
+            if column in tail.columns and (
+                column not in overlap.columns
+                or not np.allclose(tail[column].to_numpy(dtype=float), overlap[column].to_numpy(dtype=float), equal_nan=True)
+            ):
+                return 0
+        return int((market_frame.index > last_date).sum())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    def _latest_path(self, params_key: str) -> Path:
+        return self.directory / "latest" / f"{params_key}.txt"
+
+    def _read_latest(self, params_key: str) -> str | None:
+        try:
+            return self._latest_path(params_key).read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def _load(self, key: str | None) -> dict[str, Any] | None:
+        if not key:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                entry = pickle.load(handle)
+        except Exception as exc:
+            logger.warning("Discarding unreadable regime result cache entry %s: %s", path, exc)
+            return None
+        if not isinstance(entry, dict) or entry.get("schema") != REGIME_RESULT_CACHE_SCHEMA:
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _store(self, key: str, params_key: str, entry: dict[str, Any]) -> None:
+        self._remember(key, entry)
+        with self._lock:
+            self._latest[params_key] = key
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(suffix)
+            with temp_path.open("wb") as handle:
+                pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            latest_path = self._latest_path(params_key)
+            latest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_latest = latest_path.with_suffix(suffix)
+            temp_latest.write_text(key, encoding="utf-8")
+            os.replace(temp_latest, latest_path)
+        except (OSError, pickle.PicklingError) as exc:
+            logger.warning("Unable to write regime result cache entry %s: %s", key, exc)
+
+
+_REGIME_RESULT_CACHE: RegimeResultCache | None = None
+_REGIME_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def get_regime_result_cache() -> RegimeResultCache:
+    """Process-wide cache, rebuilt when ``HMM_DATA_DIR`` points somewhere new."""
+    global _REGIME_RESULT_CACHE
+    directory = default_result_cache_dir()
+    with _REGIME_RESULT_CACHE_LOCK:
+        if _REGIME_RESULT_CACHE is None or _REGIME_RESULT_CACHE.directory != directory:
+            _REGIME_RESULT_CACHE = RegimeResultCache(directory)
+        return _REGIME_RESULT_CACHE
+
+
+def fit_regime_model_cached(ticker: str, market_frame: pd.DataFrame, **kwargs: Any) -> RegimeResult:
+    """``fit_regime_model`` through the process-wide ``RegimeResultCache``."""
+    return get_regime_result_cache().fit(ticker, market_frame, **kwargs)
+
+
+_FIT_EXECUTOR: ProcessPoolExecutor | None = None
+_FIT_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_fit_executor() -> ProcessPoolExecutor:
+    """Process-wide pool for CPU-bound regime fits, created once and reused across jobs.
+
+    Workers start from a forkserver (spawn where unavailable), so they never inherit the threads
+    and locks of a threaded caller such as the web server.  A pool broken by a dead worker is
+    replaced on the next call.
+    """
+    global _FIT_EXECUTOR
+    with _FIT_EXECUTOR_LOCK:
+        if _FIT_EXECUTOR is None or getattr(_FIT_EXECUTOR, "_broken", False):
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _FIT_EXECUTOR = ProcessPoolExecutor(
+                max_workers=max(1, DEFAULT_FIT_POOL_WORKERS),
+                mp_context=multiprocessing.get_context(start_method),
+            )
+        return _FIT_EXECUTOR
+
+
+def fit_pool_size() -> int:
+    """Worker count of the ``get_fit_executor`` pool."""
+    return max(1, DEFAULT_FIT_POOL_WORKERS)
+
+
+def refit_executor() -> ProcessPoolExecutor | None:
+    """The shared fit pool for fanning one model's refit windows out, or ``None`` when it cannot help.
+
+    Returns ``None`` with a single-worker pool and inside worker processes, so a fit that already
+    runs as a pool task never starts a nested pool.
+    """
+    if fit_pool_size() <= 1 or multiprocessing.parent_process() is not None:
+        return None
+    return get_fit_executor()
+
+
+def bounded_completions(
+    executor: Executor, fn: Callable[..., Any], calls: Iterable[tuple[Any, ...]], *, limit: int
+) -> Iterator[tuple[int, Future]]:
+    """Run ``fn(*args)`` per argument tuple with at most ``limit`` calls in flight on ``executor``.
+
+    Yields ``(position, future)`` as calls complete, so a caller can cap its share of the shared
+    fit pool without owning a pool of its own.
+    """
+    queued = enumerate(calls)
+    pending: dict[Future, int] = {}
+
+    def _fill() -> None:
+        while len(pending) < max(1, int(limit)):
+            item = next(queued, None)
+            if item is None:
+                return
+            position, args = item
+            pending[executor.submit(fn, *args)] = position
+
+    _fill()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+        _fill()
@@ -4,11 +4,13 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 import logging
 from pathlib import Path
 from dataclasses import asdict, is_dataclass
-from typing import Any
+from typing import Any, Iterator
 
 from ..exceptions import DataValidationError, DuplicateThemeError, PersistenceError
 from ..logging_config import setup_regime_logging
@@ -169,16 +171,113 @@ _ORDER_AUDIT_EVENT_TYPES = (
 )
 
 
-def _connect() -> sqlite3.Connection:
+_BUSY_TIMEOUT_MS = 5000
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+)
+
+_POOL = threading.local()
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Per-thread SQLite connection reused across persistence helpers.
+
+    ``with conn:`` still commits or rolls back like a plain connection, except inside
+    :func:`transaction`, where the outermost block owns the single commit.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_depth = 0
+        self.closed = False
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.batch_depth:
+            return False
+        return super().__exit__(exc_type, exc, tb)
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def _pool_key() -> tuple[str, int] | None:
+    try:
+        return str(DB_PATH), os.stat(DB_PATH).st_ino
+    except OSError:
+        return None
+
+
+def _open_connection() -> _PooledConnection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, timeout=_BUSY_TIMEOUT_MS / 1000, factory=_PooledConnection)
     except sqlite3.Error as exc:
         logger.warning("Unable to open persistence database at %s", DB_PATH, exc_info=exc)
         raise PersistenceError(f"Unable to open persistence database at {DB_PATH}") from exc
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     from . import schema
 
-    schema.initialize_schema(conn)
+    if int(conn.execute("PRAGMA user_version").fetchone()[0]) < schema.SCHEMA_VERSION:
+        schema.initialize_schema(conn)
+        conn.execute(f"PRAGMA user_version = {schema.SCHEMA_VERSION}")
+    schema.seed_theme_defaults(conn)
+    conn.commit()
     return conn
+
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's pooled connection to ``DB_PATH``, opening it on first use.
+
+    The pool holds one connection per thread and is re-keyed whenever ``DB_PATH`` moves or
+    the file is replaced.  Schema DDL only runs when the database's ``user_version`` is
+    older than :data:`schema.SCHEMA_VERSION`; the idempotent theme-default seed runs every
+    time a pooled connection is opened.
+    """
+
+    key = _pool_key()
+    cached = getattr(_POOL, "entry", None)
+    if cached is not None and key is not None and cached[0] == key and not cached[1].closed:
+        return cached[1]
+    if cached is not None and not cached[1].closed and not cached[1].batch_depth:
+        cached[1].close()
+    conn = _open_connection()
+    _POOL.entry = (_pool_key(), conn)
+    return conn
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Group persistence writes on this thread into one commit.
+
+    Helpers called inside the block share the pooled connection and defer their own
+    commits; the outermost block commits on success and rolls back on error.
+    """
+
+    conn = _connect()
+    conn.batch_depth += 1
+    try:
+        yield conn
+    except BaseException:
+        conn.batch_depth -= 1
+        if not conn.batch_depth:
+            conn.rollback()
+        raise
+    conn.batch_depth -= 1
+    if not conn.batch_depth:
+        conn.commit()
+
+
+def close_connection() -> None:
+    """Close this thread's pooled connection, if any."""
+
+    cached = getattr(_POOL, "entry", None)
+    _POOL.entry = None
+    if cached is not None and not cached[1].closed:
+        cached[1].close()
@@ -12,6 +12,7 @@ _PAPER_PORTFOLIO_COLUMNS = core._PAPER_PORTFOLIO_COLUMNS
 _PAPER_TRADE_PLAN_COLUMNS = core._PAPER_TRADE_PLAN_COLUMNS
 _SIGNAL_SNAPSHOT_COLUMNS = core._SIGNAL_SNAPSHOT_COLUMNS
 ALERT_TYPES = core.ALERT_TYPES
+SCHEMA_VERSION = 1
 _ORDER_AUDIT_EVENT_TYPES = core._ORDER_AUDIT_EVENT_TYPES
 
 def _ensure_column(conn: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
@@ -504,6 +505,11 @@ def _migrate_legacy_theses(conn: sqlite3.Connection) -> None:
 
 
 def initialize_schema(conn: sqlite3.Connection) -> None:
+    """Create and migrate every persistence table.
+
+    ``core._connect`` only calls this when the database's ``user_version`` is below
+    :data:`SCHEMA_VERSION`, so bump the version alongside any DDL change here.
+    """
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS ticker_thesis (
@@ -863,6 +869,10 @@ def initialize_schema(conn: sqlite3.Connection) -> None:
     _migrate_audit_event_type_check(conn)
     _migrate_alert_log_type_check(conn)
     _migrate_legacy_theses(conn)
+    seed_theme_defaults(conn)
+
+
+def seed_theme_defaults(conn: sqlite3.Connection) -> None:
     conn.execute(
         """
         UPDATE investment_theme
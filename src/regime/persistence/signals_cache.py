@@ -9,7 +9,7 @@ from typing import Any
 from dataclasses import asdict, is_dataclass
 
 from ..exceptions import DataValidationError, DuplicateThemeError, PersistenceError
-from . import core
+from . import core, schema
 
 logger = core.logger
 DEFAULT_OPERATING_MODE = core.DEFAULT_OPERATING_MODE
@@ -100,6 +100,7 @@ def create_theme(name: str, narrative: str = "", conviction: int = 3, status: st
                 raise DuplicateThemeError(f"A theme named '{name.strip()}' already exists.") from exc
             raise
         theme_id = int(cursor.lastrowid)
+        schema.seed_theme_defaults(conn)
     return get_theme(theme_id) or {}
 
 
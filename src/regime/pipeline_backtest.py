@@ -4,10 +4,11 @@ import datetime as dt
 import json
 import logging
 import math
+from concurrent.futures import Executor
 from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 import numpy as np
 import pandas as pd
@@ -15,7 +16,7 @@ import pandas as pd
 from .config import DEFAULT_SIGNAL_THRESHOLDS, SignalThresholds
 from .data import download_market_frame
 from .exceptions import InsufficientDataError
-from .hmm_engine import build_features, fit_regime_model
+from .hmm_engine import FEATURE_COLUMNS, build_features, fit_regime_model, refit_executor
 from .hurdle_rate import (
     DEFAULT_ESTIMATED_STCG_RATE,
     DEFAULT_MIN_NET_RETURN_PCT,
@@ -89,11 +90,13 @@ class PipelineBacktestConfig:
     hmm_n_seeds: int = 1
     seed_agreement_min: float = 0.8
     hmm_covariance_type: str = "diag"
+    hmm_model_cache_dir: str | None = None
     oos_start: str | None = None
     risk_free_rate: float = 0.0
     signal_thresholds: SignalThresholds = field(default_factory=lambda: DEFAULT_SIGNAL_THRESHOLDS)
     composite_adjustments_enabled: bool = True
     enforce_universe_screen: bool = True
+    incremental_signals: bool = False
 
 
 @dataclass(frozen=True)
@@ -379,9 +382,10 @@ def pure_check_duration_gate(
 
 
 class _ProductionSignalProvider:
-    def __init__(self) -> None:
+    def __init__(self, fit_executor: Executor | None = None) -> None:
         self._latest_result: Any | None = None
         self._last_refit_idx: int | None = None
+        self._fit_executor = fit_executor
 
     def __call__(
         self,
@@ -391,6 +395,24 @@ class _ProductionSignalProvider:
         config: PipelineBacktestConfig,
         previous_regime: str | None,
     ) -> PipelineSignal | None:
+        result = self.regime_result(ticker, date, history, config)
+        if result is None:
+            return None
+        return _signal_from_regime_result(ticker, result, history, previous_regime, config)
+
+    def regime_result(
+        self,
+        ticker: str,
+        date: pd.Timestamp,
+        history: pd.DataFrame,
+        config: PipelineBacktestConfig,
+    ) -> Any | None:
+        """Return the walk-forward regime decode for the last bar of ``history``.
+
+        The decode depends only on the HMM settings of ``config``, never on signal
+        thresholds or gates, so sweeps can record it once and replay it per combo.
+        """
+
         del date
         try:
             features = build_features(history, lookback_window=config.lookback_window)
@@ -419,68 +441,338 @@ class _ProductionSignalProvider:
                 n_seeds=config.hmm_n_seeds,
                 seed_agreement_min=config.seed_agreement_min,
                 covariance_type=config.hmm_covariance_type,
+                executor=self._fit_executor,
+                model_cache=config.hmm_model_cache_dir,
             )
             self._latest_result = result
             self._last_refit_idx = current_idx
         else:
             result = self._decode_latest(ticker, history, config)
-        return _signal_from_regime_result(ticker, result, history, previous_regime, config)
+        return result
 
     def _decode_latest(self, ticker: str, history: pd.DataFrame, config: PipelineBacktestConfig) -> Any:
         if self._latest_result is None:
             raise InsufficientDataError("No fitted model is available for cached decode.")
-        base = self._latest_result
         features = build_features(history, lookback_window=config.lookback_window)
-        window = features.iloc[-int(config.training_window) :].copy()
-        feature_cols = ["return", "volatility", "trend", "volume_zscore", "vix_change", "yield_10y_change"]
-        scaled = base.scaler.transform(window[feature_cols].to_numpy())
-        if config.macro_weighting:
-            scaled[:, 4:6] *= float(config.macro_weight)
-        decoded = pd.Series(base.model.predict(scaled), index=window.index)
-        posteriors = base.model.predict_proba(scaled)
-        hidden = int(decoded.iloc[-1])
-        label = base.state_map[hidden]
-        state_id = int(base.canonical_state_map[hidden])
-        vector = np.zeros(3, dtype=float)
-        for hidden_state, canonical_state in base.canonical_state_map.items():
-            vector[int(canonical_state)] = float(posteriors[-1, int(hidden_state)])
-        transition = np.zeros((3, 3), dtype=float)
-        for from_hidden, from_canonical in base.canonical_state_map.items():
-            for to_hidden, to_canonical in base.canonical_state_map.items():
-                transition[int(from_canonical), int(to_canonical)] = float(base.model.transmat_[int(from_hidden), int(to_hidden)])
-        stay = float(transition[state_id, state_id])
-        expected_duration = 999.0 if stay >= 0.999999 else min(999.0, 1.0 / max(1e-9, 1.0 - stay))
-        regime_days = 0
-        for item in decoded.iloc[::-1]:
-            if base.state_map[int(item)] != label:
-                break
-            regime_days += 1
-        recent = window.tail(20).assign(hidden_state=decoded.tail(20).to_numpy())
-        mean_return = recent.loc[recent["hidden_state"] == hidden, "return"].mean()
+        return _decode_window(ticker, self._latest_result, features.iloc[-int(config.training_window) :].copy(), config)
+
+
+def _scale_decode_features(base: Any, features: pd.DataFrame, config: PipelineBacktestConfig) -> np.ndarray:
+    scaled = base.scaler.transform(features[list(FEATURE_COLUMNS)].to_numpy())
+    if config.macro_weighting:
+        scaled[:, 4:6] *= float(config.macro_weight)
+    return scaled
+
+
+def _decode_window(
+    ticker: str,
+    base: Any,
+    window: pd.DataFrame,
+    config: PipelineBacktestConfig,
+    scaled: np.ndarray | None = None,
+) -> Any:
+    """Decode the last bar of a ``training_window`` feature window with an already fitted model.
+
+    ``scaled`` may carry the window's rows already scaled by ``base``; the decode itself is a
+    full Viterbi and posterior pass over the window either way.
+    """
+
+    if scaled is None:
+        scaled = _scale_decode_features(base, window, config)
+    decoded = pd.Series(base.model.predict(scaled), index=window.index)
+    posteriors = base.model.predict_proba(scaled)
+    hidden = int(decoded.iloc[-1])
+    label = base.state_map[hidden]
+    state_id = int(base.canonical_state_map[hidden])
+    vector = np.zeros(3, dtype=float)
+    for hidden_state, canonical_state in base.canonical_state_map.items():
+        vector[int(canonical_state)] = float(posteriors[-1, int(hidden_state)])
+    transition = np.zeros((3, 3), dtype=float)
+    for from_hidden, from_canonical in base.canonical_state_map.items():
+        for to_hidden, to_canonical in base.canonical_state_map.items():
+            transition[int(from_canonical), int(to_canonical)] = float(base.model.transmat_[int(from_hidden), int(to_hidden)])
+    stay = float(transition[state_id, state_id])
+    expected_duration = 999.0 if stay >= 0.999999 else min(999.0, 1.0 / max(1e-9, 1.0 - stay))
+    regime_days = 0
+    for item in decoded.iloc[::-1]:
+        if base.state_map[int(item)] != label:
+            break
+        regime_days += 1
+    recent = window.tail(20).assign(hidden_state=decoded.tail(20).to_numpy())
+    mean_return = recent.loc[recent["hidden_state"] == hidden, "return"].mean()
+    return SimpleNamespace(
+        ticker=ticker,
+        latest_label=label,
+        latest_state_id=state_id,
+        latest_probability=float(posteriors[-1, hidden]),
+        latest_price=float(window["price"].iloc[-1]),
+        latest_state_vector=vector,
+        transition_matrix=transition,
+        expected_regime_duration=expected_duration,
+        transition_risk=max(0.0, min(1.0, 1.0 - stay)),
+        regime_days=max(1, regime_days),
+        recent_state_mean_return=float(mean_return) if pd.notna(mean_return) else None,
+        empirical_duration_quantiles=getattr(base, "empirical_duration_quantiles", None),
+        seed_agreement=float(getattr(base, "seed_agreement", 1.0) or 1.0),
+        regime_ambiguous=bool(getattr(base, "regime_ambiguous", False)),
+    )
+
+
+class _IncrementalSignalProvider(_ProductionSignalProvider):
+    """Production-equivalent provider that builds features and technicals once per frame.
+
+    Refits go through ``fit_regime_model`` exactly like ``_ProductionSignalProvider``.  Between
+    refits each bar decodes the sliding ``training_window`` slice of the precomputed features,
+    scaled once per refit, with the cached model.  This drops the per-bar ``build_features`` pass
+    over the whole history and the per-bar scaling, but the decode is still the same
+    ``_decode_window`` Viterbi and posterior pass, so per-bar cost stays O(training_window) and
+    the saving is a constant factor.  Feature rows only depend on past bars, so the slice is
+    identical to the features rebuilt from ``history`` and the result matches the production
+    provider exactly.
+    """
+
+    def __init__(self, frame: pd.DataFrame, config: PipelineBacktestConfig, fit_executor: Executor | None = None) -> None:
+        super().__init__(fit_executor)
+        self._frame_index = pd.DatetimeIndex(frame.index)
+        self._min_feature_rows = max(120, int(config.lookback_window) * 4)
+        self._scaled_features: np.ndarray | None = None
+        try:
+            self._features: pd.DataFrame | None = build_features(frame, lookback_window=config.lookback_window)
+        except InsufficientDataError:
+            self._features = None
+        # Technical overlays only read the last two complete rows, so keep those rows pre-filtered.
+        technicals = compute_technicals(frame["price"], frame["volume"], frame["high"], frame["low"])
+        self._complete_technicals = technicals.dropna()
+        self._complete_technical_positions = self._frame_index.get_indexer(self._complete_technicals.index)
+
+    def __call__(
+        self,
+        ticker: str,
+        date: pd.Timestamp,
+        history: pd.DataFrame,
+        config: PipelineBacktestConfig,
+        previous_regime: str | None,
+    ) -> PipelineSignal | None:
+        if not self._covers(date, history):
+            return super().__call__(ticker, date, history, config, previous_regime)
+        result = self.regime_result(ticker, date, history, config)
+        if result is None:
+            return None
+        complete_rows = int(np.searchsorted(self._complete_technical_positions, len(history) - 1, side="right"))
+        technicals = self._complete_technicals.iloc[max(0, complete_rows - 2) : complete_rows]
+        return _signal_from_regime_result(ticker, result, history, previous_regime, config, technicals=technicals)
+
+    def _covers(self, date: pd.Timestamp, history: pd.DataFrame) -> bool:
+        return (
+            self._features is not None
+            and len(history) <= len(self._frame_index)
+            and self._frame_index[len(history) - 1] == pd.Timestamp(date)
+        )
+
+    def regime_result(
+        self,
+        ticker: str,
+        date: pd.Timestamp,
+        history: pd.DataFrame,
+        config: PipelineBacktestConfig,
+    ) -> Any | None:
+        features = self._features
+        if features is None or not self._covers(date, history):
+            return super().regime_result(ticker, date, history, config)
+        current_idx = int(features.index.searchsorted(pd.Timestamp(date), side="right"))
+        if current_idx < self._min_feature_rows or current_idx < int(config.training_window):
+            return None
+        should_refit = (
+            self._latest_result is None
+            or self._last_refit_idx is None
+            or (current_idx - self._last_refit_idx) >= int(config.refit_step)
+        )
+        if should_refit:
+            max_rows = int(config.training_window) + int(config.lookback_window) + max(1, int(config.refit_step))
+            fit_history = history.tail(max_rows).copy() if len(history) > max_rows else history
+            result = fit_regime_model(
+                ticker=ticker,
+                market_frame=fit_history,
+                lookback_window=config.lookback_window,
+                training_window=config.training_window,
+                refit_step=config.refit_step,
+                macro_weighting=config.macro_weighting,
+                macro_weight=config.macro_weight,
+                random_state=config.random_state,
+                n_seeds=config.hmm_n_seeds,
+                seed_agreement_min=config.seed_agreement_min,
+                covariance_type=config.hmm_covariance_type,
+                executor=self._fit_executor,
+                model_cache=config.hmm_model_cache_dir,
+            )
+            self._latest_result = result
+            self._last_refit_idx = current_idx
+            self._scaled_features = None
+        else:
+            if self._scaled_features is None:
+                self._scaled_features = _scale_decode_features(self._latest_result, features, config)
+            start = current_idx - int(config.training_window)
+            window = features.iloc[start:current_idx]
+            scaled = self._scaled_features[start:current_idx]
+            result = _decode_window(ticker, self._latest_result, window, config, scaled=scaled)
+        return result
+
+
+class CompactRegimePath:
+    """A decoded regime path reduced to the per-bar fields ``_signal_from_regime_result`` reads.
+
+    Full refit results carry the fitted model and price frame; replaying a path only needs
+    labels, probabilities, state vectors and transition matrices, stored here as arrays
+    so a path is cheap to keep and to pickle into pool workers.
+    """
+
+    def __init__(self, path: Mapping[pd.Timestamp, Any]) -> None:
+        dates = [pd.Timestamp(date) for date, result in path.items() if result is not None]
+        results = [result for result in path.values() if result is not None]
+        self._rows = {date: row for row, date in enumerate(dates)}
+        self.labels = [str(result.latest_label) for result in results]
+        self.regime_days = np.array([int(result.regime_days) for result in results], dtype=int)
+        self.regime_ambiguous = np.array([bool(getattr(result, "regime_ambiguous", False)) for result in results], dtype=bool)
+        self.scalars = np.array(
+            [
+                [
+                    float(result.latest_probability),
+                    float(result.latest_price),
+                    float(result.transition_risk),
+                    float(result.expected_regime_duration),
+                    _nan_if_none(result.recent_state_mean_return),
+                    _nan_if_none(getattr(result, "seed_agreement", None)),
+                ]
+                for result in results
+            ],
+            dtype=float,
+        ).reshape(len(results), 6)
+        self.state_vectors = np.array([np.asarray(result.latest_state_vector, dtype=float) for result in results])
+        self.transition_matrices = np.array([np.asarray(result.transition_matrix, dtype=float) for result in results])
+        # One quantile dict per refit, shared by reference across that refit's bars.
+        self.duration_quantiles = [getattr(result, "empirical_duration_quantiles", None) for result in results]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, date: pd.Timestamp) -> SimpleNamespace | None:
+        row = self._rows.get(pd.Timestamp(date))
+        if row is None:
+            return None
+        probability, price, transition_risk, duration, mean_return, seed_agreement = self.scalars[row].tolist()
         return SimpleNamespace(
-            ticker=ticker,
-            latest_label=label,
-            latest_state_id=state_id,
-            latest_probability=float(posteriors[-1, hidden]),
-            latest_price=float(window["price"].iloc[-1]),
-            latest_state_vector=vector,
-            transition_matrix=transition,
-            expected_regime_duration=expected_duration,
-            transition_risk=max(0.0, min(1.0, 1.0 - stay)),
-            regime_days=max(1, regime_days),
-            recent_state_mean_return=float(mean_return) if pd.notna(mean_return) else None,
-            empirical_duration_quantiles=getattr(base, "empirical_duration_quantiles", None),
-            seed_agreement=float(getattr(base, "seed_agreement", 1.0) or 1.0),
-            regime_ambiguous=bool(getattr(base, "regime_ambiguous", False)),
+            latest_label=self.labels[row],
+            latest_probability=probability,
+            latest_price=price,
+            latest_state_vector=self.state_vectors[row],
+            transition_matrix=self.transition_matrices[row],
+            expected_regime_duration=duration,
+            transition_risk=transition_risk,
+            regime_days=int(self.regime_days[row]),
+            recent_state_mean_return=None if math.isnan(mean_return) else mean_return,
+            empirical_duration_quantiles=self.duration_quantiles[row],
+            seed_agreement=None if math.isnan(seed_agreement) else seed_agreement,
+            regime_ambiguous=bool(self.regime_ambiguous[row]),
         )
 
 
+def _nan_if_none(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+class RegimePathSignalProvider:
+    """Signal provider that replays a recorded walk-forward regime path.
+
+    ``path_loader`` returns the ``{date: regime result}`` mapping produced by
+    ``decode_regime_path`` (or its ``CompactRegimePath``); it is resolved on the first call
+    so a path is only decoded when a backtest actually asks for signals. Only the forward
+    curve, composite and price-target logic run per bar, with the thresholds of the config
+    being backtested.
+    """
+
+    def __init__(self, frame: pd.DataFrame, path_loader: Callable[[], Mapping[pd.Timestamp, Any] | CompactRegimePath]) -> None:
+        normalized = _normalize_market_frame(frame)
+        self._frame_index = pd.DatetimeIndex(normalized.index)
+        technicals = compute_technicals(normalized["price"], normalized["volume"], normalized["high"], normalized["low"])
+        self._complete_technicals = technicals.dropna()
+        self._complete_technical_positions = self._frame_index.get_indexer(self._complete_technicals.index)
+        self._path_loader = path_loader
+        self._path: Mapping[pd.Timestamp, Any] | CompactRegimePath | None = None
+
+    def __call__(
+        self,
+        ticker: str,
+        date: pd.Timestamp,
+        history: pd.DataFrame,
+        config: PipelineBacktestConfig,
+        previous_regime: str | None,
+    ) -> PipelineSignal | None:
+        if self._path is None:
+            self._path = self._path_loader()
+        result = self._path.get(pd.Timestamp(date))
+        if result is None:
+            return None
+        complete_rows = int(np.searchsorted(self._complete_technical_positions, len(history) - 1, side="right"))
+        technicals = self._complete_technicals.iloc[max(0, complete_rows - 2) : complete_rows]
+        return _signal_from_regime_result(ticker, result, history, previous_regime, config, technicals=technicals)
+
+
+def regime_decode_key(config: PipelineBacktestConfig) -> tuple[Any, ...]:
+    """Config fields that determine the walk-forward regime path."""
+
+    return (
+        int(config.training_window),
+        int(config.refit_step),
+        int(config.lookback_window),
+        bool(config.macro_weighting),
+        float(config.macro_weight),
+        int(config.random_state),
+        int(config.hmm_n_seeds),
+        float(config.seed_agreement_min),
+        str(config.hmm_covariance_type),
+        bool(config.incremental_signals),
+    )
+
+
+def decode_regime_path(
+    ticker: str,
+    market_frame: pd.DataFrame,
+    config: PipelineBacktestConfig | None = None,
+) -> dict[pd.Timestamp, Any]:
+    """Run the walk-forward regime decode once over every bar ``run_pipeline_backtest`` visits."""
+
+    cfg = config or PipelineBacktestConfig()
+    np.random.seed(int(cfg.random_state))
+    frame = _normalize_market_frame(market_frame)
+    if frame.empty:
+        return {}
+    provider = _IncrementalSignalProvider(frame, cfg) if cfg.incremental_signals else _ProductionSignalProvider()
+    start_idx = max(0, min(int(cfg.training_window), max(0, len(frame) - 1)))
+    path: dict[pd.Timestamp, Any] = {}
+    for idx in range(start_idx, len(frame)):
+        date = pd.Timestamp(frame.index[idx])
+        path[date] = provider.regime_result(ticker, date, frame.iloc[: idx + 1], cfg)
+    return path
+
+
+def decode_compact_regime_path(
+    ticker: str,
+    market_frame: pd.DataFrame,
+    config: PipelineBacktestConfig | None = None,
+) -> CompactRegimePath:
+    """``decode_regime_path`` reduced to the arrays a replayed backtest reads."""
+
+    return CompactRegimePath(decode_regime_path(ticker, market_frame, config))
+
+
 def _signal_from_regime_result(
     ticker: str,
     result: Any,
     history: pd.DataFrame,
     previous_regime: str | None,
     config: PipelineBacktestConfig,
+    *,
+    technicals: pd.DataFrame | None = None,
 ) -> PipelineSignal:
     curve = forward_regime_curve(result.transition_matrix, result.latest_state_vector, horizon=21)
     forward = signal_from_forward_curve(
@@ -492,7 +784,8 @@ def _signal_from_regime_result(
         thresholds=config.signal_thresholds,
         empirical_duration_quantiles=getattr(result, "empirical_duration_quantiles", None),
     )
-    technicals = compute_technicals(history["price"], history["volume"], history["high"], history["low"])
+    if technicals is None:
+        technicals = compute_technicals(history["price"], history["volume"], history["high"], history["low"])
     technical = intra_regime_signal(technicals, result.latest_label)
     composite = build_composite_signal(
         result.latest_label,
@@ -1022,7 +1315,10 @@ def run_pipeline_backtest(
     config: PipelineBacktestConfig | None = None,
     benchmark_frame: pd.DataFrame | None = None,
     signal_provider: SignalProvider | None = None,
+    fit_executor: Executor | None = None,
 ) -> PipelineBacktestResult:
+    """Bar-by-bar backtest of the production pipeline; ``fit_executor`` fans each refit's windows and seeds out."""
+
     cfg = config or PipelineBacktestConfig()
     np.random.seed(int(cfg.random_state))
     frame = _normalize_market_frame(market_frame)
@@ -1034,7 +1330,12 @@ def run_pipeline_backtest(
         if bool(cfg.enforce_universe_screen)
         else None
     )
-    provider = signal_provider or _ProductionSignalProvider()
+    if signal_provider is not None:
+        provider: SignalProvider = signal_provider
+    elif cfg.incremental_signals:
+        provider = _IncrementalSignalProvider(frame, cfg, fit_executor=fit_executor)
+    else:
+        provider = _ProductionSignalProvider(fit_executor)
     cash = float(cfg.starting_cash)
     position: PipelinePosition | None = None
     pending_entry: dict[str, Any] | None = None
@@ -1193,4 +1494,4 @@ def run_pipeline_backtest_for_ticker(
         cfg = replace(cfg, oos_start=oos_start)
     market = download_market_frame(ticker=ticker, period=period, interval="1d", start=start, end=end, cache=cache).frame
     benchmark = download_market_frame(ticker=benchmark_ticker, period=period, interval="1d", start=start, end=end, cache=cache).frame if benchmark_ticker else None
-    return run_pipeline_backtest(ticker, market, config=cfg, benchmark_frame=benchmark)
+    return run_pipeline_backtest(ticker, market, config=cfg, benchmark_frame=benchmark, fit_executor=refit_executor())
@@ -10,6 +10,7 @@ from .train import (
     pause_rl_explore,
     rl_explore_status,
     run_rl_explore,
+    run_rl_explore_seeds,
 )
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "pause_rl_explore",
     "rl_explore_status",
     "run_rl_explore",
+    "run_rl_explore_seeds",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from typing import Any, Protocol, Sequence, cast
 
@@ -14,6 +15,8 @@ UNVALIDATED_LABEL = "UNVALIDATED exploration — in-sample only, not certified."
 DEFAULT_SNAPSHOT_HASH = "d2ccfd9ea42e4db663003dcfacfa6a3ce69e4e91ea5c059de82b356f3a17f527"
 DEFAULT_HOLDOUT_START = "2024-01-01"
 DEFAULT_HOLDOUT_END = "2025-12-31"
+# Prepared episode inputs kept by a preloaded env; validation re-runs the same window every few episodes.
+_EPISODE_CACHE_MAX = 32
 
 
 class MarketDataProvider(Protocol):
@@ -53,6 +56,7 @@ class RLMarketEnvConfig:
     exit_cost_bps: float = 5.0
     slippage_bps: float = 2.0
     snapshot_hash: str = DEFAULT_SNAPSHOT_HASH
+    preload_panel: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -77,6 +81,76 @@ class EpisodeResult:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class _EpisodeInputs:
+    dates: pd.DatetimeIndex
+    prices: np.ndarray
+    selected: list[int]
+    terminal_events: dict[int, Any]
+
+
+class _PreloadedPricePanel:
+    """Dense date x asset close array over the whole research window.
+
+    Each permaticker is fetched once, the first time the universe selects it;
+    episodes are then cut out of the array instead of re-reading the provider.
+    """
+
+    def __init__(self, provider: MarketDataProvider, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> None:
+        self.provider = provider
+        self.start_ts = start_ts
+        self.end_ts = end_ts
+        self.dates = np.empty(0, dtype="datetime64[ns]")
+        self.values = np.empty((0, 0), dtype=float)
+        self.columns: dict[int, int] = {}
+        self._series: dict[int, pd.Series] = {}
+        self._unpriced: set[int] = set()
+
+    def ensure(self, permatickers: Sequence[int]) -> None:
+        new = [perma for perma in dict.fromkeys(int(item) for item in permatickers) if perma not in self._series and perma not in self._unpriced]
+        if not new:
+            return
+        frames = self.provider.get_prices(new, self.start_ts.date().isoformat(), self.end_ts.date().isoformat())
+        for perma in new:
+            price = _close_series(frames.get(perma, pd.DataFrame()))
+            if price is None:
+                self._unpriced.add(perma)
+            else:
+                self._series[perma] = price
+        if not self._series:
+            return
+        panel = pd.concat(self._series, axis=1).sort_index()
+        self.dates = panel.index.to_numpy(dtype="datetime64[ns]")
+        self.values = panel.to_numpy(dtype=float)
+        self.columns = {int(column): idx for idx, column in enumerate(panel.columns)}
+
+    def episode_prices(
+        self,
+        selected: Sequence[int],
+        lookback_ts: pd.Timestamp,
+        start_ts: pd.Timestamp,
+        end_ts: pd.Timestamp,
+    ) -> tuple[pd.DatetimeIndex, list[int], np.ndarray]:
+        """Same rows and columns as `RLMarketEnv._price_panel` over prices fetched from `lookback_ts`."""
+        permas = [perma for perma in dict.fromkeys(int(item) for item in selected) if perma in self.columns]
+        lo = int(np.searchsorted(self.dates, np.datetime64(lookback_ts), side="left"))
+        hi = int(np.searchsorted(self.dates, np.datetime64(end_ts), side="right"))
+        block = self.values[lo:hi][:, [self.columns[perma] for perma in permas]]
+        dates = self.dates[lo:hi]
+        observed = ~np.isnan(block)
+        priced = observed.any(axis=0)
+        permas = [perma for perma, keep in zip(permas, priced) if keep]
+        block = block[:, priced]
+        rows = observed[:, priced].any(axis=1)
+        block = _ffill_rows(block[rows])
+        dates = dates[rows]
+        keep = (dates >= np.datetime64(start_ts)) & ~np.isnan(block).all(axis=1)
+        block = block[keep]
+        complete = ~np.isnan(block).any(axis=0)
+        permas = [perma for perma, ok in zip(permas, complete) if ok]
+        return pd.DatetimeIndex(dates[keep]), permas, block[:, complete]
+
+
 class RLMarketEnv:
     """Faithful market sandbox for raw-terminal-wealth exploration.
 
@@ -85,17 +159,37 @@ class RLMarketEnv:
     selects the first top_k names. The agent emits target weights over those
     K names plus cash. Between rebalances the target weights drift with market
     returns. Costs and slippage are applied to turnover on every rebalance.
+
+    With `preload_panel` the env loads prices once for the research window
+    into a dense array and steps episodes as array operations; `run_episodes`
+    then advances a batch of episodes together. Rewards are unchanged.
     """
 
     def __init__(self, provider: MarketDataProvider | None = None, config: RLMarketEnvConfig | None = None) -> None:
         self.provider = provider or SharadarStore(DEFAULT_SHARADAR_DIR)
         self.config = config or RLMarketEnvConfig()
         self._accessed_ranges: list[tuple[str, str]] = []
+        self._panel: _PreloadedPricePanel | None = None
+        self._universe_cache: dict[pd.Timestamp, list[int]] = {}
+        self._episode_cache: OrderedDict[tuple[pd.Timestamp, pd.Timestamp], _EpisodeInputs] = OrderedDict()
 
     @property
     def accessed_ranges(self) -> list[tuple[str, str]]:
         return list(self._accessed_ranges)
 
+    def reset_access_log(self) -> None:
+        """Start a new session's access log; an already loaded panel counts as read by that session too."""
+        self._accessed_ranges = []
+        if self._panel is not None:
+            self._record_access(self._panel.start_ts.date().isoformat(), self._panel.end_ts.date().isoformat())
+
+    def preload(self, windows: Sequence[tuple[str, str]]) -> None:
+        """Load the preloaded panel for these episode windows now, so copies of this env start with it."""
+        if not self.config.preload_panel:
+            return
+        for start, end in windows:
+            self._preloaded_inputs(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize())
+
     def sample_episode_window(self, rng: np.random.Generator) -> tuple[str, str]:
         start_ts = pd.Timestamp(self.config.train_start).normalize()
         end_ts = pd.Timestamp(self.config.train_end).normalize()
@@ -116,6 +210,8 @@ class RLMarketEnv:
         rng: np.random.Generator | None = None,
         train: bool = True,
     ) -> EpisodeResult:
+        if self.config.preload_panel:
+            return self.run_episodes([agent], [(start, end)], rngs=[rng], train=train)[0]
         start_ts = pd.Timestamp(start).normalize()
         end_ts = pd.Timestamp(end).normalize()
         self._assert_not_holdout(start_ts, end_ts)
@@ -156,6 +252,63 @@ class RLMarketEnv:
         terminal_events = self.provider.terminal_value_events(selected, start=start_ts, end=end_ts)
         return self._simulate(price_panel, selected, terminal_events, agent, rng=rng, train=train)
 
+    def run_episodes(
+        self,
+        agents: Sequence[Any],
+        windows: Sequence[tuple[str, str]],
+        *,
+        rngs: Sequence[np.random.Generator | None] | None = None,
+        train: bool = True,
+    ) -> list[EpisodeResult]:
+        """Run one episode per (agent, window) pair, results in input order.
+
+        With `preload_panel` the episodes are stepped together as one batch;
+        otherwise this is `run_episode` in a loop. Agents must not be shared
+        between episodes of one batch since they hold per-episode noise.
+        """
+        if len(agents) != len(windows):
+            raise ValueError(f"Got {len(agents)} agents for {len(windows)} episode windows.")
+        episode_rngs = list(rngs) if rngs is not None else [None] * len(agents)
+        if len(episode_rngs) != len(agents):
+            raise ValueError(f"Got {len(episode_rngs)} rngs for {len(agents)} agents.")
+        if not self.config.preload_panel:
+            return [
+                self.run_episode(agent, start=start, end=end, rng=rng, train=train)
+                for agent, (start, end), rng in zip(agents, windows, episode_rngs)
+            ]
+        results: list[EpisodeResult | None] = [None] * len(agents)
+        batch: list[int] = []
+        inputs: list[_EpisodeInputs] = []
+        for idx, (start, end) in enumerate(windows):
+            start_ts = pd.Timestamp(start).normalize()
+            end_ts = pd.Timestamp(end).normalize()
+            prepared = self._preloaded_inputs(start_ts, end_ts)
+            if len(prepared.dates) < 2 or not prepared.prices.size:
+                results[idx] = EpisodeResult(
+                    terminal_wealth=self.config.starting_cash,
+                    terminal_log_wealth=0.0,
+                    steps=0,
+                    costs_paid=0.0,
+                    turnover=0.0,
+                    terminal_events_used=[],
+                    selected_permatickers=list(prepared.selected),
+                    start=start_ts.date().isoformat(),
+                    end=end_ts.date().isoformat(),
+                )
+                continue
+            batch.append(idx)
+            inputs.append(prepared)
+        if batch:
+            simulated = self._simulate_batch(
+                inputs,
+                [agents[idx] for idx in batch],
+                [episode_rngs[idx] for idx in batch],
+                train=train,
+            )
+            for idx, result in zip(batch, simulated):
+                results[idx] = result
+        return cast(list[EpisodeResult], results)
+
     def benchmark_terminal_wealth(self, *, start: str, end: str) -> float:
         start_ts = pd.Timestamp(start).normalize()
         end_ts = pd.Timestamp(end).normalize()
@@ -264,6 +417,167 @@ class RLMarketEnv:
             max_state_date=max_state_date.date().isoformat() if max_state_date is not None else None,
         )
 
+    def _preloaded_inputs(self, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> _EpisodeInputs:
+        self._assert_not_holdout(start_ts, end_ts)
+        cached = self._episode_cache.get((start_ts, end_ts))
+        if cached is not None:
+            self._episode_cache.move_to_end((start_ts, end_ts))
+            return cached
+        research_floor = pd.Timestamp(self.config.train_start).normalize()
+        if self._panel is None:
+            research_end = max(pd.Timestamp(self.config.train_end), pd.Timestamp(self.config.validation_end)).normalize()
+            self._record_access(research_floor.date().isoformat(), research_end.date().isoformat())
+            self._panel = _PreloadedPricePanel(self.provider, research_floor, research_end)
+        if end_ts > self._panel.end_ts:
+            raise ValueError(
+                f"Episode end {end_ts.date().isoformat()} is outside the preloaded research window "
+                f"ending {self._panel.end_ts.date().isoformat()}."
+            )
+        lookback_ts = max(research_floor, start_ts - pd.Timedelta(days=max(1, self.config.lookback_days) + 10))
+        universe = self._universe_cache.get(start_ts)
+        if universe is None:
+            universe = [int(item) for item in self.provider.universe_asof(start_ts, top_n=max(self.config.top_k, self.config.universe_top_n))]
+            self._universe_cache[start_ts] = universe
+        selected = universe[: self.config.top_k]
+        dates: pd.DatetimeIndex = pd.DatetimeIndex([])
+        prices = np.empty((0, 0), dtype=float)
+        events: dict[int, Any] = {}
+        if selected:
+            self._panel.ensure(selected)
+            dates, columns, prices = self._panel.episode_prices(selected, lookback_ts, start_ts, end_ts)
+            if len(dates) >= 2 and columns:
+                selected = columns
+                self._record_access(start_ts.date().isoformat(), end_ts.date().isoformat())
+                events = self.provider.terminal_value_events(selected, start=start_ts, end=end_ts)
+        prepared = _EpisodeInputs(dates=dates, prices=prices, selected=selected, terminal_events=events)
+        self._episode_cache[(start_ts, end_ts)] = prepared
+        while len(self._episode_cache) > _EPISODE_CACHE_MAX:
+            self._episode_cache.popitem(last=False)
+        return prepared
+
+    def _simulate_batch(
+        self,
+        episodes: Sequence[_EpisodeInputs],
+        agents: Sequence[Any],
+        rngs: Sequence[np.random.Generator | None],
+        *,
+        train: bool,
+    ) -> list[EpisodeResult]:
+        """Array form of `_simulate` for a batch of episodes padded to a common shape.
+
+        Weights only change at rebalances and terminal events, so the days in
+        between advance together: one matrix product for the portfolio returns
+        and one cumulative product for the equity path.
+        """
+        count = len(episodes)
+        lengths = np.array([len(episode.dates) for episode in episodes], dtype=int)
+        widths = [len(episode.selected) for episode in episodes]
+        horizon = int(lengths.max())
+        width = max(widths)
+        rebalance_every = max(1, self.config.rebalance_every_days)
+        lookback = max(1, self.config.lookback_days)
+        cost_rate = (float(self.config.entry_cost_bps) + float(self.config.exit_cost_bps) + float(self.config.slippage_bps)) / 10_000.0
+        prices = np.full((count, horizon, width), np.nan)
+        asset_returns = np.zeros((count, horizon, width))
+        # Step at which each asset's terminal event is applied; `horizon` means never.
+        fire = np.full((count, width), horizon, dtype=int)
+        terminal_rows: list[list[tuple[int, int, dict[str, Any]]]] = []
+        for b, episode in enumerate(episodes):
+            days, assets = episode.prices.shape
+            prices[b, :days, :assets] = episode.prices
+            prev = episode.prices[:-1]
+            asset_returns[b, 1:days, :assets] = np.divide(episode.prices[1:], prev, out=np.ones_like(prev), where=prev > 0) - 1.0
+            rows: list[tuple[int, int, dict[str, Any]]] = []
+            for asset_idx, perma in enumerate(episode.selected):
+                event = episode.terminal_events.get(int(perma))
+                if event is None:
+                    continue
+                step = max(1, int(episode.dates.searchsorted(pd.Timestamp(event.date).normalize(), side="left")))
+                if step >= days:
+                    continue
+                terminal_price = float(event.value)
+                base = float(episode.prices[step - 1, asset_idx])
+                asset_returns[b, step, asset_idx] = terminal_price / base - 1.0 if base > 0 else -1.0
+                asset_returns[b, step + 1 :, asset_idx] = 0.0
+                fire[b, asset_idx] = step
+                rows.append(
+                    (
+                        step,
+                        asset_idx,
+                        {
+                            "permaticker": int(perma),
+                            "date": pd.Timestamp(event.date).date().isoformat(),
+                            "value": terminal_price,
+                            "source": str(event.source),
+                            "reason": str(event.reason),
+                        },
+                    )
+                )
+            terminal_rows.append(sorted(rows, key=lambda row: (row[0], row[1])))
+        step_index = np.arange(horizon)
+        equity = np.full(count, float(self.config.starting_cash))
+        weights = np.zeros((count, width + 1), dtype=float)
+        weights[:, 0] = 1.0
+        total_costs = np.zeros(count)
+        total_turnover = np.zeros(count)
+        log_wealth = np.zeros(count)
+        last_state = np.zeros(count, dtype=int)
+        for rebalance in range(0, horizon, rebalance_every):
+            live = np.flatnonzero(lengths > rebalance)
+            features = _window_features(prices[live, max(0, rebalance - lookback) : rebalance + 1])
+            for row, b in enumerate(live):
+                assets = widths[b]
+                active = fire[b, :assets] >= rebalance
+                state = features[row, :assets].copy()
+                state[~active, :] = 0.0
+                target = np.asarray(agents[b].act(state, rng=rngs[b], train=train), dtype=float)
+                if len(target) != assets + 1:
+                    raise ValueError(f"Agent returned {len(target)} weights for {assets + 1} assets.")
+                target = _normalize_weights(target)
+                target[1:] = np.where(active, target[1:], 0.0)
+                target = _normalize_weights(target)
+                turnover = float(np.abs(target[1:] - weights[b, 1 : assets + 1]).sum())
+                cost = turnover * float(equity[b]) * cost_rate
+                equity[b] = max(0.0, float(equity[b]) - cost)
+                total_costs[b] += cost
+                total_turnover[b] += turnover
+                weights[b, : assets + 1] = target
+                last_state[b] = rebalance
+            first = max(1, rebalance)
+            stop = min(rebalance + rebalance_every, horizon)
+            events_here = fire[(fire >= first) & (fire < stop)]
+            for last in sorted(set(events_here.tolist()) | {stop - 1}):
+                if last < first:
+                    continue
+                growth = 1.0 + np.einsum("btk,bk->bt", asset_returns[:, first : last + 1], weights[:, 1:])
+                path = np.cumprod(np.column_stack([equity, growth]), axis=1)
+                path[:, 1:][np.logical_or.accumulate(growth <= 0.0, axis=1)] = 0.0
+                before, after = path[:, :-1], path[:, 1:]
+                counted = (step_index[first : last + 1] < lengths[:, None]) & (before > 0) & (after > 0)
+                log_wealth += np.log(np.divide(after, before, out=np.ones_like(after), where=counted)).sum(axis=1)
+                equity = path[:, -1].copy()
+                for b, asset_idx in zip(*np.nonzero(fire == last)):
+                    weights[b, 1 + asset_idx] = 0.0
+                    weights[b, : widths[b] + 1] = _normalize_weights(weights[b, : widths[b] + 1])
+                first = last + 1
+        holdout_accessed = self._holdout_touched()
+        return [
+            EpisodeResult(
+                terminal_wealth=float(equity[b]),
+                terminal_log_wealth=float(log_wealth[b]),
+                steps=max(0, int(lengths[b]) - 1),
+                costs_paid=float(total_costs[b]),
+                turnover=float(total_turnover[b]),
+                terminal_events_used=[row for _, _, row in terminal_rows[b]],
+                selected_permatickers=list(episode.selected),
+                start=episode.dates[0].date().isoformat(),
+                end=episode.dates[-1].date().isoformat(),
+                holdout_accessed=holdout_accessed,
+                max_state_date=episode.dates[last_state[b]].date().isoformat(),
+            )
+            for b, episode in enumerate(episodes)
+        ]
+
     def _state_features(self, prices: pd.DataFrame, idx: int, active: np.ndarray) -> np.ndarray:
         start = max(0, idx - max(1, self.config.lookback_days))
         window = prices.iloc[start : idx + 1].astype(float)
@@ -288,15 +602,9 @@ class RLMarketEnv:
     ) -> pd.DataFrame:
         series: dict[int, pd.Series] = {}
         for perma in selected:
-            frame = frames.get(int(perma), pd.DataFrame())
-            if frame.empty:
-                continue
-            normalized = _normalize_frame(frame)
-            if normalized.empty or "price" not in normalized.columns:
-                continue
-            price = normalized["price"].astype(float)
-            price.index = pd.to_datetime(price.index).normalize()
-            series[int(perma)] = price
+            price = _close_series(frames.get(int(perma), pd.DataFrame()))
+            if price is not None:
+                series[int(perma)] = price
         if not series:
             return pd.DataFrame()
         panel = pd.concat(series, axis=1).sort_index().ffill()
@@ -334,3 +642,37 @@ def _normalize_weights(weights: np.ndarray) -> np.ndarray:
         out[0] = 1.0
         return cast(np.ndarray, out)
     return cast(np.ndarray, clean / total)
+
+
+def _close_series(frame: pd.DataFrame) -> pd.Series | None:
+    if frame.empty:
+        return None
+    normalized = _normalize_frame(frame)
+    if normalized.empty or "price" not in normalized.columns:
+        return None
+    price = normalized["price"].astype(float)
+    price.index = pd.to_datetime(price.index).normalize()
+    return price
+
+
+def _ffill_rows(values: np.ndarray) -> np.ndarray:
+    if not values.size:
+        return values
+    source = np.where(np.isnan(values), 0, np.arange(len(values))[:, None])
+    np.maximum.accumulate(source, axis=0, out=source)
+    return cast(np.ndarray, values[source, np.arange(values.shape[1])])
+
+
+def _window_features(window: np.ndarray) -> np.ndarray:
+    """`RLMarketEnv._state_features` for (batch, days, assets) windows, before inactive assets are zeroed."""
+    current = window[:, -1]
+    first = window[:, 0]
+    momentum = np.divide(current, first, out=np.ones_like(current), where=first > 0) - 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        steps = window[:, 1:] / window[:, :-1] - 1.0
+    steps[~np.isfinite(steps)] = 0.0
+    volatility = np.concatenate([np.zeros_like(window[:, :1]), steps], axis=1).std(axis=1)
+    rolling_max = window.max(axis=1)
+    drawdown = np.divide(current, rolling_max, out=np.ones_like(current), where=rolling_max > 0) - 1.0
+    features = np.stack([momentum, -volatility, drawdown], axis=-1)
+    return cast(np.ndarray, np.nan_to_num(features, nan=0.0, posinf=0.0, neginf=0.0))
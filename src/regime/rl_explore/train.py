@@ -5,9 +5,10 @@ import json
 import math
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 
@@ -26,6 +27,10 @@ SCRATCH_DIR_NAME = "scratch"
 PAUSE_SENTINEL_NAME = "pause.requested"
 STATUS_FILE_NAME = "status.json"
 SUMMARY_FILE_NAME = "run_summary.json"
+SEED_SWEEP_FILE_NAME = "seed_sweep_summary.json"
+
+# Per-process state for seed-sweep workers, filled once by the pool initializer.
+_WORKER_STATE: dict[str, Any] = {}
 
 
 @dataclass(frozen=True)
@@ -58,7 +63,16 @@ def run_rl_explore(
     *,
     provider: MarketDataProvider | None = None,
     mode: str = "run",
+    env: RLMarketEnv | None = None,
+    episode_log: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
+    """Run or resume one exploration session.
+
+    ``env`` reuses an already prepared environment (and its preloaded price
+    panel) across sessions; its config must match ``config.env``. Every
+    episode row of this session is appended to ``episode_log`` when given;
+    the checkpoint replay buffer only keeps the last ``replay_buffer_size``.
+    """
     cfg = config or RLExploreConfig()
     root = Path(cfg.output_dir)
     checkpoint_dir = root / CHECKPOINT_DIR_NAME
@@ -70,7 +84,10 @@ def run_rl_explore(
     if mode not in {"run", "resume"}:
         raise ValueError("mode must be run or resume.")
     env_cfg = replace(cfg.env, snapshot_hash=cfg.snapshot_hash)
-    env = RLMarketEnv(provider=provider, config=env_cfg)
+    if env is None:
+        env = RLMarketEnv(provider=provider, config=env_cfg)
+    elif env.config != env_cfg:
+        raise ValueError("Shared RL exploration env was built for a different env config.")
     actual_snapshot = getattr(env.provider, "data_snapshot_hash", None)
     if actual_snapshot and str(actual_snapshot) != str(cfg.snapshot_hash):
         raise ValueError("RL exploration snapshot mismatch; refusing to train on changed data.")
@@ -127,21 +144,20 @@ def run_rl_explore(
         state["agent_state"] = agent.to_state()
         state["rng_state"] = rng.bit_generator.state
         state["holdout_accessed"] = bool(state.get("holdout_accessed")) or bool(result.holdout_accessed)
-        _append_replay(
-            state,
-            {
-                "episode": state["episode"],
-                "start": result.start,
-                "end": result.end,
-                "terminal_wealth": result.terminal_wealth,
-                "terminal_log_wealth": result.terminal_log_wealth,
-                "steps": result.steps,
-                "costs_paid": result.costs_paid,
-                "turnover": result.turnover,
-                "learn": learn,
-            },
-            max_size=cfg.replay_buffer_size,
-        )
+        replay_row = {
+            "episode": state["episode"],
+            "start": result.start,
+            "end": result.end,
+            "terminal_wealth": result.terminal_wealth,
+            "terminal_log_wealth": result.terminal_log_wealth,
+            "steps": result.steps,
+            "costs_paid": result.costs_paid,
+            "turnover": result.turnover,
+            "learn": learn,
+        }
+        _append_replay(state, replay_row, max_size=cfg.replay_buffer_size)
+        if episode_log is not None:
+            episode_log.append(replay_row)
         if int(state["episode"]) % max(1, int(cfg.validation_every_episodes)) == 0:
             validation = validate_policy(env, agent, cfg)
             state["last_validation"] = validation
@@ -190,6 +206,85 @@ def run_rl_explore(
     return summary
 
 
+def run_rl_explore_seeds(
+    config: RLExploreConfig | None = None,
+    seeds: Sequence[int] = (),
+    *,
+    provider: MarketDataProvider | None = None,
+    mode: str = "run",
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run one independent exploration session per seed under ``output_dir/seed_<seed>``.
+
+    Each seed is exactly the session ``run_rl_explore`` would produce for it
+    alone, so results do not depend on ``max_workers``. The provider and env
+    (with the validation window of a preloaded price panel) are built once
+    here; with ``max_workers > 1`` seeds run in a process pool whose
+    initializer hands every worker that env. Runs and every episode row they
+    ran are merged in seed order.
+    """
+    cfg = config or RLExploreConfig()
+    ordered = [int(seed) for seed in dict.fromkeys(int(seed) for seed in seeds)] or [int(cfg.seed)]
+    root = Path(cfg.output_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    seed_configs = [replace(cfg, seed=seed, output_dir=root / f"seed_{seed}") for seed in ordered]
+    env = RLMarketEnv(provider=provider, config=replace(cfg.env, snapshot_hash=cfg.snapshot_hash))
+    env.preload([(cfg.env.validation_start, cfg.env.validation_end)])
+    workers = min(int(max_workers or 1), len(seed_configs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_seed_worker, initargs=(env,)) as pool:
+            results = list(pool.map(_run_seed_in_worker, seed_configs, [mode] * len(seed_configs)))
+    else:
+        local: dict[str, Any] = {"env": env}
+        results = [_run_seed(seed_cfg, mode, local) for seed_cfg in seed_configs]
+    runs: list[dict[str, Any]] = []
+    episodes: list[dict[str, Any]] = []
+    for seed, seed_cfg, (run, seed_episodes) in zip(ordered, seed_configs, results):
+        run["seed"] = seed
+        run["output_dir"] = str(seed_cfg.output_dir)
+        runs.append(run)
+        episodes.extend({"seed": seed, **row} for row in seed_episodes)
+    best = max(
+        (run for run in runs if run.get("best_policy")),
+        key=lambda run: _float((run.get("best_policy") or {}).get("validation_terminal_wealth"), default=-math.inf),
+        default=None,
+    )
+    summary = {
+        "schema": "rl_explore_seed_sweep.v1",
+        "label": UNVALIDATED_LABEL,
+        "generated_at": _now_iso(),
+        "seeds": ordered,
+        "runs": runs,
+        "episodes": episodes,
+        "best_seed": best.get("seed") if best is not None else None,
+        "success_found": any(run.get("state") == "success" for run in runs),
+        "holdout_untouched": all(bool(run.get("holdout_untouched", True)) for run in runs),
+        "snapshot_hash": cfg.snapshot_hash,
+        "production_defaults_changed": False,
+    }
+    _write_json_atomic(root / SEED_SWEEP_FILE_NAME, summary)
+    return summary
+
+
+def _init_seed_worker(env: RLMarketEnv) -> None:
+    _WORKER_STATE.update(env=env)
+
+
+def _run_seed_in_worker(cfg: RLExploreConfig, mode: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    return _run_seed(cfg, mode, _WORKER_STATE)
+
+
+def _run_seed(cfg: RLExploreConfig, mode: str, shared: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """One seed's session summary and every episode row it ran."""
+    env_cfg = replace(cfg.env, snapshot_hash=cfg.snapshot_hash)
+    env = shared["env"]
+    if env.config != env_cfg:
+        env = shared["env"] = RLMarketEnv(provider=env.provider, config=env_cfg)
+    env.reset_access_log()
+    episodes: list[dict[str, Any]] = []
+    return run_rl_explore(cfg, mode=mode, env=env, episode_log=episodes), episodes
+
+
 def validate_policy(env: RLMarketEnv, agent: SoftmaxLinearAgent, cfg: RLExploreConfig) -> dict[str, Any]:
     result = env.run_episode(agent, start=cfg.env.validation_start, end=cfg.env.validation_end, train=False)
     benchmark = env.benchmark_terminal_wealth(start=cfg.env.validation_start, end=cfg.env.validation_end)
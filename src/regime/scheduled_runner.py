@@ -2,16 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import datetime as dt
+import time
 from typing import Any
 
-from .alerts import (
-    check_regime_changes,
-    check_loss_breach,
-    check_signal_changes,
-    check_stop_proximity,
-    check_transition_risk_spikes,
-    format_alert_summary,
-)
+from .alerts import check_loss_breach, format_alert_summary, run_regime_alert_checks
+from .hmm_engine import HMMModelCache, get_regime_result_cache
 from .notifications import dispatch_notification_sync, flush_digest
 from .monitoring import sweep_monitoring_alerts
 from .data_validator import check_database_health, run_pre_trade_validation
@@ -38,6 +33,7 @@ from .persistence import (
     list_paper_portfolios,
     set_setting,
     save_daily_snapshot,
+    transaction,
     update_transition_outcome,
 )
 from .config import (
@@ -154,34 +150,34 @@ def run_daily_backup() -> dict[str, Any]:
     return {"backup": backup, "cleanup": cleanup}
 
 
-def run_scheduled_regime_checks(tickers: list[str] | None = None) -> dict[str, Any]:
+def run_scheduled_regime_checks(tickers: list[str] | None = None, *, max_workers: int | None = None) -> dict[str, Any]:
     db_path = get_investor_db_path()
     if not db_path:
         return {"alerts": [], "summary": "Investor database unavailable."}
     selected = tickers or get_portfolio_tickers_filtered(db_path)
-    regime_alerts = check_regime_changes(selected, db_path)
-    risk_alerts = check_transition_risk_spikes(selected)
-    signal_alerts = check_signal_changes(selected)
-    stop_alerts = check_stop_proximity(selected, db_path)
+    checks = run_regime_alert_checks(selected, db_path, max_workers=max_workers)
+    timings = dict(checks["timings"])
+    persist_started = time.perf_counter()
     pending = get_pending_transition_outcomes()
     pending_tickers = sorted({str(row.get("ticker") or "").upper() for row in pending if row.get("ticker")})
     latest_prices = get_latest_prices(db_path, pending_tickers)
-    for row in pending:
-        base_price = row.get("price_at_change")
-        current_price = latest_prices.get(str(row.get("ticker") or "").upper())
-        if not base_price or current_price is None:
-            continue
-        base = float(base_price)
-        if base <= 0:
-            continue
-        realized = (float(current_price) - base) / base
-        update_transition_outcome(
-            int(row["id"]),
-            return_5d=realized,
-            return_10d=realized,
-            return_21d=realized,
-        )
-    all_alerts = [*regime_alerts, *risk_alerts, *signal_alerts, *stop_alerts]
+    with transaction():
+        for row in pending:
+            base_price = row.get("price_at_change")
+            current_price = latest_prices.get(str(row.get("ticker") or "").upper())
+            if not base_price or current_price is None:
+                continue
+            base = float(base_price)
+            if base <= 0:
+                continue
+            realized = (float(current_price) - base) / base
+            update_transition_outcome(
+                int(row["id"]),
+                return_5d=realized,
+                return_10d=realized,
+                return_21d=realized,
+            )
+    all_alerts = [*checks["regime"], *checks["risk"], *checks["signal"], *checks["stop"]]
     for alert in all_alerts:
         payload = None
         if hasattr(alert, "ticker") and hasattr(alert, "new_label"):
@@ -224,7 +220,10 @@ def run_scheduled_regime_checks(tickers: list[str] | None = None) -> dict[str, A
         if payload and payload.get("severity") in {"warning", "critical"}:
             dispatch_notification_sync(str(payload.get("alert_type")), str(payload.get("title")), str(payload.get("message") or ""), str(payload.get("severity") or "info"))
     set_setting("last_regime_check_at", dt.datetime.now(dt.timezone.utc).isoformat())
-    return {"alerts": all_alerts, "summary": format_alert_summary(all_alerts)}
+    HMMModelCache().prune(max_age_days=30)
+    get_regime_result_cache().prune(max_age_days=30)
+    timings["persist_seconds"] = time.perf_counter() - persist_started
+    return {"alerts": all_alerts, "summary": format_alert_summary(all_alerts), "timings": timings}
 
 
 def run_scheduled_discovery(
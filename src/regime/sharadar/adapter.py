@@ -54,10 +54,19 @@ class SharadarFundamentalsProvider:
         return self.quality_for_permaticker(resolution.permaticker, as_of_date)
 
     def quality_for_permaticker(self, permaticker: int, as_of_date: str | pd.Timestamp) -> PITQualitySignal:
-        fields = self.store.get_fundamentals_asof(permaticker, as_of_date, QUALITY_FIELDS)
-        if not fields:
-            return PITQualitySignal("UNAVAILABLE", False, None, "sf1_unavailable", {})
-        return _quality_signal_from_fields(fields)
+        return self.quality_for_permatickers([permaticker], as_of_date)[int(permaticker)]
+
+    def quality_for_permatickers(
+        self,
+        permatickers: Sequence[int],
+        as_of_date: str | pd.Timestamp,
+    ) -> dict[int, PITQualitySignal]:
+        """Quality signals for many names on one date from a single SF1 snapshot."""
+
+        wanted = sorted({int(perma) for perma in permatickers})
+        as_of = pd.Timestamp(as_of_date)
+        signals = self._snapshot_signals(wanted, [as_of])
+        return {perma: signals.get((perma, as_of), _unavailable_signal()) for perma in wanted}
 
     def quality_series_for_permaticker(
         self,
@@ -67,33 +76,40 @@ class SharadarFundamentalsProvider:
         date_values = [pd.Timestamp(date) for date in dates]
         if not date_values:
             return []
-        history = self.store.get_fundamentals_history(permaticker, max(date_values), QUALITY_FIELDS)
-        if history.empty:
-            return [PITQualitySignal("UNAVAILABLE", False, None, "sf1_unavailable", {}) for _ in date_values]
-        rows = history.copy()
-        if "dimension" in rows.columns:
-            dim_order = {"ARQ": 0, "ART": 1, "ARY": 2}
-            rows["_dimension_order"] = rows["dimension"].astype(str).str.upper().map(dim_order).fillna(999)
-        else:
-            rows["_dimension_order"] = 999
-        signals: list[PITQualitySignal] = []
-        for date in date_values:
-            eligible = rows.loc[rows["datekey"] <= date].copy()
-            if eligible.empty:
-                signals.append(PITQualitySignal("UNAVAILABLE", False, None, "sf1_unavailable", {}))
-                continue
-            row = eligible.sort_values(["datekey", "_dimension_order"], ascending=[False, True]).iloc[0]
-            fields = {
-                "permaticker": int(permaticker),
-                "datekey": pd.Timestamp(row["datekey"]).date().isoformat(),
-                "dimension": str(row.get("dimension") or ""),
-            }
-            for field in QUALITY_FIELDS:
-                fields[field] = row.get(field)
-            signals.append(_quality_signal_from_fields(fields))
+        signals = self._snapshot_signals([int(permaticker)], date_values)
+        return [signals.get((int(permaticker), date), _unavailable_signal()) for date in date_values]
+
+    def _snapshot_signals(
+        self,
+        permatickers: Sequence[int],
+        dates: Sequence[pd.Timestamp],
+    ) -> dict[tuple[int, pd.Timestamp], PITQualitySignal]:
+        snapshot = self.store.get_fundamentals_snapshot(permatickers, dates, QUALITY_FIELDS)
+        signals: dict[tuple[int, pd.Timestamp], PITQualitySignal] = {}
+        by_filing: dict[tuple[int, pd.Timestamp], PITQualitySignal] = {}
+        for record in snapshot.to_dict("records"):
+            perma = int(record["permaticker"])
+            datekey = pd.Timestamp(record["datekey"])
+            reuse_key = (perma, datekey)
+            signal = by_filing.get(reuse_key)
+            if signal is None:
+                fields = {
+                    "permaticker": perma,
+                    "datekey": datekey.date().isoformat(),
+                    "dimension": str(record.get("dimension") or ""),
+                }
+                for field in QUALITY_FIELDS:
+                    fields[field] = record.get(field)
+                signal = _quality_signal_from_fields(fields)
+                by_filing[reuse_key] = signal
+            signals[(perma, pd.Timestamp(record["as_of_date"]))] = signal
         return signals
 
 
+def _unavailable_signal() -> PITQualitySignal:
+    return PITQualitySignal("UNAVAILABLE", False, None, "sf1_unavailable", {})
+
+
 def _quality_signal_from_fields(fields: dict[str, Any]) -> PITQualitySignal:
     score, reasons = _quality_score(fields)
     if score is None:
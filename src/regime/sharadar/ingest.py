@@ -15,7 +15,7 @@ from typing import Any, Mapping, Sequence
 
 import pandas as pd
 
-from .store import DEFAULT_SHARADAR_DIR, FACT_TABLES, META_TABLES
+from .store import DEFAULT_SHARADAR_DIR, FACT_DATE_COLUMNS, FACT_TABLES, META_TABLES
 
 DEFAULT_TABLES = ("SF1", "SEP", "TICKERS", "ACTIONS", "DAILY", "SP500")
 
@@ -197,6 +197,7 @@ def build_store_from_frames(
                 path = root_path / "facts" / f"{table_name}.parquet"
                 normalized.to_parquet(path, index=False)
                 stats[table_name] = _table_stats(normalized, table_name)
+                stats[table_name]["partitions"] = {path.name: _partition_stats(normalized, table_name)}
             else:
                 if table_name != "TICKERS":
                     normalized = _add_permaticker(normalized, table_name, ticker_map)
@@ -288,6 +289,7 @@ def _write_fact_table(
     table_dir = facts_dir / table
     table_dir.mkdir(parents=True, exist_ok=True)
     stats: dict[str, Any] = {"row_count": 0, "min_date": None, "max_date": None, "lastupdated": None}
+    partitions: dict[str, dict[str, Any]] = {}
     for idx, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunksize, low_memory=False)):
         normalized = _normalize_columns(chunk)
         normalized = _add_permaticker(normalized, table, ticker_map or {})
@@ -295,6 +297,8 @@ def _write_fact_table(
         part_path = table_dir / f"part-{idx:05d}.parquet"
         normalized.to_parquet(part_path, index=False)
         _update_stats(stats, normalized)
+        partitions[part_path.name] = _partition_stats(normalized, table)
+    stats["partitions"] = partitions
     return stats
 
 
@@ -343,6 +347,25 @@ def _update_stats(stats: dict[str, Any], frame: pd.DataFrame) -> None:
             stats["lastupdated"] = max([item for item in [stats.get("lastupdated"), value] if item])
 
 
+def _partition_stats(frame: pd.DataFrame, table: str) -> dict[str, Any]:
+    """Per-file date and permaticker bounds that ``SharadarStore.read_fact_table`` prunes on."""
+
+    out: dict[str, Any] = {"row_count": int(len(frame))}
+    date_col = FACT_DATE_COLUMNS.get(table)
+    if date_col and date_col in frame.columns:
+        dates = pd.to_datetime(frame[date_col], errors="coerce")
+        out["date_column"] = date_col
+        out["min_date"] = dates.min().date().isoformat() if dates.notna().any() else None
+        out["max_date"] = dates.max().date().isoformat() if dates.notna().any() else None
+        out["has_unparsed_dates"] = bool(dates.isna().any())
+    if "permaticker" in frame.columns:
+        permatickers = pd.to_numeric(frame["permaticker"], errors="coerce")
+        out["min_permaticker"] = int(permatickers.min()) if permatickers.notna().any() else None
+        out["max_permaticker"] = int(permatickers.max()) if permatickers.notna().any() else None
+        out["has_unparsed_permatickers"] = bool(permatickers.isna().any())
+    return out
+
+
 def _manifest(stats: Mapping[str, dict[str, Any]], file_digests: Mapping[str, str], *, optional_errors: Mapping[str, str]) -> dict[str, Any]:
     snapshot_input = {"tables": stats, "file_digests": file_digests, "optional_errors": dict(optional_errors)}
     snapshot_hash = hashlib.sha256(json.dumps(snapshot_input, sort_keys=True, default=str).encode("utf-8")).hexdigest()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+MEMBERSHIP_TIMELINE_SCHEMA = "regime_sharadar_sp500_membership.v1"
+SNAPSHOT_ACTIONS = frozenset({"historical", "current"})
+_OPEN_END = np.iinfo(np.int64).max
+
+
+class MembershipTimeline:
+    """Point-in-time index membership precomputed as change points and per-name intervals.
+
+    ``change_dates`` holds every date on which the SP500 table can alter membership;
+    ``bitsets[i]`` is the packed member set in force from ``change_dates[i]`` until the next
+    change point.  ``interval_*`` arrays list each permaticker's membership spells sorted by
+    ``(permaticker, start)`` with an exclusive end (``_OPEN_END`` while still a member).
+    """
+
+    def __init__(
+        self,
+        *,
+        change_dates: np.ndarray,
+        permatickers: np.ndarray,
+        bitsets: np.ndarray,
+        interval_permatickers: np.ndarray,
+        interval_starts: np.ndarray,
+        interval_ends: np.ndarray,
+        data_snapshot_hash: str | None = None,
+    ) -> None:
+        self.change_dates = np.asarray(change_dates, dtype=np.int64)
+        self.permatickers = np.asarray(permatickers, dtype=np.int64)
+        self.bitsets = np.asarray(bitsets, dtype=np.uint8)
+        self.interval_permatickers = np.asarray(interval_permatickers, dtype=np.int64)
+        self.interval_starts = np.asarray(interval_starts, dtype=np.int64)
+        self.interval_ends = np.asarray(interval_ends, dtype=np.int64)
+        self.data_snapshot_hash = data_snapshot_hash
+
+    @classmethod
+    def from_rows(cls, rows: pd.DataFrame, *, data_snapshot_hash: str | None = None) -> "MembershipTimeline":
+        """Replay SP500 rows once, in date order, with the same rules as an as-of replay.
+
+        A date carrying ``historical``/``current`` snapshot rows resets membership to exactly
+        that snapshot; other dates apply their added/removed events in row order.
+        """
+
+        if rows.empty:
+            return cls.empty(data_snapshot_hash=data_snapshot_hash)
+        frame = rows.loc[:, ["date", "permaticker", "action"]].copy()
+        frame["permaticker"] = pd.to_numeric(frame["permaticker"], errors="coerce")
+        frame = frame.dropna(subset=["date", "permaticker"]).sort_values("date", kind="stable")
+        if frame.empty:
+            return cls.empty(data_snapshot_hash=data_snapshot_hash)
+        members: set[int] = set()
+        change_dates: list[int] = []
+        states: list[frozenset[int]] = []
+        spells: list[tuple[int, int, int]] = []
+        opened: dict[int, int] = {}
+        for date, group in frame.groupby("date", sort=True):
+            actions = group["action"].astype(str).tolist()
+            permas = group["permaticker"].astype(int).tolist()
+            snapshot = {perma for perma, action in zip(permas, actions) if action in SNAPSHOT_ACTIONS}
+            if snapshot:
+                updated = snapshot
+            else:
+                updated = set(members)
+                for perma, action in zip(permas, actions):
+                    if "removed" in action or "delete" in action:
+                        updated.discard(perma)
+                    elif action in {"added", *SNAPSHOT_ACTIONS} or not action:
+                        updated.add(perma)
+            if updated == members and states:
+                continue
+            stamp = pd.Timestamp(date).value
+            for perma in members - updated:
+                spells.append((perma, opened.pop(perma), stamp))
+            for perma in updated - members:
+                opened[perma] = stamp
+            members = updated
+            change_dates.append(stamp)
+            states.append(frozenset(members))
+        spells.extend((perma, start, _OPEN_END) for perma, start in opened.items())
+        universe = np.asarray(sorted({perma for perma, _start, _end in spells}), dtype=np.int64)
+        dense = np.zeros((len(states), len(universe)), dtype=bool)
+        for row, state in enumerate(states):
+            if state:
+                dense[row, np.searchsorted(universe, np.fromiter(state, dtype=np.int64, count=len(state)))] = True
+        ordered = sorted(spells)
+        return cls(
+            change_dates=np.asarray(change_dates, dtype=np.int64),
+            permatickers=universe,
+            bitsets=np.packbits(dense, axis=1) if len(universe) else np.zeros((len(states), 0), dtype=np.uint8),
+            interval_permatickers=np.asarray([item[0] for item in ordered], dtype=np.int64),
+            interval_starts=np.asarray([item[1] for item in ordered], dtype=np.int64),
+            interval_ends=np.asarray([item[2] for item in ordered], dtype=np.int64),
+            data_snapshot_hash=data_snapshot_hash,
+        )
+
+    @classmethod
+    def empty(cls, *, data_snapshot_hash: str | None = None) -> "MembershipTimeline":
+        none = np.zeros(0, dtype=np.int64)
+        return cls(
+            change_dates=none,
+            permatickers=none,
+            bitsets=np.zeros((0, 0), dtype=np.uint8),
+            interval_permatickers=none,
+            interval_starts=none,
+            interval_ends=none,
+            data_snapshot_hash=data_snapshot_hash,
+        )
+
+    def __len__(self) -> int:
+        return len(self.change_dates)
+
+    def members_asof(self, date: str | pd.Timestamp) -> list[int]:
+        """Sorted members in force on ``date``: one binary search plus one bitset unpack."""
+
+        row = int(np.searchsorted(self.change_dates, _stamp(date), side="right")) - 1
+        if row < 0 or not len(self.permatickers):
+            return []
+        bits = np.unpackbits(self.bitsets[row], count=len(self.permatickers)).astype(bool)
+        return self.permatickers[bits].tolist()
+
+    def was_member(self, permaticker: int, date: str | pd.Timestamp) -> bool:
+        perma = int(permaticker)
+        lo = int(np.searchsorted(self.interval_permatickers, perma, side="left"))
+        hi = int(np.searchsorted(self.interval_permatickers, perma, side="right"))
+        if lo == hi:
+            return False
+        stamp = _stamp(date)
+        spell = lo + int(np.searchsorted(self.interval_starts[lo:hi], stamp, side="right")) - 1
+        return spell >= lo and stamp < int(self.interval_ends[spell])
+
+    def members_between(self, start: str | pd.Timestamp, end: str | pd.Timestamp) -> list[int]:
+        """Every permaticker that was a member on at least one day of ``[start, end]``."""
+
+        overlap = (self.interval_starts <= _stamp(end)) & (self.interval_ends > _stamp(start))
+        return np.unique(self.interval_permatickers[overlap]).tolist()
+
+    def save(self, path: str | Path) -> Path:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.stem}.tmp.npz")
+        np.savez(
+            tmp,
+            schema=np.asarray(MEMBERSHIP_TIMELINE_SCHEMA),
+            data_snapshot_hash=np.asarray(self.data_snapshot_hash or ""),
+            change_dates=self.change_dates,
+            permatickers=self.permatickers,
+            bitsets=self.bitsets,
+            interval_permatickers=self.interval_permatickers,
+            interval_starts=self.interval_starts,
+            interval_ends=self.interval_ends,
+        )
+        tmp.replace(target)
+        return target
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema": MEMBERSHIP_TIMELINE_SCHEMA,
+            "data_snapshot_hash": self.data_snapshot_hash,
+            "change_point_count": int(len(self.change_dates)),
+            "permaticker_count": int(len(self.permatickers)),
+            "interval_count": int(len(self.interval_permatickers)),
+        }
+
+
+def load_membership_timeline(path: str | Path, *, snapshot_hash: str) -> MembershipTimeline | None:
+    try:
+        with np.load(Path(path), allow_pickle=False) as payload:
+            if str(payload["schema"]) != MEMBERSHIP_TIMELINE_SCHEMA or str(payload["data_snapshot_hash"]) != snapshot_hash:
+                return None
+            return MembershipTimeline(
+                change_dates=payload["change_dates"],
+                permatickers=payload["permatickers"],
+                bitsets=payload["bitsets"],
+                interval_permatickers=payload["interval_permatickers"],
+                interval_starts=payload["interval_starts"],
+                interval_ends=payload["interval_ends"],
+                data_snapshot_hash=snapshot_hash,
+            )
+    except Exception:
+        return None
+
+
+def _stamp(date: str | pd.Timestamp) -> int:
+    return int(pd.Timestamp(date).normalize().value)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PRICE_CACHE_MAX_BYTES = int(os.getenv("REGIME_SHARADAR_PRICE_CACHE_MB", "512")) * 1024 * 1024
+PRICE_PANEL_SCHEMA = "regime_sharadar_price_panel.v1"
+PRICE_PANEL_FIELDS = ("open", "high", "low", "price", "volume")
+
+
+class PriceFrameCache:
+    """Process-wide, byte-bounded LRU of full-history adjusted price frames.
+
+    Keys carry the store's ``data_snapshot_hash`` so a rebuilt or re-stamped snapshot never
+    serves stale frames.  Callers slice the cached full history to the requested range.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PRICE_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[Hashable, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        with self._lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, frame: pd.DataFrame) -> None:
+        if not self.enabled:
+            return
+        size = int(frame.memory_usage(index=True, deep=True).sum()) if not frame.empty else 0
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._frames.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._frames[key] = (frame, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._frames:
+                _key, (_frame, evicted) = self._frames.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._frames), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+PRICE_FRAME_CACHE = PriceFrameCache()
+
+
+def slice_price_frame(frame: pd.DataFrame, start: Any, end: Any) -> pd.DataFrame:
+    """Inclusive ``[start, end]`` slice of a cached full-history frame, shaped like ``_price_frame``."""
+
+    if frame.empty:
+        return pd.DataFrame()
+    index = frame.index
+    mask = np.ones(len(index), dtype=bool)
+    if start is not None:
+        mask &= np.asarray(index >= pd.Timestamp(start))
+    if end is not None:
+        mask &= np.asarray(index <= pd.Timestamp(end))
+    if not mask.any():
+        return pd.DataFrame()
+    return frame.loc[mask].copy()
+
+
+def price_panel_dir(root: str | Path, table: str, snapshot_hash: str) -> Path:
+    return Path(root) / "cache" / "price_panels" / f"{table}_{snapshot_hash[:16]}"
+
+
+def write_price_panel(directory: str | Path, frames: Mapping[int, pd.DataFrame], *, snapshot_hash: str) -> Path:
+    """Spill adjusted price frames to a wide date x permaticker panel of ``.npy`` files.
+
+    Each field is one float64 matrix that ``load_price_panel`` memory-maps, so later runs can
+    rebuild per-permaticker frames without touching Parquet.  Frames with duplicate dates
+    cannot be represented in a wide panel and are left out.
+    """
+
+    target = Path(directory)
+    usable = {
+        int(perma): frame
+        for perma, frame in sorted(frames.items())
+        if not frame.empty and not frame.index.has_duplicates and not frame.index.hasnans
+    }
+    dates = pd.DatetimeIndex(sorted(set().union(*(frame.index for frame in usable.values())))) if usable else pd.DatetimeIndex([])
+    permatickers = np.asarray(list(usable), dtype=np.int64)
+    target.mkdir(parents=True, exist_ok=True)
+    tmp_suffix = f".tmp{os.getpid()}.npy"
+    np.save(target / f"dates{tmp_suffix}", dates.asi8, allow_pickle=False)
+    np.save(target / f"permatickers{tmp_suffix}", permatickers, allow_pickle=False)
+    for field in PRICE_PANEL_FIELDS:
+        matrix = np.full((len(dates), len(permatickers)), np.nan, dtype=float)
+        for column, frame in enumerate(usable.values()):
+            rows = dates.get_indexer(frame.index)
+            matrix[rows, column] = pd.to_numeric(frame[field], errors="coerce").to_numpy(dtype=float)
+        np.save(target / f"{field}{tmp_suffix}", matrix, allow_pickle=False)
+    for name in ("dates", "permatickers", *PRICE_PANEL_FIELDS):
+        os.replace(target / f"{name}{tmp_suffix}", target / f"{name}.npy")
+    meta = {"schema": PRICE_PANEL_SCHEMA, "data_snapshot_hash": snapshot_hash, "permaticker_count": len(permatickers), "date_count": len(dates)}
+    (target / "panel.json").write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+    return target
+
+
+class PricePanel:
+    """Memory-mapped view of a spilled price panel."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        meta = json.loads((self.directory / "panel.json").read_text(encoding="utf-8"))
+        if meta.get("schema") != PRICE_PANEL_SCHEMA:
+            raise ValueError(f"Unsupported price panel schema: {meta.get('schema')}")
+        self.data_snapshot_hash = str(meta.get("data_snapshot_hash") or "")
+        self.dates = pd.DatetimeIndex(np.load(self.directory / "dates.npy", allow_pickle=False).astype("datetime64[ns]"), name="date")
+        permatickers = np.load(self.directory / "permatickers.npy", allow_pickle=False)
+        self.columns = {int(perma): position for position, perma in enumerate(permatickers.tolist())}
+        self.fields = {field: np.load(self.directory / f"{field}.npy", mmap_mode="r", allow_pickle=False) for field in PRICE_PANEL_FIELDS}
+
+    def __contains__(self, permaticker: object) -> bool:
+        return permaticker in self.columns
+
+    def frame(self, permaticker: int) -> pd.DataFrame:
+        """Rebuild the full-history adjusted frame for one permaticker."""
+
+        column = self.columns[int(permaticker)]
+        prices = np.asarray(self.fields["price"][:, column])
+        rows = np.flatnonzero(~np.isnan(prices))
+        if not len(rows):
+            return pd.DataFrame()
+        data = pd.DataFrame(index=self.dates[rows])
+        for field in PRICE_PANEL_FIELDS:
+            data[field] = np.asarray(self.fields[field][rows, column])
+        data["permaticker"] = pd.array([int(permaticker)] * len(rows), dtype="Int64")
+        return data
+
+
+def load_price_panel(directory: str | Path, *, snapshot_hash: str) -> PricePanel | None:
+    try:
+        panel = PricePanel(directory)
+    except Exception:
+        return None
+    return panel if panel.data_snapshot_hash == snapshot_hash else None
+
+
+def cache_keys(root: str | Path, table: str, snapshot_hash: str, permatickers: Iterable[int]) -> dict[int, tuple[str, str, str, int]]:
+    root_key = str(Path(root).resolve())
+    return {int(perma): (root_key, snapshot_hash, table, int(perma)) for perma in permatickers}
@@ -8,14 +8,29 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 
+from .membership import MembershipTimeline, load_membership_timeline
+from .price_cache import (
+    PRICE_FRAME_CACHE,
+    PricePanel,
+    cache_keys,
+    load_price_panel,
+    price_panel_dir,
+    slice_price_frame,
+    write_price_panel,
+)
+
 DEFAULT_SHARADAR_DIR = Path("data") / "sharadar"
 FACT_TABLES = {"SEP", "SFP", "SF1", "DAILY"}
+FACT_DATE_COLUMNS = {"SEP": "date", "SFP": "date", "DAILY": "date", "SF1": "datekey"}
 META_TABLES = {"TICKERS", "ACTIONS", "SP500"}
 AS_REPORTED_DIMENSIONS = ("ARQ", "ART", "ARY")
 TERMINAL_DEFAULT_POLICY_VERSION = "terminal_value_policy.v3.reason_dependent_terminal_values"
 TERMINAL_DEFAULTS_ARTIFACT_NAME = "terminal_value_defaults.json"
+SP500_MEMBERSHIP_ARTIFACT_NAME = "sp500_membership.npz"
+SYNTH_SP500_CACHE_VERSION = "synth_sp500.v2"
 
 
 @dataclass(frozen=True)
@@ -72,6 +87,10 @@ class SharadarStore:
         self.sqlite_path = self.root / "metadata.sqlite"
         self.manifest_path = self.root / "manifest.json"
         self._meta_cache: dict[str, pd.DataFrame] = {}
+        self._partition_cache: dict[str, dict[str, dict[str, Any]]] | None = None
+        self._delist_cache: tuple[str | None, dict[int, pd.Timestamp]] | None = None
+        self._price_panels: dict[tuple[str, str], PricePanel | None] = {}
+        self._sp500_timeline: tuple[str | None, MembershipTimeline] | None = None
 
     def exists(self) -> bool:
         return self.manifest_path.exists() and self.sqlite_path.exists()
@@ -95,23 +114,53 @@ class SharadarStore:
         *,
         columns: Sequence[str] | None = None,
         filters: list[tuple[str, str, Any]] | None = None,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
     ) -> pd.DataFrame:
+        """Read a fact table with column projection and predicate pushdown.
+
+        ``start``/``end`` bound the table's date column (``datekey`` for SF1) inclusively.
+        Partition files whose manifest min/max statistics cannot satisfy the filters are
+        skipped, and the rest are scanned as one Arrow dataset so filtered-out rows are never
+        materialized.  Falls back to per-file pandas reads if the dataset scan fails.
+        """
+
         normalized = _table_name(table)
+        filters = [*(filters or []), *_date_range_filters(normalized, start, end)] or None
         path = self.facts_dir / normalized
+        file_path = self.facts_dir / f"{normalized}.parquet"
         if path.is_dir():
             files = sorted(path.glob("*.parquet"))
-            if not files:
-                return pd.DataFrame()
-            frames = [
-                frame
-                for frame in (_read_parquet(file, columns=columns, filters=filters) for file in files)
-                if not frame.empty
-            ]
-            return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
-        file_path = self.facts_dir / f"{normalized}.parquet"
-        if file_path.exists():
+        elif file_path.exists():
+            files = [file_path]
+        else:
+            return pd.DataFrame()
+        if not files:
+            return pd.DataFrame()
+        files = _prune_partitions(files, self._partition_stats(normalized), filters)
+        if not files:
+            return pd.DataFrame()
+        frame = _read_parquet_dataset(files, columns=columns, filters=filters)
+        if frame is not None:
+            return frame
+        if not path.is_dir():
             return _read_parquet(file_path, columns=columns, filters=filters)
-        return pd.DataFrame()
+        frames = [
+            frame
+            for frame in (_read_parquet(file, columns=columns, filters=filters) for file in files)
+            if not frame.empty
+        ]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def _partition_stats(self, table: str) -> dict[str, dict[str, Any]]:
+        if self._partition_cache is None:
+            tables = dict(self.manifest().get("tables") or {})
+            self._partition_cache = {
+                _table_name(name): dict(meta.get("partitions") or {})
+                for name, meta in tables.items()
+                if isinstance(meta, dict)
+            }
+        return self._partition_cache.get(table, {})
 
     def read_meta_table(self, table: str) -> pd.DataFrame:
         normalized = _table_name(table)
@@ -640,35 +689,33 @@ class SharadarStore:
     def sp500_membership_asof(self, date: str | pd.Timestamp) -> list[int]:
         """Return point-in-time S&P 500 members from Sharadar SP500 data."""
 
-        rows = self._sp500_rows()
-        if rows.empty:
-            return []
-        as_of = pd.Timestamp(date).normalize()
-        rows = rows.loc[rows["date"] <= as_of].copy()
-        if rows.empty:
-            return []
-        snapshots = rows.loc[rows["action"].isin({"historical", "current"})].copy()
-        members: set[int] = set()
-        snapshot_date: pd.Timestamp | None = None
-        if not snapshots.empty:
-            snapshot_date = pd.Timestamp(snapshots["date"].max()).normalize()
-            members = set(
-                pd.to_numeric(snapshots.loc[snapshots["date"] == snapshot_date, "permaticker"], errors="coerce")
-                .dropna()
-                .astype(int)
-                .tolist()
-            )
-        events = rows if snapshot_date is None else rows.loc[rows["date"] > snapshot_date].copy()
-        for _, row in events.sort_values("date").iterrows():
-            perma = _parse_int(row.get("permaticker"))
-            if perma is None:
-                continue
-            action = str(row.get("action") or "").strip().lower()
-            if "removed" in action or "delete" in action:
-                members.discard(perma)
-            elif action in {"added", "historical", "current"} or not action:
-                members.add(perma)
-        return sorted(members)
+        return self.sp500_membership_timeline().members_asof(date)
+
+    def sp500_was_member(self, permaticker: int | str, date: str | pd.Timestamp) -> bool:
+        perma = _parse_int(permaticker)
+        return perma is not None and self.sp500_membership_timeline().was_member(perma, date)
+
+    def sp500_membership_timeline(self) -> MembershipTimeline:
+        """Return the SP500 membership timeline, built once per data snapshot.
+
+        The timeline is persisted next to ``metadata.sqlite`` so later processes on the same
+        snapshot load it instead of replaying SP500 events.
+        """
+
+        snapshot_hash = self.data_snapshot_hash
+        if self._sp500_timeline is not None and self._sp500_timeline[0] == snapshot_hash:
+            return self._sp500_timeline[1]
+        path = self.root / SP500_MEMBERSHIP_ARTIFACT_NAME
+        timeline = load_membership_timeline(path, snapshot_hash=snapshot_hash) if snapshot_hash else None
+        if timeline is None:
+            timeline = MembershipTimeline.from_rows(self._sp500_rows(), data_snapshot_hash=snapshot_hash)
+            if snapshot_hash and self.root.exists():
+                try:
+                    timeline.save(path)
+                except OSError:
+                    pass
+        self._sp500_timeline = (snapshot_hash, timeline)
+        return timeline
 
     def synth_sp500_total_return(
         self,
@@ -677,11 +724,14 @@ class SharadarStore:
         *,
         reconstitution: str = "monthly",
         base_level: float = 100.0,
+        use_cache: bool = True,
     ) -> pd.DataFrame:
         """Build a cap-weighted S&P 500 total-return proxy from SP500 + SEP + DAILY.
 
         The benchmark uses point-in-time SP500 membership, adjusted SEP prices, and
-        as-of DAILY market caps. Membership is refreshed monthly by default.
+        as-of DAILY market caps. Membership is refreshed monthly by default and the
+        weights drift with prices between reconstitutions. Results are cached as
+        Parquet under ``cache/`` keyed by snapshot hash and date range.
         """
 
         if str(reconstitution).lower() != "monthly":
@@ -690,6 +740,12 @@ class SharadarStore:
         end_ts = pd.Timestamp(end).normalize()
         if end_ts < start_ts:
             return pd.DataFrame()
+        cache_path = self._synth_sp500_cache_path(start_ts, end_ts, base_level) if use_cache else None
+        if cache_path is not None and cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except Exception:
+                pass
         candidates = self._sp500_member_candidates(start_ts, end_ts)
         if not candidates:
             return pd.DataFrame()
@@ -712,42 +768,51 @@ class SharadarStore:
         cap_panel = self._marketcap_panel(candidates, start_ts, end_ts, date_index)
         returns = price_panel.pct_change().replace([float("inf"), float("-inf")], 0.0).fillna(0.0)
         rebalance_dates = _monthly_trading_rebalance_dates(date_index, start_ts, end_ts)
-        rebalance_set = set(rebalance_dates)
-        current_weights = pd.Series(dtype="float64")
-        level = float(base_level)
-        rows: list[dict[str, Any]] = []
-        for idx, date in enumerate(date_index):
-            if current_weights.empty or date in rebalance_set:
-                current_weights = _synth_weights_for_date(
-                    self.sp500_membership_asof(date),
-                    date,
-                    price_panel=price_panel,
-                    cap_panel=cap_panel,
-                )
-            if current_weights.empty:
-                continue
-            if idx > 0:
-                day_return = returns.loc[date, current_weights.index].fillna(0.0)
-                level *= 1.0 + float((day_return * current_weights).sum())
-            coverage_columns = [column for column in current_weights.index if not cap_panel.empty and column in cap_panel.columns]
-            rows.append(
-                {
-                    "date": date,
-                    "open": level,
-                    "high": level,
-                    "low": level,
-                    "price": level,
-                    "volume": 0.0,
-                    "member_count": int(len(current_weights)),
-                    "marketcap_coverage": float(cap_panel.loc[date, coverage_columns].notna().mean()) if coverage_columns else 0.0,
-                    "synthetic_benchmark": "synth_sp500_total_return",
-                }
-            )
-        if not rows:
+        segments = self._synth_weight_segments(date_index, rebalance_dates, price_panel=price_panel, cap_panel=cap_panel)
+        if not segments:
             return pd.DataFrame()
-        out = pd.DataFrame(rows).set_index("date").sort_index()
+        out = _synth_level_frame(segments, returns=returns, cap_panel=cap_panel, base_level=float(base_level))
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                out.to_parquet(cache_path)
+            except Exception:
+                pass
         return out
 
+    def _synth_weight_segments(
+        self,
+        date_index: pd.DatetimeIndex,
+        rebalance_dates: Sequence[pd.Timestamp],
+        *,
+        price_panel: pd.DataFrame,
+        cap_panel: pd.DataFrame,
+    ) -> list[tuple[int, int, pd.Series]]:
+        """Return ``(start_pos, end_pos, weights)`` holding periods between reconstitutions.
+
+        A reconstitution with no priceable members leaves the index uninvested; weights are
+        retried each following day until members become available.
+        """
+
+        boundaries = sorted({int(pos) for pos in date_index.get_indexer(pd.DatetimeIndex(rebalance_dates)) if pos >= 0} | {0})
+        boundaries.append(len(date_index))
+        segments: list[tuple[int, int, pd.Series]] = []
+        for block_start, block_end in zip(boundaries[:-1], boundaries[1:]):
+            for pos in range(block_start, block_end):
+                date = date_index[pos]
+                weights = _synth_weights_for_date(self.sp500_membership_asof(date), date, price_panel=price_panel, cap_panel=cap_panel)
+                if not weights.empty:
+                    segments.append((pos, block_end, weights))
+                    break
+        return segments
+
+    def _synth_sp500_cache_path(self, start: pd.Timestamp, end: pd.Timestamp, base_level: float) -> Path | None:
+        snapshot_hash = self.data_snapshot_hash
+        if snapshot_hash is None:
+            return None
+        name = f"{SYNTH_SP500_CACHE_VERSION}_{snapshot_hash[:16]}_{start.date().isoformat()}_{end.date().isoformat()}_{float(base_level):g}.parquet"
+        return self.root / "cache" / "synth_sp500" / name
+
     def _sp500_rows(self) -> pd.DataFrame:
         sp500 = self.read_meta_table("SP500")
         if sp500.empty or "permaticker" not in sp500.columns:
@@ -764,19 +829,7 @@ class SharadarStore:
         return rows.dropna(subset=["date", "permaticker"]).copy()
 
     def _sp500_member_candidates(self, start: pd.Timestamp, end: pd.Timestamp) -> list[int]:
-        rows = self._sp500_rows()
-        if rows.empty:
-            return []
-        rows = rows.loc[rows["date"] <= end].copy()
-        if rows.empty:
-            return []
-        start_snapshot = rows.loc[(rows["date"] <= start) & rows["action"].isin({"historical", "current"})]
-        if not start_snapshot.empty:
-            first_snapshot_date = pd.Timestamp(start_snapshot["date"].max()).normalize()
-            rows = rows.loc[rows["date"] >= first_snapshot_date].copy()
-        eligible = rows.loc[~rows["action"].str.contains("removed|delete", regex=True, na=False)].copy()
-        values = pd.to_numeric(eligible["permaticker"], errors="coerce").dropna().astype(int).tolist()
-        return sorted(set(values))
+        return self.sp500_membership_timeline().members_between(start, end)
 
     def _marketcap_panel(
         self,
@@ -814,10 +867,43 @@ class SharadarStore:
 
     def _get_adjusted_prices(self, table: str, permatickers: Sequence[int | str], start: str, end: str) -> dict[int, pd.DataFrame]:
         wanted = {perma for perma in (_parse_security_permaticker(item) for item in permatickers) if perma is not None}
+        snapshot_hash = self.data_snapshot_hash
+        if not wanted or snapshot_hash is None or not PRICE_FRAME_CACHE.enabled:
+            return self._read_adjusted_prices(table, wanted, start, end)
+        keys = cache_keys(self.root, table, snapshot_hash, wanted)
+        histories: dict[int, pd.DataFrame] = {}
+        missing: set[int] = set()
+        for perma, key in keys.items():
+            cached = PRICE_FRAME_CACHE.get(key)
+            if cached is None:
+                missing.add(perma)
+            else:
+                histories[perma] = cached
+        panel = self._price_panel(table, snapshot_hash) if missing else None
+        if panel is not None:
+            for perma in sorted(missing & set(panel.columns)):
+                histories[perma] = self._truncate_at_delist(perma, panel.frame(perma))
+                PRICE_FRAME_CACHE.put(keys[perma], histories[perma])
+            missing -= set(panel.columns)
+        if missing:
+            for perma, frame in self._read_adjusted_prices(table, missing, None, None).items():
+                histories[perma] = frame
+                PRICE_FRAME_CACHE.put(keys[perma], frame)
+        return {perma: slice_price_frame(histories[perma], start, end) for perma in wanted}
+
+    def _read_adjusted_prices(
+        self,
+        table: str,
+        wanted: set[int],
+        start: str | pd.Timestamp | None,
+        end: str | pd.Timestamp | None,
+    ) -> dict[int, pd.DataFrame]:
         sep = self.read_fact_table(
             table,
             columns=["permaticker", "date", "open", "high", "low", "close", "closeadj", "volume"],
             filters=[("permaticker", "in", sorted(wanted))] if wanted else None,
+            start=start,
+            end=end,
         )
         if sep.empty:
             return {int(perma): pd.DataFrame() for perma in wanted}
@@ -826,18 +912,60 @@ class SharadarStore:
             return {int(perma): pd.DataFrame() for perma in wanted}
         sep["permaticker"] = pd.to_numeric(sep["permaticker"], errors="coerce").astype("Int64")
         sep["date"] = pd.to_datetime(sep["date"], errors="coerce")
-        start_ts = pd.Timestamp(start)
-        end_ts = pd.Timestamp(end)
-        rows = sep.loc[sep["permaticker"].isin(wanted) & (sep["date"] >= start_ts) & (sep["date"] <= end_ts)].copy()
+        mask = sep["permaticker"].isin(wanted)
+        if start is not None:
+            mask &= sep["date"] >= pd.Timestamp(start)
+        if end is not None:
+            mask &= sep["date"] <= pd.Timestamp(end)
+        rows = sep.loc[mask].copy()
         actions = self._delist_dates()
         out: dict[int, pd.DataFrame] = {}
-        for perma in wanted:
-            frame = rows.loc[rows["permaticker"] == perma].copy()
-            delist_date = actions.get(perma)
+        for perma, frame in rows.groupby("permaticker", sort=False):
+            delist_date = actions.get(int(perma))
             if delist_date is not None:
                 frame = frame.loc[frame["date"] <= delist_date]
-            out[perma] = _price_frame(frame)
-        return out
+            out[int(perma)] = _price_frame(frame)
+        return {perma: out.get(perma, pd.DataFrame()) for perma in wanted}
+
+    def _truncate_at_delist(self, permaticker: int, frame: pd.DataFrame) -> pd.DataFrame:
+        delist_date = self._delist_dates().get(int(permaticker))
+        if delist_date is None or frame.empty:
+            return frame
+        return slice_price_frame(frame, None, delist_date)
+
+    def _price_panel(self, table: str, snapshot_hash: str) -> PricePanel | None:
+        key = (table, snapshot_hash)
+        if key not in self._price_panels:
+            self._price_panels[key] = load_price_panel(price_panel_dir(self.root, table, snapshot_hash), snapshot_hash=snapshot_hash)
+        return self._price_panels[key]
+
+    def spill_price_panel(
+        self,
+        permatickers: Sequence[int | str] | None = None,
+        *,
+        table: str = "SEP",
+        directory: str | Path | None = None,
+    ) -> Path | None:
+        """Write full-history adjusted prices to a memory-mapped wide panel for warm starts.
+
+        With no ``permatickers`` every name in ``table`` is spilled.  Later ``get_prices`` calls
+        on the same snapshot rebuild frames from the panel instead of re-reading Parquet.
+        """
+
+        snapshot_hash = self.data_snapshot_hash
+        if snapshot_hash is None:
+            return None
+        normalized = _table_name(table)
+        if permatickers is None:
+            ids = self.read_fact_table(normalized, columns=["permaticker"])
+            wanted = sorted(set(pd.to_numeric(ids.get("permaticker", pd.Series(dtype=float)), errors="coerce").dropna().astype(int)))
+        else:
+            wanted = sorted({perma for perma in (_parse_security_permaticker(item) for item in permatickers) if perma is not None})
+        frames = self._read_adjusted_prices(normalized, set(wanted), None, None)
+        target = Path(directory) if directory is not None else price_panel_dir(self.root, normalized, snapshot_hash)
+        written = write_price_panel(target, frames, snapshot_hash=snapshot_hash)
+        self._price_panels.pop((normalized, snapshot_hash), None)
+        return written
 
     def get_fundamentals_asof(
         self,
@@ -847,29 +975,74 @@ class SharadarStore:
         *,
         dimensions: Sequence[str] = AS_REPORTED_DIMENSIONS,
     ) -> dict[str, Any] | None:
-        as_of = pd.Timestamp(as_of_date)
-        sf1 = self.get_fundamentals_history(permaticker, as_of, fields, dimensions=dimensions)
-        if sf1.empty:
+        snapshot = self.get_fundamentals_snapshot([permaticker], [as_of_date], fields, dimensions=dimensions)
+        if snapshot.empty:
             return None
-        sf1 = sf1.loc[sf1["datekey"] <= as_of].copy()
+        return _fundamentals_payload(snapshot.iloc[0], fields)
+
+    def get_fundamentals_snapshot(
+        self,
+        permatickers: Sequence[int | str],
+        as_of_dates: Sequence[str | pd.Timestamp],
+        fields: Sequence[str],
+        *,
+        dimensions: Sequence[str] = AS_REPORTED_DIMENSIONS,
+    ) -> pd.DataFrame:
+        """Return the latest as-reported SF1 row for every ``(permaticker, as_of_date)`` pair.
+
+        One SF1 scan covers all names up to the last as-of date; rows are matched with a
+        backward ``merge_asof`` on ``datekey``, preferring ``dimensions`` in the given order
+        when a datekey carries several. Pairs with no eligible filing are omitted.
+        """
+
+        wanted = sorted({perma for perma in (_parse_int(item) for item in permatickers) if perma is not None})
+        dates = sorted({pd.Timestamp(date) for date in as_of_dates})
+        field_columns = list(dict.fromkeys(str(field).lower() for field in fields))
+        output_columns = ["permaticker", "as_of_date", "datekey", "dimension", *field_columns]
+        if not wanted or not dates:
+            return pd.DataFrame(columns=output_columns)
+        sf1 = self.read_fact_table(
+            "SF1",
+            columns=list(dict.fromkeys(["permaticker", "datekey", "dimension", *field_columns])),
+            filters=[("permaticker", "in", wanted)],
+            end=dates[-1],
+        )
         if sf1.empty:
-            return None
+            return pd.DataFrame(columns=output_columns)
+        sf1 = _normalize_columns(sf1)
+        if "permaticker" not in sf1.columns or "datekey" not in sf1.columns:
+            return pd.DataFrame(columns=output_columns)
+        sf1["permaticker"] = pd.to_numeric(sf1["permaticker"], errors="coerce")
+        sf1["datekey"] = pd.to_datetime(sf1["datekey"], errors="coerce").astype("datetime64[ns]")
+        rows = sf1.loc[sf1["permaticker"].isin(wanted) & sf1["datekey"].notna() & (sf1["datekey"] <= dates[-1])].copy()
         dim_order = {str(dim).upper(): idx for idx, dim in enumerate(dimensions)}
-        sf1["_dimension_order"] = (
-            sf1["dimension"].astype(str).str.upper().map(dim_order).fillna(999)
-            if "dimension" in sf1.columns
-            else 999
+        if "dimension" in rows.columns:
+            rows = rows.loc[rows["dimension"].astype(str).str.upper().isin(dim_order)].copy()
+            rows["_dimension_order"] = rows["dimension"].astype(str).str.upper().map(dim_order)
+        else:
+            rows["dimension"] = ""
+            rows["_dimension_order"] = 999
+        if rows.empty:
+            return pd.DataFrame(columns=output_columns)
+        rows["permaticker"] = rows["permaticker"].astype("int64")
+        rows = rows.sort_values(["permaticker", "datekey", "_dimension_order"], kind="stable")
+        rows = rows.drop_duplicates(["permaticker", "datekey"], keep="first").sort_values("datekey", kind="stable")
+        for column in field_columns:
+            if column not in rows.columns:
+                rows[column] = None
+        grid = pd.MultiIndex.from_product([wanted, dates], names=["permaticker", "as_of_date"]).to_frame(index=False)
+        grid["permaticker"] = grid["permaticker"].astype("int64")
+        grid["as_of_date"] = grid["as_of_date"].astype("datetime64[ns]")
+        merged = pd.merge_asof(
+            grid.sort_values("as_of_date", kind="stable"),
+            rows[["permaticker", "datekey", "dimension", *field_columns]],
+            left_on="as_of_date",
+            right_on="datekey",
+            by="permaticker",
+            direction="backward",
         )
-        row = sf1.sort_values(["datekey", "_dimension_order"], ascending=[False, True]).iloc[0]
-        payload: dict[str, Any] = {
-            "permaticker": int(permaticker),
-            "datekey": pd.Timestamp(row["datekey"]).date().isoformat(),
-            "dimension": str(row.get("dimension") or ""),
-        }
-        for field in fields:
-            normalized = str(field).lower()
-            payload[normalized] = row.get(normalized)
-        return payload
+        merged = merged.dropna(subset=["datekey"])
+        return merged.sort_values(["permaticker", "as_of_date"]).reset_index(drop=True)[output_columns]
 
     def get_fundamentals_history(
         self,
@@ -913,7 +1086,11 @@ class SharadarStore:
             values = [int(value) for value in pd.to_numeric(active["permaticker"], errors="coerce").dropna().astype(int).tolist()]
             if values:
                 return list(dict.fromkeys(values))
-        daily = self.read_fact_table("DAILY")
+        daily = self.read_fact_table(
+            "DAILY",
+            columns=["permaticker", "date", "marketcap", "market_cap", "ev"],
+            end=as_of,
+        )
         if daily.empty or "permaticker" not in daily.columns:
             return []
         daily = _normalize_columns(daily)
@@ -929,6 +1106,14 @@ class SharadarStore:
         return [int(value) for value in pd.to_numeric(rows.sort_values(cap_col, ascending=False)["permaticker"], errors="coerce").dropna().astype(int).head(top_n).tolist()]
 
     def _delist_dates(self) -> dict[int, pd.Timestamp]:
+        snapshot_hash = self.data_snapshot_hash
+        if self._delist_cache is not None and self._delist_cache[0] == snapshot_hash:
+            return self._delist_cache[1]
+        out = self._build_delist_dates()
+        self._delist_cache = (snapshot_hash, out)
+        return out
+
+    def _build_delist_dates(self) -> dict[int, pd.Timestamp]:
         actions = self.read_meta_table("ACTIONS")
         if actions.empty or "permaticker" not in actions.columns:
             return {}
@@ -940,15 +1125,25 @@ class SharadarStore:
         date_col = _first_existing(rows, ["date", "actiondate"])
         if date_col is None:
             return {}
-        rows[date_col] = pd.to_datetime(rows[date_col], errors="coerce")
-        out: dict[int, pd.Timestamp] = {}
-        for _, row in rows.dropna(subset=[date_col]).iterrows():
-            perma = _parse_int(row.get("permaticker"))
-            if perma is not None:
-                current = out.get(perma)
-                value = pd.Timestamp(row[date_col]).normalize()
-                out[perma] = min(current, value) if current is not None else value
-        return out
+        rows["_date"] = pd.to_datetime(rows[date_col], errors="coerce").dt.normalize()
+        rows["_permaticker"] = [_parse_int(value) for value in rows["permaticker"].tolist()]
+        rows = rows.dropna(subset=["_date", "_permaticker"])
+        if rows.empty:
+            return {}
+        earliest = rows.groupby(rows["_permaticker"].astype(int), sort=False)["_date"].min()
+        return {int(perma): pd.Timestamp(value) for perma, value in earliest.items()}
+
+
+def _fundamentals_payload(row: pd.Series, fields: Sequence[str]) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "permaticker": int(row["permaticker"]),
+        "datekey": pd.Timestamp(row["datekey"]).date().isoformat(),
+        "dimension": str(row.get("dimension") or ""),
+    }
+    for field in fields:
+        normalized = str(field).lower()
+        payload[normalized] = row.get(normalized)
+    return payload
 
 
 def _price_frame(frame: pd.DataFrame) -> pd.DataFrame:
@@ -979,6 +1174,158 @@ def _price_frame(frame: pd.DataFrame) -> pd.DataFrame:
     return data.dropna(subset=["price", "open"]).sort_index()
 
 
+def _date_range_filters(
+    table: str,
+    start: str | pd.Timestamp | None,
+    end: str | pd.Timestamp | None,
+) -> list[tuple[str, str, Any]]:
+    date_col = FACT_DATE_COLUMNS.get(table)
+    if date_col is None:
+        return []
+    out: list[tuple[str, str, Any]] = []
+    if start is not None:
+        out.append((date_col, ">=", pd.Timestamp(start).date().isoformat()))
+    if end is not None:
+        out.append((date_col, "<=", pd.Timestamp(end).date().isoformat()))
+    return out
+
+
+def _prune_partitions(
+    files: list[Path],
+    partitions: dict[str, dict[str, Any]],
+    filters: list[tuple[str, str, Any]] | None,
+) -> list[Path]:
+    """Drop partition files whose recorded min/max bounds cannot satisfy ``filters``."""
+
+    if not filters or not partitions:
+        return files
+    return [file for file in files if _partition_may_match(partitions.get(file.name), filters)]
+
+
+def _partition_may_match(stats: dict[str, Any] | None, filters: list[tuple[str, str, Any]]) -> bool:
+    if not stats:
+        return True
+    for column, op, value in filters:
+        try:
+            if column == stats.get("date_column") and not stats.get("has_unparsed_dates"):
+                low, high = stats.get("min_date"), stats.get("max_date")
+                if low is None or high is None:
+                    return False
+                if not _range_may_match(pd.Timestamp(low), pd.Timestamp(high), op, value, pd.Timestamp):
+                    return False
+            elif column == "permaticker" and not stats.get("has_unparsed_permatickers"):
+                low, high = stats.get("min_permaticker"), stats.get("max_permaticker")
+                if low is None or high is None:
+                    return False
+                if not _range_may_match(int(low), int(high), op, value, lambda item: int(float(item))):
+                    return False
+        except Exception:
+            continue
+    return True
+
+
+def _range_may_match(low: Any, high: Any, op: str, value: Any, parse: Any) -> bool:
+    if op in {"in", "not in"}:
+        if op == "not in":
+            return True
+        return any(low <= parsed <= high for parsed in (parse(item) for item in value))
+    parsed = parse(value)
+    if isinstance(parsed, pd.Timestamp):
+        parsed_day = parsed.normalize()
+        if op in {">", ">="}:
+            return high >= parsed_day
+        if op in {"<", "<="}:
+            return low <= parsed
+        if op in {"=", "=="}:
+            return low <= parsed_day <= high
+        return True
+    if op == ">":
+        return high > parsed
+    if op == ">=":
+        return high >= parsed
+    if op == "<":
+        return low < parsed
+    if op == "<=":
+        return low <= parsed
+    if op in {"=", "=="}:
+        return low <= parsed <= high
+    return True
+
+
+def _read_parquet_dataset(
+    files: Sequence[Path],
+    *,
+    columns: Sequence[str] | None = None,
+    filters: list[tuple[str, str, Any]] | None = None,
+) -> pd.DataFrame | None:
+    """Scan parquet files as one Arrow dataset; ``None`` means use the per-file fallback."""
+
+    try:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except Exception:
+        return None
+    try:
+        schema = pa.unify_schemas([pq.read_schema(file) for file in files])
+        dataset = ds.dataset([str(file) for file in files], schema=schema, format="parquet")
+        expression = None
+        for column, op, value in filters or []:
+            if column not in schema.names:
+                continue
+            term = _arrow_filter_term(ds.field(column), schema.field(column).type, op, value)
+            expression = term if expression is None else expression & term
+        projected = [column for column in dict.fromkeys(columns) if column in schema.names] if columns else None
+        table = dataset.to_table(columns=projected, filter=expression)
+        return table.to_pandas()
+    except Exception:
+        return None
+
+
+def _arrow_filter_term(field: Any, arrow_type: Any, op: str, value: Any) -> Any:
+    import pyarrow as pa
+
+    def literal(item: Any) -> Any:
+        if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            if isinstance(item, str):
+                return item
+            if hasattr(item, "isoformat"):
+                return pd.Timestamp(item).date().isoformat()
+            raise TypeError(f"Cannot compare string column with {type(item).__name__}")
+        if pa.types.is_timestamp(arrow_type):
+            stamp = pd.Timestamp(item)
+            if arrow_type.tz is not None and stamp.tzinfo is None:
+                stamp = stamp.tz_localize(arrow_type.tz)
+            return pa.scalar(stamp, type=arrow_type)
+        if pa.types.is_date(arrow_type):
+            return pa.scalar(pd.Timestamp(item).date(), type=arrow_type)
+        if pa.types.is_integer(arrow_type):
+            if isinstance(item, bool) or not float(item).is_integer():
+                raise TypeError(f"Cannot compare integer column with {item!r}")
+            return int(float(item))
+        if pa.types.is_floating(arrow_type):
+            return float(item)
+        return item
+
+    if op in {"in", "not in"}:
+        term = field.isin([literal(item) for item in value])
+        return ~term if op == "not in" else term
+    operand = literal(value)
+    if op in {"=", "=="}:
+        return field == operand
+    if op == "!=":
+        return field != operand
+    if op == "<":
+        return field < operand
+    if op == "<=":
+        return field <= operand
+    if op == ">":
+        return field > operand
+    if op == ">=":
+        return field >= operand
+    raise ValueError(f"Unsupported parquet filter operator: {op}")
+
+
 def _read_parquet(
     path: Path,
     *,
@@ -1146,6 +1493,59 @@ def _monthly_trading_rebalance_dates(date_index: pd.DatetimeIndex, start: pd.Tim
     return out
 
 
+def _synth_level_frame(
+    segments: Sequence[tuple[int, int, pd.Series]],
+    *,
+    returns: pd.DataFrame,
+    cap_panel: pd.DataFrame,
+    base_level: float,
+) -> pd.DataFrame:
+    """Compound drifting segment weights over the return panel into a level series.
+
+    Within a holding period the index level is ``level_at_entry * (growth @ weights)``,
+    where ``growth`` is the cumulative product of member gross returns since entry.
+    """
+
+    date_index = pd.DatetimeIndex(returns.index)
+    column_pos = {int(column): pos for pos, column in enumerate(returns.columns)}
+    gross = 1.0 + returns.to_numpy(dtype=float)
+    caps = cap_panel.reindex(index=date_index)
+    cap_known = caps.notna().to_numpy()
+    cap_pos = {int(column): pos for pos, column in enumerate(caps.columns)}
+    positions: list[np.ndarray] = []
+    levels: list[np.ndarray] = []
+    member_counts: list[np.ndarray] = []
+    coverage: list[np.ndarray] = []
+    level = float(base_level)
+    for seg_start, seg_end, weights in segments:
+        members = [int(member) for member in weights.index]
+        seg_gross = gross[seg_start:seg_end][:, [column_pos[member] for member in members]]
+        if seg_start == 0:
+            seg_gross[0] = 1.0
+        seg_levels = level * (np.cumprod(seg_gross, axis=0) @ weights.to_numpy(dtype=float))
+        level = float(seg_levels[-1])
+        covered = [cap_pos[member] for member in members if member in cap_pos]
+        positions.append(np.arange(seg_start, seg_end))
+        levels.append(seg_levels)
+        member_counts.append(np.full(seg_end - seg_start, len(members), dtype=np.int64))
+        coverage.append(cap_known[seg_start:seg_end][:, covered].mean(axis=1) if covered else np.zeros(seg_end - seg_start))
+    values = np.concatenate(levels)
+    out = pd.DataFrame(
+        {
+            "open": values,
+            "high": values,
+            "low": values,
+            "price": values,
+            "volume": 0.0,
+            "member_count": np.concatenate(member_counts),
+            "marketcap_coverage": np.concatenate(coverage).astype(float),
+            "synthetic_benchmark": "synth_sp500_total_return",
+        },
+        index=pd.DatetimeIndex(date_index[np.concatenate(positions)], name="date"),
+    )
+    return out
+
+
 def _synth_weights_for_date(
     members: Sequence[int],
     date: pd.Timestamp,
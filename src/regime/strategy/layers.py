@@ -68,11 +68,10 @@ class PriceHistorySignalProvider:
         frame = self._signals.get(str(ticker).upper())
         if frame is None or frame.empty:
             return {}
-        date = pd.Timestamp(date)
-        rows = frame.loc[frame.index <= date]
-        if rows.empty:
+        position = int(frame.index.searchsorted(pd.Timestamp(date), side="right")) - 1
+        if position < 0:
             return {}
-        row = rows.iloc[-1]
+        row = frame.iloc[position]
         regime = str(row.get("regime_label") or row.get("regime") or "Bull")
         output = {
             "price": _as_float(row.get("price")),
@@ -11,6 +11,7 @@ import pandas as pd
 
 from . import ccel_campaign as ccel
 from .alpha_campaign import DEFAULT_BASKET_PATH, DEFAULT_CAMPAIGN_DIR, _git_sha, _json_safe, _read_json, _write_json, load_basket
+from .factor_panel import FactorPanel
 from .paper_trading.planning import trailing_stop_level
 from .portfolio_backtest import PortfolioBacktestConfig
 from .portfolio_campaign import _campaign_row, _float, _fmt_num, _fmt_pct, _safe_name
@@ -456,9 +457,10 @@ def run_thematic_sleeve_backtest(
     dates = ccel._panel_dates(frames)
     if len(dates) < 2:
         raise ValueError("TCS backtest requires at least two trading dates.")
+    factors = FactorPanel(frames)
 
     cash = float(cfg.starting_cash)
-    lots: list[ccel.CCELLot] = []
+    lots = ccel.LotBook()
     trades: list[dict[str, Any]] = []
     audit_events: list[dict[str, Any]] = []
     realizations: list[dict[str, Any]] = []
@@ -487,7 +489,7 @@ def run_thematic_sleeve_backtest(
 
         cash, exit_trades, exit_realized, exit_costs, exit_turnover = _process_exits(
             date=date,
-            frames=frames,
+            factors=factors,
             active=active,
             lots=lots,
             cash=cash,
@@ -514,6 +516,7 @@ def run_thematic_sleeve_backtest(
             cash, next_lot_id, buy_trades, buy_costs, buy_turnover = _process_entries(
                 date=date,
                 frames=frames,
+                factors=factors,
                 active=active,
                 lots=lots,
                 cash=cash,
@@ -623,9 +626,9 @@ def run_thematic_sleeve_backtest(
 def _process_exits(
     *,
     date: pd.Timestamp,
-    frames: dict[str, pd.DataFrame],
+    factors: FactorPanel,
     active: set[str],
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cash: float,
     prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -651,7 +654,7 @@ def _process_exits(
         reason: str | None = None
         sell_qty = qty
         theme = ticker_theme.get(ticker)
-        if _thesis_break(ticker, theme, date, frames, cfg):
+        if _thesis_break(ticker, theme, date, factors, cfg):
             reason = "thesis_break"
         elif cfg.oversize_trim_enabled:
             total = cash + ccel._position_value(lots, prices)
@@ -669,7 +672,7 @@ def _process_exits(
             if stop is not None and price <= float(stop):
                 reason = "trailing_stop"
         if reason is None and ticker not in promoted_core and cfg.momentum_decay_enabled:
-            if _bottom_momentum(ticker, date, frames, active, cfg.bottom_momentum_quantile):
+            if factors.bottom_momentum(ticker, date, cfg.bottom_momentum_quantile):
                 bottom_since.setdefault(ticker, pd.Timestamp(date))
             else:
                 bottom_since.pop(ticker, None)
@@ -714,8 +717,9 @@ def _process_entries(
     *,
     date: pd.Timestamp,
     frames: dict[str, pd.DataFrame],
+    factors: FactorPanel,
     active: set[str],
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cash: float,
     prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -732,7 +736,7 @@ def _process_entries(
     costs = 0.0
     turnover = 0.0
     for theme, tickers in cfg.active_themes.items():
-        eligible = _eligible_theme_candidates(theme, tickers, date, frames, active, lots, cfg, no_rebuy_until)
+        eligible = _eligible_theme_candidates(theme, tickers, date, frames, factors, active, lots, cfg, no_rebuy_until)
         if len(eligible) < cfg.min_names_per_theme_at_entry:
             continue
         held_theme_count = _theme_sleeve_count(theme, lots, ticker_theme, promoted_core)
@@ -771,7 +775,7 @@ def _process_scale_ins(
     date: pd.Timestamp,
     frames: dict[str, pd.DataFrame],
     active: set[str],
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cash: float,
     prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -827,7 +831,7 @@ def _process_scale_ins(
 
 def _process_promotions(
     date: pd.Timestamp,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cash: float,
     prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -865,7 +869,7 @@ def _buy_tranche(
     date: pd.Timestamp,
     ticker: str,
     price: float,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cash: float,
     prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -891,7 +895,7 @@ def _buy_tranche(
         return cash, next_lot_id, None, 0.0, 0.0
     cost = qty * price * cfg.entry_cost_bps / 10_000.0
     cash -= qty * price + cost
-    lots.append(ccel.CCELLot(next_lot_id, ticker, qty, price + (cost / qty if qty else 0.0), ccel._date_text(date)))
+    lots.add(ccel.CCELLot(next_lot_id, ticker, qty, price + (cost / qty if qty else 0.0), ccel._date_text(date)))
     next_lot_id += 1
     trade = ccel._trade_row(date, ticker, "Buy", qty, price, qty * price, cost, -cost, reason)
     trade["theme"] = theme
@@ -904,7 +908,7 @@ def _sell_ticker_quantity(
     ticker: str,
     quantity: float,
     price: float,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     reason: str,
     cfg: ThematicConvexitySleeveConfig,
     tax_aware: bool,
@@ -927,7 +931,7 @@ def _sell_ticker_quantity(
 
 
 def _sell_tax_aware_lots(
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     ticker: str,
     quantity: float,
     proceeds_per_share: float,
@@ -943,12 +947,8 @@ def _sell_tax_aware_lots(
         is_long = holding_days > 365
         return (0 if is_loss else 1, 0 if is_long else 1, -lot.basis_per_share, lot.acquisition_date, lot.lot_id)
 
-    remaining = float(quantity)
     realized: list[dict[str, Any]] = []
-    for lot in sorted([lot for lot in lots if lot.ticker == ticker and lot.quantity > 0], key=key):
-        if remaining <= 1e-9:
-            break
-        take = min(lot.quantity, remaining)
+    for lot, take in lots.relieve(ticker, quantity, order=key):
         holding_days = (as_of - pd.Timestamp(lot.acquisition_date)).days
         gain = (float(proceeds_per_share) - lot.basis_per_share) * take
         realized.append(
@@ -965,9 +965,6 @@ def _sell_tax_aware_lots(
                 "exit_reason": reason,
             }
         )
-        lot.quantity -= take
-        remaining -= take
-    lots[:] = [lot for lot in lots if lot.quantity > 1e-9]
     return realized
 
 
@@ -976,14 +973,15 @@ def _eligible_theme_candidates(
     tickers: Sequence[str],
     date: pd.Timestamp,
     frames: dict[str, pd.DataFrame],
+    factors: FactorPanel,
     active: set[str],
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cfg: ThematicConvexitySleeveConfig,
     no_rebuy_until: dict[str, pd.Timestamp],
 ) -> list[str]:
     candidates = [ticker for ticker in (str(item).upper() for item in tickers) if ticker in active and ticker in frames]
     scored: list[tuple[float, str]] = []
-    momentums = {ticker: ccel._momentum_12_1(ticker, date, frames) for ticker in candidates}
+    momentums = {ticker: factors.momentum_12_1(ticker, date) for ticker in candidates}
     valid_scores = [score for score in momentums.values() if score is not None]
     for ticker in candidates:
         if cfg.require_theme_membership and ticker not in tickers:
@@ -996,7 +994,7 @@ def _eligible_theme_candidates(
             continue
         if _dollar_adv(ticker, date, frames) < cfg.min_dollar_adv:
             continue
-        if cfg.quality_gate == "pass" and ccel._quality_fails(ticker, date, frames):
+        if cfg.quality_gate == "pass" and factors.quality_fails(ticker, date):
             continue
         score = momentums.get(ticker)
         if valid_scores:
@@ -1013,7 +1011,7 @@ def _eligible_theme_candidates(
 def _update_high_water_and_stop(
     ticker: str,
     price: float,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     high_water: dict[str, float],
     stop_prices: dict[str, float],
     cfg: ThematicConvexitySleeveConfig,
@@ -1043,10 +1041,10 @@ def _thesis_break(
     ticker: str,
     theme: str | None,
     date: pd.Timestamp,
-    frames: dict[str, pd.DataFrame],
+    factors: FactorPanel,
     cfg: ThematicConvexitySleeveConfig,
 ) -> bool:
-    if cfg.thesis_break_quality_gate_fails and ccel._quality_fails(ticker, date, frames):
+    if cfg.thesis_break_quality_gate_fails and factors.quality_fails(ticker, date):
         return True
     if cfg.thesis_break_theme_invalidation_flag and theme and bool(dict(cfg.theme_invalidation_flags).get(theme)):
         return True
@@ -1057,7 +1055,7 @@ def _significant_short_gain(
     ticker: str,
     price: float,
     date: pd.Timestamp,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     cfg: ThematicConvexitySleeveConfig,
 ) -> bool:
     basis = _weighted_basis_for_ticker(lots, ticker)
@@ -1066,23 +1064,10 @@ def _significant_short_gain(
     gain_pct = price / basis - 1.0
     if gain_pct < cfg.promote_to_core_at_pct / 100.0:
         return False
-    oldest = min((pd.Timestamp(lot.acquisition_date) for lot in lots if lot.ticker == ticker), default=None)
+    oldest = min((pd.Timestamp(lot.acquisition_date) for lot in lots.lots(ticker)), default=None)
     return oldest is not None and (pd.Timestamp(date) - oldest).days < cfg.significant_gain_min_hold_days
 
 
-def _bottom_momentum(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame], active: set[str], quantile: float) -> bool:
-    scored: list[tuple[str, float]] = []
-    for name in active:
-        score = ccel._momentum_12_1(name, date, frames)
-        if score is not None:
-            scored.append((name, score))
-    if len(scored) < 4:
-        return False
-    scored.sort(key=lambda item: item[1])
-    cutoff = max(1, math.ceil(len(scored) * max(0.0, min(1.0, quantile))))
-    return ticker in {name for name, _score in scored[:cutoff]}
-
-
 def _reference_arms(
     *,
     raw_frames: dict[str, pd.DataFrame],
@@ -1563,7 +1548,7 @@ def _load_results(summary: dict[str, Any]) -> dict[str, dict[str, Any]]:
 
 def _per_name_pnl(
     trades: list[dict[str, Any]],
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     prices: dict[str, float],
     deployed_capital: dict[str, float],
 ) -> list[dict[str, Any]]:
@@ -1653,43 +1638,39 @@ def _percentile_rank(value: float | None, scores: Sequence[float]) -> float:
     return 100.0 * below / len(scores)
 
 
-def _held_quantity(lots: list[ccel.CCELLot], ticker: str) -> float:
-    return float(sum(lot.quantity for lot in lots if lot.ticker == ticker))
+def _held_quantity(lots: ccel.LotBook, ticker: str) -> float:
+    return lots.quantity(ticker)
 
 
-def _weighted_basis_for_ticker(lots: list[ccel.CCELLot], ticker: str) -> float:
-    ticker_lots = [lot for lot in lots if lot.ticker == ticker and lot.quantity > 0]
-    if not ticker_lots:
-        return 0.0
-    total = sum(lot.quantity for lot in ticker_lots)
-    return sum(lot.quantity * lot.basis_per_share for lot in ticker_lots) / total if total > 0 else 0.0
+def _weighted_basis_for_ticker(lots: ccel.LotBook, ticker: str) -> float:
+    return lots.weighted_basis(ticker)
 
 
-def _sleeve_value(lots: list[ccel.CCELLot], prices: dict[str, float], promoted_core: set[str]) -> float:
-    return float(sum(lot.quantity * float(prices.get(lot.ticker, 0.0)) for lot in lots if lot.ticker not in promoted_core))
+def _sleeve_value(lots: ccel.LotBook, prices: dict[str, float], promoted_core: set[str]) -> float:
+    return float(sum(quantity * float(prices.get(ticker, 0.0)) for ticker, quantity in lots.positions().items() if ticker not in promoted_core))
 
 
-def _core_value(lots: list[ccel.CCELLot], prices: dict[str, float], promoted_core: set[str]) -> float:
-    return float(sum(lot.quantity * float(prices.get(lot.ticker, 0.0)) for lot in lots if lot.ticker in promoted_core))
+def _core_value(lots: ccel.LotBook, prices: dict[str, float], promoted_core: set[str]) -> float:
+    return float(sum(quantity * float(prices.get(ticker, 0.0)) for ticker, quantity in lots.positions().items() if ticker in promoted_core))
 
 
 def _theme_value(
     theme: str,
-    lots: list[ccel.CCELLot],
+    lots: ccel.LotBook,
     prices: dict[str, float],
     ticker_theme: dict[str, str],
     promoted_core: set[str],
 ) -> float:
     return float(
         sum(
-            lot.quantity * float(prices.get(lot.ticker, 0.0))
-            for lot in lots
-            if ticker_theme.get(lot.ticker) == theme and lot.ticker not in promoted_core
+            quantity * float(prices.get(ticker, 0.0))
+            for ticker, quantity in lots.positions().items()
+            if ticker_theme.get(ticker) == theme and ticker not in promoted_core
         )
     )
 
 
-def _theme_sleeve_count(theme: str, lots: list[ccel.CCELLot], ticker_theme: dict[str, str], promoted_core: set[str]) -> int:
+def _theme_sleeve_count(theme: str, lots: ccel.LotBook, ticker_theme: dict[str, str], promoted_core: set[str]) -> int:
     return sum(1 for ticker in ccel._held_tickers(lots) if ticker_theme.get(ticker) == theme and ticker not in promoted_core)
 
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import itertools
 import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import asdict, replace
 from pathlib import Path
 from typing import Any, Callable
@@ -10,7 +12,15 @@ from typing import Any, Callable
 import pandas as pd
 
 from .config import DEFAULT_SIGNAL_THRESHOLDS, SignalThresholds
-from .pipeline_backtest import PipelineBacktestConfig, run_pipeline_backtest
+from .pipeline_backtest import (
+    CompactRegimePath,
+    PipelineBacktestConfig,
+    RegimePathSignalProvider,
+    decode_compact_regime_path,
+    decode_regime_path,
+    regime_decode_key,
+    run_pipeline_backtest,
+)
 
 
 DEFAULT_THRESHOLD_GRID: dict[str, list[Any]] = {
@@ -62,41 +72,217 @@ def run_threshold_sweep(
     base_config: PipelineBacktestConfig | None = None,
     signal_provider_factory: Callable[[str, dict[str, Any]], Any] | None = None,
     include_stress_windows: bool = False,
+    max_workers: int | None = None,
+    checkpoint_dir: str | Path | None = None,
 ) -> list[dict[str, Any]]:
+    """Backtest every threshold combo against every ticker.
+
+    Threshold combos only change the signal and gate logic applied after the regime
+    decode, so each ticker's walk-forward decode runs once and is replayed per combo.
+    Paths are kept as ``CompactRegimePath`` arrays. ``max_workers > 1`` decodes every
+    (ticker, distinct decode key) pair once over a process pool, then fans the combos out
+    over a second pool whose workers receive those compact paths once through the
+    initializer (custom ``signal_provider_factory`` sweeps stay in-process). With ``checkpoint_dir``
+    each finished combo is written to its own JSON file and skipped on the next run
+    with the same inputs.
+    """
+
     config = base_config or PipelineBacktestConfig()
-    rows: list[dict[str, Any]] = []
-    for combo in expand_threshold_grid(grid):
-        thresholds = thresholds_from_combo(combo, base=config.signal_thresholds)
-        combo_config = replace(
-            config,
-            signal_thresholds=thresholds,
-            composite_adjustments_enabled=bool(combo.get("composite_adjustments_enabled", config.composite_adjustments_enabled)),
-        )
-        combo_rows: list[dict[str, Any]] = []
-        for ticker in tickers:
-            normalized = str(ticker or "").strip().upper()
-            frame = market_frames.get(normalized)
-            if frame is None:
-                frame = market_frames.get(str(ticker))
-            if frame is None:
-                continue
-            result = run_pipeline_backtest(
-                normalized,
-                frame,
-                config=combo_config,
-                benchmark_frame=benchmark_frame,
-                signal_provider=signal_provider_factory(normalized, combo) if signal_provider_factory is not None else None,
+    frames = _sweep_frames(tickers, market_frames)
+    combos = expand_threshold_grid(grid)
+    checkpoints = Path(checkpoint_dir) if checkpoint_dir else None
+    fingerprint = _sweep_fingerprint(frames, benchmark_frame, config, include_stress_windows) if checkpoints else ""
+    completed = _load_checkpoints(checkpoints, combos, fingerprint) if checkpoints else {}
+    pending = [combo for combo in combos if combo["combo_id"] not in completed]
+
+    def finish(combo: dict[str, Any], combo_rows: list[dict[str, Any]]) -> None:
+        completed[combo["combo_id"]] = combo_rows
+        if checkpoints is not None:
+            _write_checkpoint(checkpoints, combo, fingerprint, combo_rows)
+
+    workers = int(max_workers or 1)
+    if pending and workers > 1 and signal_provider_factory is None:
+        decode_configs: dict[tuple[Any, ...], PipelineBacktestConfig] = {}
+        for combo in pending:
+            combo_config = _combo_config(config, combo)
+            decode_configs.setdefault(regime_decode_key(combo_config), combo_config)
+        jobs = [(ticker, key) for key in decode_configs for ticker in frames]
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)) or 1) as pool:
+            decoded = pool.map(
+                decode_compact_regime_path,
+                [ticker for ticker, _key in jobs],
+                [frames[ticker] for ticker, _key in jobs],
+                [decode_configs[key] for _ticker, key in jobs],
+            )
+            paths = dict(zip(jobs, decoded))
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=_init_sweep_worker,
+            initargs=(frames, benchmark_frame, config, include_stress_windows, paths),
+        ) as pool:
+            futures = {pool.submit(_run_combo_in_worker, combo): combo for combo in pending}
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+    else:
+        paths = {}
+        for combo in pending:
+            finish(
+                combo,
+                _run_combo(
+                    combo,
+                    frames=frames,
+                    benchmark_frame=benchmark_frame,
+                    config=config,
+                    include_stress_windows=include_stress_windows,
+                    paths=paths,
+                    signal_provider_factory=signal_provider_factory,
+                ),
             )
-            row = _result_row(normalized, combo, result.metrics, result.in_sample, result.out_of_sample)
-            if include_stress_windows:
-                row.update(_stress_metric_prefix(result.stress_windows))
-            combo_rows.append(row)
-            rows.append(row)
-        if combo_rows:
-            rows.append(_aggregate_row(combo, combo_rows))
+    rows: list[dict[str, Any]] = []
+    for combo in combos:
+        rows.extend(completed.get(combo["combo_id"], []))
     return rows
 
 
+def _combo_config(config: PipelineBacktestConfig, combo: dict[str, Any]) -> PipelineBacktestConfig:
+    return replace(
+        config,
+        signal_thresholds=thresholds_from_combo(combo, base=config.signal_thresholds),
+        composite_adjustments_enabled=bool(combo.get("composite_adjustments_enabled", config.composite_adjustments_enabled)),
+    )
+
+
+def _sweep_frames(tickers: list[str], market_frames: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    frames: dict[str, pd.DataFrame] = {}
+    for ticker in tickers:
+        normalized = str(ticker or "").strip().upper()
+        frame = market_frames.get(normalized)
+        if frame is None:
+            frame = market_frames.get(str(ticker))
+        if frame is not None:
+            frames[normalized] = frame
+    return frames
+
+
+def _run_combo(
+    combo: dict[str, Any],
+    *,
+    frames: dict[str, pd.DataFrame],
+    benchmark_frame: pd.DataFrame | None,
+    config: PipelineBacktestConfig,
+    include_stress_windows: bool,
+    paths: dict[tuple[Any, ...], CompactRegimePath],
+    signal_provider_factory: Callable[[str, dict[str, Any]], Any] | None = None,
+) -> list[dict[str, Any]]:
+    combo_config = _combo_config(config, combo)
+    decode_key = regime_decode_key(combo_config)
+    combo_rows: list[dict[str, Any]] = []
+    for ticker, frame in frames.items():
+        if signal_provider_factory is not None:
+            provider = signal_provider_factory(ticker, combo)
+        else:
+            provider = RegimePathSignalProvider(frame, _path_loader(paths, ticker, frame, combo_config, decode_key))
+        result = run_pipeline_backtest(
+            ticker,
+            frame,
+            config=combo_config,
+            benchmark_frame=benchmark_frame,
+            signal_provider=provider,
+        )
+        row = _result_row(ticker, combo, result.metrics, result.in_sample, result.out_of_sample)
+        if include_stress_windows:
+            row.update(_stress_metric_prefix(result.stress_windows))
+        combo_rows.append(row)
+    if combo_rows:
+        combo_rows.append(_aggregate_row(combo, combo_rows))
+    return combo_rows
+
+
+def _path_loader(
+    paths: dict[tuple[Any, ...], CompactRegimePath],
+    ticker: str,
+    frame: pd.DataFrame,
+    config: PipelineBacktestConfig,
+    decode_key: tuple[Any, ...],
+) -> Callable[[], CompactRegimePath]:
+    # Pooled sweeps pre-decode every key, so decoding here only happens in-process.
+    def load() -> CompactRegimePath:
+        key = (ticker, decode_key)
+        if key not in paths:
+            paths[key] = CompactRegimePath(decode_regime_path(ticker, frame, config))
+        return paths[key]
+
+    return load
+
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_sweep_worker(
+    frames: dict[str, pd.DataFrame],
+    benchmark_frame: pd.DataFrame | None,
+    config: PipelineBacktestConfig,
+    include_stress_windows: bool,
+    paths: dict[tuple[Any, ...], CompactRegimePath],
+) -> None:
+    """Pool initializer: frames and compact paths are unpickled once per worker; tasks carry only the combo."""
+    _WORKER_STATE.update(
+        frames=frames,
+        benchmark_frame=benchmark_frame,
+        config=config,
+        include_stress_windows=include_stress_windows,
+        paths=paths,
+    )
+
+
+def _run_combo_in_worker(combo: dict[str, Any]) -> list[dict[str, Any]]:
+    return _run_combo(combo, **_WORKER_STATE)
+
+
+def _sweep_fingerprint(
+    frames: dict[str, pd.DataFrame],
+    benchmark_frame: pd.DataFrame | None,
+    config: PipelineBacktestConfig,
+    include_stress_windows: bool,
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(json.dumps(config_payload(config), sort_keys=True, default=str).encode("utf-8"))
+    digest.update(f"stress={bool(include_stress_windows)}".encode("utf-8"))
+    for name, frame in [*frames.items(), ("__BENCHMARK__", benchmark_frame)]:
+        digest.update(name.encode("utf-8"))
+        if frame is not None:
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _checkpoint_path(directory: Path, combo_id: str) -> Path:
+    return directory / f"{hashlib.sha1(combo_id.encode('utf-8')).hexdigest()[:16]}.json"
+
+
+def _load_checkpoints(directory: Path, combos: list[dict[str, Any]], fingerprint: str) -> dict[str, list[dict[str, Any]]]:
+    loaded: dict[str, list[dict[str, Any]]] = {}
+    for combo in combos:
+        path = _checkpoint_path(directory, combo["combo_id"])
+        if not path.exists():
+            continue
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if payload.get("combo_id") == combo["combo_id"] and payload.get("fingerprint") == fingerprint:
+            loaded[combo["combo_id"]] = list(payload.get("rows") or [])
+    return loaded
+
+
+def _write_checkpoint(directory: Path, combo: dict[str, Any], fingerprint: str, rows: list[dict[str, Any]]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = _checkpoint_path(directory, combo["combo_id"])
+    tmp = path.with_suffix(".json.tmp")
+    payload = {"combo_id": combo["combo_id"], "fingerprint": fingerprint, "rows": rows}
+    tmp.write_text(json.dumps(payload, indent=2, default=str) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
 def write_sweep_rows(rows: list[dict[str, Any]], *, json_path: str | Path | None = None, csv_path: str | Path | None = None) -> None:
     if json_path:
         Path(json_path).write_text(json.dumps(rows, indent=2) + "\n", encoding="utf-8")
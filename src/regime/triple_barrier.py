@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 
 from .exceptions import DataValidationError
-from .paper_trading import trailing_stop_level
+from .paper_trading import DEFAULT_SIZING_ATR_MULTIPLIER, trailing_stop_level
 
 
 @dataclass(frozen=True)
@@ -59,87 +59,83 @@ def compute_atr(
     return tr.ewm(alpha=1.0 / period, min_periods=period, adjust=False).mean()
 
 
-def _label_single_bar(
-    idx: int,
+_DAY_NS = 86_400_000_000_000
+
+
+def _optional_column(values: np.ndarray, present: np.ndarray, *, integer: bool = False) -> np.ndarray:
+    """Column with ``None`` for absent rows, typed the way pandas infers a list of per-row dicts."""
+
+    if not present.any():
+        return np.full(len(values), None, dtype=object)
+    if present.all():
+        return values.astype(np.int64) if integer else values.astype(float)
+    column = values.astype(float)
+    column[~present] = np.nan
+    return column
+
+
+def _atr_floor(atr: np.ndarray, min_atr: float) -> np.ndarray:
+    return np.maximum(np.where(np.isfinite(atr), atr, min_atr), min_atr)
+
+
+def triple_barrier_columns(
     close: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     atr: np.ndarray,
-    regime: str,
-    config: BarrierConfig,
-) -> dict[str, Any]:
-    """Label a single bar by scanning forward."""
-
-    entry_price = float(close[idx])
-    atr_raw = atr[idx]
-    atr_val = max(float(atr_raw) if np.isfinite(atr_raw) else config.min_atr, config.min_atr)
-
-    if regime == "Bull":
-        target = entry_price + config.profit_target_atr_mult * atr_val
-        stop = entry_price - config.stop_loss_atr_mult * atr_val
-    elif regime == "Bear":
-        target = entry_price - config.profit_target_atr_mult * atr_val
-        stop = entry_price + config.stop_loss_atr_mult * atr_val
-    else:
-        return {
-            "barrier_outcome": np.nan,
-            "barrier_type": None,
-            "barrier_days": None,
-            "barrier_entry": entry_price,
-            "barrier_target": None,
-            "barrier_stop": None,
-        }
-
-    max_scan = min(idx + config.max_holding_days, len(close) - 1)
-
-    for j in range(idx + 1, max_scan + 1):
-        days = j - idx
-        if regime == "Bull":
-            if high[j] >= target:
-                return {
-                    "barrier_outcome": 1.0,
-                    "barrier_type": "upper",
-                    "barrier_days": days,
-                    "barrier_entry": entry_price,
-                    "barrier_target": target,
-                    "barrier_stop": stop,
-                }
-            if low[j] <= stop:
-                return {
-                    "barrier_outcome": 0.0,
-                    "barrier_type": "lower",
-                    "barrier_days": days,
-                    "barrier_entry": entry_price,
-                    "barrier_target": target,
-                    "barrier_stop": stop,
-                }
-        else:
-            if low[j] <= target:
-                return {
-                    "barrier_outcome": 1.0,
-                    "barrier_type": "upper",
-                    "barrier_days": days,
-                    "barrier_entry": entry_price,
-                    "barrier_target": target,
-                    "barrier_stop": stop,
-                }
-            if high[j] >= stop:
-                return {
-                    "barrier_outcome": 0.0,
-                    "barrier_type": "lower",
-                    "barrier_days": days,
-                    "barrier_entry": entry_price,
-                    "barrier_target": target,
-                    "barrier_stop": stop,
-                }
+    regimes: np.ndarray,
+    config: BarrierConfig = DEFAULT_BARRIER_CONFIG,
+) -> dict[str, np.ndarray]:
+    """First-touch triple-barrier labels for every bar at once, as columnar arrays.
+
+    Walks the holding horizon one offset at a time across all unresolved bars, so the cost is
+    O(max_holding_days) vectorized passes instead of a Python scan per bar.  On a day that
+    touches both barriers the profit barrier wins.
+    """
 
+    n = len(close)
+    entry = np.asarray(close, dtype=float)
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    atr_val = _atr_floor(np.asarray(atr, dtype=float), float(config.min_atr))
+    bull = regimes == "Bull"
+    bear = regimes == "Bear"
+    directional = bull | bear
+    target = np.where(bull, entry + config.profit_target_atr_mult * atr_val, entry - config.profit_target_atr_mult * atr_val)
+    stop = np.where(bull, entry - config.stop_loss_atr_mult * atr_val, entry + config.stop_loss_atr_mult * atr_val)
+
+    horizon = int(config.max_holding_days)
+    touch_days = np.zeros(n, dtype=np.int64)
+    upper = np.zeros(n, dtype=bool)
+    for offset in range(1, min(horizon, n - 1) + 1):
+        count = n - offset
+        open_rows = directional[:count] & (touch_days[:count] == 0)
+        if not open_rows.any():
+            break
+        future_high = high[offset:]
+        future_low = low[offset:]
+        upper_hit = np.where(bull[:count], future_high >= target[:count], future_low <= target[:count])
+        lower_hit = np.where(bull[:count], future_low <= stop[:count], future_high >= stop[:count])
+        hit_upper = open_rows & upper_hit
+        hit_any = open_rows & (upper_hit | lower_hit)
+        touch_days[:count][hit_any] = offset
+        upper[:count] |= hit_upper
+
+    touched = touch_days > 0
+    remaining = (n - 1) - np.arange(n)
+    vertical_days = np.where(np.minimum(horizon, remaining) > 0, np.minimum(horizon, remaining), horizon)
+    barrier_type = np.full(n, None, dtype=object)
+    barrier_type[directional & touched & upper] = "upper"
+    barrier_type[directional & touched & ~upper] = "lower"
+    barrier_type[directional & ~touched] = "vertical"
+    outcome = np.where(directional, np.where(touched & upper, 1.0, 0.0), np.nan)
     return {
-        "barrier_outcome": 0.0,
-        "barrier_type": "vertical",
-        "barrier_days": (max_scan - idx) if max_scan > idx else config.max_holding_days,
-        "barrier_entry": entry_price,
-        "barrier_target": target,
-        "barrier_stop": stop,
+        "barrier_outcome": outcome,
+        "barrier_type": barrier_type,
+        "barrier_days": _optional_column(np.where(touched, touch_days, vertical_days), directional, integer=True),
+        "barrier_entry": entry,
+        "barrier_target": _optional_column(target, directional),
+        "barrier_stop": _optional_column(stop, directional),
     }
 
 
@@ -176,117 +172,145 @@ def apply_triple_barrier_labels(
     low = frame[low_name].astype(float).to_numpy()
     atr_values = atr.astype(float).to_numpy()
 
-    labels = [
-        _label_single_bar(
-            idx,
-            close,
-            high,
-            low,
-            atr_values,
-            str(frame.iloc[idx][regime_col] or ""),
-            config,
-        )
-        for idx in range(len(frame))
-    ]
-    label_frame = pd.DataFrame(labels, index=frame.index)
+    if frame.empty:
+        return frame
+    regimes = np.asarray([str(value or "") for value in frame[regime_col].tolist()], dtype=object)
+    label_frame = pd.DataFrame(triple_barrier_columns(close, high, low, atr_values, regimes, config), index=frame.index)
     return frame.join(label_frame)
 
 
-def _calendar_days(index: pd.Index, start_idx: int, end_idx: int) -> int:
-    try:
-        start = pd.Timestamp(index[start_idx]).normalize()
-        end = pd.Timestamp(index[end_idx]).normalize()
-        return max(0, int((end - start).days))
-    except Exception:
-        return max(0, int(end_idx - start_idx))
+def _calendar_day_offsets(index: pd.Index) -> tuple[np.ndarray, np.ndarray]:
+    """Normalized-date nanosecond offsets plus a mask of rows that do not parse as timestamps.
 
+    Holding periods that touch an unparsed row fall back to counting bars.
+    """
 
-def _managed_label_single_bar(
-    idx: int,
+    offsets = np.zeros(len(index), dtype=np.int64)
+    unparsed = np.zeros(len(index), dtype=bool)
+    origin: pd.Timestamp | None = None
+    for position, value in enumerate(index):
+        try:
+            stamp = pd.Timestamp(value).normalize()
+            if origin is None:
+                origin = stamp
+            offsets[position] = int((stamp - origin).value)
+        except Exception:
+            unparsed[position] = True
+    return offsets, unparsed
+
+
+def managed_exit_columns(
     index: pd.Index,
     close: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     atr: np.ndarray,
-    regimes: list[str],
-    config: ManagedExitConfig,
+    regimes: np.ndarray,
+    config: ManagedExitConfig = DEFAULT_MANAGED_EXIT_CONFIG,
 ) -> dict[str, Any]:
-    entry_price = float(close[idx])
-    atr_raw = atr[idx]
-    atr_val = max(float(atr_raw) if np.isfinite(atr_raw) else config.min_atr, config.min_atr)
-    if regimes[idx] != "Bull" or not np.isfinite(entry_price) or entry_price <= 0:
-        return {
-            "barrier_outcome": np.nan,
-            "barrier_type": None,
-            "barrier_days": None,
-            "barrier_entry": entry_price if np.isfinite(entry_price) else None,
-            "barrier_target": None,
-            "barrier_stop": None,
-            "label_end_idx": np.nan,
-            "label_entry_date": pd.Timestamp(index[idx]),
-            "label_end_date": pd.NaT,
-        }
-
-    target = entry_price + config.profit_target_atr_mult * atr_val
-    initial_stop = entry_price - config.stop_atr_mult * atr_val
-    current_stop = initial_stop
-    cost_fraction = max(0.0, float(config.cost_bps or 0.0)) / 10_000.0
+    """Managed-exit labels for every Bull entry at once, as columnar arrays.
 
-    def resolved(j: int, outcome: float, barrier_type: str) -> dict[str, Any]:
-        return {
-            "barrier_outcome": float(outcome),
-            "barrier_type": barrier_type,
-            "barrier_days": _calendar_days(index, idx, j),
-            "barrier_entry": entry_price,
-            "barrier_target": target,
-            "barrier_stop": current_stop,
-            "label_end_idx": int(j),
-            "label_entry_date": pd.Timestamp(index[idx]),
-            "label_end_date": pd.Timestamp(index[j]),
-        }
-
-    for j in range(idx + 1, len(close)):
-        stop_touched = bool(np.isfinite(low[j]) and low[j] <= current_stop)
-        if stop_touched:
-            if current_stop > entry_price:
-                net_return = (current_stop / entry_price) - 1.0 - cost_fraction
-                return resolved(j, 1.0 if net_return > 0.0 else 0.0, "trailing")
-            return resolved(j, 0.0, "stop")
-
-        target_touched = bool(np.isfinite(high[j]) and high[j] >= target)
-        if target_touched:
-            return resolved(j, 1.0, "target")
-
-        holding_days = _calendar_days(index, idx, j)
-        if holding_days >= int(config.time_stop_days):
-            net_return = (float(close[j]) / entry_price) - 1.0 - cost_fraction
-            return resolved(j, 1.0 if net_return > 0.0 else 0.0, "time_win" if net_return > 0.0 else "time_loss")
-
-        if regimes[j] == "Bear":
-            net_return = (float(close[j]) / entry_price) - 1.0 - cost_fraction
-            return resolved(j, 1.0 if net_return > 0.0 else 0.0, "regime")
-
-        ratcheted = trailing_stop_level(
-            entry_price=entry_price,
-            current_price=float(close[j]),
-            atr_14=atr_val,
-            existing_stop=current_stop,
-            atr_multiplier=config.trailing_atr_mult,
-            activation_atr=config.trailing_activation_atr,
-        )
-        if ratcheted is not None:
-            current_stop = float(ratcheted)
+    Advances all open entries one bar per pass with the production exit ladder: stop/trailing
+    stop, target, calendar time stop, Bear regime exit, then the trailing-stop ratchet for
+    entries still open.
+    """
 
+    n = len(close)
+    entry = np.asarray(close, dtype=float)
+    high = np.asarray(high, dtype=float)
+    low = np.asarray(low, dtype=float)
+    atr_val = _atr_floor(np.asarray(atr, dtype=float), float(config.min_atr))
+    is_bear = regimes == "Bear"
+    eligible = (regimes == "Bull") & np.isfinite(entry) & (entry > 0)
+    target = entry + config.profit_target_atr_mult * atr_val
+    current_stop = entry - config.stop_atr_mult * atr_val
+    cost_fraction = max(0.0, float(config.cost_bps or 0.0)) / 10_000.0
+    activation = max(0.0, float(config.trailing_activation_atr or 0.0))
+    trailing_mult = max(0.1, float(config.trailing_atr_mult or DEFAULT_SIZING_ATR_MULTIPLIER))
+    time_stop_days = int(config.time_stop_days)
+    day_offsets, unparsed = _calendar_day_offsets(index)
+
+    end_idx = np.full(n, -1, dtype=np.int64)
+    outcome = np.full(n, np.nan, dtype=float)
+    barrier_type = np.full(n, None, dtype=object)
+    open_rows = np.flatnonzero(eligible)
+    for offset in range(1, n):
+        open_rows = open_rows[open_rows + offset < n]
+        if open_rows.size == 0:
+            break
+        future = open_rows + offset
+        entries = entry[open_rows]
+        stops = current_stop[open_rows]
+        future_low = low[future]
+        future_high = high[future]
+        future_close = close[future].astype(float)
+        close_return = future_close / entries - 1.0 - cost_fraction
+
+        stop_hit = np.isfinite(future_low) & (future_low <= stops)
+        trailing_hit = stop_hit & (stops > entries)
+        trailing_win = (stops / entries - 1.0 - cost_fraction) > 0.0
+        target_hit = ~stop_hit & np.isfinite(future_high) & (future_high >= target[open_rows])
+        open_now = ~stop_hit & ~target_hit
+        calendar_days = np.where(
+            unparsed[open_rows] | unparsed[future],
+            offset,
+            np.maximum(0, (day_offsets[future] - day_offsets[open_rows]) // _DAY_NS),
+        )
+        time_hit = open_now & (calendar_days >= time_stop_days)
+        open_now &= ~time_hit
+        regime_hit = open_now & is_bear[future]
+        open_now &= ~regime_hit
+
+        outcome[open_rows[trailing_hit]] = np.where(trailing_win[trailing_hit], 1.0, 0.0)
+        barrier_type[open_rows[trailing_hit]] = "trailing"
+        static_hit = stop_hit & ~trailing_hit
+        outcome[open_rows[static_hit]] = 0.0
+        barrier_type[open_rows[static_hit]] = "stop"
+        outcome[open_rows[target_hit]] = 1.0
+        barrier_type[open_rows[target_hit]] = "target"
+        time_win = close_return > 0.0
+        outcome[open_rows[time_hit]] = np.where(time_win[time_hit], 1.0, 0.0)
+        barrier_type[open_rows[time_hit]] = np.where(time_win[time_hit], "time_win", "time_loss")
+        outcome[open_rows[regime_hit]] = np.where(time_win[regime_hit], 1.0, 0.0)
+        barrier_type[open_rows[regime_hit]] = "regime"
+        end_idx[open_rows[~open_now]] = future[~open_now]
+
+        # Trailing-stop ratchet, mirroring ``trailing_stop_level`` for entries still open.
+        atr_open = atr_val[open_rows]
+        candidate = np.maximum(0.01, future_close - trailing_mult * atr_open)
+        stop_known = np.isfinite(stops) & (stops > 0)
+        ratchet = (
+            open_now
+            & np.isfinite(future_close)
+            & (future_close > 0)
+            & (atr_open > 0)
+            & (future_close > entries + activation * atr_open)
+            & (candidate < future_close)
+            & (~stop_known | (candidate > stops + 0.005))
+        )
+        if ratchet.any():
+            current_stop[open_rows[ratchet]] = [round(value, 4) for value in candidate[ratchet].tolist()]
+        open_rows = open_rows[open_now]
+
+    resolved = end_idx >= 0
+    safe_end = np.where(resolved, end_idx, np.arange(n))
+    barrier_days = np.where(
+        unparsed | unparsed[safe_end],
+        safe_end - np.arange(n),
+        np.maximum(0, (day_offsets[safe_end] - day_offsets) // _DAY_NS),
+    )
+    entry_dates = pd.DatetimeIndex([pd.Timestamp(value) for value in index])
+    label_end_idx = end_idx.astype(np.int64) if resolved.all() else np.where(resolved, end_idx, np.nan)
     return {
-        "barrier_outcome": np.nan,
-        "barrier_type": None,
-        "barrier_days": None,
-        "barrier_entry": entry_price,
-        "barrier_target": target,
-        "barrier_stop": current_stop,
-        "label_end_idx": np.nan,
-        "label_entry_date": pd.Timestamp(index[idx]),
-        "label_end_date": pd.NaT,
+        "barrier_outcome": outcome,
+        "barrier_type": barrier_type,
+        "barrier_days": _optional_column(barrier_days, resolved, integer=True),
+        "barrier_entry": _optional_column(entry, np.isfinite(entry)),
+        "barrier_target": _optional_column(target, eligible),
+        "barrier_stop": _optional_column(current_stop, eligible),
+        "label_end_idx": label_end_idx,
+        "label_entry_date": entry_dates,
+        "label_end_date": entry_dates.take(safe_end).where(resolved),
     }
 
 
@@ -323,94 +347,90 @@ def apply_managed_exit_labels(
     high = high_series.to_numpy()
     low = low_series.to_numpy()
     atr_values = atr.astype(float).to_numpy()
-    regimes = [str(value or "") for value in frame[regime_col].tolist()]
-    labels = [
-        _managed_label_single_bar(idx, frame.index, close, high, low, atr_values, regimes, config)
-        for idx in range(len(frame))
-    ]
-    label_frame = pd.DataFrame(labels, index=frame.index)
+    if frame.empty:
+        return frame
+    regimes = np.asarray([str(value or "") for value in frame[regime_col].tolist()], dtype=object)
+    label_frame = pd.DataFrame(
+        managed_exit_columns(frame.index, close, high, low, atr_values, regimes, config),
+        index=frame.index,
+    )
     return frame.join(label_frame)
 
 
+def _interval_average_uniqueness(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Mean of ``1 / concurrency`` over each inclusive ``[start, end]`` interval.
+
+    Concurrency is a difference array over the covered span and the per-interval means come
+    from a prefix sum of its reciprocal, so the cost is linear in labels plus span length.
+    """
+
+    origin = int(starts.min())
+    offsets_start = starts - origin
+    offsets_end = ends - origin
+    span = int(offsets_end.max()) + 2
+    delta = np.bincount(offsets_start, minlength=span) - np.bincount(offsets_end + 1, minlength=span)
+    concurrency = np.cumsum(delta)[:-1]
+    reciprocal = np.divide(1.0, concurrency, out=np.zeros(len(concurrency), dtype=float), where=concurrency > 0)
+    prefix = np.concatenate(([0.0], np.cumsum(reciprocal)))
+    return (prefix[offsets_end + 1] - prefix[offsets_start]) / (offsets_end - offsets_start + 1)
+
+
 def sample_uniqueness_weights(labeled_frame: pd.DataFrame) -> pd.Series:
-    """Compute average-uniqueness sample weights from label lifespans."""
+    """Compute average-uniqueness sample weights from label lifespans, per ticker."""
 
+    weights = np.ones(len(labeled_frame), dtype=float)
     if labeled_frame.empty:
-        return pd.Series(1.0, index=labeled_frame.index, dtype=float)
+        return pd.Series(weights, index=labeled_frame.index, dtype=float)
 
-    weights = pd.Series(1.0, index=labeled_frame.index, dtype=float)
-    group_iter = (
-        labeled_frame.groupby("ticker", sort=False)
-        if "ticker" in labeled_frame.columns
-        else [(None, labeled_frame)]
-    )
+    if "ticker" in labeled_frame.columns:
+        group_positions = list(labeled_frame.groupby("ticker", sort=False).indices.values())
+    else:
+        group_positions = [np.arange(len(labeled_frame))]
+    has_outcome = labeled_frame["barrier_outcome"].notna().to_numpy()
 
     if {"label_entry_date", "label_end_date"}.issubset(labeled_frame.columns):
-        for _group, group in group_iter:
-            valid = group.loc[group["barrier_outcome"].notna()].copy()
-            if valid.empty:
-                continue
-            valid["_entry_date"] = pd.to_datetime(valid["label_entry_date"], errors="coerce")
-            valid["_end_date"] = pd.to_datetime(valid["label_end_date"], errors="coerce")
-            valid = valid.loc[valid["_entry_date"].notna() & valid["_end_date"].notna()]
-            if valid.empty:
-                continue
-            date_intervals: list[tuple[Any, list[pd.Timestamp]]] = []
-            date_concurrency: dict[pd.Timestamp, int] = {}
-            for index_value, row in valid.iterrows():
-                start = pd.Timestamp(row["_entry_date"]).normalize()
-                end = pd.Timestamp(row["_end_date"]).normalize()
-                if end < start:
-                    continue
-                days = list(pd.date_range(start, end, freq="D"))
-                if not days:
-                    continue
-                date_intervals.append((index_value, days))
-                for day in days:
-                    date_concurrency[day] = date_concurrency.get(day, 0) + 1
-            for index_value, days in date_intervals:
-                values = [1.0 / date_concurrency[day] for day in days if date_concurrency.get(day, 0) > 0]
-                if values:
-                    weights.loc[index_value] = float(np.mean(values))
-        return weights
+        entry_days, entry_parsed = _normalized_day_numbers(labeled_frame["label_entry_date"])
+        end_days, end_parsed = _normalized_day_numbers(labeled_frame["label_end_date"])
+        usable = has_outcome & entry_parsed & end_parsed & (end_days >= entry_days)
+        for positions in group_positions:
+            positions = positions[usable[positions]]
+            if len(positions):
+                weights[positions] = _interval_average_uniqueness(entry_days[positions], end_days[positions])
+        return pd.Series(weights, index=labeled_frame.index, dtype=float)
 
     if "label_end_idx" not in labeled_frame.columns:
-        return weights
+        return pd.Series(weights, index=labeled_frame.index, dtype=float)
 
-    group_iter = (
-        labeled_frame.groupby("ticker", sort=False)
-        if "ticker" in labeled_frame.columns
-        else [(None, labeled_frame)]
-    )
-    for _group, group in group_iter:
-        valid = group.loc[group["barrier_outcome"].notna() & group["label_end_idx"].notna()]
-        if valid.empty:
-            continue
-        group_positions = {index_value: position for position, index_value in enumerate(group.index)}
-        positional_intervals: list[tuple[Any, int, int]] = []
-        for index_value, row in valid.iterrows():
-            try:
-                start = int(row["_label_start_idx"]) if "_label_start_idx" in valid.columns else group_positions[index_value]
-            except Exception:
-                start = group_positions[index_value]
-            try:
-                end = int(row["label_end_idx"])
-            except Exception:
-                continue
-            start = max(0, min(start, len(group) - 1))
-            end = max(start, min(end, len(group) - 1))
-            positional_intervals.append((index_value, start, end))
-        if not positional_intervals:
+    end_raw = pd.to_numeric(labeled_frame["label_end_idx"], errors="coerce").to_numpy(dtype=float)
+    if "_label_start_idx" in labeled_frame.columns:
+        start_raw = pd.to_numeric(labeled_frame["_label_start_idx"], errors="coerce").to_numpy(dtype=float)
+    else:
+        start_raw = np.full(len(labeled_frame), np.nan)
+    usable = has_outcome & np.isfinite(end_raw)
+    for positions in group_positions:
+        group_size = len(positions)
+        local = np.arange(group_size)
+        keep = usable[positions]
+        if not keep.any():
             continue
-        positional_concurrency = np.zeros(len(group), dtype=float)
-        for _index_value, start, end in positional_intervals:
-            positional_concurrency[start : end + 1] += 1.0
-        for index_value, start, end in positional_intervals:
-            active = positional_concurrency[start : end + 1]
-            active = active[active > 0]
-            if len(active):
-                weights.loc[index_value] = float(np.mean(1.0 / active))
-    return weights
+        group_start = start_raw[positions]
+        starts = np.where(np.isfinite(group_start), np.trunc(np.nan_to_num(group_start)), local).astype(np.int64)
+        starts = np.clip(starts, 0, group_size - 1)[keep]
+        ends = np.trunc(end_raw[positions][keep]).astype(np.int64)
+        ends = np.maximum(starts, np.minimum(ends, group_size - 1))
+        weights[positions[keep]] = _interval_average_uniqueness(starts, ends)
+    return pd.Series(weights, index=labeled_frame.index, dtype=float)
+
+
+def _normalized_day_numbers(values: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Epoch day number of each normalized timestamp plus a mask of values that parsed."""
+
+    stamps = pd.to_datetime(values, errors="coerce")
+    if getattr(stamps.dt, "tz", None) is not None:
+        stamps = stamps.dt.tz_localize(None)
+    parsed = stamps.notna().to_numpy()
+    day_numbers = stamps.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]").astype(np.int64)
+    return np.where(parsed, day_numbers, 0), parsed
 
 
 def build_managed_labeled_frame(
@@ -53,3 +53,25 @@ class FakeRegime:
             ]
         )
         self.price_frame = price_frame if price_frame is not None else pd.DataFrame({"state_probability": [0.80, 0.84, 0.88, latest_probability]})
+
+
+def regime_switching_frame(rows: int = 620, seed: int = 7, start: str = "2018-01-02") -> pd.DataFrame:
+    """Synthetic OHLCV + macro frame whose drift and volatility switch every 60 bars."""
+
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=rows)
+    drift = np.repeat(rng.choice([0.0015, -0.002, 0.0], size=rows // 60 + 1), 60)[:rows]
+    returns = rng.normal(drift, np.where(drift < 0, 0.03, 0.012))
+    closes = 100 * np.exp(np.cumsum(returns))
+    return pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes * (1 + rng.uniform(0.001, 0.02, rows)),
+            "low": closes * (1 - rng.uniform(0.001, 0.02, rows)),
+            "price": closes,
+            "volume": rng.integers(800_000, 2_500_000, rows).astype(float),
+            "vix": 18 + rng.normal(0, 2, rows).cumsum() * 0.05,
+            "yield_10y": 3.5 + rng.normal(0, 0.03, rows).cumsum() * 0.05,
+        },
+        index=dates,
+    )
@@ -734,6 +734,20 @@ def test_synth_sp500_sanity(tmp_path) -> None:
     assert frame["member_count"].min() >= 2
 
 
+def test_synth_sp500_drifts_between_reconstitutions_and_reuses_parquet_cache(tmp_path, monkeypatch) -> None:
+    store = _store(tmp_path)
+
+    frame = store.synth_sp500_total_return("2020-01-02", "2020-01-31")
+    prices = store.get_prices([1, 2, 3], "2020-01-02", "2020-01-31")
+    caps = {1: 2_000_000_000, 2: 1_800_000_000, 3: 1_500_000_000}
+    held = sum(caps[perma] / sum(caps.values()) * prices[perma]["price"] / prices[perma]["price"].iloc[0] for perma in caps)
+
+    assert frame["price"].to_numpy() == pytest.approx((100.0 * held).to_numpy())
+    assert list((store.root / "cache" / "synth_sp500").glob("*.parquet"))
+    monkeypatch.setattr(SharadarStore, "_sp500_member_candidates", lambda *args: pytest.fail("expected a cache hit"))
+    pd.testing.assert_frame_equal(SharadarStore(store.root).synth_sp500_total_return("2020-01-02", "2020-01-31"), frame)
+
+
 def test_synth_benchmark_survivorship_free(tmp_path) -> None:
     store = _store(tmp_path)
 
@@ -6,6 +6,7 @@ import pandas as pd
 import pytest
 
 from src.regime import ccel_campaign as ccel
+from src.regime.factor_panel import FactorPanel
 
 
 def _frame(start: str, prices: list[float]) -> pd.DataFrame:
@@ -13,7 +14,7 @@ def _frame(start: str, prices: list[float]) -> pd.DataFrame:
     return pd.DataFrame({"open": prices, "high": prices, "low": prices, "price": prices, "volume": 1_000_000}, index=dates)
 
 
-def _position_weight(lots: list[ccel.CCELLot], ticker: str, prices: dict[str, float], cash: float) -> float:
+def _position_weight(lots: ccel.LotBook, ticker: str, prices: dict[str, float], cash: float) -> float:
     value = sum(lot.quantity for lot in lots if lot.ticker == ticker) * float(prices[ticker])
     total = cash + ccel._position_value(lots, prices)
     return value / total if total > 0 else 0.0
@@ -41,17 +42,48 @@ def test_apply_wash_sales_disallows_same_ticker_replacement_loss() -> None:
     assert adjusted[0]["tax_gain"] == 0.0
 
 
+def test_lot_book_relieves_fifo_and_keeps_running_totals() -> None:
+    lots = ccel.LotBook(
+        [
+            ccel.CCELLot(2, "AAA", 10, 12.0, "2020-02-01"),
+            ccel.CCELLot(1, "AAA", 10, 10.0, "2020-01-01"),
+            ccel.CCELLot(3, "BBB", 4, 50.0, "2020-01-01"),
+        ]
+    )
+
+    assert [lot.lot_id for lot in lots.lots("AAA")] == [1, 2]
+    assert lots.weighted_basis("AAA") == pytest.approx(11.0)
+    assert ccel._position_value(lots, {"AAA": 20.0, "BBB": 40.0}) == pytest.approx(560.0)
+
+    realized = ccel._sell_fifo_lots(lots, "AAA", 15, 20.0, "2020-06-01", "test")
+
+    assert [(row["basis_per_share"], row["quantity"]) for row in realized] == [(10.0, 10), (12.0, 5)]
+    assert [lot.lot_id for lot in lots.lots("AAA")] == [2]
+    assert lots.quantity("AAA") == pytest.approx(5.0)
+    assert lots.weighted_basis("AAA") == pytest.approx(12.0)
+    assert len(lots) == 2
+
+    ccel._sell_fifo_lots(lots, "AAA", 5, 20.0, "2020-06-02", "test")
+
+    assert ccel._held_tickers(lots) == {"BBB"}
+    assert lots.quantity("AAA") == 0.0
+    assert [lot.lot_id for lot in lots] == [3]
+
+
 def test_loss_harvest_default_redeploys_into_remaining_holdings() -> None:
     date = pd.Timestamp("2020-03-02")
     frames = {
         ticker: pd.DataFrame({"open": [price], "price": [price], "volume": [1_000_000]}, index=[date])
         for ticker, price in {"AAA": 10.0, "BBB": 10.0, "CCC": 10.0, "DDD": 10.0}.items()
     }
-    lots = [
-        ccel.CCELLot(1, "AAA", 10, 20.0, "2020-01-01"),
-        ccel.CCELLot(2, "BBB", 5, 10.0, "2020-01-01"),
-        ccel.CCELLot(3, "CCC", 5, 10.0, "2020-01-01"),
-    ]
+    factors = FactorPanel(frames)
+    lots = ccel.LotBook(
+        [
+            ccel.CCELLot(1, "AAA", 10, 20.0, "2020-01-01"),
+            ccel.CCELLot(2, "BBB", 5, 10.0, "2020-01-01"),
+            ccel.CCELLot(3, "CCC", 5, 10.0, "2020-01-01"),
+        ]
+    )
 
     pending = ccel._build_ccel_instruction(
         date=date,
@@ -65,6 +97,7 @@ def test_loss_harvest_default_redeploys_into_remaining_holdings() -> None:
         cfg=ccel.CCELConfig(starting_cash=1_000.0, min_cash_to_deploy=1.0),
         first_day=False,
         is_month_start=True,
+        factors=factors,
     )
 
     assert pending is not None
@@ -100,11 +133,14 @@ def test_harvest_restores_exposure_after_wash_window() -> None:
         )
         for ticker in ["AAA", "BBB", "CCC"]
     }
-    lots = [
-        ccel.CCELLot(1, "AAA", 10, 20.0, "2020-01-01"),
-        ccel.CCELLot(2, "BBB", 5, 10.0, "2020-01-01"),
-        ccel.CCELLot(3, "CCC", 5, 10.0, "2020-01-01"),
-    ]
+    factors = FactorPanel(frames)
+    lots = ccel.LotBook(
+        [
+            ccel.CCELLot(1, "AAA", 10, 20.0, "2020-01-01"),
+            ccel.CCELLot(2, "BBB", 5, 10.0, "2020-01-01"),
+            ccel.CCELLot(3, "CCC", 5, 10.0, "2020-01-01"),
+        ]
+    )
     no_rebuy_until: dict[str, pd.Timestamp] = {}
     pending_reentry: dict[str, dict] = {}
     cfg = ccel.CCELConfig(starting_cash=1_000.0, min_cash_to_deploy=1.0)
@@ -121,6 +157,7 @@ def test_harvest_restores_exposure_after_wash_window() -> None:
         cfg=cfg,
         first_day=False,
         is_month_start=True,
+        factors=factors,
     )
     assert pending is not None
     assert pending.sell_tickers == {"AAA": "loss_harvest"}
@@ -155,6 +192,7 @@ def test_harvest_restores_exposure_after_wash_window() -> None:
         cfg=cfg,
         first_day=False,
         is_month_start=False,
+        factors=factors,
     )
     assert wash_window_pending is None or "AAA" not in wash_window_pending.buy_candidates
     assert wash_window_pending is None or "AAA" not in wash_window_pending.harvest_reentry_targets
@@ -172,6 +210,7 @@ def test_harvest_restores_exposure_after_wash_window() -> None:
         cfg=cfg,
         first_day=False,
         is_month_start=False,
+        factors=factors,
     )
     assert pending is not None
     assert pending.harvest_reentry_targets == {"AAA": pre_harvest_weight}
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from src.regime import ccel_campaign as ccel
+from src.regime.factor_panel import FactorPanel
+from src.regime.portfolio_campaign import _float
+
+
+def _frames() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(7)
+    frames: dict[str, pd.DataFrame] = {}
+    for offset, ticker in enumerate(["AAA", "BBB", "CCC", "DDD", "EEE", "FFF"]):
+        dates = pd.bdate_range(pd.Timestamp("2019-01-01") + pd.Timedelta(days=17 * offset), periods=380 - 9 * offset)
+        prices = 50.0 * np.exp(np.cumsum(rng.normal(0.0005 * (offset - 2), 0.02, len(dates))))
+        frame = pd.DataFrame({"open": prices, "price": prices, "volume": 1_000_000}, index=dates)
+        if ticker == "BBB":
+            frame["quality_gate_pass"] = rng.random(len(dates)) > 0.3
+        if ticker == "CCC":
+            frame["quality_score"] = np.where(rng.random(len(dates)) > 0.2, rng.random(len(dates)), np.nan)
+        frames[ticker] = frame.drop(frame.index[5::13])
+    return frames
+
+
+def _momentum_12_1(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame]) -> float | None:
+    frame = frames.get(ticker)
+    if frame is None or frame.empty:
+        return None
+    rows = frame.loc[frame.index <= pd.Timestamp(date)]
+    if len(rows) < 253:
+        return None
+    price = pd.to_numeric(rows["price"], errors="coerce")
+    if float(price.iloc[-252]) <= 0:
+        return None
+    return float(price.iloc[-21] / price.iloc[-252] - 1.0)
+
+
+def _quality_fails(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame]) -> bool:
+    frame = frames.get(ticker)
+    if frame is None or frame.empty:
+        return False
+    rows = frame.loc[frame.index <= pd.Timestamp(date)]
+    if rows.empty:
+        return False
+    row = rows.iloc[-1]
+    if "quality_gate_pass" in row:
+        return not bool(row.get("quality_gate_pass"))
+    if "quality_score" in row:
+        value = _float(row.get("quality_score"))
+        return value is not None and value < 0.2
+    return False
+
+
+def _legacy_bottom(ticker: str, date: pd.Timestamp, frames: dict[str, pd.DataFrame], quantile: float) -> bool:
+    active = {name for name, frame in frames.items() if date in frame.index}
+    scored = [(name, score) for name in sorted(active) if (score := _momentum_12_1(name, date, frames)) is not None]
+    if len(scored) < 4:
+        return False
+    scored.sort(key=lambda item: item[1])
+    cutoff = max(1, math.ceil(len(scored) * quantile))
+    return ticker in {name for name, _score in scored[:cutoff]}
+
+
+def test_factor_panel_matches_per_frame_helpers() -> None:
+    frames = _frames()
+    panel = FactorPanel(frames)
+    dates = ccel._panel_dates(frames)[260::4] + [pd.Timestamp("2018-06-01"), pd.Timestamp("2020-05-02"), pd.Timestamp("2030-01-01")]
+    ranked_dates = 0
+    for date in dates:
+        for ticker in [*frames, "MISSING"]:
+            expected = _momentum_12_1(ticker, date, frames)
+            actual = panel.momentum_12_1(ticker, date)
+            assert (actual is None) == (expected is None)
+            if expected is not None:
+                assert actual == expected
+            assert panel.quality_fails(ticker, date) is _quality_fails(ticker, date, frames)
+            assert panel.bottom_momentum(ticker, date, 0.34) == _legacy_bottom(ticker, date, frames, 0.34)
+        ranked_dates += any(panel.bottom_momentum(ticker, date, 0.34) for ticker in frames)
+    assert ranked_dates > 10
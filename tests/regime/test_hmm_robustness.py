@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -66,6 +67,80 @@ def test_fit_regime_model_defaults_preserve_covariance_and_macro_noop() -> None:
     assert same_default.regime_ambiguous is False
 
 
+def test_fit_regime_model_executor_and_model_cache_match_serial(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    frame = _market_frame(240)
+    kwargs = {"training_window": 120, "refit_step": 21, "iterations": 50, "n_seeds": 2}
+    serial = hmm_engine.fit_regime_model("TEST", frame, **kwargs)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parallel = hmm_engine.fit_regime_model("TEST", frame, executor=executor, model_cache=tmp_path, **kwargs)
+    assert parallel.price_frame["regime"].tolist() == serial.price_frame["regime"].tolist()
+    assert parallel.latest_probability == pytest.approx(serial.latest_probability)
+    assert parallel.seed_agreement == pytest.approx(serial.seed_agreement)
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 2 * len(hmm_engine._refit_end_positions(120, len(serial.price_frame) + 119, 21))
+
+    def fail_fit(**_kwargs):
+        raise AssertionError("cached refit windows must not be refitted")
+
+    monkeypatch.setattr(hmm_engine, "_fit_hmm_candidate", fail_fit)
+    cache = hmm_engine.HMMModelCache(tmp_path)
+    cached = hmm_engine.fit_regime_model("TEST", frame, model_cache=cache, **kwargs)
+    assert cached.price_frame["regime"].tolist() == serial.price_frame["regime"].tolist()
+    assert cache.misses == 0
+    assert cache.hits > 0
+
+
+def test_hmm_model_cache_concurrent_stores_of_one_key_stay_readable(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = hmm_engine.HMMModelCache(tmp_path)
+    payload = {"score": 1.0, "posteriors": np.arange(200_000, dtype=float)}
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _index: cache.store("ab" * 32, payload), range(32)))
+    loaded = cache.load("ab" * 32)
+    assert loaded is not None
+    assert np.array_equal(loaded["posteriors"], payload["posteriors"])
+    assert not list(tmp_path.glob("*/*.tmp"))
+
+
+def test_bounded_completions_caps_calls_in_flight() -> None:
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def tracked(value: int) -> int:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        completions = hmm_engine.bounded_completions(executor, tracked, ((value,) for value in range(12)), limit=2)
+        results = {position: future.result() for position, future in completions}
+    assert results == {value: value * 2 for value in range(12)}
+    assert peak[0] <= 2
+
+
+def test_refit_executor_only_fans_out_from_the_top_level_process(monkeypatch) -> None:
+    pool = object()
+    monkeypatch.setattr(hmm_engine, "get_fit_executor", lambda: pool)
+    monkeypatch.setattr(hmm_engine.multiprocessing, "parent_process", lambda: None)
+
+    monkeypatch.setattr(hmm_engine, "DEFAULT_FIT_POOL_WORKERS", 1)
+    assert hmm_engine.refit_executor() is None
+    monkeypatch.setattr(hmm_engine, "DEFAULT_FIT_POOL_WORKERS", 4)
+    assert hmm_engine.refit_executor() is pool
+    monkeypatch.setattr(hmm_engine.multiprocessing, "parent_process", lambda: object())
+    assert hmm_engine.refit_executor() is None
+
+
 def test_regime_calibrator_json_round_trip_and_improves_brier(tmp_path: Path) -> None:
     frame = pd.DataFrame(
         {
@@ -125,3 +200,52 @@ def test_generate_buy_plans_skips_regime_ambiguous_snapshot(monkeypatch) -> None
     monkeypatch.setattr(anti_churn, "get_anti_churn_settings", lambda: {"anti_churn_enabled": False})
     monkeypatch.setattr(anti_churn, "check_anti_churn", lambda *_args, **_kwargs: SimpleNamespace(passed=True))
     assert paper_trading.generate_buy_plans(1) == []
+
+
+def test_regime_result_cache_hits_decodes_appended_bars_and_refits_on_restatement(tmp_path: Path, monkeypatch) -> None:
+    frame = _market_frame(240)
+    kwargs = {"training_window": 120, "refit_step": 21, "iterations": 50}
+    cache = hmm_engine.RegimeResultCache(tmp_path, max_entries=4)
+    first = cache.fit("TEST", frame.iloc[:230], **kwargs)
+    assert cache.last_outcome() == "miss"
+    hit = cache.fit("TEST", frame.iloc[:230], **kwargs)
+    assert cache.last_outcome() == "hit"
+    assert hit is not first
+    assert hit.price_frame.equals(first.price_frame) and hit.latest_label == first.latest_label
+
+    real_fit = hmm_engine.fit_regime_model
+    monkeypatch.setattr(hmm_engine, "fit_regime_model", lambda *args, **kw: (_ for _ in ()).throw(AssertionError("must not refit")))
+    extended = hmm_engine.RegimeResultCache(tmp_path).fit("TEST", frame.iloc[:235], **kwargs)
+    assert len(extended.price_frame) == len(first.price_frame) + 5
+    assert extended.price_frame["regime"].iloc[: len(first.price_frame)].tolist() == first.price_frame["regime"].tolist()
+    assert extended.model is not None and extended.latest_price == pytest.approx(float(frame["price"].iloc[234]))
+
+    monkeypatch.setattr(hmm_engine, "fit_regime_model", real_fit)
+    restated = frame.iloc[:236].copy()
+    restated.loc[restated.index[-10], "price"] += 5.0
+    cache.fit("TEST", restated, **kwargs)
+    assert cache.last_outcome() == "miss"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_regime_result_cache_hits_are_isolated_from_caller_mutation(tmp_path: Path) -> None:
+    frame = _market_frame(200)
+    kwargs = {"training_window": 120, "refit_step": 21, "iterations": 50}
+    cache = hmm_engine.RegimeResultCache(tmp_path)
+    fitted = cache.fit("TEST", frame, **kwargs)
+    expected_regimes = fitted.price_frame["regime"].tolist()
+    expected_vector = fitted.latest_state_vector.copy()
+    fitted.price_frame["regime"] = "Bear"
+    fitted.latest_state_vector[:] = 0.0
+    fitted.state_map.clear()
+
+    first_hit = cache.fit("TEST", frame, **kwargs)
+    first_hit.latest_label = "Mutated"
+    first_hit.transition_matrix[:] = 0.0
+    second_hit = cache.fit("TEST", frame, **kwargs)
+
+    assert cache.stats()["hits"] == 2
+    assert second_hit.price_frame["regime"].tolist() == expected_regimes
+    assert np.array_equal(second_hit.latest_state_vector, expected_vector)
+    assert second_hit.state_map and second_hit.latest_label != "Mutated"
+    assert second_hit.transition_matrix.sum() > 0
@@ -10,13 +10,17 @@ import pandas as pd
 import pytest
 from sklearn.metrics import brier_score_loss
 
+from tests.regime._triple_barrier_reference import label_single_bar, managed_label_single_bar, sample_uniqueness_weights_reference
 from src.regime.meta_labeler import META_FEATURES, MetaLabelerConfig, MetaLabelerEngine
 from src.regime.pipeline_backtest import PipelineBacktestConfig, PipelinePosition, _manage_position
 from src.regime.probability_calibration import ProbabilityCalibrator, fit_calibrator, load_calibrator
 from src.regime.triple_barrier import (
+    BarrierConfig,
     ManagedExitConfig,
     apply_managed_exit_labels,
+    apply_triple_barrier_labels,
     build_multi_ticker_managed_frame,
+    compute_atr,
     sample_uniqueness_weights,
 )
 
@@ -183,6 +187,61 @@ def test_same_bar_high_does_not_ratchet_before_low_is_tested() -> None:
     assert label["label_end_idx"] == 2
 
 
+def _random_labeling_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, rows)))
+    highs = closes * (1 + rng.uniform(0.0, 0.03, rows))
+    lows = closes * (1 - rng.uniform(0.0, 0.03, rows))
+    highs[rng.choice(rows, 3, replace=False)] = np.nan
+    lows[rng.choice(rows, 3, replace=False)] = np.nan
+    regimes = np.repeat(rng.choice(["Bull", "Bear", "Neutral", None], size=rows // 5 + 1), 5)[:rows]
+    dates = pd.bdate_range("2024-01-01", periods=rows + 20)
+    return pd.DataFrame(
+        {"price": closes, "high": highs, "low": lows, "regime": regimes},
+        index=dates[np.sort(rng.choice(len(dates), rows, replace=False))],
+    )
+
+
+@pytest.mark.parametrize("seed", [3, 11, 29])
+def test_vectorized_triple_barrier_labels_match_per_bar_scan(seed: int) -> None:
+    frame = _random_labeling_frame(160, seed)
+    config = BarrierConfig(max_holding_days=10, profit_target_atr_mult=1.5, stop_loss_atr_mult=1.0)
+    atr = compute_atr(frame["high"], frame["low"], frame["price"], period=config.atr_period).to_numpy()
+    regimes = [str(value or "") for value in frame["regime"].tolist()]
+    arrays = [frame[column].to_numpy(dtype=float) for column in ("price", "high", "low")]
+    expected = frame.join(
+        pd.DataFrame(
+            [label_single_bar(idx, *arrays, atr, regimes[idx], config) for idx in range(len(frame))],
+            index=frame.index,
+        )
+    )
+
+    pd.testing.assert_frame_equal(apply_triple_barrier_labels(frame, config=config), expected)
+
+
+@pytest.mark.parametrize("seed", [3, 11, 29])
+def test_vectorized_managed_exit_labels_match_per_bar_ladder(seed: int) -> None:
+    frame = _random_labeling_frame(160, seed)
+    frame["atr_14"] = compute_atr(frame["high"], frame["low"], frame["price"], period=14)
+    config = ManagedExitConfig(profit_target_atr_mult=3.0, trailing_atr_mult=1.0, trailing_activation_atr=0.5, time_stop_days=30)
+    atr = frame["atr_14"].fillna(config.min_atr).clip(lower=config.min_atr).to_numpy()
+    regimes = [str(value or "") for value in frame["regime"].tolist()]
+    arrays = [frame[column].to_numpy(dtype=float) for column in ("price", "high", "low")]
+    expected = frame.join(
+        pd.DataFrame(
+            [
+                managed_label_single_bar(idx, frame.index, *arrays, atr, regimes, config)
+                for idx in range(len(frame))
+            ],
+            index=frame.index,
+        )
+    )
+
+    labeled = apply_managed_exit_labels(frame, config=config)
+    assert set(labeled["barrier_type"].dropna()) >= {"stop", "trailing", "regime"}
+    pd.testing.assert_frame_equal(labeled, expected)
+
+
 def test_sample_uniqueness_weights_disjoint_and_fully_overlapping() -> None:
     disjoint = pd.DataFrame({"barrier_outcome": [1, 0, 1], "label_end_idx": [0, 1, 2]})
     pd.testing.assert_series_equal(sample_uniqueness_weights(disjoint), pd.Series([1.0, 1.0, 1.0]), check_names=False)
@@ -198,6 +257,40 @@ def test_sample_uniqueness_weights_disjoint_and_fully_overlapping() -> None:
     assert weights.tolist() == pytest.approx([1 / 3, 1 / 3, 1 / 3])
 
 
+def _random_lifespan_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    entry = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 90, rows), unit="D")
+    frame = pd.DataFrame(
+        {
+            "ticker": rng.choice(["AAA", "BBB", "CCC"], rows),
+            "barrier_outcome": np.where(rng.random(rows) < 0.1, np.nan, rng.integers(0, 2, rows)),
+            "label_entry_date": entry + pd.to_timedelta(rng.integers(0, 12, rows), unit="h"),
+            "label_end_date": entry + pd.to_timedelta(rng.integers(-2, 25, rows), unit="D"),
+            "label_end_idx": np.where(rng.random(rows) < 0.1, np.nan, rng.integers(-3, rows + 5, rows)),
+            "_label_start_idx": np.where(rng.random(rows) < 0.2, np.nan, rng.integers(-2, rows, rows)),
+        },
+        index=pd.Index(rng.permutation(rows) + 1000),
+    )
+    frame.loc[frame.sample(frac=0.05, random_state=seed).index, "label_end_date"] = pd.NaT
+    return frame
+
+
+@pytest.mark.parametrize("seed", [5, 17])
+def test_vectorized_uniqueness_weights_match_reference_on_date_and_positional_paths(seed: int) -> None:
+    frame = _random_lifespan_frame(240, seed)
+    pd.testing.assert_series_equal(
+        sample_uniqueness_weights(frame), sample_uniqueness_weights_reference(frame), rtol=1e-12
+    )
+    positional = frame.drop(columns=["label_entry_date", "label_end_date"])
+    pd.testing.assert_series_equal(
+        sample_uniqueness_weights(positional), sample_uniqueness_weights_reference(positional), rtol=1e-12
+    )
+    without_starts = positional.drop(columns=["_label_start_idx", "ticker"])
+    pd.testing.assert_series_equal(
+        sample_uniqueness_weights(without_starts), sample_uniqueness_weights_reference(without_starts), rtol=1e-12
+    )
+
+
 def test_build_multi_ticker_managed_frame_stamps_date_coordinates() -> None:
     first = SimpleNamespace(
         price_frame=_managed_frame(
@@ -80,7 +80,7 @@ def test_low_skill_model_self_disqualifies_and_does_not_reach_size_only(monkeypa
         },
         index=pd.date_range("2026-01-01", periods=2),
     )
-    monkeypatch.setattr(cli, "_ProductionSignalProvider", lambda: BaseProvider())
+    monkeypatch.setattr(cli, "_ProductionSignalProvider", lambda fit_executor=None: BaseProvider())
     provider = cli._MetaLabelerVetoProvider(engine, veto_mode="size_only")
 
     scored = provider("NVDA", date, history, cli.PipelineBacktestConfig(), None)
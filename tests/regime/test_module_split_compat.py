@@ -32,6 +32,7 @@ PERSISTENCE_PUBLIC_NAMES = [
     "add_wash_sale_restriction",
     "annotations",
     "asdict",
+    "close_connection",
     "close_paper_position",
     "close_tax_lot",
     "core",
@@ -147,6 +148,7 @@ PERSISTENCE_PUBLIC_NAMES = [
     "sys",
     "timedelta",
     "timezone",
+    "transaction",
     "types",
     "update_paper_portfolio",
     "update_paper_position_quantity",
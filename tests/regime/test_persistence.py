@@ -239,3 +239,59 @@ def test_connect_raises_persistence_error_on_sqlite_failure(tmp_path, monkeypatc
     monkeypatch.setattr(module.sqlite3, "connect", lambda *_args, **_kwargs: (_ for _ in ()).throw(sqlite3.Error("boom")))
     with pytest.raises(module.PersistenceError):
         module._connect()
+
+
+def test_connect_pools_per_thread_and_batches_commits(temp_persistence, monkeypatch) -> None:
+    import threading
+
+    from src.regime.persistence import schema
+
+    first = temp_persistence._connect()
+    assert temp_persistence._connect() is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert first.execute("PRAGMA user_version").fetchone()[0] == schema.SCHEMA_VERSION
+
+    other: list[object] = []
+    worker = threading.Thread(target=lambda: other.append(temp_persistence._connect()))
+    worker.start()
+    worker.join()
+    assert other[0] is not first
+
+    temp_persistence.close_connection()
+    calls: list[int] = []
+    monkeypatch.setattr(schema, "initialize_schema", lambda conn: calls.append(1))
+    assert temp_persistence._connect() is not first
+    assert calls == []
+
+    with temp_persistence.transaction() as conn:
+        temp_persistence.upsert_thesis("nvda", "AI thesis")
+        temp_persistence.upsert_thesis("amd", "GPU thesis")
+        assert conn.in_transaction
+    assert not conn.in_transaction
+    assert [row["ticker"] for row in temp_persistence.list_theses()] == ["AMD", "NVDA"]
+
+    with pytest.raises(RuntimeError):
+        with temp_persistence.transaction():
+            temp_persistence.upsert_thesis("intc", "Foundry thesis")
+            raise RuntimeError("boom")
+    assert "INTC" not in {row["ticker"] for row in temp_persistence.list_theses()}
+
+
+def test_connect_seeds_theme_defaults_when_a_pooled_connection_opens(temp_persistence) -> None:
+    import sqlite3 as raw_sqlite
+
+    temp_persistence._connect()
+    temp_persistence.close_connection()
+    with raw_sqlite.connect(temp_persistence.DB_PATH) as raw:
+        raw.execute(
+            """
+            INSERT INTO investment_theme (name, narrative, sector_hint, conviction, status, created_at, updated_at)
+            VALUES ('Generative AI', '', '', 3, 'Active', '2024-01-01', '2024-01-01')
+            """
+        )
+    raw.close()
+
+    row = temp_persistence._connect().execute("SELECT narrative, sector_hint FROM investment_theme WHERE name = 'Generative AI'").fetchone()
+
+    assert row["narrative"].startswith("Companies building, deploying, or enabling generative AI")
+    assert row["sector_hint"] == "Artificial Intelligence / Machine Learning"
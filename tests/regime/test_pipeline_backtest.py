@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import json
 import math
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from types import SimpleNamespace
 
 import pandas as pd
 import pytest
 
+from _fixtures import regime_switching_frame
 from src.regime import cli
 from src.regime import paper_trading
 from src.regime.hurdle_rate import check_duration_gate, check_hurdle_rate
 from src.regime.pipeline_backtest import (
     PipelineBacktestConfig,
     PipelineSignal,
+    _IncrementalSignalProvider,
+    _normalize_market_frame,
+    _ProductionSignalProvider,
     compute_equity_metrics,
     pure_check_duration_gate,
     pure_check_hurdle_rate,
@@ -397,3 +401,53 @@ def test_pipeline_backtest_cli_meta_labeler_ab_formats_is_oos_segments() -> None
     assert "NVDA,in_sample,baseline,0.050000" in output
     assert "NVDA,out_of_sample,meta_size_only,0.050000" in output
     assert "NVDA,out_of_sample,diff,0.000000" in output
+
+
+@pytest.mark.parametrize(("seed", "rows"), [(7, 620), (11, 600), (23, 700)])
+def test_incremental_signal_provider_matches_production_provider(seed: int, rows: int) -> None:
+    frame = _normalize_market_frame(regime_switching_frame(rows, seed=seed))
+    config = PipelineBacktestConfig()
+    production = _ProductionSignalProvider()
+    incremental = _IncrementalSignalProvider(frame, config)
+    compared = 0
+    for idx in range(config.training_window, len(frame)):
+        history = frame.iloc[: idx + 1]
+        date = pd.Timestamp(frame.index[idx])
+        expected = production("TEST", date, history, config, None)
+        actual = incremental("TEST", date, history, config, None)
+        assert actual == expected
+        compared += expected is not None
+    assert compared > 50
+
+
+def test_incremental_signals_config_reproduces_backtest() -> None:
+    frame = regime_switching_frame(580)
+    config = PipelineBacktestConfig(enforce_universe_screen=False)
+    baseline = run_pipeline_backtest("TEST", frame, config=config)
+    incremental = run_pipeline_backtest("TEST", frame, config=replace(config, incremental_signals=True))
+    assert [row["signal_regime"] for row in incremental.equity_curve] == [row["signal_regime"] for row in baseline.equity_curve]
+    assert incremental.trades == baseline.trades
+
+
+def test_pipeline_backtest_fans_refits_out_on_the_fit_executor(monkeypatch) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.regime import pipeline_backtest
+
+    frame = regime_switching_frame(580)
+    config = PipelineBacktestConfig(enforce_universe_screen=False, hmm_n_seeds=2)
+    baseline = run_pipeline_backtest("TEST", frame, config=config)
+    executors: list[object] = []
+    original_fit = pipeline_backtest.fit_regime_model
+
+    def recording_fit(*args, **kwargs):
+        executors.append(kwargs.get("executor"))
+        return original_fit(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline_backtest, "fit_regime_model", recording_fit)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pooled = run_pipeline_backtest("TEST", frame, config=config, fit_executor=executor)
+
+    assert executors and all(item is executor for item in executors)
+    assert pooled.trades == baseline.trades
+    assert [row["signal_regime"] for row in pooled.equity_curve] == [row["signal_regime"] for row in baseline.equity_curve]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Sequence
@@ -8,7 +9,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.regime.rl_explore.agent import RLAgentConfig
+from src.regime.rl_explore.agent import RLAgentConfig, SoftmaxLinearAgent
 from src.regime.rl_explore.env import DEFAULT_SNAPSHOT_HASH, RLMarketEnv, RLMarketEnvConfig
 from src.regime.rl_explore.train import (
     CHECKPOINT_DIR_NAME,
@@ -16,6 +17,7 @@ from src.regime.rl_explore.train import (
     load_latest_good_checkpoint,
     rl_explore_status,
     run_rl_explore,
+    run_rl_explore_seeds,
     write_checkpoint,
 )
 
@@ -251,6 +253,54 @@ def test_env_is_faithful() -> None:
         assert pd.Timestamp(end) <= pd.Timestamp("2020-03-31")
 
 
+def test_preloaded_panel_matches_provider_env_and_batches() -> None:
+    event = SimpleNamespace(
+        permaticker=2,
+        date=pd.Timestamp("2020-02-03"),
+        value=30.0,
+        source="actions_failure_default_zero",
+        reason="bankruptcy",
+    )
+    cfg = RLMarketEnvConfig(
+        train_start="2020-01-01",
+        train_end="2020-12-31",
+        validation_start="2021-01-01",
+        validation_end="2021-12-31",
+        top_k=3,
+        universe_top_n=3,
+        rebalance_every_days=5,
+        lookback_days=10,
+    )
+    windows = [("2020-01-02", "2020-03-31"), ("2020-02-10", "2020-09-30"), ("2020-05-01", "2020-05-05"), ("2020-06-01", "2020-12-31")]
+
+    def noisy_agents() -> list[tuple[SoftmaxLinearAgent, np.random.Generator]]:
+        out = []
+        for seed in range(len(windows)):
+            rng = np.random.default_rng(seed)
+            agent = SoftmaxLinearAgent(RLAgentConfig(exploration_sigma=2.0), rng=rng)
+            agent.begin_episode(rng)
+            out.append((agent, rng))
+        return out
+
+    reference_env = RLMarketEnv(provider=FakeMarketDataProvider(terminal_event=event), config=cfg)
+    expected = [reference_env.run_episode(agent, start=start, end=end, rng=rng) for (agent, rng), (start, end) in zip(noisy_agents(), windows)]
+    provider = FakeMarketDataProvider(terminal_event=event)
+    preloaded = RLMarketEnv(provider=provider, config=replace(cfg, preload_panel=True))
+    pairs = noisy_agents()
+    batched = preloaded.run_episodes([agent for agent, _ in pairs], windows, rngs=[rng for _, rng in pairs])
+
+    assert [kind for kind, _, _ in provider.accessed_ranges].count("prices") == 1
+    assert expected[0].terminal_events_used and expected[0].terminal_events_used == batched[0].terminal_events_used
+    for want, got in zip(expected, batched):
+        assert got.terminal_wealth == pytest.approx(want.terminal_wealth, rel=1e-12)
+        assert got.terminal_log_wealth == pytest.approx(want.terminal_log_wealth, rel=1e-12, abs=1e-12)
+        assert got.costs_paid == pytest.approx(want.costs_paid, rel=1e-12)
+        assert got.turnover == pytest.approx(want.turnover, rel=1e-12)
+        assert (got.steps, got.start, got.end, got.max_state_date) == (want.steps, want.start, want.end, want.max_state_date)
+        assert got.selected_permatickers == want.selected_permatickers
+        assert got.holdout_accessed is False
+
+
 def test_budgets_checkpoint_then_stop(tmp_path: Path) -> None:
     episode_root = tmp_path / "episode"
     episode_summary = run_rl_explore(_small_cfg(episode_root, max_episodes=1), provider=FakeMarketDataProvider(), mode="run")
@@ -272,3 +322,51 @@ def test_budgets_checkpoint_then_stop(tmp_path: Path) -> None:
     assert _latest_state(wall_root)["episode"] == 0
     run_rl_explore(_small_cfg(wall_root, max_episodes=1), provider=FakeMarketDataProvider(), mode="resume")
     assert _latest_state(wall_root)["episode"] == 1
+
+
+def test_seed_sweep_is_independent_of_worker_count(tmp_path: Path) -> None:
+    base = _small_cfg(tmp_path / "single", max_episodes=3)
+    single = run_rl_explore(replace(base, seed=5), provider=FakeMarketDataProvider(), mode="run")
+    sequential = run_rl_explore_seeds(
+        _small_cfg(tmp_path / "sequential", max_episodes=3), [5, 9], provider=FakeMarketDataProvider(), max_workers=1
+    )
+    pooled = run_rl_explore_seeds(_small_cfg(tmp_path / "pooled", max_episodes=3), [5, 9], provider=FakeMarketDataProvider(), max_workers=2)
+
+    assert [run["seed"] for run in pooled["runs"]] == [5, 9]
+    assert [(row["seed"], row["episode"]) for row in pooled["episodes"]] == [(5, 1), (5, 2), (5, 3), (9, 1), (9, 2), (9, 3)]
+    assert pooled["holdout_untouched"] is True
+    for left, right in zip(sequential["episodes"], pooled["episodes"]):
+        assert left == right
+    seed_five = _latest_state(tmp_path / "pooled" / "seed_5")
+    alone = _latest_state(tmp_path / "single")
+    assert seed_five["rng_state"] == alone["rng_state"]
+    assert seed_five["agent_state"]["weights"] == alone["agent_state"]["weights"]
+    assert pooled["runs"][0]["best_policy"]["validation_terminal_wealth"] == single["best_policy"]["validation_terminal_wealth"]
+
+
+def test_seed_sweep_starts_each_seed_with_a_fresh_access_log(tmp_path: Path) -> None:
+    from src.regime.rl_explore.train import _run_seed
+
+    base = _small_cfg(tmp_path / "shared", max_episodes=2)
+    env_cfg = replace(base.env, snapshot_hash=base.snapshot_hash)
+    shared = {"env": RLMarketEnv(provider=FakeMarketDataProvider(), config=env_cfg)}
+    _run_seed(replace(base, seed=5, output_dir=tmp_path / "shared" / "seed_5"), "run", shared)
+    _run_seed(replace(base, seed=9, output_dir=tmp_path / "shared" / "seed_9"), "run", shared)
+
+    alone = RLMarketEnv(provider=FakeMarketDataProvider(), config=env_cfg)
+    run_rl_explore(replace(base, seed=9, output_dir=tmp_path / "alone"), mode="run", env=alone)
+
+    assert shared["env"].accessed_ranges == alone.accessed_ranges
+
+
+def test_seed_sweep_merges_every_episode_past_the_replay_buffer(tmp_path: Path) -> None:
+    def cfg(name: str) -> RLExploreConfig:
+        base = _small_cfg(tmp_path / name, max_episodes=4)
+        return replace(base, replay_buffer_size=2, env=replace(base.env, preload_panel=True))
+
+    sequential = run_rl_explore_seeds(cfg("sequential"), [5, 9], provider=FakeMarketDataProvider(), max_workers=1)
+    pooled = run_rl_explore_seeds(cfg("pooled"), [5, 9], provider=FakeMarketDataProvider(), max_workers=2)
+
+    assert len(_latest_state(tmp_path / "pooled" / "seed_5")["replay_buffer"]) == 2
+    assert [(row["seed"], row["episode"]) for row in pooled["episodes"]] == [(seed, episode) for seed in (5, 9) for episode in range(1, 5)]
+    assert pooled["episodes"] == sequential["episodes"]
@@ -4,10 +4,13 @@ import json
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from src.regime import ccel_campaign as ccel
+from src.regime.factor_panel import FactorPanel
 from src.regime.sharadar.adapter import SharadarFrameLoader, SharadarFundamentalsProvider
-from src.regime.sharadar.ingest import build_store_from_frames, ingest_sharadar
+from src.regime.sharadar import store as store_module
+from src.regime.sharadar.ingest import _partition_stats, build_store_from_frames, ingest_sharadar
 from src.regime.sharadar.readiness import certification_gate_status, classify_readiness
 from src.regime.sharadar.store import SharadarStore
 
@@ -75,6 +78,62 @@ def test_pit_fundamentals_do_not_look_ahead(tmp_path) -> None:
     assert as_of["netinc"] == 5
 
 
+def test_fundamentals_snapshot_matches_per_name_asof_with_dimension_precedence(tmp_path) -> None:
+    tables = _fixture_tables()
+    tables["SF1"] = pd.concat(
+        [
+            tables["SF1"],
+            pd.DataFrame(
+                [
+                    {"permaticker": 1, "datekey": "2020-01-05", "dimension": "ART", "netinc": 50, "revenue": 999},
+                    {"permaticker": 1, "datekey": "2020-01-08", "dimension": "ARY", "netinc": 6, "revenue": 130},
+                    {"permaticker": 1, "datekey": "2020-01-09", "dimension": "MRQ", "netinc": -1, "revenue": -1},
+                ]
+            ),
+        ],
+        ignore_index=True,
+    )
+    root = tmp_path / "sharadar"
+    build_store_from_frames(root, tables)
+    store = SharadarStore(root)
+    dates = [pd.Timestamp(date) for date in _dates("2020-01-01", 10)]
+
+    snapshot = store.get_fundamentals_snapshot([1, 2, 5, 99], dates, ["revenue", "netinc"])
+
+    assert list(snapshot.columns) == ["permaticker", "as_of_date", "datekey", "dimension", "revenue", "netinc"]
+    precedence = {"ARQ": 0, "ART": 1, "ARY": 2}
+    for perma in (1, 2, 5, 99):
+        history = store.get_fundamentals_history(perma, dates[-1], ["revenue", "netinc"]).to_dict("records")
+        for date in dates:
+            rows = snapshot.loc[(snapshot["permaticker"] == perma) & (snapshot["as_of_date"] == date)]
+            eligible = [
+                row
+                for row in history
+                if pd.Timestamp(row["datekey"]) <= date and str(row["dimension"]).upper() in precedence
+            ]
+            if not eligible:
+                assert rows.empty
+                continue
+            latest = max(pd.Timestamp(row["datekey"]) for row in eligible)
+            expected = min(
+                (row for row in eligible if pd.Timestamp(row["datekey"]) == latest),
+                key=lambda row: precedence[str(row["dimension"]).upper()],
+            )
+            assert len(rows) == 1
+            assert pd.Timestamp(rows["datekey"].iloc[0]) == latest
+            assert rows["dimension"].iloc[0] == expected["dimension"]
+            assert rows["revenue"].iloc[0] == expected["revenue"]
+            assert rows["netinc"].iloc[0] == expected["netinc"]
+    first_filing = snapshot.loc[(snapshot["permaticker"] == 1) & (snapshot["as_of_date"] == pd.Timestamp("2020-01-07"))]
+    assert first_filing["dimension"].tolist() == ["ARQ"]
+    assert first_filing["revenue"].tolist() == [100]
+    assert store.get_fundamentals_asof(1, "2020-01-07", ["revenue"])["revenue"] == 100
+    assert store.get_fundamentals_asof(1, "2020-01-10", ["revenue"])["revenue"] == 130
+    signals = SharadarFundamentalsProvider(store).quality_for_permatickers([1, 2, 99], "2020-01-10")
+    assert signals[99].status == "UNAVAILABLE"
+    assert signals[2].fields["datekey"] == "2020-01-08"
+
+
 def test_ticker_reuse_resolves_by_permaticker_without_leakage(tmp_path) -> None:
     store = _build_store(tmp_path / "sharadar")
 
@@ -171,6 +230,151 @@ def test_delisted_name_price_history_stops_at_action_date_without_terminal_injec
     assert prices.loc[pd.Timestamp("2020-01-03"), "price"] == 18.0
 
 
+def test_get_prices_serves_ranges_from_cached_history_and_spilled_panel(tmp_path, monkeypatch) -> None:
+    from src.regime.sharadar.price_cache import PRICE_FRAME_CACHE
+
+    root = tmp_path / "sharadar"
+    store = _build_store(root)
+    expected = store._read_adjusted_prices("SEP", {3, 4}, "2020-01-02", "2020-01-06")
+    PRICE_FRAME_CACHE.clear()
+
+    first = store.get_prices([3, 4], "2020-01-02", "2020-01-06")
+    reads: list[str] = []
+    original = SharadarStore.read_fact_table
+
+    def recording_read(self, table, **kwargs):
+        reads.append(table)
+        return original(self, table, **kwargs)
+
+    monkeypatch.setattr(SharadarStore, "read_fact_table", recording_read)
+    second = store.get_prices([4], "2020-01-08", "2020-01-10")
+
+    assert reads == []
+    for perma in (3, 4):
+        pd.testing.assert_frame_equal(first[perma], expected[perma])
+    assert list(second[4].index) == list(pd.date_range("2020-01-08", "2020-01-10"))
+
+    panel_dir = store.spill_price_panel([3, 4])
+    assert panel_dir is not None and (panel_dir / "price.npy").exists()
+    PRICE_FRAME_CACHE.clear()
+    reads.clear()
+    warm = SharadarStore(root).get_prices([3, 4], "2020-01-02", "2020-01-06")
+
+    assert reads == []
+    for perma in (3, 4):
+        pd.testing.assert_frame_equal(warm[perma], expected[perma], check_dtype=False, check_freq=False)
+    PRICE_FRAME_CACHE.clear()
+
+
+def _replay_sp500_membership(rows: pd.DataFrame, as_of: pd.Timestamp) -> list[int]:
+    rows = rows.loc[rows["date"] <= as_of]
+    snapshots = rows.loc[rows["action"].isin({"historical", "current"})]
+    members: set[int] = set()
+    if not snapshots.empty:
+        snapshot_date = snapshots["date"].max()
+        members = set(snapshots.loc[snapshots["date"] == snapshot_date, "permaticker"].astype(int))
+        rows = rows.loc[rows["date"] > snapshot_date]
+    for perma, action in zip(rows["permaticker"].astype(int), rows["action"]):
+        if "removed" in action:
+            members.discard(perma)
+        else:
+            members.add(perma)
+    return sorted(members)
+
+
+def test_sp500_membership_timeline_matches_event_replay_and_persists(tmp_path, monkeypatch) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    dates = pd.date_range("2019-01-01", periods=60, freq="7D")
+    events = [{"date": dates[0].date().isoformat(), "action": "historical", "permaticker": perma} for perma in range(1, 9)]
+    for date in dates[1:]:
+        if rng.random() < 0.1:
+            snapshot = sorted(rng.choice(np.arange(1, 21), size=8, replace=False).tolist())
+            events.extend({"date": date.date().isoformat(), "action": "historical", "permaticker": perma} for perma in snapshot)
+            continue
+        for perma in rng.choice(np.arange(1, 21), size=2, replace=False).tolist():
+            events.append({"date": date.date().isoformat(), "action": str(rng.choice(["added", "removed"])), "permaticker": perma})
+    tables = _fixture_tables()
+    tables["SP500"] = pd.DataFrame(events)
+    root = tmp_path / "sharadar"
+    build_store_from_frames(root, tables)
+    store = SharadarStore(root)
+    rows = store._sp500_rows()
+
+    for as_of in [dates[0] - pd.Timedelta(days=1), *dates, *(dates + pd.Timedelta(days=3))]:
+        expected = _replay_sp500_membership(rows, as_of)
+        assert store.sp500_membership_asof(as_of) == expected
+        assert all(store.sp500_was_member(perma, as_of) == (perma in expected) for perma in range(1, 21))
+    window = _replay_sp500_membership(rows, dates[10])
+    assert set(window) <= set(store._sp500_member_candidates(dates[10], dates[20]))
+
+    assert (root / "sp500_membership.npz").exists()
+    monkeypatch.setattr(SharadarStore, "_sp500_rows", lambda self: pytest.fail("timeline should load from disk"))
+    reloaded = SharadarStore(root)
+    assert reloaded.sp500_membership_asof(dates[30]) == _replay_sp500_membership(rows, dates[30])
+
+
+def _partitioned_store(root: Path) -> SharadarStore:
+    """Fixture store with SEP split into date-ordered part files like a bulk CSV ingest."""
+
+    _build_store(root)
+    single = root / "facts" / "SEP.parquet"
+    sep = pd.read_parquet(single).sort_values("date").reset_index(drop=True)
+    single.unlink()
+    part_dir = root / "facts" / "SEP"
+    part_dir.mkdir()
+    partitions = {}
+    for idx, start in enumerate(range(0, len(sep), 12)):
+        part = sep.iloc[start : start + 12]
+        name = f"part-{idx:05d}.parquet"
+        part.to_parquet(part_dir / name, index=False)
+        partitions[name] = _partition_stats(part, "SEP")
+    manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+    manifest["tables"]["SEP"]["partitions"] = partitions
+    (root / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return SharadarStore(root)
+
+
+def test_read_fact_table_prunes_partitions_and_pushes_down_date_range(tmp_path, monkeypatch) -> None:
+    store = _partitioned_store(tmp_path / "sharadar")
+    scanned: list[list[str]] = []
+    original = store_module._read_parquet_dataset
+
+    def recording_reader(files, **kwargs):
+        scanned.append([file.name for file in files])
+        return original(files, **kwargs)
+
+    monkeypatch.setattr(store_module, "_read_parquet_dataset", recording_reader)
+    rows = store.read_fact_table(
+        "SEP",
+        columns=["permaticker", "date", "close", "not_a_column"],
+        filters=[("permaticker", "in", [4, 5])],
+        start="2020-01-08",
+        end=pd.Timestamp("2020-01-09"),
+    )
+
+    assert scanned and len(scanned[0]) < len(list((tmp_path / "sharadar" / "facts" / "SEP").glob("*.parquet")))
+    assert list(rows.columns) == ["permaticker", "date", "close"]
+    assert sorted(zip(rows["permaticker"], rows["date"])) == [
+        (4, "2020-01-08"),
+        (4, "2020-01-09"),
+        (5, "2020-01-08"),
+        (5, "2020-01-09"),
+    ]
+    assert store.read_fact_table("SEP", start="2021-01-01").empty
+    prices = store.get_prices([4], "2020-01-03", "2020-01-04")[4]
+    assert list(prices.index) == [pd.Timestamp("2020-01-03"), pd.Timestamp("2020-01-04")]
+
+
+def test_read_fact_table_falls_back_to_pandas_when_filters_do_not_type_check(tmp_path) -> None:
+    store = _partitioned_store(tmp_path / "sharadar")
+
+    rows = store.read_fact_table("SEP", filters=[("permaticker", "=", "not-a-number")])
+
+    assert len(rows) == len(_fixture_tables()["SEP"])
+
+
 def test_terminal_value_source_order(tmp_path) -> None:
     dates = _dates("2020-01-01", 3)
     tables = {
@@ -279,7 +483,7 @@ def test_missing_pit_quality_fails_closed(tmp_path) -> None:
     assert signal.quality_gate_pass is False
     assert set(frame["quality_signal_status"]) == {"UNAVAILABLE"}
     assert frame["quality_gate_pass"].eq(False).all()
-    assert ccel._quality_fails("MISS", pd.Timestamp("2020-01-05"), {"MISS": frame}) is True
+    assert FactorPanel({"MISS": frame}).quality_fails("MISS", pd.Timestamp("2020-01-05")) is True
 
 
 def test_readiness_blocks_certification_until_survivorship_free(tmp_path) -> None:
@@ -216,7 +216,7 @@ def test_size_only_mode_does_not_block_entry_in_cli_provider(monkeypatch) -> Non
         },
         index=pd.date_range("2026-01-01", periods=2),
     )
-    monkeypatch.setattr(cli, "_ProductionSignalProvider", lambda: BaseProvider())
+    monkeypatch.setattr(cli, "_ProductionSignalProvider", lambda fit_executor=None: BaseProvider())
     gated = cli._MetaLabelerVetoProvider(Engine(), veto_mode="gate")("NVDA", date, history, cli.PipelineBacktestConfig(), None)
     size_only = cli._MetaLabelerVetoProvider(Engine(), veto_mode="size_only")("NVDA", date, history, cli.PipelineBacktestConfig(), None)
     assert gated.composite_action == "Hold"
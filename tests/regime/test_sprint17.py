@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import datetime as dt
+import os
 import sys
+import threading
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -15,6 +17,7 @@ from src.regime import persistence
 from src.regime.alerts import RegimeAlert, SignalAlert, format_alert_summary
 from src.regime.portfolio import compute_correlation_risk, portfolio_risk_summary_dict
 from src.regime.scheduled_runner import run_scheduled_regime_checks
+from src.regime.signals import PriceTargets
 
 
 def test_transition_outcome_columns_and_journal(tmp_path, monkeypatch) -> None:
@@ -83,19 +86,73 @@ def test_scheduled_runner_formats_alert_summary(monkeypatch) -> None:
     monkeypatch.setattr("src.regime.scheduled_runner.get_investor_db_path", lambda: "/tmp/investor.db")
     monkeypatch.setattr("src.regime.scheduled_runner.get_portfolio_tickers_filtered", lambda db_path: ["NVDA"])
     monkeypatch.setattr(
-        "src.regime.scheduled_runner.check_regime_changes",
-        lambda tickers, db_path: [RegimeAlert("NVDA", "Neutral", "Bull", 0.08, "Buy", None, "2026-03-24T12:00:00+00:00")],
+        "src.regime.scheduled_runner.run_regime_alert_checks",
+        lambda tickers, db_path, max_workers=None: {
+            "regime": [RegimeAlert("NVDA", "Neutral", "Bull", 0.08, "Buy", None, "2026-03-24T12:00:00+00:00")],
+            "risk": [],
+            "signal": [SignalAlert("NVDA", "Hold", "Buy", "2026-03-24T12:00:00+00:00")],
+            "stop": [],
+            "timings": {"ticker_count": 1, "analyze_seconds": 0.5},
+        },
     )
-    monkeypatch.setattr("src.regime.scheduled_runner.check_transition_risk_spikes", lambda tickers: [])
-    monkeypatch.setattr(
-        "src.regime.scheduled_runner.check_signal_changes",
-        lambda tickers: [SignalAlert("NVDA", "Hold", "Buy", "2026-03-24T12:00:00+00:00")],
-    )
-    monkeypatch.setattr("src.regime.scheduled_runner.check_stop_proximity", lambda tickers, db_path: [])
     monkeypatch.setattr("src.regime.scheduled_runner.get_pending_transition_outcomes", lambda: [])
     monkeypatch.setattr("src.regime.scheduled_runner.get_latest_prices", lambda db_path, tickers: {})
     result = run_scheduled_regime_checks()
     assert "NVDA" in result["summary"]
+    assert result["timings"]["analyze_seconds"] == 0.5
+    assert "persist_seconds" in result["timings"]
+
+
+def _fake_alert_analysis(ticker: str, market_frame: pd.DataFrame, load_seconds: float = 0.0):
+    from src.regime import alerts
+
+    regime = SimpleNamespace(
+        latest_label="Bull",
+        latest_state_id=0,
+        transition_risk=0.35 if ticker == "NVDA" else 0.05,
+        worker_pid=os.getpid(),
+    )
+    return alerts.TickerAnalysis(
+        ticker=ticker,
+        regime=regime,
+        technicals=pd.DataFrame(),
+        composite=SimpleNamespace(composite_action="Buy"),
+        price_targets=PriceTargets(100.0, None, None, 97.0, None, 21, None, 1.0, "mid"),
+        timings={"load_seconds": load_seconds, "fit_seconds": 2.0, "signal_seconds": 0.5},
+    )
+
+
+def test_fused_alert_checks_fit_each_ticker_once(monkeypatch) -> None:
+    from src.regime import alerts
+
+    downloads: list[tuple[str, str]] = []
+
+    def fake_download(ticker: str):
+        downloads.append((ticker, threading.current_thread().name))
+        return pd.DataFrame({"price": [1.0]}), 1.0
+
+    monkeypatch.setattr(alerts, "_download_ticker_frame", fake_download)
+    monkeypatch.setattr(alerts, "analyze_frame", _fake_alert_analysis)
+    monkeypatch.setattr(alerts, "positions_by_ticker_and_account", lambda accounts: {})
+    monkeypatch.setattr(alerts, "get_tax_assumptions", lambda db_path: {})
+    monkeypatch.setattr(alerts, "save_regime_event", lambda ticker, label, state_id: {"previous_label": "Neutral"})
+    monkeypatch.setattr(alerts, "get_signal_effectiveness", lambda: {"rows": [{"ticker": "AVGO", "action": "Buy"}]})
+    result = alerts.run_regime_alert_checks(["nvda", "AVGO", "", None, " NVDA "], "/tmp/investor.db", max_workers=2)
+    assert [alert.ticker for alert in result["regime"]] == ["NVDA", "AVGO"]
+    assert [alert.ticker for alert in result["risk"]] == ["NVDA"]
+    assert [alert.ticker for alert in result["signal"]] == ["NVDA"]
+    assert len(result["stop"]) == 2
+    assert result["timings"]["ticker_count"] == 2
+    assert result["timings"]["fit_seconds"] == 4.0
+
+    assert sorted(ticker for ticker, _thread in downloads) == ["AVGO", "NVDA"]
+    assert all(thread.startswith("alert-download") for _ticker, thread in downloads)
+
+    analyses = alerts.analyze_tickers(["NVDA", "AVGO"], max_workers=2)
+    assert list(analyses) == ["NVDA", "AVGO"]
+    assert all(analysis.regime.worker_pid != os.getpid() for analysis in analyses.values())
+    risks = alerts.check_transition_risk_spikes(["nvda", "", None], analyses=analyses)
+    assert [alert.ticker for alert in risks] == ["NVDA"]
 
 
 def test_alert_summary_formats_multiple_alert_types() -> None:
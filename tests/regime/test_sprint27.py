@@ -64,8 +64,8 @@ def test_quick_regime_screen_single_download(temp_modules, monkeypatch) -> None:
     )
     monkeypatch.setattr(
         discovery_module,
-        "fit_regime_model",
-        lambda ticker, market_frame, training_window=252, refit_step=21: type("Regime", (), {"latest_label": "Bull", "latest_probability": 0.66})(),
+        "fit_regime_model_cached",
+        lambda ticker, market_frame, training_window=252, refit_step=21, executor=None: type("Regime", (), {"latest_label": "Bull", "latest_probability": 0.66})(),
     )
     label, probability, entry_price, stop_price = discovery_module._quick_regime_screen("WOLF")
     assert calls == ["WOLF"]
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import csv
+import importlib
 import json
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
+from _fixtures import regime_switching_frame
 from src.regime.config import SignalThresholds
 from src.regime.hmm_engine import empirical_regime_duration_quantiles
-from src.regime.pipeline_backtest import PipelineBacktestConfig, PipelineSignal
+from src.regime import threshold_sweep
+from src.regime.pipeline_backtest import PipelineBacktestConfig, PipelineSignal, run_pipeline_backtest
 from src.regime.signals import SignalResult, build_composite_signal, signal_from_forward_curve
 from src.regime.threshold_sweep import run_threshold_sweep, write_sweep_rows
 
@@ -152,3 +155,58 @@ def test_threshold_sweep_grid_and_round_trip_outputs(tmp_path: Path) -> None:
     assert len(json.loads(json_path.read_text())) == len(rows)
     with csv_path.open(newline="", encoding="utf-8") as handle:
         assert len(list(csv.DictReader(handle))) == len(rows)
+
+
+def test_threshold_sweep_replays_one_decode_per_ticker_and_resumes_from_checkpoints(tmp_path: Path, monkeypatch) -> None:
+    grid = {"use_forward_curve_gates": [False, True], "composite_adjustments_enabled": [True, False]}
+    config = PipelineBacktestConfig(incremental_signals=True, enforce_universe_screen=False, oos_start="2019-12-02")
+    frame = regime_switching_frame(seed=11)
+    decodes: list[str] = []
+    original_decode = threshold_sweep.decode_regime_path
+
+    def counting_decode(ticker, market_frame, cfg):
+        decodes.append(ticker)
+        return original_decode(ticker, market_frame, cfg)
+
+    monkeypatch.setattr(threshold_sweep, "decode_regime_path", counting_decode)
+    rows = run_threshold_sweep(tickers=["TEST"], market_frames={"TEST": frame}, grid=grid, base_config=config, checkpoint_dir=tmp_path)
+
+    assert decodes == ["TEST"]
+    for combo in threshold_sweep.expand_threshold_grid(grid):
+        direct = run_pipeline_backtest("TEST", frame, config=threshold_sweep._combo_config(config, combo))
+        replayed = next(row for row in rows if row["ticker"] == "TEST" and row["combo_id"] == combo["combo_id"])
+        assert replayed["full_total_return"] == pytest.approx(direct.metrics["total_return"])
+        assert replayed["full_trade_count"] == direct.metrics["trade_count"]
+
+    monkeypatch.setattr(threshold_sweep, "run_pipeline_backtest", lambda *args, **kwargs: pytest.fail("expected checkpoint reuse"))
+    resumed = run_threshold_sweep(tickers=["TEST"], market_frames={"TEST": frame}, grid=grid, base_config=config, checkpoint_dir=tmp_path)
+    assert resumed == rows
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+
+@pytest.fixture()
+def live_signal_thresholds() -> SignalThresholds:
+    """Thresholds built from the current ``src.regime.config`` module.
+
+    Other tests reload that module, and thresholds pickled for pool workers must be
+    instances of the class the module currently exposes.
+    """
+
+    return importlib.import_module("src.regime.config").SignalThresholds()
+
+
+def test_threshold_sweep_process_pool_matches_serial_rows(live_signal_thresholds: SignalThresholds) -> None:
+    grid = {"use_forward_curve_gates": [False, True]}
+    config = PipelineBacktestConfig(
+        incremental_signals=True,
+        enforce_universe_screen=False,
+        oos_start="2019-12-02",
+        signal_thresholds=live_signal_thresholds,
+    )
+    frames = {"TEST": regime_switching_frame(seed=11), "ALT": regime_switching_frame(seed=23)}
+
+    serial = run_threshold_sweep(tickers=["TEST", "ALT"], market_frames=frames, grid=grid, base_config=config)
+    parallel = run_threshold_sweep(tickers=["TEST", "ALT"], market_frames=frames, grid=grid, base_config=config, max_workers=2)
+
+    assert len(serial) == 6
+    assert parallel == serial
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import re
 from decimal import Decimal
 from pathlib import Path
 
@@ -12,6 +13,7 @@ from src.db.models import Base, ExpenseAccount, ExpenseImportBatch, ExpenseMerch
 from src.investor.expenses.categorize import apply_rules_to_db, categorize_one
 from src.investor.expenses.config import CategorizationConfig
 from src.investor.expenses.recurring import detect_recurring
+from src.investor.expenses import categorize as categorize_module
 from src.investor.expenses.categorize import load_rules
 
 
@@ -309,3 +311,81 @@ def test_chase_category_hint_shopping_maps_to_shopping(tmp_path: Path) -> None:
     )
     assert cat == "Shopping"
     assert rule == "hint"
+
+
+def test_indexed_rule_matcher_agrees_with_priority_scan(tmp_path: Path, monkeypatch) -> None:
+    cfg = CategorizationConfig()
+    rules_doc = {
+        "version": 1,
+        "categories": ["Dining", "Shopping", "Travel"],
+        "rules": [
+            {"name": "amazon", "priority": 100, "category": "Shopping", "match": {"merchant_exact": " AMAZON "}},
+            {"name": "amazon dining hint", "priority": 120, "category": "Dining", "match": {"merchant_exact": "amazon", "category_hint_exact": "dining"}},
+            {"name": "coffee", "priority": 50, "category": "Dining", "match": {"merchant_regex": r"^(starbucks|peet)"}},
+            {"name": "grocery", "priority": 10, "category": "Groceries", "match": {"description_regex": r"\b(whole foods|kroger)\b"}},
+            {"name": "grocery alt", "priority": 10, "category": "Shopping", "match": {"description_regex": r"kroger fuel"}},
+            {"name": "ticket", "priority": 5, "category": "Travel", "match": {"description_regex": r"#(\d)\1$", "category_hint_exact": "Travel"}},
+            {"name": "catch-all", "priority": -1, "category": "Misc", "match": {"merchant_regex": r"zz"}},
+        ],
+    }
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text(yaml.safe_dump(rules_doc, sort_keys=False))
+    rules = load_rules(rules_path, defaults=cfg)
+
+    def linear(merchant: str, desc: str, hint: str | None) -> str | None:
+        for r in rules.rules:
+            if r.merchant_exact and merchant.strip().lower() != r.merchant_exact.strip().lower():
+                continue
+            if r.merchant_regex and not r.merchant_regex.search(merchant):
+                continue
+            if r.description_regex and not r.description_regex.search(desc):
+                continue
+            if r.category_hint_exact and (hint or "").strip().lower() != r.category_hint_exact.strip().lower():
+                continue
+            return r.name
+        return None
+
+    evaluations: list[tuple[str, str, float, str | None]] = []
+    uncached = categorize_module._categorize_uncached
+
+    def counting(**kwargs):
+        evaluations.append((kwargs["merchant_norm"], kwargs["description_norm"], kwargs["amount"], kwargs["category_hint"]))
+        return uncached(**kwargs)
+
+    monkeypatch.setattr(categorize_module, "_categorize_uncached", counting)
+
+    merchants = ["Amazon", "amazon ", "Starbucks", "Peets", "Kroger", "Whole Foods", "Buzz", "Unknown"]
+    descs = ["WHOLE FOODS MKT", "KROGER FUEL #12", "KROGER", "Kroger Fuel", "TICKET #44", "TICKET #45", "STRASSE KROGER", "ſ kroger"]
+    hints = [None, "Dining", " travel ", "Shopping"]
+    for m in merchants:
+        for d in descs:
+            for h in hints:
+                r = rules.matcher.match_rule(merchant_norm=m, description_norm=d, category_hint=h)
+                assert (r.name if r else None) == linear(m, d, h), (m, d, h)
+                for amount in (-5.0, 5.0):
+                    first = categorize_one(merchant_norm=m, description_norm=d, amount=amount, category_hint=h, rules=rules)
+                    evaluated = len(evaluations)
+                    again = categorize_one(merchant_norm=m, description_norm=d, amount=amount * 3, category_hint=h, rules=rules)
+                    assert again is first
+                    assert len(evaluations) == evaluated
+    assert len(evaluations) == len(set(evaluations)) == len(merchants) * len(descs) * len(hints) * 2
+
+
+def test_required_literal_only_keeps_text_every_match_contains() -> None:
+    from src.investor.expenses.categorize import _required_literal
+
+    cases = {
+        r"kroger fuel": "kroger fuel",
+        r"^AMZN Mktp": "amzn mktp",
+        r"uber\s*eats": "uber",
+        r"colou?r": "colo",
+        r"ab+c": "ab",
+        r"x\.com": "x.com",
+        r"net(flix)?": "net",
+        r"\x41bc": "bc",
+        r"#(\d)\1$": "#",
+        r"abc|def": None,
+        r"\b(whole foods|kroger)\b": None,
+    }
+    for pattern, literal in cases.items():
+        assert _required_literal(re.compile(pattern, re.IGNORECASE)) == literal, pattern
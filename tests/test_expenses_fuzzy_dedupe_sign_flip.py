@@ -70,3 +70,55 @@ def test_fuzzy_dedupe_detects_sign_flip_duplicates(tmp_path: Path) -> None:
     finally:
         session.close()
 
+
+def test_fuzzy_dedupe_index_matches_per_row_query() -> None:
+    from decimal import Decimal
+
+    from src.investor.expenses.db import _fuzzy_duplicate_exists, _FuzzyDedupeIndex
+
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    session = Session(engine)
+    try:
+        acct = ExpenseAccount(institution="Amex", name="Gold", last4_masked="1000", type="CREDIT")
+        other = ExpenseAccount(institution="Amex", name="Blue", last4_masked="2000", type="CREDIT")
+        batch = ExpenseImportBatch(source="CSV", file_name="seed.csv", file_hash="y" * 64, row_count=0, duplicates_skipped=0)
+        session.add_all([acct, other, batch])
+        session.flush()
+        seeds = [
+            (acct.id, dt.date(2024, 3, 1), -12.5, "Blue Bottle", "BLUE BOTTLE COFFEE #12"),
+            (acct.id, dt.date(2024, 3, 2), 12.5, "Shell", "SHELL OIL 5744"),
+            (acct.id, dt.date(2024, 3, 4), -40.0, "Trader Joe's", "TRADER JOE'S #552"),
+            (acct.id, dt.date(2024, 3, 4), -40.0, "", ""),
+            (other.id, dt.date(2024, 3, 1), -12.5, "Uber", "UBER TRIP"),
+        ]
+        for i, (aid, posted, amount, merchant, desc) in enumerate(seeds):
+            session.add(
+                ExpenseTransaction(
+                    txn_id=f"seed_{i}",
+                    expense_account_id=aid,
+                    institution="Amex",
+                    account_name="Gold",
+                    posted_date=posted,
+                    description_raw=desc,
+                    description_norm=desc,
+                    merchant_norm=merchant,
+                    amount=amount,
+                    currency="USD",
+                    tags_json=[],
+                    import_batch_id=batch.id,
+                )
+            )
+        session.commit()
+
+        probes = [(m, d) for m in ["Blue Bottle", "Uber", "Trader Joes", "Shell", ""] for d in ["BLUE BOTTLE 99", "UBER TRIP", "SHELL", ""]]
+        dates = [dt.date(2024, 2, 28) + dt.timedelta(days=k) for k in range(8)]
+        index = _FuzzyDedupeIndex(session, expense_account_id=acct.id, dates=dates)
+        for posted in dates:
+            for amount in (Decimal("-12.50"), Decimal("12.50"), Decimal("-40.00"), Decimal("7.00")):
+                for merchant, desc in probes:
+                    kwargs = dict(posted_date=posted, amount_2dp=amount, merchant_norm=merchant, description_norm=desc)
+                    expected = _fuzzy_duplicate_exists(session, expense_account_id=acct.id, **kwargs)
+                    assert index.exists(**kwargs) is expected, kwargs
+    finally:
+        session.close()
@@ -170,3 +170,52 @@ def test_holdings_falls_back_to_snapshot_market_value_when_no_price_cache(sessio
     assert voo.latest_price is not None  # derived from snapshot MV/qty
     assert voo.market_value == 500.0
     assert view.total_market_value == 500.0
+
+
+def test_latest_price_index_refreshes_incrementally(tmp_path, monkeypatch):
+    import portfolio_report.prices as prices_mod
+    from src.core import price_index
+    from src.core.price_index import INDEX_FILENAME, LatestPriceIndex
+
+    prices_dir = tmp_path / "prices"
+    prices_dir.mkdir()
+    csv_path = prices_dir / "NVDA.csv"
+    csv_path.write_text("Date,Close\n2026-01-02,150.00\n2026-01-05,151.00\n", encoding="utf-8")
+
+    index = LatestPriceIndex(prices_dir)
+    hit = index.latest_price(csv_path, symbol="NVDA", as_of=dt.date(2026, 1, 6))
+    assert hit is not None and hit[:2] == (dt.date(2026, 1, 5), 151.0)
+    index.save()
+    assert (prices_dir / INDEX_FILENAME).exists()
+
+    # Unchanged files are answered from the persisted index without parsing the CSV.
+    def _no_parse(*_a, **_k):
+        raise AssertionError("CSV should not be parsed")
+
+    monkeypatch.setattr(prices_mod, "parse_price_rows", _no_parse)
+    monkeypatch.setattr(price_index, "_latest_price_from_csv", _no_parse)
+    hit = LatestPriceIndex(prices_dir).latest_price(csv_path, symbol="NVDA", as_of=dt.date(2026, 1, 6))
+    assert hit is not None and hit[:2] == (dt.date(2026, 1, 5), 151.0)
+    monkeypatch.undo()
+
+    # Appended rows are parsed from the stored offset only.
+    seen: list[str] = []
+    real_parse = prices_mod.parse_price_rows
+
+    def _spy(text, **kwargs):
+        seen.append(text)
+        return real_parse(text, **kwargs)
+
+    monkeypatch.setattr(prices_mod, "parse_price_rows", _spy)
+    with csv_path.open("a", encoding="utf-8") as fh:
+        fh.write("2026-01-06,155.50\n")
+    index = LatestPriceIndex(prices_dir)
+    hit = index.latest_price(csv_path, symbol="NVDA", as_of=dt.date(2026, 1, 7))
+    assert hit is not None and hit[:2] == (dt.date(2026, 1, 6), 155.5)
+    assert seen == ["Date,Close\n2026-01-06,155.50\n"]
+
+    # Rewritten files are re-parsed in full; historical as-of dates still resolve.
+    csv_path.write_text("date,close\n2025-12-31,140.00\n2026-01-08,160.00\n", encoding="utf-8")
+    assert index.latest_price(csv_path, symbol="NVDA", as_of=dt.date(2026, 1, 9))[:2] == (dt.date(2026, 1, 8), 160.0)
+    assert index.latest_price(csv_path, symbol="NVDA", as_of=dt.date(2026, 1, 7))[:2] == (dt.date(2025, 12, 31), 140.0)
+    assert index.latest_price(csv_path, symbol="NVDA", as_of=dt.date(2025, 1, 1)) is None
@@ -55,3 +55,81 @@ def test_build_holdings_view_prefers_positions_snapshot_over_total_only(session)
     view = build_holdings_view(session, scope="household", account_id=int(acct.id), today=dt.date(2026, 1, 1))
     assert any(p.symbol == "NVDA" for p in (view.positions or []))
 
+
+def test_snapshot_rollup_rows_follow_payload_and_backfill(session):
+    from sqlalchemy import text
+
+    from src.core.external_holdings import accounts_with_snapshot_positions, get_current_tickers_by_scope
+    from src.core.performance import _valuation_points_from_snapshots
+    from src.db.holding_rollup import ROLLUP_VERSION, backfill_holding_rollups
+    from src.db.models import (
+        Account,
+        ExternalAccountMap,
+        ExternalConnection,
+        ExternalHoldingPosition,
+        ExternalHoldingSnapshot,
+        ExternalHoldingValuation,
+        TaxpayerEntity,
+    )
+
+    tp = TaxpayerEntity(name="Trust", type="TRUST")
+    session.add(tp)
+    session.flush()
+    acct = Account(name="IB Taxable", broker="IB", account_type="TAXABLE", taxpayer_entity_id=tp.id)
+    session.add(acct)
+    session.flush()
+    conn = ExternalConnection(name="IB", provider="IB", broker="IB", taxpayer_entity_id=tp.id, status="ACTIVE")
+    session.add(conn)
+    session.flush()
+    session.add(ExternalAccountMap(connection_id=conn.id, provider_account_id="IB:U1", account_id=acct.id))
+    snap = ExternalHoldingSnapshot(
+        connection_id=conn.id,
+        as_of=dt.datetime(2025, 1, 2, 23, 59, 59, tzinfo=dt.timezone.utc),
+        payload_json={
+            "items": [
+                {"provider_account_id": "IB:U1", "symbol": "aapl", "qty": 2, "market_value": 300.0},
+                {"provider_account_id": "IB:U1", "symbol": "AAPL", "qty": 1, "market_value": "150"},
+                {"provider_account_id": "IB:U1", "symbol": "CASH:USD", "qty": 50.0, "market_value": 50.0},
+            ]
+        },
+    )
+    session.add(snap)
+    session.commit()
+
+    aapl = session.query(ExternalHoldingPosition).filter_by(snapshot_id=snap.id, symbol="AAPL").one()
+    assert (aapl.qty, aapl.market_value, aapl.is_cash) == (3.0, 450.0, False)
+    val = session.query(ExternalHoldingValuation).filter_by(snapshot_id=snap.id).one()
+    assert (val.positions_value, val.cash_value, val.total_value) == (450.0, 50.0, None)
+    assert get_current_tickers_by_scope(session, scope="trust") == ["AAPL"]
+    assert accounts_with_snapshot_positions(session, scope="trust") == {int(acct.id)}
+    points = _valuation_points_from_snapshots(
+        session, scope="trust", start_date=dt.date(2025, 1, 1), end_date=dt.date(2025, 1, 31), connection_ids=[conn.id]
+    )
+    assert points == {int(conn.id): {dt.date(2025, 1, 2): 500.0}}
+
+    # Re-importing the same as_of rewrites payload_json in place; child rows follow without duplicate keys.
+    snap.payload_json = {
+        "items": [
+            {"provider_account_id": "IB:U1", "symbol": "AAPL", "qty": 1, "market_value": 160.0},
+            {"provider_account_id": "IB:U1", "symbol": "TOTAL", "market_value": 1000.0, "is_total": True},
+        ]
+    }
+    session.commit()
+    rows = session.query(ExternalHoldingPosition).filter_by(snapshot_id=snap.id).order_by(ExternalHoldingPosition.symbol).all()
+    assert [(r.symbol, r.is_total, r.market_value) for r in rows] == [("AAPL", False, 160.0), ("TOTAL", True, 1000.0)]
+    points = _valuation_points_from_snapshots(
+        session, scope="trust", start_date=dt.date(2025, 1, 1), end_date=dt.date(2025, 1, 31), connection_ids=[conn.id]
+    )
+    assert points == {int(conn.id): {dt.date(2025, 1, 2): 1000.0}}
+
+    # Snapshots written before the rollup tables existed are derived by the init_db backfill.
+    session.execute(text("DELETE FROM external_holding_positions"))
+    session.execute(text("DELETE FROM external_holding_valuations"))
+    session.execute(text("UPDATE external_holding_snapshots SET rollup_version = NULL"))
+    session.commit()
+    snap_id = int(snap.id)
+    session.expunge_all()
+    assert get_current_tickers_by_scope(session, scope="trust") == []
+    assert backfill_holding_rollups(session) == 1
+    assert session.get(ExternalHoldingSnapshot, snap_id).rollup_version == ROLLUP_VERSION
+    assert get_current_tickers_by_scope(session, scope="trust") == ["AAPL"]
@@ -307,6 +307,7 @@ def test_ib_flex_web_adapter_parses_trades_cashflows_and_broker_rows(session, mo
     assert any(a.get("provider_account_id") == "IBFLEX:U1" for a in accts)
 
     items, next_cursor = adapter.fetch_transactions(ctx, dt.date(2025, 1, 1), dt.date(2025, 1, 10), cursor=None)
+    items = list(items)
     assert next_cursor is None
     assert any((it.get("record_kind") or "").upper() == "REPORT_PAYLOAD" for it in items)
     tx_types = {it.get("type") for it in items if (it.get("record_kind") or "").upper() not in {"REPORT_PAYLOAD", "BROKER_CLOSED_LOT", "BROKER_WASH_SALE"}}
@@ -479,6 +480,47 @@ def test_ib_flex_web_sync_idempotent_payload_skip(session, monkeypatch):
     assert int(cov.get("report_payloads_skipped") or 0) >= 1
 
 
+def test_ib_flex_web_sync_ingests_streamed_report_in_batches(session, monkeypatch):
+    import src.core.sync_runner as sync_runner
+
+    _patch_http(monkeypatch)
+    monkeypatch.setenv("APP_SECRET_KEY", "test-secret-key-32-bytes-minimum!!")
+    monkeypatch.setattr(sync_runner, "_PAGE_ITEM_BATCH", 2)
+
+    tp = TaxpayerEntity(name="Trust", type="TRUST")
+    session.add(tp)
+    session.flush()
+    conn = ExternalConnection(
+        name="IB Flex Web",
+        provider="IB",
+        broker="IB",
+        connector="IB_FLEX_WEB",
+        taxpayer_entity_id=tp.id,
+        status="ACTIVE",
+        metadata_json={},
+    )
+    session.add(conn)
+    session.flush()
+    upsert_credential(session, connection_id=conn.id, key="IB_FLEX_TOKEN", plaintext="TOK")
+    upsert_credential(session, connection_id=conn.id, key="IB_FLEX_QUERY_ID", plaintext="QID")
+    session.commit()
+
+    run = run_sync(
+        session,
+        connection_id=conn.id,
+        mode="FULL",
+        start_date=dt.date(2025, 1, 1),
+        end_date=dt.date(2025, 1, 10),
+        actor="test",
+    )
+    assert run.status == "SUCCESS"
+    assert session.query(Transaction).count() == session.query(ExternalTransactionMap).count() > 0
+    assert session.query(BrokerLotClosure).count() == 1
+    assert session.query(BrokerWashSaleEvent).count() == 1
+    assert session.query(ExternalHoldingSnapshot).count() == 1
+    assert int((run.coverage_json or {}).get("parse_fail_count") or 0) == 0
+
+
 def test_ib_flex_web_retries_on_1018_send_request_then_succeeds(session, monkeypatch):
     import src.adapters.ib_flex_web.adapter as mod
     import src.utils.rate_limit as rl
@@ -668,3 +710,56 @@ def test_ib_flex_web_rate_limit_exceeded_skips_one_query_but_run_succeeds(sessio
     assert int(cov.get("txn_count") or 0) > 0
     warns = cov.get("warnings") or []
     assert any("rate limit (1018)" in str(w).lower() for w in warns)
+
+
+def test_ib_flex_web_streaming_parse_keeps_record_order_and_cash_precedence():
+    from src.adapters.ib_flex_web.adapter import FlexReport, IBFlexWebAdapter
+    from src.importers.adapters import ProviderError
+
+    payload = b"""<?xml version="1.0" encoding="UTF-8"?>
+<FlexQueryResponse xmlns="http://example.com/flex">
+  <FlexStatements count="1">
+    <FlexStatement accountId="U1" fromDate="20250101" toDate="20250110" period="Custom">
+      <CashTransactions>
+        <CashTransaction accountId="U1" dateTime="20250105;120000" amount="5" type="Dividends" symbol="AAPL" transactionID="C1"/>
+      </CashTransactions>
+      <CashReport accountId="U1" endingCash="2500"/>
+      <CashReport>
+        <CashReportCurrency accountId="U1" toDate="20250110" currency="USD" endingCash="2000"/>
+      </CashReport>
+      <Trades>
+        <Trade accountId="U1" tradeDate="20250102" symbol="AAPL" buySell="BUY" quantity="10" netCash="-1000" transactionID="T1"/>
+        <Trade accountId="U1" tradeDate="20250103" symbol="AAPL" buySell="SELL" quantity="-5" netCash="600" transactionID="T2"/>
+      </Trades>
+    </FlexStatement>
+  </FlexStatements>
+</FlexQueryResponse>
+"""
+    adapter = IBFlexWebAdapter()
+    rep = FlexReport(query_id="Q", reference_code="R", payload=payload, payload_hash="H", payload_path=None)
+    items, holdings, metrics = adapter._parse_report_transactions(
+        None, rep, start_date=dt.date(2025, 1, 1), end_date=dt.date(2025, 1, 10)
+    )
+    # Trade and cash rows stream lazily; their counters fill in as the items are consumed.
+    assert not isinstance(items, list)
+    assert (metrics["trades_seen"], metrics["cash_rows_seen"]) == (0, 0)
+    items = list(items)
+
+    # Trades precede cash rows regardless of section order in the document.
+    txids = [it.get("provider_transaction_id") for it in items if it.get("type")]
+    assert txids == ["T1", "T2", "C1"]
+    assert (metrics["trades_seen"], metrics["cash_rows_seen"]) == (2, 1)
+    # CashReport overrides CashReportCurrency for the same account/date (anchored to FlexStatement toDate).
+    balances = [it for it in items if it.get("record_kind") == "CASH_BALANCE"]
+    assert [(b["as_of_date"], b["amount"]) for b in balances] == [("2025-01-10", 2500.0)]
+    assert holdings["cash_balances"][0]["amount"] == 2500.0
+    assert adapter._accounts_from_report_xml(payload) == {"U1"}
+    assert adapter._accounts_from_report_xml(b"<FlexQueryResponse><Trade accountId='U2'/>") == set()
+
+    with pytest.raises(ProviderError, match="not XML"):
+        adapter._parse_report_transactions(
+            None,
+            FlexReport(query_id="Q", reference_code="R", payload=b"not xml", payload_hash="H", payload_path=None),
+            start_date=dt.date(2025, 1, 1),
+            end_date=dt.date(2025, 1, 10),
+        )
@@ -252,3 +252,152 @@ def test_plaid_chase_investments_one_time_24m_backfill(session, monkeypatch):
 
     conn2 = session.query(ExternalConnection).filter(ExternalConnection.id == conn.id).one()
     assert (conn2.metadata_json or {}).get("plaid_initial_backfill_done") is True
+
+
+def test_plaid_chase_links_churned_ids_and_upserts_modified_expenses(session, monkeypatch):
+    monkeypatch.setenv("APP_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("NETWORK_ENABLED", "1")
+
+    import datetime as _dt
+
+    from src.core import sync_runner as sr
+    from src.db.models import ExternalTransactionMap
+
+    monkeypatch.setattr(sr, "now_utc", lambda: _dt.datetime(2026, 1, 9, 12, 0, 0, tzinfo=_dt.timezone.utc))
+
+    conn = _mk_conn(session)
+    conn.metadata_json = {"plaid_env": "sandbox", "plaid_enable_investments": True}
+    session.add(conn)
+    session.commit()
+    upsert_credential(session, connection_id=conn.id, key="PLAID_ACCESS_TOKEN", plaintext="AT")
+    upsert_credential(session, connection_id=conn.id, key="PLAID_ITEM_ID", plaintext="ITEM1")
+    session.commit()
+
+    buy = {
+        "account_id": "INV1",
+        "security_id": "S1",
+        "date": "2026-01-05",
+        "type": "buy",
+        "amount": 100.0,
+        "quantity": 1.0,
+        "price": 100.0,
+        "iso_currency_code": "USD",
+        "name": "BUY SPY",
+    }
+    state = {
+        "accounts": [
+            {"account_id": "INV1", "name": "Chase IRA", "official_name": "Chase IRA", "type": "investment", "subtype": "ira", "mask": "8839"},
+            {"account_id": "D1", "name": "Chase Checking", "official_name": "Chase Checking", "type": "depository", "subtype": "checking", "mask": "1234"},
+        ],
+        "sync_by_cursor": {
+            "": {
+                "added": [
+                    {"transaction_id": "TD1", "account_id": "D1", "date": "2026-01-02", "amount": 12.34, "iso_currency_code": "USD", "name": "Coffee"},
+                    {"transaction_id": "TD1", "account_id": "D1", "date": "2026-01-03", "amount": 12.50, "iso_currency_code": "USD", "name": "Coffee Shop"},
+                ],
+                "modified": [],
+                "removed": [],
+                "has_more": False,
+                "next_cursor": "CUR1",
+            },
+            "CUR1": {
+                "added": [],
+                "modified": [
+                    {"transaction_id": "TD1", "account_id": "D1", "date": "2026-01-04", "amount": 13.00, "iso_currency_code": "USD", "name": "Coffee Shop"},
+                ],
+                "removed": [],
+                "has_more": False,
+                "next_cursor": "CUR2",
+            },
+        },
+        "investment_securities": [{"security_id": "S1", "ticker_symbol": "SPY", "name": "SPDR S&P 500 ETF"}],
+        # A pending -> posted churn on one page: same signature, new provider id.
+        "investment_transactions": [{**buy, "investment_transaction_id": "IT1"}, {**buy, "investment_transaction_id": "IT2"}],
+    }
+
+    from src.adapters.plaid_chase import adapter as mod
+
+    monkeypatch.setattr(mod.PlaidChaseAdapter, "_client", lambda _self, _ctx: _FakePlaidClient(state=state))
+
+    r1 = run_sync(session, connection_id=conn.id, mode="INCREMENTAL", pull_holdings=False, actor="test")
+    assert r1.status == "SUCCESS"
+    buys = session.query(Transaction).filter(Transaction.type == "BUY").all()
+    assert len(buys) == 1
+    maps = session.query(ExternalTransactionMap).filter(ExternalTransactionMap.transaction_id == buys[0].id).all()
+    assert sorted(m.provider_txn_id for m in maps) == ["PLAID_INV:IT1", "PLAID_INV:IT2"]
+    expense = session.query(ExpenseTransaction).one()
+    assert float(expense.amount) == pytest.approx(-12.50)
+    assert expense.posted_date == dt.date(2026, 1, 3)
+    assert session.query(ExpenseImportBatch).one().row_count == 1
+
+    # A later run churns the id again and modifies the expense: link to the stored row, update in place.
+    state["investment_transactions"].append({**buy, "investment_transaction_id": "IT3"})
+    r2 = run_sync(session, connection_id=conn.id, mode="INCREMENTAL", pull_holdings=False, actor="test")
+    assert r2.status == "SUCCESS"
+    assert session.query(Transaction).filter(Transaction.type == "BUY").count() == 1
+    assert (
+        session.query(ExternalTransactionMap).filter(ExternalTransactionMap.provider_txn_id == "PLAID_INV:IT3").one().transaction_id
+        == buys[0].id
+    )
+    expense = session.query(ExpenseTransaction).one()
+    assert float(expense.amount) == pytest.approx(-13.00)
+    assert expense.posted_date == dt.date(2026, 1, 4)
+
+
+def test_plaid_chase_sync_survives_a_failed_batch_insert(session, monkeypatch):
+    import src.core.sync_runner as sr
+    from src.adapters.plaid_chase import adapter as mod
+
+    monkeypatch.setenv("APP_SECRET_KEY", "test-secret")
+    monkeypatch.setenv("NETWORK_ENABLED", "1")
+    monkeypatch.setattr(sr, "_PAGE_ITEM_BATCH", 1)
+
+    conn = _mk_conn(session)
+    upsert_credential(session, connection_id=conn.id, key="PLAID_ACCESS_TOKEN", plaintext="AT")
+    upsert_credential(session, connection_id=conn.id, key="PLAID_ITEM_ID", plaintext="ITEM1")
+    session.commit()
+
+    state = {
+        "accounts": [{"account_id": "A1", "name": "Chase Checking", "type": "depository", "subtype": "checking", "mask": "1234"}],
+        "sync_by_cursor": {
+            "": {
+                "added": [
+                    {"transaction_id": f"T{i}", "account_id": "A1", "date": f"2026-01-0{i}", "amount": 5.0 * i, "iso_currency_code": "USD", "name": f"Shop {i}"}
+                    for i in (1, 2, 3)
+                ],
+                "modified": [],
+                "removed": [],
+                "has_more": False,
+                "next_cursor": "CUR1",
+            },
+        },
+    }
+    monkeypatch.setattr(mod.PlaidChaseAdapter, "_client", lambda _self, _ctx: _FakePlaidClient(state=state))
+
+    bad_txn_id = sr._plaid_expense_txn_id("T2")
+    insert = sr._insert_pending_expenses
+
+    def failing_insert(session_, pending):
+        if any(row.txn_id == bad_txn_id for row in pending):
+            raise ValueError("bad row")
+        return insert(session_, pending)
+
+    monkeypatch.setattr(sr, "_insert_pending_expenses", failing_insert)
+
+    run = run_sync(
+        session,
+        connection_id=conn.id,
+        mode="FULL",
+        start_date=dt.date(2026, 1, 1),
+        end_date=dt.date(2026, 1, 5),
+        pull_holdings=False,
+        actor="test",
+    )
+
+    assert run.status == "PARTIAL"
+    assert sorted(row.txn_id for row in session.query(ExpenseTransaction).all()) == sorted(
+        sr._plaid_expense_txn_id(t) for t in ("T1", "T3")
+    )
+    coverage = run.coverage_json or {}
+    assert coverage.get("parse_fail_count") == 1
+    assert any("Parse fail kind=EXPENSE_TXN" in w for w in coverage.get("warnings") or [])
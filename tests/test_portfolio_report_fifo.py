@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import datetime as dt
 
-from portfolio_report.fifo import fifo_realized_pnl
-from portfolio_report.transactions import NormalizedTransaction
+from portfolio_report.fifo import fifo_by_symbol, fifo_realized_pnl
+from portfolio_report.transactions import NormalizedTransaction, transactions_by_symbol
 
 
 def test_fifo_realized_pnl_basic():
@@ -123,3 +123,43 @@ def test_fifo_flags_carry_in_basis_unknown():
     assert matches[0].cost is None
     assert matches[0].pnl is None
     assert warnings and "carry-in basis unknown" in warnings[0].lower()
+
+
+def _tx(d: dt.date, symbol: str, tx_type: str, qty: float, price: float) -> NormalizedTransaction:
+    return NormalizedTransaction(
+        date=d,
+        symbol=symbol,
+        tx_type=tx_type,
+        qty=qty,
+        price=price,
+        amount=None,
+        fees=0.0,
+        account=None,
+        description=None,
+        cash_impact_portfolio=None,
+        is_external=False,
+        external_cashflow_investor=None,
+    )
+
+
+def test_fifo_by_symbol_matches_per_symbol_scan_and_reports_open_lots():
+    txs = [
+        _tx(dt.date(2025, 1, 2), "BBB", "SELL", 2.0, 50.0),
+        _tx(dt.date(2025, 1, 3), "AAA", "BUY", 10.0, 10.0),
+        _tx(dt.date(2025, 1, 3), "BBB", "BUY", 5.0, 40.0),
+        _tx(dt.date(2025, 1, 4), "AAA", "BUY", 10.0, 12.0),
+        _tx(dt.date(2025, 2, 1), "AAA", "SELL", 15.0, 20.0),
+        _tx(dt.date(2025, 2, 2), "BBB", "SELL", 1.0, 45.0),
+        _tx(dt.date(2025, 2, 3), "CCC", "DIV", 0.0, 0.0),
+    ]
+    by_sym = transactions_by_symbol(txs)
+    for workers in (None, 2):
+        res = fifo_by_symbol(by_sym, symbols=["AAA", "BBB"], max_workers=workers)
+        assert list(res) == ["AAA", "BBB"]
+        for sym, r in res.items():
+            assert (r.matches, r.warnings) == fifo_realized_pnl(txs, symbol=sym)
+        assert [(lot.qty, lot.unit_cost) for lot in res["AAA"].open_lots] == [(5.0, 12.0)]
+        assert [(lot.qty, lot.unit_cost) for lot in res["BBB"].open_lots] == [(4.0, 40.0)]
+        assert res["BBB"].carry_in_sells == 1
+        assert res["BBB"].carry_in_first == dt.date(2025, 1, 2)
+        assert res["AAA"].warnings == []
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import os
 import sys
 import time
 import threading
@@ -579,6 +580,116 @@ def test_fit_regime_with_adaptive_window_retries_short_history() -> None:
     assert payload["training_window"] < 504
 
 
+def test_dashboard_fits_fan_out_and_stream_partial_rows(monkeypatch) -> None:
+    runtime = _fake_runtime()
+    runtime["set_setting"]("regime_dashboard_fit_workers", "3")
+    fit_daily = runtime["fit_regime_model"]
+
+    def slow_fit(ticker, market_frame):
+        if ticker == "AAPL":
+            time.sleep(0.2)
+        if ticker == "BAD":
+            raise RuntimeError("no data")
+        return fit_daily(ticker, market_frame)
+
+    runtime["fit_regime_model"] = slow_fit
+    monkeypatch.setattr(regime_route, "_load_hmm_runtime", lambda: (runtime, None))
+    monkeypatch.setattr(regime_route, "_fetch_regime_change_history", lambda tickers, days=90: [])
+    events = []
+    payload = regime_route._build_regime_dashboard_payload(
+        tickers=["AAPL", "BAD", "NVDA", "AVGO"],
+        progress_callback=lambda progress, total, ticker, **kwargs: events.append((progress, ticker, kwargs)),
+    )
+    assert [row["ticker"] for row in payload["rows"]] == ["AAPL", "NVDA", "AVGO"]
+    assert any("BAD: unable to analyze holding" in warning for warning in payload["warnings"])
+    streamed = [(ticker, kwargs["partial_result"]) for _progress, ticker, kwargs in events if kwargs["stage"] == "fit" and kwargs["partial_result"]]
+    assert [ticker for ticker, _row in streamed][-1] == "AAPL"
+    assert {row["analysis_stage"] for _ticker, row in streamed} == {"fit"}
+    assert [progress for progress, _ticker, kwargs in events if kwargs["stage"] == "fit"] == [0, 1, 2, 3, 4]
+    assert payload["regime_cache"] == {"hits": 0, "incremental": 0, "misses": 0}
+
+
+def test_dashboard_signal_snapshots_share_one_transaction(monkeypatch) -> None:
+    from contextlib import contextmanager
+
+    runtime = _fake_runtime()
+    transactions: list[list[str]] = []
+    open_transactions: list[list[str]] = []
+
+    @contextmanager
+    def recording_transaction():
+        open_transactions.append([])
+        try:
+            yield
+        finally:
+            transactions.append(open_transactions.pop())
+
+    def save_snapshot(**kwargs):
+        assert open_transactions, "snapshot written outside a transaction"
+        open_transactions[-1].append(kwargs["ticker"])
+
+    runtime["persistence_transaction"] = recording_transaction
+    runtime["save_signal_snapshot"] = save_snapshot
+    runtime["build_composite_signal"] = lambda *args, **kwargs: SimpleNamespace(composite_action="Buy", composite_strength=0.7)
+    monkeypatch.setattr(regime_route, "_load_hmm_runtime", lambda: (runtime, None))
+    monkeypatch.setattr(regime_route, "_fetch_regime_change_history", lambda tickers, days=90: [])
+    payload = regime_route._build_regime_dashboard_payload(tickers=["NVDA", "AVGO", "AAPL"])
+
+    snapshot_batches = [batch for batch in transactions if batch]
+    assert len(snapshot_batches) == 1
+    assert sorted(snapshot_batches[0]) == ["AAPL", "AVGO", "NVDA"]
+    assert payload["snapshots_saved"] == 3
+
+
+def _pool_download_market_frame(**kwargs):
+    frame = pd.DataFrame({"price": [100.0, 101.0], "volume": [1_000_000, 1_050_000], "high": [101.0, 102.0], "low": [99.0, 100.0]})
+    return SimpleNamespace(frame=frame)
+
+
+def _pool_fit_regime_model(ticker, market_frame):
+    return FakeRegime(ticker, "Bull", latest_price=float(os.getpid()))
+
+
+def test_dashboard_fits_run_on_the_shared_process_pool(monkeypatch) -> None:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from src.regime.hmm_engine import fit_pool_size, get_fit_executor
+
+    runtime = _fake_runtime()
+    runtime["set_setting"]("regime_dashboard_fit_workers", "2")
+    runtime["download_market_frame"] = _pool_download_market_frame
+    runtime["fit_regime_model"] = _pool_fit_regime_model
+    runtime["fit_regime_model_weekly"] = _pool_fit_regime_model
+    monkeypatch.setattr(regime_route, "_load_hmm_runtime", lambda: (runtime, None))
+    monkeypatch.setattr(regime_route, "_fetch_regime_change_history", lambda tickers, days=90: [])
+    executors = []
+    original_executor = regime_route._dashboard_fit_executor
+
+    def recording_executor(fit_functions, workers):
+        context, concurrency, kind = original_executor(fit_functions, workers)
+        executors.append(context)
+        return context, concurrency, kind
+
+    monkeypatch.setattr(regime_route, "_dashboard_fit_executor", recording_executor)
+    events = []
+    first = regime_route._build_regime_dashboard_payload(
+        tickers=["NVDA", "AVGO"], progress_callback=lambda progress, total, ticker, **kwargs: events.append(kwargs)
+    )
+    second = regime_route._build_regime_dashboard_payload(tickers=["AVGO", "NVDA"])
+
+    concurrency = min(2, fit_pool_size())
+    assert f"up to {concurrency} at a time on process worker" in events[0]["text"]
+
+    assert [row["ticker"] for row in first["rows"]] == ["NVDA", "AVGO"]
+    assert [row["ticker"] for row in second["rows"]] == ["AVGO", "NVDA"]
+    pools = [context.__enter__() for context in executors]
+    assert all(isinstance(pool, ProcessPoolExecutor) for pool in pools)
+    assert pools[0] is pools[1] is get_fit_executor()
+    assert pools[0]._mp_context.get_start_method() in {"forkserver", "spawn"}
+    worker_pids = {row["current_price"] for row in [*first["rows"], *second["rows"]]}
+    assert worker_pids and os.getpid() not in worker_pids
+
+
 def test_docs_route_renders_navigation_and_sections(monkeypatch) -> None:
     client = _client(monkeypatch)
     response = client.get("/docs")
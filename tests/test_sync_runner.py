@@ -152,6 +152,30 @@ def test_existing_lot_does_not_prevent_txn_import(session, monkeypatch):
     assert run.coverage_json["new_inserted"] == 1
 
 
+def test_page_batches_new_rows_and_dedupes_within_page(session, monkeypatch):
+    conn = _mk_connection(session)
+    from src.db.models import ExternalTransactionMap, PositionLot, Transaction
+
+    page = [
+        {"provider_transaction_id": "T1", "provider_account_id": "A1", "date": "2025-12-01", "type": "BUY", "symbol": "VTI", "qty": 1, "amount": -100},
+        {"provider_transaction_id": "T1", "provider_account_id": "A1", "date": "2025-12-01", "type": "BUY", "symbol": "VTI", "qty": 1, "amount": -100},
+        {"provider_transaction_id": "T2", "provider_account_id": "A1", "date": "2025-12-03", "type": "SELL", "symbol": "VXUS", "qty": 2, "amount": 50},
+    ]
+    adapter = FakeAdapter(accounts=[{"provider_account_id": "A1", "name": "IB Taxable", "account_type": "TAXABLE"}], pages=[page])
+    monkeypatch.setattr("src.core.sync_runner._adapter_for", lambda _c: adapter)
+    r1 = run_sync(session, connection_id=conn.id, mode="FULL", start_date=dt.date(2025, 12, 1), end_date=dt.date(2025, 12, 20), actor="test")
+    r2 = run_sync(session, connection_id=conn.id, mode="FULL", start_date=dt.date(2025, 12, 1), end_date=dt.date(2025, 12, 20), actor="test")
+    assert r1.coverage_json["new_inserted"] == 2
+    assert r1.coverage_json["duplicates_skipped"] == 1
+    assert r1.coverage_json["earliest_txn_date"] == "2025-12-01"
+    assert r1.coverage_json["latest_txn_date"] == "2025-12-03"
+    assert r2.coverage_json["new_inserted"] == 0
+    assert r2.coverage_json["duplicates_skipped"] == 3
+    assert session.query(Transaction).count() == 2
+    assert session.query(ExternalTransactionMap).count() == 2
+    assert session.query(PositionLot).count() == 1
+
+
 def test_parse_fail_triggers_partial(session, monkeypatch):
     conn = _mk_connection(session)
     adapter = FakeAdapter(